@@ -1,15 +1,31 @@
 """
 Pytest configuration for cognitive-architecture tests.
 
-Sets up the Python path for importing core modules.
+Sets up the Python path for importing core modules and keeps the eval
+result cache, cascade results and frame feedback out of the source tree.
 """
 
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add the cognitive-architecture directory to Python path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 # Tell pytest to ignore the root __init__.py as a test file
 collect_ignore = ["__init__.py"]
+
+
+@pytest.fixture(autouse=True)
+def isolated_eval_cache(tmp_path, monkeypatch):
+    """Point evaluators and harnesses at a per-test result cache."""
+    monkeypatch.setenv("EVAL_CACHE_DIR", str(tmp_path / "eval_cache"))
+
+
+@pytest.fixture(autouse=True)
+def isolated_storage(tmp_path, monkeypatch):
+    """Point cascade results and frame feedback at per-test directories."""
+    monkeypatch.setattr("optimization.cascade.DEFAULT_STORAGE_DIR", tmp_path / "cascade")
+    monkeypatch.setattr("core.frame_validation_bridge.DEFAULT_FEEDBACK_DIR", tmp_path / "frame-feedback")
@@ -3,14 +3,14 @@ Core module for cognitive architecture.
 
 Contains:
 - config: Configuration dataclasses and VectorCodec
-- verix: VERIX epistemic notation parser and validator
+- verix: VERIX epistemic notation parser (batch and streaming) and validator
 - verilingua: 7 cognitive frames from natural language distinctions
 - prompt_builder: THIN WAIST contract for prompt construction
 - runtime: Claude client wrapper
 """
 
 from .config import FullConfig, FrameworkConfig, PromptConfig, VectorCodec
-from .verix import VerixClaim, VerixParser, VerixValidator
+from .verix import VerixClaim, VerixParser, VerixStreamParser, VerixValidator
 from .verilingua import CognitiveFrame, FrameRegistry
 
 __all__ = [
@@ -20,6 +20,7 @@ __all__ = [
     "VectorCodec",
     "VerixClaim",
     "VerixParser",
+    "VerixStreamParser",
     "VerixValidator",
     "CognitiveFrame",
     "FrameRegistry",
@@ -11,9 +11,17 @@ This module is the FOUNDATION - all other modules depend on it.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Tuple, Dict
+from typing import Any, List, Sequence, Tuple, Dict
 from enum import Enum
 
+# Batch VectorCodec APIs need numpy; everything else is pure Python
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
 
 class VerixStrictness(Enum):
     """VERIX compliance strictness levels."""
@@ -251,6 +259,13 @@ class VectorCodec:
 
     This codec is STABLE - the mapping NEVER changes once deployed.
     GlobalMOO optimization operates on these vectors.
+
+    Batch APIs (numpy) map an (N, 14) array to frame masks, decoded enum
+    columns, config codes and cluster keys in one vectorized call. A config
+    code packs the quantized vector (frame toggles, strictness, compression,
+    ground, confidence) into one int: rows with the same code decode to
+    equal FullConfigs, and decode_batch() shares one cached FullConfig per
+    code instead of constructing one per row.
     """
 
     VECTOR_SIZE = 14
@@ -275,6 +290,21 @@ class VectorCodec:
     IDX_RESERVED_2 = 12
     IDX_RESERVED_3 = 13
 
+    # FrameworkConfig field for each frame index (0-6)
+    FRAME_NAMES = (
+        "evidential", "aspectual", "morphological", "compositional",
+        "honorific", "classifier", "spatial",
+    )
+
+    # Config code layout: frame bits 0-6, require_ground bit 7,
+    # require_confidence bit 8, then * 9 + strictness * 3 + compression.
+    # A cluster code is the same without the ground/confidence bits.
+    N_CONFIG_CODES = (1 << 9) * 9
+    N_CLUSTER_CODES = (1 << 7) * 9
+
+    # cluster code -> cluster_key() string (immutable, so safe to share)
+    _cluster_key_cache: Dict[int, str] = {}
+
     @staticmethod
     def encode(config: FullConfig) -> List[float]:
         """
@@ -422,6 +452,172 @@ class VectorCodec:
         t = max(0.0, min(1.0, t))  # Clamp to [0, 1]
         return [a + t * (b - a) for a, b in zip(v1, v2)]
 
+    # -------------------------------------------------------------------------
+    # Batch APIs
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def as_matrix(vectors: Any) -> "np.ndarray":
+        """
+        View vectors as an (N, 14) float array.
+
+        Args:
+            vectors: (N, 14) array or a sequence of 14-float vectors
+
+        Raises:
+            ValueError: If the vectors do not have 14 dimensions
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("VectorCodec batch APIs require numpy")
+        matrix = np.asarray(vectors, dtype=float)
+        if matrix.ndim == 1 and matrix.size == 0:
+            matrix = matrix.reshape(0, VectorCodec.VECTOR_SIZE)
+        if matrix.ndim != 2 or matrix.shape[1] != VectorCodec.VECTOR_SIZE:
+            raise ValueError(
+                f"Vectors must have shape (N, {VectorCodec.VECTOR_SIZE}), "
+                f"got {matrix.shape}"
+            )
+        return matrix
+
+    @staticmethod
+    def encode_batch(configs: Sequence[FullConfig]) -> "np.ndarray":
+        """Encode configs into an (N, 14) float array (rows as encode())."""
+        return VectorCodec.as_matrix([VectorCodec.encode(config) for config in configs])
+
+    @staticmethod
+    def frame_masks(vectors: Any) -> "np.ndarray":
+        """(N, 7) bool array of active frames, thresholded as in decode()."""
+        matrix = VectorCodec.as_matrix(vectors)
+        return matrix[:, VectorCodec.IDX_EVIDENTIAL:VectorCodec.IDX_SPATIAL + 1] >= 0.5
+
+    @staticmethod
+    def decode_columns(vectors: Any) -> Dict[str, "np.ndarray"]:
+        """
+        Decode every row at once, field by field.
+
+        Returns:
+            Dict with one (N,) bool array per frame name, "require_ground"
+            and "require_confidence", and (N,) int8 arrays of enum values
+            for "verix_strictness" and "compression_level"
+
+        Raises:
+            ValueError: If a strictness or compression value is not finite
+        """
+        matrix = VectorCodec.as_matrix(vectors)
+        masks = VectorCodec.frame_masks(matrix)
+        columns = {name: masks[:, i] for i, name in enumerate(VectorCodec.FRAME_NAMES)}
+        columns["verix_strictness"] = VectorCodec._enum_column(matrix, VectorCodec.IDX_VERIX_STRICTNESS)
+        columns["compression_level"] = VectorCodec._enum_column(matrix, VectorCodec.IDX_COMPRESSION_LEVEL)
+        columns["require_ground"] = matrix[:, VectorCodec.IDX_REQUIRE_GROUND] >= 0.5
+        columns["require_confidence"] = matrix[:, VectorCodec.IDX_REQUIRE_CONFIDENCE] >= 0.5
+        return columns
+
+    @staticmethod
+    def cluster_codes(vectors: Any) -> "np.ndarray":
+        """(N,) int array; equal codes have equal cluster_key() values."""
+        matrix = VectorCodec.as_matrix(vectors)
+        return VectorCodec._codes(matrix, VectorCodec.frame_masks(matrix))
+
+    @staticmethod
+    def config_codes(vectors: Any) -> "np.ndarray":
+        """(N,) int array; equal codes decode() to equal FullConfigs."""
+        matrix = VectorCodec.as_matrix(vectors)
+        bits = np.concatenate([
+            VectorCodec.frame_masks(matrix),
+            matrix[:, [VectorCodec.IDX_REQUIRE_GROUND, VectorCodec.IDX_REQUIRE_CONFIDENCE]] >= 0.5,
+        ], axis=1)
+        return VectorCodec._codes(matrix, bits)
+
+    @staticmethod
+    def cluster_keys(vectors: Any) -> List[str]:
+        """cluster_key(decode(v)) for every row, one key built per distinct code."""
+        codes = VectorCodec.cluster_codes(vectors)
+        unique, inverse = np.unique(codes, return_inverse=True)
+        keys = [VectorCodec.cluster_key_for_code(int(code)) for code in unique]
+        return [keys[i] for i in inverse.ravel()]
+
+    @staticmethod
+    def decode_batch(vectors: Any) -> List[FullConfig]:
+        """
+        decode() every row from its config code.
+
+        Every row gets its own FullConfig, so callers may mutate the results
+        (PromptBuilder's mode selection does).
+        """
+        return [VectorCodec.decode_code(code) for code in VectorCodec.config_codes(vectors).tolist()]
+
+    @staticmethod
+    def cluster_code(vector: Sequence[float]) -> int:
+        """cluster_codes() for one vector, without numpy."""
+        bits = sum(1 << i for i in range(len(VectorCodec.FRAME_NAMES)) if vector[i] >= 0.5)
+        return VectorCodec._scalar_code(vector, bits)
+
+    @staticmethod
+    def config_code(vector: Sequence[float]) -> int:
+        """config_codes() for one vector, without numpy."""
+        bits = sum(1 << i for i in range(len(VectorCodec.FRAME_NAMES)) if vector[i] >= 0.5)
+        if vector[VectorCodec.IDX_REQUIRE_GROUND] >= 0.5:
+            bits |= 1 << 7
+        if vector[VectorCodec.IDX_REQUIRE_CONFIDENCE] >= 0.5:
+            bits |= 1 << 8
+        return VectorCodec._scalar_code(vector, bits)
+
+    @staticmethod
+    def decode_code(code: int) -> FullConfig:
+        """A new FullConfig for a config code (equal to decode() of its vectors)."""
+        if not 0 <= code < VectorCodec.N_CONFIG_CODES:
+            raise ValueError(f"Invalid config code: {code}")
+        bits, enums = divmod(code, 9)
+        strictness, compression = divmod(enums, 3)
+        framework = FrameworkConfig(**{
+            name: bool(bits >> i & 1) for i, name in enumerate(VectorCodec.FRAME_NAMES)
+        })
+        prompt = PromptConfig(
+            verix_strictness=VerixStrictness(strictness),
+            compression_level=CompressionLevel(compression),
+            require_ground=bool(bits >> 7 & 1),
+            require_confidence=bool(bits >> 8 & 1),
+        )
+        return FullConfig(framework=framework, prompt=prompt)
+
+    @staticmethod
+    def cluster_key_for_code(code: int) -> str:
+        """cluster_key() of the configs with this cluster code, built from its bits."""
+        key = VectorCodec._cluster_key_cache.get(code)
+        if key is None:
+            if not 0 <= code < VectorCodec.N_CLUSTER_CODES:
+                raise ValueError(f"Invalid cluster code: {code}")
+            bits, enums = divmod(code, 9)
+            strictness, compression = divmod(enums, 3)
+            frames = sorted(name for i, name in enumerate(VectorCodec.FRAME_NAMES) if bits >> i & 1)
+            key = VectorCodec._cluster_key_cache[code] = (
+                f"frames:{'+'.join(frames) if frames else 'none'}|"
+                f"strict:{strictness}|"
+                f"compress:{compression}"
+            )
+        return key
+
+    @staticmethod
+    def _scalar_code(vector: Sequence[float], bits: int) -> int:
+        strictness = max(0, min(2, int(round(vector[VectorCodec.IDX_VERIX_STRICTNESS]))))
+        compression = max(0, min(2, int(round(vector[VectorCodec.IDX_COMPRESSION_LEVEL]))))
+        return bits * 9 + strictness * 3 + compression
+
+    @staticmethod
+    def _enum_column(matrix: "np.ndarray", index: int) -> "np.ndarray":
+        # round() then clamp, as in decode(); rint rounds half to even like round()
+        column = matrix[:, index]
+        if not np.isfinite(column).all():
+            raise ValueError(f"Vector dimension {index} must be finite")
+        return np.clip(np.rint(column), 0, 2).astype(np.int8)
+
+    @staticmethod
+    def _codes(matrix: "np.ndarray", bits: "np.ndarray") -> "np.ndarray":
+        weights = np.left_shift(1, np.arange(bits.shape[1], dtype=np.int64))
+        strictness = VectorCodec._enum_column(matrix, VectorCodec.IDX_VERIX_STRICTNESS)
+        compression = VectorCodec._enum_column(matrix, VectorCodec.IDX_COMPRESSION_LEVEL)
+        return (bits @ weights) * 9 + strictness.astype(np.int64) * 3 + compression
+
 
 # Default configurations for common use cases
 DEFAULT_CONFIG = FullConfig()
@@ -39,6 +39,9 @@ from .config import FrameworkConfig, PromptConfig, FullConfig
 
 logger = logging.getLogger(__name__)
 
+# Where feedback history is persisted when no feedback_dir is given
+DEFAULT_FEEDBACK_DIR = Path(__file__).parent.parent / "storage" / "frame-feedback"
+
 
 class FeedbackSignal(Enum):
     """Feedback signals from VERIX validation."""
@@ -153,7 +156,7 @@ class FrameValidationBridge:
         self.auto_adjust = auto_adjust
 
         if feedback_dir is None:
-            feedback_dir = Path(__file__).parent.parent / "storage" / "frame-feedback"
+            feedback_dir = DEFAULT_FEEDBACK_DIR
         self.feedback_dir = Path(feedback_dir)
         self.feedback_dir.mkdir(parents=True, exist_ok=True)
 
@@ -19,7 +19,8 @@ FIX-4 from REMEDIATION-PLAN.md:
 - Modes are selected based on task context and applied before frame activation
 """
 
-from typing import Tuple, List, Optional
+from collections import OrderedDict
+from typing import Any, Dict, Tuple, List, Optional
 from dataclasses import dataclass
 import logging
 
@@ -126,14 +127,22 @@ class PromptBuilder:
 
     FIX-5: Now includes FrameValidationBridge for bidirectional VERIX-VERILINGUA integration.
     Validation feedback is used to dynamically adjust frame weights.
+
+    The system prompt depends only on the config, the selected mode and the
+    task type - never on the task text - so it is memoized in a bounded LRU
+    cache keyed on cluster_key() plus the mode. The cache is cleared by
+    set_mode() and whenever validation feedback changes frame weights.
     """
 
+    DEFAULT_CACHE_SIZE = 128
+
     def __init__(
         self,
         config: FullConfig,
         mode_selector: Optional[ModeSelector] = None,
         auto_select_mode: bool = True,
         enable_feedback_loop: bool = True,
+        cache_size: int = DEFAULT_CACHE_SIZE,
     ):
         """
         Initialize builder with configuration.
@@ -143,6 +152,7 @@ class PromptBuilder:
             mode_selector: Optional ModeSelector for runtime mode selection
             auto_select_mode: If True, automatically select mode based on task
             enable_feedback_loop: If True, enable VERIX-VERILINGUA feedback loop (FIX-5)
+            cache_size: Max cached system prompts (0 disables caching)
         """
         self.config = config
         self.active_frames = FrameRegistry.get_active(config.framework)
@@ -173,6 +183,12 @@ class PromptBuilder:
         # P1-4 FIX: VCL validation integration
         self._vcl_validator = VCLValidator()
 
+        # System prompt memoization (LRU)
+        self._cache_size = cache_size
+        self._prompt_cache: "OrderedDict[Tuple, str]" = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
+
     def build(self, task: str, task_type: str) -> Tuple[str, str]:
         """
         THE CONTRACT - NEVER CHANGES
@@ -193,23 +209,91 @@ class PromptBuilder:
         if self.auto_select_mode and not self._mode_applied:
             self._select_and_apply_mode(task, task_type)
 
-        # Gather components
+        # Static system prompt (memoized), then per-task user prompt
+        system_prompt = self._system_prompt(task_type)
+        user_prompt = self._assemble_user_prompt(task)
+
+        # FIX: Reset mode selection for next build to prevent stale mode reuse (PB-STICKY-MODE)
+        self._mode_applied = False
+
+        return system_prompt, user_prompt
+
+    def _system_prompt(self, task_type: str) -> str:
+        """
+        Return the system prompt for the current config, mode and task type.
+
+        Args:
+            task_type: Category of task
+
+        Returns:
+            Assembled system prompt (from cache when possible)
+        """
+        key = self._system_prompt_key(task_type)
+        cached = self._prompt_cache.get(key)
+        if cached is not None:
+            self._prompt_cache.move_to_end(key)
+            self._cache_hits += 1
+            return cached
+
+        self._cache_misses += 1
         components = PromptComponents(
             base_instruction=self._base_instruction(task_type),
             frame_activations=self._frame_activations(),
             verix_requirements=self._verix_requirements(),
             output_format=self._output_format(),
-            task_content=task,
+            task_content="",
         )
-
-        # Assemble prompts
         system_prompt = self._assemble_system_prompt(components)
-        user_prompt = self._assemble_user_prompt(components)
 
-        # FIX: Reset mode selection for next build to prevent stale mode reuse (PB-STICKY-MODE)
-        self._mode_applied = False
+        if self._cache_size > 0:
+            self._prompt_cache[key] = system_prompt
+            if len(self._prompt_cache) > self._cache_size:
+                self._prompt_cache.popitem(last=False)
 
-        return system_prompt, user_prompt
+        return system_prompt
+
+    def _system_prompt_key(self, task_type: str) -> Tuple:
+        """
+        Cache key for the static system prompt.
+
+        cluster_key() covers active frames, strictness and compression; the
+        remaining inputs of _verix_requirements() and the frame weights are
+        added so that no config change can serve a stale prompt.
+        """
+        prompt = self.config.prompt
+        mode_name = self._selected_mode.name if self._selected_mode else None
+        return (
+            self._cluster_key,
+            mode_name,
+            task_type.lower().strip(),
+            prompt.require_ground,
+            prompt.require_confidence,
+            self._weights_signature(),
+        )
+
+    def _weights_signature(self) -> Tuple:
+        """Hashable snapshot of the current frame weights."""
+        return tuple(sorted(self.config.framework.frame_weights.items()))
+
+    def clear_cache(self) -> None:
+        """Drop all memoized system prompts (hit/miss counters are kept)."""
+        self._prompt_cache.clear()
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """
+        Return system prompt cache statistics.
+
+        Returns:
+            Dict with hits, misses, hit_rate, size and max_size
+        """
+        lookups = self._cache_hits + self._cache_misses
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "hit_rate": self._cache_hits / lookups if lookups else 0.0,
+            "size": len(self._prompt_cache),
+            "max_size": self._cache_size,
+        }
 
     def _select_and_apply_mode(self, task: str, task_type: str) -> None:
         """
@@ -304,6 +388,7 @@ class PromptBuilder:
         self._selected_mode = mode
         self._apply_mode_config(mode)
         self._mode_applied = True
+        self.clear_cache()
 
     def validate_response(
         self,
@@ -342,10 +427,15 @@ class PromptBuilder:
             logger.warning(f"VCL validation error (non-fatal): {e}")
 
         if self._validation_bridge:
+            weights_before = self._weights_signature()
             score, violations, feedback = self._validation_bridge.validate_and_feedback(
                 response_text, task_type
             )
 
+            # Frame weights adjusted by feedback invalidate memoized prompts
+            if self._weights_signature() != weights_before:
+                self.clear_cache()
+
             # Merge VERIX violations with VCL violations
             all_violations.extend(violations)
 
@@ -596,12 +686,12 @@ Your response MUST:
         # Filter empty sections and join
         return "\n".join(s for s in sections if s)
 
-    def _assemble_user_prompt(self, components: PromptComponents) -> str:
+    def _assemble_user_prompt(self, task_content: str) -> str:
         """
-        Assemble final user prompt from components.
+        Assemble final user prompt for the task.
 
         Args:
-            components: PromptComponents with task content
+            task_content: The specific task description
 
         Returns:
             Complete user prompt string
@@ -609,7 +699,7 @@ Your response MUST:
         return f"""
 # TASK
 
-{components.task_content}
+{task_content}
 
 ---
 
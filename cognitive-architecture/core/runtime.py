@@ -11,8 +11,10 @@ The runtime wraps the Anthropic SDK but could be swapped
 for other providers without changing the rest of the system.
 """
 
+import asyncio
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -122,6 +124,14 @@ class ClaudeRuntime:
 
     DEFAULT_MODEL = "claude-sonnet-4-20250514"
     DEFAULT_MAX_TOKENS = 4096
+    DEFAULT_MAX_CONCURRENCY = 8
+
+    # Rate-limit backoff: exponential from BACKOFF_BASE_S, capped at
+    # BACKOFF_MAX_S, unless the server sends a retry-after header
+    DEFAULT_MAX_RETRIES = 3
+    BACKOFF_BASE_S = 1.0
+    BACKOFF_MAX_S = 30.0
+    RETRYABLE_STATUS_CODES = (429, 529)
 
     def __init__(
         self,
@@ -129,6 +139,9 @@ class ClaudeRuntime:
         api_key: Optional[str] = None,
         model: Optional[str] = None,
         max_tokens: Optional[int] = None,
+        base_url: Optional[str] = None,
+        request_timeout: Optional[float] = None,
+        max_retries: Optional[int] = None,
     ):
         """
         Initialize runtime with configuration.
@@ -138,10 +151,16 @@ class ClaudeRuntime:
             api_key: Anthropic API key (defaults to ANTHROPIC_API_KEY env var)
             model: Model to use (defaults to claude-sonnet-4-20250514)
             max_tokens: Max output tokens (defaults to 4096)
+            base_url: Override API base URL (e.g. a local stub server)
+            request_timeout: Per-request timeout in seconds (None = SDK default)
+            max_retries: Retries on rate-limit/overloaded responses (defaults to 3)
         """
         self.config = config
         self.model = model or self.DEFAULT_MODEL
         self.max_tokens = max_tokens or self.DEFAULT_MAX_TOKENS
+        self.base_url = base_url
+        self.request_timeout = request_timeout
+        self.max_retries = self.DEFAULT_MAX_RETRIES if max_retries is None else max_retries
 
         # Initialize components
         self.prompt_builder = PromptBuilder(config)
@@ -153,7 +172,11 @@ class ClaudeRuntime:
         self._client: Optional[Any] = None
 
         if HAS_ANTHROPIC and self._api_key:
-            self._client = anthropic.Anthropic(api_key=self._api_key)
+            self._client = self._create_client()
+
+    def _create_client(self) -> Any:
+        """Create the Anthropic SDK client (SDK retries off; see _retry_delay)."""
+        return anthropic.Anthropic(api_key=self._api_key, base_url=self.base_url, max_retries=0)
 
     @property
     def is_available(self) -> bool:
@@ -182,6 +205,57 @@ class ClaudeRuntime:
         # Execute via API
         result = self._call_api(system_prompt, user_prompt)
 
+        return self._finalize(result, task_type)
+
+    def execute_many(
+        self,
+        tasks: List[Dict[str, Any]],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> List[ExecutionResult]:
+        """
+        Execute a batch of tasks with bounded concurrency.
+
+        Prompts are built up front, API calls run on a thread pool of
+        max_concurrency workers, and parsing, validation and telemetry for
+        each result run on the calling thread as soon as its call completes,
+        overlapping with the calls still in flight.
+
+        Args:
+            tasks: List of task dicts with 'task' and 'task_type' keys
+            max_concurrency: Maximum number of in-flight API calls
+
+        Returns:
+            ExecutionResults in the same order as tasks
+        """
+        prompts = [
+            self.prompt_builder.build(t.get("task", ""), t.get("task_type", "default"))
+            for t in tasks
+        ]
+        results: List[Optional[ExecutionResult]] = [None] * len(tasks)
+
+        with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as pool:
+            futures = {
+                pool.submit(self._call_api, system_prompt, user_prompt): i
+                for i, (system_prompt, user_prompt) in enumerate(prompts)
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                task_type = tasks[i].get("task_type", "default")
+                results[i] = self._finalize(future.result(), task_type)
+
+        return results
+
+    def _finalize(self, result: ExecutionResult, task_type: str) -> ExecutionResult:
+        """
+        Parse, validate and record telemetry for a completed API call.
+
+        Args:
+            result: ExecutionResult from _call_api
+            task_type: Category of task
+
+        Returns:
+            The same ExecutionResult, with claims, validation and feedback set
+        """
         if not result.success:
             return result
 
@@ -269,54 +343,103 @@ class ClaudeRuntime:
 
         start_time = time.time()
         timestamp = datetime.now().isoformat()
+        attempt = 0
+
+        while True:
+            try:
+                message = self._client.messages.create(**self._request_kwargs(
+                    system_prompt, user_prompt
+                ))
+                return self._build_result(message, start_time, timestamp)
+
+            except Exception as e:
+                delay = self._retry_delay(e, attempt)
+                if delay is None:
+                    return self._error_result(e, timestamp)
+                attempt += 1
+                logger.info(f"Rate limited, retrying in {delay:.1f}s (attempt {attempt})")
+                time.sleep(delay)
+
+    def _request_kwargs(self, system_prompt: str, user_prompt: str) -> Dict[str, Any]:
+        """Build keyword arguments for messages.create."""
+        kwargs: Dict[str, Any] = {
+            "model": self.model,
+            "max_tokens": self.max_tokens,
+            "system": system_prompt,
+            "messages": [
+                {"role": "user", "content": user_prompt}
+            ],
+        }
+        if self.request_timeout is not None:
+            kwargs["timeout"] = self.request_timeout
+        return kwargs
+
+    def _build_result(self, message: Any, start_time: float, timestamp: str) -> ExecutionResult:
+        """Convert an SDK message into an ExecutionResult with metrics."""
+        # Extract response
+        response_text = ""
+        for block in message.content:
+            if hasattr(block, "text"):
+                response_text += block.text
+
+        # Calculate metrics
+        latency_ms = (time.time() - start_time) * 1000
+        metrics = ExecutionMetrics(
+            input_tokens=message.usage.input_tokens,
+            output_tokens=message.usage.output_tokens,
+            total_tokens=message.usage.input_tokens + message.usage.output_tokens,
+            latency_ms=latency_ms,
+            model=self.model,
+            timestamp=timestamp,
+        )
 
-        try:
-            message = self._client.messages.create(
-                model=self.model,
-                max_tokens=self.max_tokens,
-                system=system_prompt,
-                messages=[
-                    {"role": "user", "content": user_prompt}
-                ],
-            )
+        return ExecutionResult(
+            response=response_text,
+            metrics=metrics,
+            success=True,
+        )
 
-            # Extract response
-            response_text = ""
-            for block in message.content:
-                if hasattr(block, "text"):
-                    response_text += block.text
-
-            # Calculate metrics
-            latency_ms = (time.time() - start_time) * 1000
-            metrics = ExecutionMetrics(
-                input_tokens=message.usage.input_tokens,
-                output_tokens=message.usage.output_tokens,
-                total_tokens=message.usage.input_tokens + message.usage.output_tokens,
-                latency_ms=latency_ms,
-                model=self.model,
-                timestamp=timestamp,
-            )
+    def _error_result(self, error: Exception, timestamp: str) -> ExecutionResult:
+        """Convert a failed API call into an unsuccessful ExecutionResult."""
+        if HAS_ANTHROPIC and isinstance(error, anthropic.APIError):
+            message = f"API error: {error}"
+        elif isinstance(error, asyncio.TimeoutError):
+            message = f"Request timed out after {self.request_timeout}s"
+        else:
+            message = f"Unexpected error: {error}"
 
-            return ExecutionResult(
-                response=response_text,
-                metrics=metrics,
-                success=True,
-            )
+        return ExecutionResult(
+            response="",
+            success=False,
+            error=message,
+            metrics=ExecutionMetrics(timestamp=timestamp),
+        )
 
-        except anthropic.APIError as e:
-            return ExecutionResult(
-                response="",
-                success=False,
-                error=f"API error: {e}",
-                metrics=ExecutionMetrics(timestamp=timestamp),
-            )
-        except Exception as e:
-            return ExecutionResult(
-                response="",
-                success=False,
-                error=f"Unexpected error: {e}",
-                metrics=ExecutionMetrics(timestamp=timestamp),
-            )
+    def _retry_delay(self, error: Exception, attempt: int) -> Optional[float]:
+        """
+        Backoff delay before retrying a failed call.
+
+        Only rate-limit (429) and overloaded (529) responses are retried.
+        A retry-after header from the server takes precedence over the
+        exponential schedule.
+
+        Returns:
+            Delay in seconds, or None if the error should not be retried
+        """
+        if attempt >= self.max_retries:
+            return None
+        if getattr(error, "status_code", None) not in self.RETRYABLE_STATUS_CODES:
+            return None
+
+        response = getattr(error, "response", None)
+        retry_after = response.headers.get("retry-after") if response is not None else None
+        try:
+            if retry_after is not None:
+                return min(self.BACKOFF_MAX_S, max(0.0, float(retry_after)))
+        except ValueError:
+            pass
+
+        return min(self.BACKOFF_MAX_S, self.BACKOFF_BASE_S * (2 ** attempt))
 
     def validate_response(self, response: str) -> Tuple[bool, List[str]]:
         """
@@ -386,6 +509,118 @@ class ClaudeRuntime:
         }
 
 
+class AsyncClaudeRuntime(ClaudeRuntime):
+    """
+    asyncio variant of ClaudeRuntime.
+
+    execute(), execute_many() and execute_raw() are coroutines backed by
+    the SDK's AsyncAnthropic client. execute_many() keeps at most
+    max_concurrency requests in flight; each result is parsed, validated
+    and recorded as soon as it arrives while the remaining requests are
+    still pending. Rate-limit backoff and the per-request timeout are
+    applied to every call.
+    """
+
+    def _create_client(self) -> Any:
+        """Create the async Anthropic SDK client (SDK retries off; see _retry_delay)."""
+        return anthropic.AsyncAnthropic(api_key=self._api_key, base_url=self.base_url, max_retries=0)
+
+    async def execute(self, task: str, task_type: str = "default") -> ExecutionResult:
+        """
+        Execute a task and return structured result.
+
+        Args:
+            task: Task description
+            task_type: Category of task
+
+        Returns:
+            ExecutionResult with response, claims, metrics, validation, and feedback
+        """
+        system_prompt, user_prompt = self.prompt_builder.build(task, task_type)
+        result = await self._call_api_async(system_prompt, user_prompt)
+        return self._finalize(result, task_type)
+
+    async def execute_many(
+        self,
+        tasks: List[Dict[str, Any]],
+        max_concurrency: int = ClaudeRuntime.DEFAULT_MAX_CONCURRENCY,
+    ) -> List[ExecutionResult]:
+        """
+        Execute a batch of tasks with bounded concurrency.
+
+        Args:
+            tasks: List of task dicts with 'task' and 'task_type' keys
+            max_concurrency: Maximum number of in-flight API calls
+
+        Returns:
+            ExecutionResults in the same order as tasks
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def run(task_data: Dict[str, Any]) -> ExecutionResult:
+            task_type = task_data.get("task_type", "default")
+            system_prompt, user_prompt = self.prompt_builder.build(
+                task_data.get("task", ""), task_type
+            )
+            async with semaphore:
+                result = await self._call_api_async(system_prompt, user_prompt)
+            return self._finalize(result, task_type)
+
+        return list(await asyncio.gather(*(run(t) for t in tasks)))
+
+    async def execute_raw(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+    ) -> ExecutionResult:
+        """Execute with pre-built prompts (bypass PromptBuilder)."""
+        return await self._call_api_async(system_prompt, user_prompt)
+
+    async def _call_api_async(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+    ) -> ExecutionResult:
+        """
+        Make async API call to Claude with backoff and timeout.
+
+        Args:
+            system_prompt: System prompt
+            user_prompt: User prompt
+
+        Returns:
+            ExecutionResult with response and metrics
+        """
+        if not self.is_available:
+            return ExecutionResult(
+                response="",
+                success=False,
+                error="Anthropic client not available (missing API key or package)",
+            )
+
+        start_time = time.time()
+        timestamp = datetime.now().isoformat()
+        attempt = 0
+
+        while True:
+            try:
+                message = await asyncio.wait_for(
+                    self._client.messages.create(**self._request_kwargs(
+                        system_prompt, user_prompt
+                    )),
+                    timeout=self.request_timeout,
+                )
+                return self._build_result(message, start_time, timestamp)
+
+            except Exception as e:
+                delay = self._retry_delay(e, attempt)
+                if delay is None:
+                    return self._error_result(e, timestamp)
+                attempt += 1
+                logger.info(f"Rate limited, retrying in {delay:.1f}s (attempt {attempt})")
+                await asyncio.sleep(delay)
+
+
 class MockRuntime:
     """
     Mock runtime for testing without API calls.
@@ -394,9 +629,16 @@ class MockRuntime:
     useful for unit tests and development.
     """
 
-    def __init__(self, config: FullConfig):
-        """Initialize mock runtime."""
+    def __init__(self, config: FullConfig, latency_s: float = 0.0):
+        """
+        Initialize mock runtime.
+
+        Args:
+            config: FullConfig for prompt building and validation
+            latency_s: Real delay per call, for offline concurrency benchmarks
+        """
         self.config = config
+        self.latency_s = latency_s
         self.prompt_builder = PromptBuilder(config)
         self.verix_parser = VerixParser(config.prompt)
         self.verix_validator = VerixValidator(config.prompt)
@@ -413,11 +655,57 @@ class MockRuntime:
 
         Generates a VERIX-formatted mock response based on the task.
         """
-        self._call_count += 1
+        system_prompt, user_prompt, call_index = self._prepare(task, task_type)
+        if self.latency_s > 0:
+            time.sleep(self.latency_s)
+        result = self._mock_result(task, task_type, system_prompt, user_prompt, call_index)
+        return self._finalize(result)
+
+    def execute_many(
+        self,
+        tasks: List[Dict[str, Any]],
+        max_concurrency: int = ClaudeRuntime.DEFAULT_MAX_CONCURRENCY,
+    ) -> List[ExecutionResult]:
+        """
+        Execute a batch of tasks with bounded concurrency.
 
-        # Build prompts (for consistency)
+        Mirrors ClaudeRuntime.execute_many(): simulated calls run on a
+        thread pool and parse/validate overlaps with pending calls.
+        """
+        prepared = [
+            (t.get("task", ""), t.get("task_type", "default"))
+            + self._prepare(t.get("task", ""), t.get("task_type", "default"))
+            for t in tasks
+        ]
+        results: List[Optional[ExecutionResult]] = [None] * len(tasks)
+
+        def call(args: Tuple[str, str, str, str, int]) -> ExecutionResult:
+            if self.latency_s > 0:
+                time.sleep(self.latency_s)
+            return self._mock_result(*args)
+
+        with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as pool:
+            futures = {pool.submit(call, args): i for i, args in enumerate(prepared)}
+            for future in as_completed(futures):
+                results[futures[future]] = self._finalize(future.result())
+
+        return results
+
+    def _prepare(self, task: str, task_type: str) -> Tuple[str, str, int]:
+        """Build prompts (for consistency) and number the call."""
+        self._call_count += 1
         system_prompt, user_prompt = self.prompt_builder.build(task, task_type)
+        return system_prompt, user_prompt, self._call_count
 
+    def _mock_result(
+        self,
+        task: str,
+        task_type: str,
+        system_prompt: str,
+        user_prompt: str,
+        call_index: int,
+    ) -> ExecutionResult:
+        """Generate the unparsed mock result for one call."""
         # Generate mock response with VERIX notation
         mock_response = self._generate_mock_response(task, task_type)
 
@@ -426,25 +714,25 @@ class MockRuntime:
             input_tokens=len(system_prompt.split()) + len(user_prompt.split()),
             output_tokens=len(mock_response.split()),
             total_tokens=0,  # Will be calculated
-            latency_ms=50.0 + (self._call_count * 10),  # Simulated latency
+            latency_ms=50.0 + (call_index * 10),  # Simulated latency
             model="mock-model",
             timestamp=datetime.now().isoformat(),
         )
         mock_metrics.total_tokens = mock_metrics.input_tokens + mock_metrics.output_tokens
 
-        # Parse and validate
-        claims = self.verix_parser.parse(mock_response)
-        is_valid, violations = self.verix_validator.validate(claims) if claims else (True, [])
-
         return ExecutionResult(
             response=mock_response,
-            claims=claims,
             metrics=mock_metrics,
             success=True,
-            is_valid=is_valid,
-            violations=violations,
         )
 
+    def _finalize(self, result: ExecutionResult) -> ExecutionResult:
+        """Parse and validate a mock result."""
+        result.claims = self.verix_parser.parse(result.response)
+        if result.claims:
+            result.is_valid, result.violations = self.verix_validator.validate(result.claims)
+        return result
+
     def _generate_mock_response(self, task: str, task_type: str) -> str:
         """Generate a mock VERIX-formatted response."""
         # Extract key terms from task
@@ -471,9 +759,43 @@ Key findings:
 """
 
 
+class AsyncMockRuntime(MockRuntime):
+    """
+    asyncio variant of MockRuntime with the AsyncClaudeRuntime interface.
+
+    Simulated latency uses asyncio.sleep, so execute_many() concurrency
+    can be exercised and benchmarked offline.
+    """
+
+    async def execute(self, task: str, task_type: str = "default") -> ExecutionResult:
+        """Execute with mock response."""
+        system_prompt, user_prompt, call_index = self._prepare(task, task_type)
+        if self.latency_s > 0:
+            await asyncio.sleep(self.latency_s)
+        result = self._mock_result(task, task_type, system_prompt, user_prompt, call_index)
+        return self._finalize(result)
+
+    async def execute_many(
+        self,
+        tasks: List[Dict[str, Any]],
+        max_concurrency: int = ClaudeRuntime.DEFAULT_MAX_CONCURRENCY,
+    ) -> List[ExecutionResult]:
+        """Execute a batch of tasks with bounded concurrency."""
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def run(task_data: Dict[str, Any]) -> ExecutionResult:
+            async with semaphore:
+                return await self.execute(
+                    task_data.get("task", ""), task_data.get("task_type", "default")
+                )
+
+        return list(await asyncio.gather(*(run(t) for t in tasks)))
+
+
 def create_runtime(
     config: Optional[FullConfig] = None,
     use_mock: bool = False,
+    use_async: bool = False,
     **kwargs,
 ) -> ClaudeRuntime:
     """
@@ -482,15 +804,21 @@ def create_runtime(
     Args:
         config: Configuration (uses default if not provided)
         use_mock: If True, return MockRuntime instead
+        use_async: If True, return the asyncio variant (AsyncClaudeRuntime/AsyncMockRuntime)
         **kwargs: Additional arguments passed to runtime constructor
+            (only latency_s is used for mocks)
 
     Returns:
-        ClaudeRuntime or MockRuntime instance
+        ClaudeRuntime or MockRuntime instance (or their async variants)
     """
     cfg = config or FullConfig()
 
     if use_mock:
-        return MockRuntime(cfg)
+        latency_s = kwargs.get("latency_s", 0.0)
+        return AsyncMockRuntime(cfg, latency_s) if use_async else MockRuntime(cfg, latency_s)
+
+    if use_async:
+        return AsyncClaudeRuntime(cfg, **kwargs)
 
     return ClaudeRuntime(cfg, **kwargs)
 
@@ -538,13 +866,8 @@ def evaluate(config_vector: List[float], tasks: List[Dict[str, Any]]) -> Dict[st
             "epistemic_consistency": 0.0,
         }
 
-    # Evaluate each task
-    for task_data in tasks:
-        task = task_data.get("task", "")
-        task_type = task_data.get("task_type", "default")
-
-        result = runtime.execute(task, task_type)
-
+    # Evaluate tasks as one concurrent batch
+    for result in runtime.execute_many(tasks):
         if result.success:
             # Accuracy: based on VERIX validity
             total_accuracy += 1.0 if result.is_valid else 0.5
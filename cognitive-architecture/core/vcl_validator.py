@@ -213,6 +213,169 @@ class VCLConfig:
         return self
 
 
+# =============================================================================
+# COMPILED VALIDATION ENGINE
+# =============================================================================
+
+# One pass over the output collects the tokens the checks share: the first
+# position of each slot marker ([SLOT: / [[SLOT:), every [conf:x] value, the
+# first [ground:x], and Turkish evidential / Russian aspect markers. No two
+# token kinds can overlap, except an aspect marker inside a ground body,
+# which _scan_output checks separately.
+_TOKEN_RE = re.compile(
+    r'\[+(?P<slot>(?i:HON|MOR|COM|CLS|EVD|ASP|SPC)):'
+    r'|\[conf:(?P<conf>\d+\.?\d*)\]'
+    r'|\[ground:(?P<ground>[\w\-:=\.]+)\]'
+    r'|(?P<evd_marker>(?i:-DI<|-mis<|-dir<))'
+    r'|(?P<asp_marker>(?i:sov\.))'
+)
+_ASP_MARKER_RE = re.compile(r'sov\.', re.IGNORECASE)
+_DOUBLE_BRACKET_RE = re.compile(r'\[\[[\w:]+\]\]')
+
+# Keyword checks run on the case-folded output (see _fold) with str.find:
+# `literal in folded` matches exactly where re.IGNORECASE would, and the few
+# remaining regexes only run when a literal they require is present.
+_CASE_FOLD = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s", "\u212a": "k"})
+
+# Naturalized (L2) evidence and aspect phrases, expanded from
+#   \bi (directly )?(observed|verified|witnessed|saw)\b, \baccording to\b,
+#   \bresearch (indicates|shows|suggests)\b, \bit'?s reported that\b,
+#   \bi (infer|deduce|conclude) that\b, \bbased on\b
+# and
+#   \b(complete|done|finished|succeeded|failed)\b,
+#   \b(in progress|ongoing|working on|processing)\b, \b(partial(ly)?|started|begun)\b
+# (matched as whole words), plus the VERIX [ground: and [state: markers.
+_EVIDENCE_WORDS = tuple(
+    [f"i {directly}{verb}" for directly in ("", "directly ")
+     for verb in ("observed", "verified", "witnessed", "saw")]
+    + ["according to", "research indicates", "research shows", "research suggests",
+       "it's reported that", "its reported that", "i infer that", "i deduce that",
+       "i conclude that", "based on"]
+)
+_ASPECT_WORDS = (
+    "complete", "done", "finished", "succeeded", "failed", "in progress", "ongoing",
+    "working on", "processing", "partial", "partially", "started", "begun",
+)
+
+# EVD type keywords, in precedence order. Equivalent to searching
+# observation|gozlem|kansoku|mushahada|-DI.*gozlem, research|...|-mis.*arastirma,
+# report(ed)?|...|-mis.*rapor, infer(red)?|cikarim|suiron|-dir,
+# definition|tanim|teigi and policy|politika|houshin case-insensitively.
+_EVD_TYPE_KEYWORDS = [
+    (EVDType.OBSERVATION, ("observation", "gozlem", "kansoku", "mushahada")),
+    (EVDType.RESEARCH, ("research", "arastirma", "kenkyu")),
+    (EVDType.REPORT, ("report", "rapor", "houkoku")),
+    (EVDType.INFERENCE, ("infer", "cikarim", "suiron", "-dir")),
+    (EVDType.DEFINITION, ("definition", "tanim", "teigi")),
+    (EVDType.POLICY, ("policy", "politika", "houshin")),
+]
+_GROUND_RE = re.compile(r'\[ground:([\w\-:=\.]+)\]')
+
+# Epistemic cosplay: i (directly )?(observed|witnessed|saw)
+_OBSERVATION_CLAIMS = tuple(
+    f"i {directly}{verb}" for directly in ("", "directly ") for verb in ("observed", "witnessed", "saw")
+)
+_OBSERVATION_GROUND_RE = re.compile(r'\[ground:.*observed|witnessed|read.*code|ran.*test', re.IGNORECASE)
+_OBSERVATION_ACTIONS = ("i ran", "i executed", "i checked", "i verified")
+_COMPLETE_ASP_RE = re.compile(r'\bASP:sov\.', re.IGNORECASE)
+_COMPLETION_CRITERIA = ("criteria", "passed", "succeeded", "done:")
+
+# Delimiter collisions inside [[SLOT:body]]
+_SLOT_BODY_RE = re.compile(r'\[\[(\w+):([^\]]*(?:\][^\]])*[^\]]*)\]\]')
+_MALFORMED_SLOT_RE = re.compile(r'\[\[\w+:[^\]]*\[[^\]]*\][^\]]*\]\]')
+
+
+@dataclass
+class _OutputScan:
+    """Tokens extracted from one output, shared by every check."""
+    output: str
+    folded: str
+    slot_positions: Dict[VCLSlot, int] = field(default_factory=dict)
+    confidences: List[str] = field(default_factory=list)
+    ground: Optional[str] = None
+    evd_marker: bool = False
+    asp_marker: bool = False
+    _evd_type: Any = field(default=None, repr=False)
+    _evd_type_known: bool = field(default=False, repr=False)
+
+    def contains(self, literals: Tuple[str, ...]) -> bool:
+        """Whether any lowercase literal occurs in the output, ignoring case."""
+        return any(literal in self.folded for literal in literals)
+
+    def contains_word(self, phrases: Tuple[str, ...]) -> bool:
+        """Whether any lowercase phrase occurs as \\bphrase\\b, ignoring case."""
+        folded = self.folded
+        for phrase in phrases:
+            start = folded.find(phrase)
+            while start != -1:
+                end = start + len(phrase)
+                if (start == 0 or not _is_word(folded[start - 1])) and \
+                        (end == len(folded) or not _is_word(folded[end])):
+                    return True
+                start = folded.find(phrase, start + 1)
+        return False
+
+    @property
+    def evd_type(self) -> Optional[EVDType]:
+        """EVD type of the output (computed on first use)."""
+        if not self._evd_type_known:
+            self._evd_type = _evd_type(self.folded, self.ground)
+            self._evd_type_known = True
+        return self._evd_type
+
+
+def _scan_output(output: str) -> _OutputScan:
+    """Extract slot, confidence, ground and marker tokens in one pass."""
+    scan = _OutputScan(output, _fold(output))
+    for match in _TOKEN_RE.finditer(output):
+        kind = match.lastgroup
+        if kind == "slot":
+            scan.slot_positions.setdefault(VCLSlot(match.group("slot").upper()), match.start())
+        elif kind == "conf":
+            scan.confidences.append(match.group("conf"))
+        elif kind == "ground":
+            body = match.group("ground")
+            if scan.ground is None:
+                scan.ground = body
+            if not scan.asp_marker and _ASP_MARKER_RE.search(body):
+                scan.asp_marker = True
+        elif kind == "evd_marker":
+            scan.evd_marker = True
+        else:
+            scan.asp_marker = True
+    return scan
+
+
+def _fold(text: str) -> str:
+    """Lowercase text so that `literal in _fold(text)` matches like re.IGNORECASE."""
+    return text.translate(_CASE_FOLD).lower()
+
+
+def _is_word(char: str) -> bool:
+    """re's \\w for one character."""
+    return char.isalnum() or char == "_"
+
+
+def _evd_type(folded: str, ground: Optional[str]) -> Optional[EVDType]:
+    """EVD type from explicit markers, else from the first ground marker."""
+    for evd_type, keywords in _EVD_TYPE_KEYWORDS:
+        if any(keyword in folded for keyword in keywords):
+            return evd_type
+
+    if ground:
+        ground = ground.lower()
+        if 'witnessed' in ground or 'observed' in ground:
+            return EVDType.OBSERVATION
+        if 'research' in ground:
+            return EVDType.RESEARCH
+        if 'reported' in ground:
+            return EVDType.REPORT
+        if 'inferred' in ground:
+            return EVDType.INFERENCE
+
+    return None
+
+
 # =============================================================================
 # VCL VALIDATOR
 # =============================================================================
@@ -227,6 +390,9 @@ class VCLValidator:
     - Epistemic cosplay detection
     - Immutable safety bounds (EVD >= 1, ASP >= 1)
     - L2 English purity for human output
+
+    The output is tokenized once (see _scan_output) and every check is
+    evaluated from that scan with precompiled patterns.
     """
 
     SLOT_ORDER = [VCLSlot.HON, VCLSlot.MOR, VCLSlot.COM,
@@ -271,14 +437,15 @@ class VCLValidator:
         """
         cfg = config or self.config
         cfg.enforce_safety_bounds()
+        scan = _scan_output(output)
 
         checks = {
-            "slot_order_correct": self._check_slot_order(output),
-            "evd_present": self._check_evd_present(output, cfg),
-            "asp_present": self._check_asp_present(output, cfg),
-            "confidence_ceiling_respected": self._check_confidence_ceiling(output),
-            "no_epistemic_cosplay": self._check_no_cosplay(output),
-            "l2_english_output": self._check_l2_english(output, cfg),
+            "slot_order_correct": self._check_slot_order(scan),
+            "evd_present": self._check_evd_present(scan, cfg),
+            "asp_present": self._check_asp_present(scan, cfg),
+            "confidence_ceiling_respected": self._check_confidence_ceiling(scan),
+            "no_epistemic_cosplay": self._check_no_cosplay(scan),
+            "l2_english_output": self._check_l2_english(scan, cfg),
             "no_bracket_collision": self._check_bracket_collision(output),
             "immutable_bounds_enforced": self._check_immutable_bounds(cfg),
         }
@@ -297,36 +464,27 @@ class VCLValidator:
             vcl_compliance_score=vcl_compliance,
         )
 
-    def _check_slot_order(self, output: str) -> bool:
+    def _check_slot_order(self, scan: _OutputScan) -> bool:
         """
         Check if VCL slots appear in correct order.
 
         Fixed order: HON -> MOR -> COM -> CLS -> EVD -> ASP -> SPC
         """
-        # Find positions of each slot marker
-        slot_positions = {}
-        for slot in self.SLOT_ORDER:
-            # Look for [[SLOT:...]] or [SLOT:...] patterns
-            pattern = rf'\[+{slot.value}:'
-            match = re.search(pattern, output, re.IGNORECASE)
-            if match:
-                slot_positions[slot] = match.start()
-
         # If no slots found, consider it valid (L2 output)
-        if not slot_positions:
+        if not scan.slot_positions:
             return True
 
-        # Check order
+        # Check order of each slot's first [[SLOT: or [SLOT: marker
         last_pos = -1
         for slot in self.SLOT_ORDER:
-            if slot in slot_positions:
-                if slot_positions[slot] < last_pos:
+            if slot in scan.slot_positions:
+                if scan.slot_positions[slot] < last_pos:
                     return False
-                last_pos = slot_positions[slot]
+                last_pos = scan.slot_positions[slot]
 
         return True
 
-    def _check_evd_present(self, output: str, config: VCLConfig) -> bool:
+    def _check_evd_present(self, scan: _OutputScan, config: VCLConfig) -> bool:
         """
         Check if EVD (evidential) marker is present when required.
 
@@ -337,32 +495,15 @@ class VCLValidator:
 
         # For L2 output, check for naturalized evidence markers
         if config.compression == CompressionLevel.L2_HUMAN:
-            evidence_phrases = [
-                r'\bi (directly )?(observed|verified|witnessed|saw)\b',
-                r'\baccording to\b',
-                r'\bresearch (indicates|shows|suggests)\b',
-                r'\bit\'?s reported that\b',
-                r'\bi (infer|deduce|conclude) that\b',
-                r'\bbased on\b',
-                r'\[ground:',  # VERIX ground marker
-            ]
-            for phrase in evidence_phrases:
-                if re.search(phrase, output, re.IGNORECASE):
-                    return True
-            # If output is short or non-factual, allow
-            if len(output) < 50:
+            if scan.contains_word(_EVIDENCE_WORDS) or scan.contains(("[ground:",)):
                 return True
-            return False
+            # If output is short or non-factual, allow
+            return len(scan.output) < 50
 
         # For L0/L1, check for explicit EVD markers
-        evd_patterns = [r'\[+EVD:', r'-DI<', r'-mis<', r'-dir<']
-        for pattern in evd_patterns:
-            if re.search(pattern, output, re.IGNORECASE):
-                return True
-
-        return False
+        return VCLSlot.EVD in scan.slot_positions or scan.evd_marker
 
-    def _check_asp_present(self, output: str, config: VCLConfig) -> bool:
+    def _check_asp_present(self, scan: _OutputScan, config: VCLConfig) -> bool:
         """
         Check if ASP (aspectual) marker is present when required.
 
@@ -373,43 +514,24 @@ class VCLValidator:
 
         # For L2 output, check for naturalized aspect markers
         if config.compression == CompressionLevel.L2_HUMAN:
-            aspect_phrases = [
-                r'\b(complete|done|finished|succeeded|failed)\b',
-                r'\b(in progress|ongoing|working on|processing)\b',
-                r'\b(partial(ly)?|started|begun)\b',
-                r'\[state:',  # VERIX state marker
-            ]
-            for phrase in aspect_phrases:
-                if re.search(phrase, output, re.IGNORECASE):
-                    return True
-            # Short outputs may not need aspect
-            if len(output) < 50:
-                return True
-            return False
-
-        # For L0/L1, check for explicit ASP markers
-        asp_patterns = [r'\[+ASP:', r'sov\.', r'nesov\.']
-        for pattern in asp_patterns:
-            if re.search(pattern, output, re.IGNORECASE):
+            if scan.contains_word(_ASPECT_WORDS) or scan.contains(("[state:",)):
                 return True
+            # Short outputs may not need aspect
+            return len(scan.output) < 50
 
-        return False
+        # For L0/L1, check for explicit ASP markers (sov. also covers nesov.)
+        return VCLSlot.ASP in scan.slot_positions or scan.asp_marker
 
-    def _check_confidence_ceiling(self, output: str) -> bool:
+    def _check_confidence_ceiling(self, scan: _OutputScan) -> bool:
         """
         Check if confidence values respect EVD type ceilings.
 
         Rule: confidence <= ceiling(EVD_type)
         """
-        # Extract confidence values
-        conf_pattern = r'\[conf:(\d+\.?\d*)\]'
-        conf_matches = re.findall(conf_pattern, output)
-
-        if not conf_matches:
+        if not scan.confidences:
             return True  # No explicit confidence, valid
 
-        # Extract EVD type
-        evd_type = self._extract_evd_type(output)
+        evd_type = scan.evd_type
         if not evd_type:
             # Default to inference ceiling (most restrictive)
             ceiling = CONFIDENCE_CEILINGS[EVDType.INFERENCE]
@@ -417,7 +539,7 @@ class VCLValidator:
             ceiling = CONFIDENCE_CEILINGS.get(evd_type, 0.70)
 
         # Check all confidence values
-        for conf_str in conf_matches:
+        for conf_str in scan.confidences:
             try:
                 conf = float(conf_str)
                 if conf > ceiling:
@@ -429,37 +551,10 @@ class VCLValidator:
 
     def _extract_evd_type(self, output: str) -> Optional[EVDType]:
         """Extract EVD type from output."""
-        # Check for explicit EVD markers
-        if re.search(r'observation|gozlem|kansoku|mushahada|-DI.*gozlem', output, re.IGNORECASE):
-            return EVDType.OBSERVATION
-        if re.search(r'research|arastirma|kenkyu|-mis.*arastirma', output, re.IGNORECASE):
-            return EVDType.RESEARCH
-        if re.search(r'report(ed)?|rapor|houkoku|-mis.*rapor', output, re.IGNORECASE):
-            return EVDType.REPORT
-        if re.search(r'infer(red)?|cikarim|suiron|-dir', output, re.IGNORECASE):
-            return EVDType.INFERENCE
-        if re.search(r'definition|tanim|teigi', output, re.IGNORECASE):
-            return EVDType.DEFINITION
-        if re.search(r'policy|politika|houshin', output, re.IGNORECASE):
-            return EVDType.POLICY
-
-        # Check VERIX ground markers
-        ground_pattern = r'\[ground:([\w\-:=\.]+)\]'
-        ground_match = re.search(ground_pattern, output)
-        if ground_match:
-            ground = ground_match.group(1).lower()
-            if 'witnessed' in ground or 'observed' in ground:
-                return EVDType.OBSERVATION
-            if 'research' in ground:
-                return EVDType.RESEARCH
-            if 'reported' in ground:
-                return EVDType.REPORT
-            if 'inferred' in ground:
-                return EVDType.INFERENCE
-
-        return None
-
-    def _check_no_cosplay(self, output: str) -> bool:
+        ground_match = _GROUND_RE.search(output)
+        return _evd_type(_fold(output), ground_match.group(1) if ground_match else None)
+
+    def _check_no_cosplay(self, scan: _OutputScan) -> bool:
         """
         Detect epistemic cosplay violations.
 
@@ -470,39 +565,38 @@ class VCLValidator:
         - STATE=complete but no completion criteria
         - High confidence (>0.85) from inference/report
         """
+        output = scan.output
         violations = []
 
         # Check observation claims without observation ground
-        if re.search(r'i (directly )?(observed|witnessed|saw)', output, re.IGNORECASE):
+        if scan.contains(_OBSERVATION_CLAIMS):
             # Must have observation-type ground
-            if not re.search(r'\[ground:.*observed|witnessed|read.*code|ran.*test', output, re.IGNORECASE):
+            if not (scan.contains(("witnessed",)) or (
+                    scan.contains(("[ground:", "read", "ran")) and _OBSERVATION_GROUND_RE.search(output))):
                 # Allow if it's actually describing an observation
-                if not re.search(r'i ran|i executed|i checked|i verified', output, re.IGNORECASE):
+                if not scan.contains(_OBSERVATION_ACTIONS):
                     violations.append("observation_without_ground")
 
-        # Check complete state without criteria
-        if re.search(r'\[state:complete\]|\bASP:sov\.', output, re.IGNORECASE):
+        # Check complete state without criteria ([state:complete] or ASP:sov.)
+        if scan.contains(("[state:complete]",)) or (
+                scan.contains(("asp:sov.",)) and _COMPLETE_ASP_RE.search(output)):
             # Should have completion criteria
-            if not re.search(r'criteria|passed|succeeded|done:', output, re.IGNORECASE):
+            if not scan.contains(_COMPLETION_CRITERIA):
                 violations.append("complete_without_criteria")
 
         # Check high confidence from weak evidence
-        conf_pattern = r'\[conf:(\d+\.?\d*)\]'
-        conf_matches = re.findall(conf_pattern, output)
-        evd_type = self._extract_evd_type(output)
-
-        if evd_type in [EVDType.INFERENCE, EVDType.REPORT]:
-            for conf_str in conf_matches:
+        if scan.confidences and scan.evd_type in [EVDType.INFERENCE, EVDType.REPORT]:
+            for conf_str in scan.confidences:
                 try:
                     conf = float(conf_str)
                     if conf > 0.85:
-                        violations.append(f"high_confidence_{conf}_from_{evd_type.value}")
+                        violations.append(f"high_confidence_{conf}_from_{scan.evd_type.value}")
                 except ValueError:
                     continue
 
         return len(violations) == 0
 
-    def _check_l2_english(self, output: str, config: VCLConfig) -> bool:
+    def _check_l2_english(self, scan: _OutputScan, config: VCLConfig) -> bool:
         """
         Check if L2 output is pure English (no VCL notation leaked).
 
@@ -511,10 +605,14 @@ class VCLValidator:
         if config.compression != CompressionLevel.L2_HUMAN:
             return True  # Not L2, VCL notation allowed
 
-        # Check for leaked VCL notation
-        for pattern in self.VCL_NOTATION_PATTERNS:
-            if re.search(pattern, output, re.IGNORECASE):
-                return False
+        # Check for leaked VCL notation (VCL_NOTATION_PATTERNS): [EVD:, [ASP:
+        # and [HON: are slot markers; sov. covers nesov.
+        if scan.evd_marker or scan.asp_marker:
+            return False
+        if any(slot in scan.slot_positions for slot in (VCLSlot.EVD, VCLSlot.ASP, VCLSlot.HON)):
+            return False
+        if '[[' in scan.output and _DOUBLE_BRACKET_RE.search(scan.output):
+            return False
 
         # L1 VERIX markers are allowed in L2 for auditability
         # (ground, conf, state markers are acceptable)
@@ -527,20 +625,19 @@ class VCLValidator:
 
         [ ] is reserved for VERIX confidence ONLY, not inside VCL slot bodies.
         """
-        # Find VCL slot bodies - match [[SLOT:content]]
-        # Use non-greedy match to find the slot body
-        slot_pattern = r'\[\[(\w+):([^\]]*(?:\][^\]])*[^\]]*)\]\]'
-        matches = re.findall(slot_pattern, output)
+        # Both patterns need a [[SLOT:body]] opener
+        if '[[' not in output:
+            return True
 
-        for slot_name, slot_body in matches:
+        # Find VCL slot bodies - match [[SLOT:content]]
+        for slot_name, slot_body in _SLOT_BODY_RE.findall(output):
             # Check if [ ] appears inside slot body (collision)
             # But allow < > which are valid for trilingual markers
             if '[' in slot_body or ']' in slot_body:
                 return False
 
         # Also check for malformed patterns with nested brackets
-        malformed_pattern = r'\[\[\w+:[^\]]*\[[^\]]*\][^\]]*\]\]'
-        if re.search(malformed_pattern, output):
+        if _MALFORMED_SLOT_RE.search(output):
             return False
 
         return True
@@ -33,7 +33,8 @@ Protocol:
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Protocol, runtime_checkable, Tuple
+from typing import Any, List, Dict, Optional, Protocol, Set, runtime_checkable, Tuple
+from collections import Counter
 from dataclasses import dataclass
 import re
 import threading
@@ -68,6 +69,30 @@ FRAME_WEIGHTS: Dict[str, float] = {
 EVIDENTIAL_MINIMUM: float = 0.30
 
 
+# =============================================================================
+# RESPONSE SCORING HELPERS
+# =============================================================================
+# Built-in frames split score_response() into a scan (which markers appear,
+# how many COUNT_PATTERN matches) and score_from_counts(). The scan for all
+# frames is done once by CompiledFrameScorer; score_response() keeps the
+# per-frame scan for direct callers.
+# =============================================================================
+
+def _marker_count(markers: List[str], found_markers: Set[str]) -> int:
+    """Number of markers (case-insensitive) present in the scanned text."""
+    return sum(1 for m in markers if m.lower() in found_markers)
+
+
+def _score_frame(frame: Any, response: str) -> float:
+    """Score one frame by scanning the response for it alone."""
+    lower = response.lower()
+    found = {m.lower() for m in frame.MARKERS if m.lower() in lower}
+    pattern_count = 0
+    if frame.COUNT_PATTERN:
+        pattern_count = len(re.findall(frame.COUNT_PATTERN, response, frame.COUNT_FLAGS))
+    return frame.score_from_counts(found, pattern_count)
+
+
 class FrameWeightViolation(Exception):
     """Raised when frame weight policy is violated."""
     pass
@@ -114,6 +139,8 @@ class EvidentialFrame:
     cognitive_force: str = "How do you know?"
 
     MARKERS = ["[witnessed]", "[reported]", "[inferred]", "[assumed]"]
+    COUNT_PATTERN = r'[.!?]+'
+    COUNT_FLAGS = 0
 
     def activation_instruction(self) -> str:
         return """
@@ -139,10 +166,14 @@ DO NOT make claims without evidence markers. Every factual statement needs a sou
 
     def score_response(self, response: str) -> float:
         """Score based on marker usage density."""
-        marker_count = sum(1 for m in self.MARKERS if m.lower() in response.lower())
+        return _score_frame(self, response)
+
+    def score_from_counts(self, found_markers: Set[str], pattern_count: int) -> float:
+        """Score from lowercased markers present and COUNT_PATTERN matches."""
+        marker_count = _marker_count(self.MARKERS, found_markers)
 
         # Estimate number of claims (sentences that could be factual)
-        sentences = len(re.findall(r'[.!?]+', response))
+        sentences = pattern_count
         claim_sentences = max(1, sentences * 0.6)  # Assume 60% are factual claims
 
         # Score is ratio of marked claims
@@ -186,6 +217,8 @@ class AspectualFrame:
     cognitive_force: str = "Complete or ongoing?"
 
     MARKERS = ["[complete]", "[ongoing]", "[habitual]", "[attempted]"]
+    COUNT_PATTERN = r'\b(is|are|was|were|has|have|had|will|would|should|could|can|may|might)\b'
+    COUNT_FLAGS = re.IGNORECASE
 
     def activation_instruction(self) -> str:
         return """
@@ -211,11 +244,14 @@ DO NOT describe actions without aspect markers. Every verb needs completion stat
 
     def score_response(self, response: str) -> float:
         """Score based on marker usage for action descriptions."""
-        marker_count = sum(1 for m in self.MARKERS if m.lower() in response.lower())
+        return _score_frame(self, response)
+
+    def score_from_counts(self, found_markers: Set[str], pattern_count: int) -> float:
+        """Score from lowercased markers present and COUNT_PATTERN matches."""
+        marker_count = _marker_count(self.MARKERS, found_markers)
 
         # Estimate action descriptions (verb phrases)
-        action_patterns = r'\b(is|are|was|were|has|have|had|will|would|should|could|can|may|might)\b'
-        action_count = len(re.findall(action_patterns, response, re.IGNORECASE))
+        action_count = pattern_count
         expected_markers = max(1, action_count * 0.3)  # 30% of verb phrases are trackable
 
         coverage = min(1.0, marker_count / expected_markers)
@@ -257,6 +293,8 @@ class MorphologicalFrame:
     cognitive_force: str = "What are the root components?"
 
     MARKERS = ["[root:", "[derived:", "[composed:"]
+    COUNT_PATTERN = r'\b[A-Z][a-z]+[A-Z][a-z]+\b|\b\w{8,}\b'
+    COUNT_FLAGS = 0
 
     def activation_instruction(self) -> str:
         return """
@@ -282,11 +320,14 @@ When introducing technical terms, show their compositional structure.
 
     def score_response(self, response: str) -> float:
         """Score based on decomposition marker usage."""
-        marker_count = sum(1 for m in self.MARKERS if m.lower() in response.lower())
+        return _score_frame(self, response)
+
+    def score_from_counts(self, found_markers: Set[str], pattern_count: int) -> float:
+        """Score from lowercased markers present and COUNT_PATTERN matches."""
+        marker_count = _marker_count(self.MARKERS, found_markers)
 
         # Estimate complex terms (multi-syllable technical words)
-        technical_pattern = r'\b[A-Z][a-z]+[A-Z][a-z]+\b|\b\w{8,}\b'
-        technical_count = len(re.findall(technical_pattern, response))
+        technical_count = pattern_count
         expected_markers = max(1, technical_count * 0.2)  # 20% should be decomposed
 
         coverage = min(1.0, marker_count / expected_markers)
@@ -327,6 +368,9 @@ class CompositionalFrame:
     cognitive_force: str = "How does this build from primitives?"
 
     MARKERS = ["[primitive:", "[compound:", "[builds:"]
+    COUNT_PATTERN = r'\b(is a|means|refers to|defined as)\b'
+    COUNT_FLAGS = re.IGNORECASE
+    COUNT_PHRASES = ["is a", "refers to", "defined as"]
 
     def activation_instruction(self) -> str:
         return """
@@ -353,11 +397,14 @@ Start with primitives, then show how they compose into the complex concept.
 
     def score_response(self, response: str) -> float:
         """Score based on compositional marker usage."""
-        marker_count = sum(1 for m in self.MARKERS if m.lower() in response.lower())
+        return _score_frame(self, response)
+
+    def score_from_counts(self, found_markers: Set[str], pattern_count: int) -> float:
+        """Score from lowercased markers present and COUNT_PATTERN matches."""
+        marker_count = _marker_count(self.MARKERS, found_markers)
 
         # Estimate definable concepts
-        definition_triggers = r'\b(is a|means|refers to|defined as)\b'
-        definition_count = len(re.findall(definition_triggers, response, re.IGNORECASE))
+        definition_count = pattern_count
         expected_markers = max(1, definition_count * 0.5)
 
         coverage = min(1.0, marker_count / expected_markers)
@@ -398,6 +445,8 @@ class HonorificFrame:
     cognitive_force: str = "Who is the audience?"
 
     MARKERS = ["[audience:", "[formality:", "[register:"]
+    COUNT_PATTERN = None
+    COUNT_FLAGS = 0
 
     def activation_instruction(self) -> str:
         return """
@@ -427,10 +476,14 @@ Always consider: Who will read this? What do they need to know?
 
     def score_response(self, response: str) -> float:
         """Score based on audience awareness markers."""
-        marker_count = sum(1 for m in self.MARKERS if m.lower() in response.lower())
+        return _score_frame(self, response)
+
+    def score_from_counts(self, found_markers: Set[str], pattern_count: int) -> float:
+        """Score from lowercased markers present (no count pattern)."""
+        marker_count = _marker_count(self.MARKERS, found_markers)
 
         # Audience should be set at least once
-        has_audience = "[audience:" in response.lower()
+        has_audience = "[audience:" in found_markers
         base_score = 0.5 if has_audience else 0.0
 
         # Additional markers add to score
@@ -472,6 +525,8 @@ class ClassifierFrame:
     cognitive_force: str = "What category/type is this?"
 
     MARKERS = ["[type:", "[category:", "[measure:"]
+    COUNT_PATTERN = r'\b\d+\b|\b(some|few|many|several|multiple)\b'
+    COUNT_FLAGS = re.IGNORECASE
 
     def activation_instruction(self) -> str:
         return """
@@ -499,11 +554,14 @@ Never say "some things" or "a few items" - always classify and count precisely.
 
     def score_response(self, response: str) -> float:
         """Score based on classifier usage."""
-        marker_count = sum(1 for m in self.MARKERS if m.lower() in response.lower())
+        return _score_frame(self, response)
+
+    def score_from_counts(self, found_markers: Set[str], pattern_count: int) -> float:
+        """Score from lowercased markers present and COUNT_PATTERN matches."""
+        marker_count = _marker_count(self.MARKERS, found_markers)
 
         # Estimate countable references
-        number_pattern = r'\b\d+\b|\b(some|few|many|several|multiple)\b'
-        number_count = len(re.findall(number_pattern, response, re.IGNORECASE))
+        number_count = pattern_count
         expected_markers = max(1, number_count * 0.3)
 
         coverage = min(1.0, marker_count / expected_markers)
@@ -545,6 +603,8 @@ class SpatialFrame:
     cognitive_force: str = "What is the absolute position/path?"
 
     MARKERS = ["[path:", "[location:", "[direction:"]
+    COUNT_PATTERN = r'\b(file|function|class|module|line|path)\b'
+    COUNT_FLAGS = re.IGNORECASE
 
     def activation_instruction(self) -> str:
         return """
@@ -571,11 +631,14 @@ Always provide full paths, exact line numbers, or clear directional flow.
 
     def score_response(self, response: str) -> float:
         """Score based on absolute positioning markers."""
-        marker_count = sum(1 for m in self.MARKERS if m.lower() in response.lower())
+        return _score_frame(self, response)
+
+    def score_from_counts(self, found_markers: Set[str], pattern_count: int) -> float:
+        """Score from lowercased markers present and COUNT_PATTERN matches."""
+        marker_count = _marker_count(self.MARKERS, found_markers)
 
         # Estimate location references
-        location_pattern = r'\b(file|function|class|module|line|path)\b'
-        location_count = len(re.findall(location_pattern, response, re.IGNORECASE))
+        location_count = pattern_count
         expected_markers = max(1, location_count * 0.3)
 
         coverage = min(1.0, marker_count / expected_markers)
@@ -602,6 +665,128 @@ This frame derives from Guugu Yimithirr absolute directional system.
 """
 
 
+class CompiledFrameScorer:
+    """
+    Scores a response against many frames in one pass.
+
+    Frames that expose MARKERS, COUNT_PATTERN and score_from_counts() are
+    scored from a shared scan:
+
+    1. Markers: one alternation regex (longest first) over the lowercased
+       response. Markers that only start with "[" cannot overlap except
+       at a shared start, where the longest wins and its prefixes are
+       implied; otherwise a lookahead regex reports every position.
+    2. Count patterns: the response is tokenized once into word runs
+       (\\w+), punctuation runs ([.!?]+) and the frames' COUNT_PHRASES.
+       Each distinct token is matched against every frame's COUNT_PATTERN
+       once (memoized), and counts are summed with token multiplicities.
+       This is exact because every built-in COUNT_PATTERN match lies
+       within a single token.
+
+    Other frames fall back to their own score_response().
+    """
+
+    MAX_TOKEN_CACHE = 50_000
+
+    def __init__(self, frames: Dict[str, Any]):
+        self.frames = dict(frames)
+        self._compiled = {
+            name: frame for name, frame in self.frames.items()
+            if all(hasattr(frame, a) for a in ("MARKERS", "COUNT_PATTERN", "score_from_counts"))
+        }
+
+        # Marker scanner
+        markers = sorted(
+            {m.lower() for f in self._compiled.values() for m in f.MARKERS},
+            key=len, reverse=True,
+        )
+        self._implied = {m: {p for p in markers if m.startswith(p)} for m in markers}
+        alternation = "|".join(re.escape(m) for m in markers)
+        if not markers:
+            self._marker_re = None
+        elif self._markers_overlap(markers):
+            self._marker_re = re.compile(f"(?=({alternation}))")
+        else:
+            self._marker_re = re.compile(alternation)
+
+        # Count pattern tokenizer
+        self._count_names = [n for n, f in self._compiled.items() if f.COUNT_PATTERN]
+        self._count_res = [
+            re.compile(self._compiled[n].COUNT_PATTERN, self._compiled[n].COUNT_FLAGS)
+            for n in self._count_names
+        ]
+        phrases = []
+        for name in self._count_names:
+            frame = self._compiled[name]
+            inline = "(?i:" if frame.COUNT_FLAGS & re.IGNORECASE else "(?:"
+            for phrase in getattr(frame, "COUNT_PHRASES", []):
+                phrases.append(f"{inline}{re.escape(phrase)})\\b")
+        self._token_re = re.compile("|".join(phrases + [r"\w+", r"[.!?]+"]))
+        self._token_counts: Dict[str, Tuple[int, ...]] = {}
+
+        self._last: Optional[Tuple[str, Tuple[str, ...], Dict[str, float]]] = None
+
+    @staticmethod
+    def _markers_overlap(markers: List[str]) -> bool:
+        """True if a marker can start strictly inside another marker."""
+        for a in markers:
+            for k in range(1, len(a)):
+                tail = a[k:]
+                if any(b.startswith(tail) or tail.startswith(b) for b in markers):
+                    return True
+        return False
+
+    def score(self, response: str, names: List[str]) -> Dict[str, float]:
+        """
+        Score a response against the named frames.
+
+        Returns:
+            Dict mapping frame names to scores, in the order given
+        """
+        key = tuple(names)
+        if self._last is not None and self._last[1] == key and self._last[0] == response:
+            return dict(self._last[2])
+
+        scores: Dict[str, float] = {}
+        if any(n in self._compiled for n in names):
+            found = self._scan_markers(response)
+            counts = self._scan_counts(response)
+        for name in names:
+            frame = self._compiled.get(name)
+            if frame is None:
+                scores[name] = self.frames[name].score_response(response)
+            else:
+                scores[name] = frame.score_from_counts(found, counts.get(name, 0))
+
+        self._last = (response, key, dict(scores))
+        return scores
+
+    def _scan_markers(self, response: str) -> Set[str]:
+        if self._marker_re is None:
+            return set()
+        found: Set[str] = set()
+        for marker in set(self._marker_re.findall(response.lower())):
+            found |= self._implied[marker]
+        return found
+
+    def _scan_counts(self, response: str) -> Dict[str, int]:
+        if not self._count_res:
+            return {}
+        if len(self._token_counts) > self.MAX_TOKEN_CACHE:
+            self._token_counts.clear()
+
+        totals = [0] * len(self._count_res)
+        for token, n in Counter(self._token_re.findall(response)).items():
+            per_pattern = self._token_counts.get(token)
+            if per_pattern is None:
+                per_pattern = tuple(len(r.findall(token)) for r in self._count_res)
+                self._token_counts[token] = per_pattern
+            for i, c in enumerate(per_pattern):
+                if c:
+                    totals[i] += c * n
+        return dict(zip(self._count_names, totals))
+
+
 class FrameRegistry:
     """
     Registry of all cognitive frames.
@@ -611,6 +796,7 @@ class FrameRegistry:
     """
 
     _frames: Dict[str, CognitiveFrame] = None
+    _scorer: Optional[CompiledFrameScorer] = None
     _lock: threading.Lock = threading.Lock()
     _initialized: bool = False
 
@@ -673,6 +859,7 @@ class FrameRegistry:
                 "classifier": ClassifierFrame(),
                 "spatial": SpatialFrame(),
             }
+            cls._scorer = CompiledFrameScorer(cls._frames)
             cls._initialized = True
 
     @classmethod
@@ -684,7 +871,24 @@ class FrameRegistry:
             frame: Frame instance to register
         """
         cls._ensure_initialized()
-        cls._frames[frame.name] = frame
+        with cls._lock:
+            cls._frames[frame.name] = frame
+            cls._scorer = CompiledFrameScorer(cls._frames)
+
+    @classmethod
+    def score_response(cls, response: str, names: List[str]) -> Dict[str, float]:
+        """
+        Score a response against several frames in one pass.
+
+        Args:
+            response: The response text to score
+            names: Registered frame names
+
+        Returns:
+            Dict mapping frame names to scores (0.0 - 1.0)
+        """
+        cls._ensure_initialized()
+        return cls._scorer.score(response, names)
 
     @classmethod
     def get(cls, name: str) -> CognitiveFrame:
@@ -863,7 +1067,7 @@ def score_all_frames(response: str, config: FrameworkConfig) -> Dict[str, float]
         Dict mapping frame names to scores (0.0 - 1.0)
     """
     active_frames = FrameRegistry.get_active(config)
-    return {frame.name: frame.score_response(response) for frame in active_frames}
+    return FrameRegistry.score_response(response, [frame.name for frame in active_frames])
 
 
 def aggregate_frame_score(response: str, config: FrameworkConfig) -> float:
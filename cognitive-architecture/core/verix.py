@@ -42,7 +42,7 @@ Compression Levels:
 """
 
 from dataclasses import dataclass
-from typing import Optional, List, Tuple
+from typing import Dict, Optional, List, Tuple
 from enum import Enum
 import re
 
@@ -648,17 +648,41 @@ class VerixValidator:
         # Check for contradicting confidence levels on same content
         content_confidence = {}
         for i, claim in enumerate(claims):
-            normalized = claim.content.lower().strip()
-            if normalized in content_confidence:
-                prev_conf, prev_idx = content_confidence[normalized]
-                if abs(claim.confidence - prev_conf) > 0.3:
-                    violations.append(
-                        f"Inconsistent confidence for same content: "
-                        f"Claim {prev_idx + 1} ({prev_conf:.2f}) vs "
-                        f"Claim {i + 1} ({claim.confidence:.2f})"
-                    )
-            else:
-                content_confidence[normalized] = (claim.confidence, i)
+            violation = self._check_confidence_consistency(claim, i, content_confidence)
+            if violation:
+                violations.append(violation)
+
+        violations.extend(self._check_retracted_references(claims))
+        return violations
+
+    def _check_confidence_consistency(
+        self,
+        claim: VerixClaim,
+        index: int,
+        content_confidence: Dict[str, Tuple[float, int]],
+    ) -> Optional[str]:
+        """
+        Compare a claim with the first earlier claim of the same content.
+
+        content_confidence maps normalized content to (confidence, index) of
+        its first claim and is updated in place.
+        """
+        normalized = claim.content.lower().strip()
+        if normalized not in content_confidence:
+            content_confidence[normalized] = (claim.confidence, index)
+            return None
+        prev_conf, prev_idx = content_confidence[normalized]
+        if abs(claim.confidence - prev_conf) > 0.3:
+            return (
+                f"Inconsistent confidence for same content: "
+                f"Claim {prev_idx + 1} ({prev_conf:.2f}) vs "
+                f"Claim {index + 1} ({claim.confidence:.2f})"
+            )
+        return None
+
+    def _check_retracted_references(self, claims: List[VerixClaim]) -> List[str]:
+        """Confirmed claims grounded on content that is retracted elsewhere."""
+        violations = []
 
         # Check for retracted claims referenced by confirmed claims
         retracted_content = {
@@ -793,6 +817,227 @@ class VerixValidator:
         return total_points / max_points if max_points > 0 else 0.0
 
 
+class VerixStreamParser:
+    """
+    Parse and validate VERIX claims incrementally as a response streams in.
+
+    Chunks are fed as they arrive; each call to feed() returns the claims
+    completed by that chunk, and the running violations are available at
+    any time, so a caller can abort a response that goes off-spec before it
+    finishes. After close(), claims and result() are exactly what
+    VerixParser.parse() and VerixValidator.validate() give for the whole
+    text.
+
+    An L1 claim is emitted once a later line with text completes (trailing
+    [ground:]/[conf:]/[state:] markers may continue on following lines).
+    L0 claims are emitted per completed line while no L1 claim has been
+    seen; like parse(), a response containing any L1 claim keeps only its
+    L1 claims, so the first L1 claim replaces earlier L0 claims.
+
+    Usage:
+        stream = VerixStreamParser(config, max_violations=0)
+        for chunk in response_chunks:
+            stream.feed(chunk)
+            if stream.rejected:
+                break
+        claims = stream.close()
+        is_valid, violations = stream.result()
+    """
+
+    def __init__(
+        self,
+        config: Optional[PromptConfig] = None,
+        max_violations: Optional[int] = None,
+    ):
+        """
+        Initialize stream parser.
+
+        Args:
+            config: PromptConfig for parsing defaults and validation
+            max_violations: Reject the response once more violations than
+                this are found (None = never reject)
+        """
+        self.config = config or PromptConfig()
+        self.parser = VerixParser(self.config)
+        self.validator = VerixValidator(self.config)
+        self.max_violations = max_violations
+
+        self._buffer = ""
+        self._l1_pos = 0
+        self._l0_pos = 0
+        self._l1_claims: List[VerixClaim] = []
+        self._l0_claims: List[VerixClaim] = []
+        self._closed = False
+        self.rejected = False
+        self._reset_validation()
+
+    def _reset_validation(self) -> None:
+        self._claim_violations: List[str] = []
+        self._consistency_violations: List[str] = []
+        self._content_confidence: Dict[str, Tuple[float, int]] = {}
+        self._validated = 0
+
+    @property
+    def claims(self) -> List[VerixClaim]:
+        """Claims completed so far (L1 if any were seen, else L0)."""
+        return list(self._l1_claims or self._l0_claims)
+
+    @property
+    def violations(self) -> List[str]:
+        """
+        Violations found so far.
+
+        Per-claim and confidence-consistency checks run as claims arrive;
+        retracted-reference and ground-cycle checks need every claim and
+        run in result().
+        """
+        return self._claim_violations + self._consistency_violations
+
+    def feed(self, chunk: str) -> List[VerixClaim]:
+        """
+        Add a chunk of the response.
+
+        Args:
+            chunk: Next piece of the streamed text
+
+        Returns:
+            Claims completed by this chunk (empty once rejected)
+        """
+        if self._closed:
+            raise ValueError("feed() called after close()")
+        if self.rejected:
+            return []
+        self._buffer += chunk
+        # Only completed lines are parsed before close()
+        if "\n" not in chunk:
+            return []
+        return self._advance(final=False)
+
+    def close(self) -> List[VerixClaim]:
+        """
+        End the stream and parse the remaining text.
+
+        Returns:
+            All claims of the response
+        """
+        if not self._closed:
+            self._closed = True
+            if not self.rejected:
+                self._advance(final=True)
+        return self.claims
+
+    def result(self) -> Tuple[bool, List[str]]:
+        """
+        Validation result of the claims parsed so far.
+
+        Returns:
+            Tuple of (is_valid, list_of_violations), identical to
+            VerixValidator.validate(claims)
+        """
+        claims = self.claims
+        violations = self.violations
+        if len(claims) > 1:
+            violations += self.validator._check_retracted_references(claims)
+            violations += [
+                f"Circular ground reference detected: {cycle}"
+                for cycle in self.validator.detect_ground_cycles(claims)
+            ]
+        return len(violations) == 0, violations
+
+    def _advance(self, final: bool) -> List[VerixClaim]:
+        """Parse the buffer as far as later chunks cannot change (everything if final)."""
+        # Before close(), only the completed lines are scanned
+        text = self._buffer if final else self._buffer[:self._buffer.rfind("\n") + 1]
+        emitted = []
+        had_l1 = bool(self._l1_claims)
+
+        for match in self.parser.L1_PATTERN.finditer(text, self._l1_pos):
+            if not final and not self._l1_match_is_final(text, match):
+                break
+            self._l1_pos = match.end()
+            claim = self.parser._parse_l1_match(match)
+            if claim:
+                self._l1_claims.append(claim)
+                emitted.append(claim)
+        else:
+            if not final and self._grounds_closed(text):
+                self._l1_pos = max(self._l1_pos, self._settled_prefix(text))
+
+        if self._l1_claims:
+            if not had_l1:
+                # parse() ignores L0 claims when L1 claims are present
+                self._reset_validation()
+        else:
+            # L0 claims never span lines: every completed line is final
+            for match in self.parser.L0_PATTERN.finditer(text, self._l0_pos):
+                claim = self.parser._parse_l0_match(match)
+                if claim:
+                    self._l0_claims.append(claim)
+                    emitted.append(claim)
+            self._l0_pos = len(text)
+
+        self._validate_new_claims()
+        self._trim()
+        return emitted
+
+    def _l1_match_is_final(self, text: str, match: re.Match) -> bool:
+        """
+        Whether more text could change this L1 match.
+
+        text holds completed lines only. L1_PATTERN can read past a line
+        end through whitespace (trailing markers on later lines) and
+        through an unclosed [ground:...], so the match is settled once
+        non-whitespace text follows it and every [ground: from the scan
+        position on is closed.
+        """
+        return bool(text[match.end():].strip()) and self._grounds_closed(text)
+
+    @staticmethod
+    def _settled_prefix(text: str) -> int:
+        """
+        End of the text no future match can start in, given no match so far.
+
+        A failed attempt only depends on later text if it ran out of input
+        in the whitespace after a [meta]/[agent:]/[id:]/[illocution|affect]
+        marker, i.e. through lines ending in "]". Everything before the
+        trailing run of such lines is settled.
+        """
+        pos = len(text)
+        while True:
+            line_end = len(text[:pos].rstrip())
+            if not line_end or text[line_end - 1] != "]":
+                return pos
+            pos = text.rfind("\n", 0, line_end) + 1
+
+    def _grounds_closed(self, text: str) -> bool:
+        ground = text.rfind("[ground:", self._l1_pos)
+        return ground < 0 or text.find("]", ground) >= 0
+
+    def _validate_new_claims(self) -> None:
+        claims = self._l1_claims or self._l0_claims
+        for index in range(self._validated, len(claims)):
+            claim = claims[index]
+            self._claim_violations.extend(self.validator._validate_single(claim, index))
+            violation = self.validator._check_confidence_consistency(
+                claim, index, self._content_confidence
+            )
+            if violation:
+                self._consistency_violations.append(violation)
+        self._validated = len(claims)
+        if self.max_violations is not None and len(self.violations) > self.max_violations:
+            self.rejected = True
+
+    def _trim(self) -> None:
+        """Drop fully parsed lines from the buffer."""
+        pos = self._l1_pos if self._l1_claims else min(self._l1_pos, self._l0_pos)
+        # Cut after a newline so L0's ^ and L1's scan positions keep their meaning
+        cut = self._buffer.rfind("\n", 0, pos) + 1
+        if cut:
+            self._buffer = self._buffer[cut:]
+            self._l1_pos -= cut
+            self._l0_pos = max(0, self._l0_pos - cut)
+
+
 def format_claim(
     claim: VerixClaim,
     compression: CompressionLevel = CompressionLevel.L1_AI_HUMAN
@@ -16,6 +16,7 @@ from .metrics import (
 from .edge_cases import (
     EdgeCaseType,
     EdgeCaseDetector,
+    EdgeCaseScan,
     create_adversarial_task,
     detect_edge_case_type,
 )
@@ -36,6 +37,7 @@ __all__ = [
     # Edge Cases
     "EdgeCaseType",
     "EdgeCaseDetector",
+    "EdgeCaseScan",
     "create_adversarial_task",
     "detect_edge_case_type",
     # Consistency
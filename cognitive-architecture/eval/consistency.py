@@ -6,11 +6,16 @@ Validates that claims within a response are internally consistent:
 - Ground chains are coherent
 - State transitions are valid
 - Illocution-content alignment
+
+Contradiction detection tokenizes each claim once (ClaimSetIndex) and
+uses prefix filtering over an inverted token index to find the pairs that
+can reach the similarity threshold, instead of comparing every pair.
 """
 
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional, Tuple, Set
 from enum import Enum
+import math
 import sys
 import os
 
@@ -20,6 +25,114 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from core.verix import VerixClaim, VerixParser, Illocution, State, Affect
 
 
+# (negated, affirmed) substrings checked by contradiction detection
+NEGATION_PATTERNS = [
+    ("not ", ""), ("n't ", ""), ("false", "true"),
+    ("incorrect", "correct"), ("wrong", "right"),
+    ("no ", "yes "), ("never", "always"),
+]
+
+# Minimum Jaccard similarity of word sets for "similar content"
+CONTENT_SIMILARITY_THRESHOLD = 0.5
+
+
+def _jaccard_at_least(words1: Set[str], words2: Set[str], threshold: float) -> bool:
+    """Same test as ConsistencyChecker._content_similar, on word sets."""
+    if not words1 or not words2:
+        return False
+    intersection = len(words1 & words2)
+    return intersection / (len(words1) + len(words2) - intersection) >= threshold
+
+
+class ClaimSetIndex:
+    """
+    Tokenized claims with candidate-pair lookup for contradiction checks.
+
+    For every claim this keeps the word set of its lowercased content and,
+    per negation pattern, the word sets after removing the negated or the
+    affirmed substring, i.e. exactly the sets the pairwise check compares.
+    Two sets can only reach Jaccard >= t if they share a token among the
+    first |s| - ceil(t * |s|) + 1 tokens of each (rarest first), so
+    indexing those prefixes yields every pair that can contradict.
+    """
+
+    def __init__(
+        self,
+        claims: List[VerixClaim],
+        threshold: float = CONTENT_SIMILARITY_THRESHOLD,
+    ):
+        self.claims = claims
+        self.threshold = threshold
+        self.words: List[Set[str]] = []
+        self.negated: List[List[Optional[Set[str]]]] = []
+        self.affirmed: List[List[Optional[Set[str]]]] = []
+
+        for claim in claims:
+            content = claim.content.lower()
+            words = set(content.split())
+            self.words.append(words)
+            self.negated.append([
+                set(content.replace(neg, "").split()) if neg in content else None
+                for neg, _ in NEGATION_PATTERNS
+            ])
+            self.affirmed.append([
+                (set(content.replace(pos, "").split()) if pos else words) if pos in content else None
+                for _, pos in NEGATION_PATTERNS
+            ])
+
+    def _variants(self, i: int) -> List[Set[str]]:
+        variants = [self.words[i]]
+        variants.extend(v for v in self.negated[i] if v is not None)
+        variants.extend(v for v in self.affirmed[i] if v is not None)
+        return variants
+
+    def candidate_pairs(self) -> List[Tuple[int, int]]:
+        """Sorted (i, j), i < j, that share a prefix token in any word-set variant."""
+        variants = [self._variants(i) for i in range(len(self.claims))]
+
+        # Document frequency orders tokens rarest first
+        frequency: Dict[str, int] = {}
+        for claim_variants in variants:
+            for token in set().union(*claim_variants):
+                frequency[token] = frequency.get(token, 0) + 1
+
+        postings: Dict[str, List[int]] = {}
+        for i, claim_variants in enumerate(variants):
+            prefix_tokens: Set[str] = set()
+            for words in claim_variants:
+                if not words:
+                    continue
+                ordered = sorted(words, key=lambda t: (frequency[t], t))
+                prefix = len(words) - math.ceil(self.threshold * len(words)) + 1
+                prefix_tokens.update(ordered[:prefix])
+            for token in prefix_tokens:
+                postings.setdefault(token, []).append(i)
+
+        pairs: Set[Tuple[int, int]] = set()
+        for indices in postings.values():
+            for a, i in enumerate(indices):
+                for j in indices[a + 1:]:
+                    pairs.add((i, j))
+        return sorted(pairs)
+
+    def contradicts(self, i: int, j: int) -> bool:
+        """ConsistencyChecker._claims_contradict(claims[i], claims[j]) on indexed sets."""
+        t = self.threshold
+        negated1, affirmed1 = self.negated[i], self.affirmed[i]
+        negated2, affirmed2 = self.negated[j], self.affirmed[j]
+        for k in range(len(NEGATION_PATTERNS)):
+            if negated1[k] is not None and affirmed2[k] is not None \
+                    and _jaccard_at_least(negated1[k], affirmed2[k], t):
+                return True
+            if negated2[k] is not None and affirmed1[k] is not None \
+                    and _jaccard_at_least(affirmed1[k], negated2[k], t):
+                return True
+
+        if self.claims[i].state == State.CONFIRMED and self.claims[j].state == State.RETRACTED:
+            return _jaccard_at_least(self.words[i], self.words[j], t)
+        return False
+
+
 class ViolationType(Enum):
     """Types of consistency violations."""
 
@@ -145,22 +258,22 @@ class ConsistencyChecker:
     ) -> List[ConsistencyViolation]:
         """Check for contradicting claims with high combined confidence."""
         violations = []
+        index = ClaimSetIndex(claims)
 
-        for i, claim1 in enumerate(claims):
-            for j, claim2 in enumerate(claims[i+1:], start=i+1):
-                if self._claims_contradict(claim1, claim2):
-                    # Contradicting claims should have lower combined confidence
-                    combined = claim1.confidence + claim2.confidence
-                    if combined > 1.0:
-                        violations.append(ConsistencyViolation(
-                            violation_type=ViolationType.CONFIDENCE_CONTRADICTION,
-                            claim_indices=[i, j],
-                            description=(
-                                f"Claims {i} and {j} appear to contradict but have "
-                                f"combined confidence of {combined:.2f}"
-                            ),
-                            severity=min(1.0, (combined - 1.0) * 2),
-                        ))
+        for i, j in index.candidate_pairs():
+            claim1, claim2 = claims[i], claims[j]
+            # Contradicting claims should have lower combined confidence
+            combined = claim1.confidence + claim2.confidence
+            if combined > 1.0 and index.contradicts(i, j):
+                violations.append(ConsistencyViolation(
+                    violation_type=ViolationType.CONFIDENCE_CONTRADICTION,
+                    claim_indices=[i, j],
+                    description=(
+                        f"Claims {i} and {j} appear to contradict but have "
+                        f"combined confidence of {combined:.2f}"
+                    ),
+                    severity=min(1.0, (combined - 1.0) * 2),
+                ))
 
         return violations
 
@@ -392,13 +505,7 @@ class ConsistencyChecker:
         content2 = claim2.content.lower()
 
         # Check for explicit negation
-        negation_patterns = [
-            ("not ", ""), ("n't ", ""), ("false", "true"),
-            ("incorrect", "correct"), ("wrong", "right"),
-            ("no ", "yes "), ("never", "always"),
-        ]
-
-        for neg, pos in negation_patterns:
+        for neg, pos in NEGATION_PATTERNS:
             if neg in content1 and pos in content2:
                 # Check for content similarity
                 core1 = content1.replace(neg, "").strip()
@@ -418,7 +525,12 @@ class ConsistencyChecker:
 
         return False
 
-    def _content_similar(self, content1: str, content2: str, threshold: float = 0.5) -> bool:
+    def _content_similar(
+        self,
+        content1: str,
+        content2: str,
+        threshold: float = CONTENT_SIMILARITY_THRESHOLD,
+    ) -> bool:
         """Check if two content strings are similar."""
         words1 = set(content1.split())
         words2 = set(content2.split())
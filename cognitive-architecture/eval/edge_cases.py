@@ -11,13 +11,27 @@ Edge Types:
 - adversarial: Intentionally misleading input
 - out_of_distribution: Unusual or rare input
 - contradictory: Self-contradicting input
+
+Detection compiles every pattern group into one scanner: the text is
+case-folded once, each pattern is gated by the literals any of its matches
+must contain (extracted from the regex), and only patterns whose literals
+are present run their regex. Inputs longer than a single pass are streamed
+through overlapping windows, so large inputs are classified on their
+content; OVERLOAD is reported for large inputs that are highly redundant.
 """
 
-from dataclasses import dataclass
-from typing import List, Dict, Any, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Iterable, Optional, Tuple
 from enum import Enum
 import re
 import random
+import zlib
+
+try:
+    import re._parser as _sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse as _sre_parse
 
 
 class EdgeCaseType(Enum):
@@ -111,26 +125,149 @@ EDGE_PATTERNS: List[EdgeCasePattern] = [
 ]
 
 
+# Inputs up to this length are scanned in one pass
+SINGLE_PASS_CHARS = 10000
+# Larger inputs are scanned in windows of this size...
+WINDOW_CHARS = 8192
+# ...overlapping by this much, so matches shorter than it are never split
+WINDOW_OVERLAP = 512
+# Large inputs compressing below this ratio are repetitive enough to be OVERLOAD
+OVERLOAD_COMPRESSION_RATIO = 0.1
+OVERLOAD_CONFIDENCE = 0.8
+
+# Under IGNORECASE these non-ASCII letters match ASCII letters; str.lower()
+# does not map them, so they are folded explicitly before literal checks
+_CASE_FOLD = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s", "\u212a": "k"})
+
+
+def _fold(text: str) -> str:
+    return text.translate(_CASE_FOLD).lower()
+
+
+def _required_literals(pattern: str) -> Optional[Tuple[str, ...]]:
+    """
+    Literals of which every match of pattern contains at least one.
+
+    Returns None if no such (ASCII, 2+ character) set can be derived, in
+    which case the pattern's regex always runs.
+    """
+    try:
+        parsed = _sre_parse.parse(pattern, re.IGNORECASE)
+    except Exception:
+        return None
+    factor = _sequence_factor(list(parsed))
+    if not factor or min(len(lit) for lit in factor) < 2 \
+            or not all(lit.isascii() for lit in factor):
+        return None
+    return tuple(sorted(factor))
+
+
+def _sequence_factor(items: List[Tuple[Any, Any]]) -> Optional[frozenset]:
+    """Most selective required-literal set of a parsed regex sequence."""
+    factors = []
+    run = ""
+    for op, av in items:
+        if op is _sre_parse.LITERAL:
+            run += chr(av).lower()
+            continue
+        if run:
+            factors.append(frozenset([run]))
+            run = ""
+        if op is _sre_parse.BRANCH:
+            branch_factors = [_sequence_factor(list(branch)) for branch in av[1]]
+            if all(branch_factors):
+                factors.append(frozenset().union(*branch_factors))
+        elif op is _sre_parse.SUBPATTERN:
+            sub = _sequence_factor(list(av[-1]))
+            if sub:
+                factors.append(sub)
+        elif op in (_sre_parse.MAX_REPEAT, _sre_parse.MIN_REPEAT) and av[0] >= 1:
+            sub = _sequence_factor(list(av[2]))
+            if sub:
+                factors.append(sub)
+    if run:
+        factors.append(frozenset([run]))
+    if not factors:
+        return None
+    return max(factors, key=lambda f: (min(len(lit) for lit in f), -len(f)))
+
+
+@dataclass
+class _Rule:
+    """One compiled pattern of a pattern group."""
+
+    group: int
+    regex: "re.Pattern"
+    literals: Optional[Tuple[str, ...]]
+
+
+@dataclass
+class EdgeCaseScan:
+    """Per-type results of one scan."""
+
+    length: int
+    # Distinct patterns of each type that matched (drives confidence)
+    pattern_hits: Dict[EdgeCaseType, int] = field(default_factory=dict)
+    # Total non-overlapping matches of each type's patterns
+    match_counts: Dict[EdgeCaseType, int] = field(default_factory=dict)
+    windows: int = 1
+    # Compressed/raw size for windowed scans (None for single-pass scans)
+    compression_ratio: Optional[float] = None
+    empty: bool = False
+
+
 class EdgeCaseDetector:
     """Detect and classify edge cases in tasks."""
 
-    def __init__(self, patterns: Optional[List[EdgeCasePattern]] = None):
+    def __init__(
+        self,
+        patterns: Optional[List[EdgeCasePattern]] = None,
+        overload_ratio: float = OVERLOAD_COMPRESSION_RATIO,
+    ):
         """
         Initialize detector with patterns.
 
         Args:
             patterns: Custom patterns or None for defaults
+            overload_ratio: Compression ratio below which a large input is OVERLOAD
         """
         self.patterns = patterns or EDGE_PATTERNS
+        self.overload_ratio = overload_ratio
         self._compiled = {
             p.edge_type: [re.compile(pat, re.IGNORECASE) for pat in p.patterns]
             for p in self.patterns
         }
+        self._rules = [
+            _Rule(group, regex, _required_literals(regex.pattern))
+            for group, p in enumerate(self.patterns)
+            for regex in self._compiled[p.edge_type]
+        ]
+        self._severity = {p.edge_type: p.severity for p in self.patterns}
+
+    def _candidate_rules(self, text: str) -> List[_Rule]:
+        """Rules whose required literals occur in text."""
+        folded = _fold(text)
+        return [
+            rule for rule in self._rules
+            if rule.literals is None or any(lit in folded for lit in rule.literals)
+        ]
+
+    def _confidences(self, hits: List[int]) -> List[Tuple[EdgeCaseType, float]]:
+        detected = []
+        for pattern, matches in zip(self.patterns, hits):
+            if matches > 0:
+                # Confidence based on pattern severity and match count
+                confidence = min(1.0, pattern.severity * (1 + 0.2 * (matches - 1)))
+                detected.append((pattern.edge_type, confidence))
+        return detected
 
     def detect(self, text: str) -> List[Tuple[EdgeCaseType, float]]:
         """
         Detect all edge cases in text.
 
+        Inputs longer than SINGLE_PASS_CHARS are scanned in windows; OVERLOAD
+        is reported first when such an input is highly repetitive.
+
         Args:
             text: Input text to analyze
 
@@ -140,22 +277,146 @@ class EdgeCaseDetector:
         if not text or not text.strip():
             return [(EdgeCaseType.EMPTY, 1.0)]
 
-        if len(text) > 10000:
-            return [(EdgeCaseType.OVERLOAD, 0.8)]
+        if len(text) > SINGLE_PASS_CHARS:
+            return self.detections(self.scan(text))
 
-        detected = []
+        hits = [0] * len(self.patterns)
+        for rule in self._candidate_rules(text):
+            if rule.regex.search(text):
+                hits[rule.group] += 1
+        return self._confidences(hits)
 
-        for pattern in self.patterns:
-            compiled = self._compiled[pattern.edge_type]
-            matches = sum(1 for p in compiled if p.search(text))
+    def scan(self, text: str) -> EdgeCaseScan:
+        """
+        Count matches per edge case type.
 
-            if matches > 0:
-                # Confidence based on pattern severity and match count
-                confidence = min(1.0, pattern.severity * (1 + 0.2 * (matches - 1)))
-                detected.append((pattern.edge_type, confidence))
+        Args:
+            text: Input text (windowed when longer than SINGLE_PASS_CHARS)
+
+        Returns:
+            EdgeCaseScan with per-type pattern hits and match counts
+        """
+        if len(text) > SINGLE_PASS_CHARS:
+            return self.scan_stream(
+                text[start:start + WINDOW_CHARS] for start in range(0, len(text), WINDOW_CHARS)
+            )
+
+        hits = [0] * len(self.patterns)
+        counts = [0] * len(self.patterns)
+        for rule in self._candidate_rules(text):
+            found = sum(1 for _ in rule.regex.finditer(text))
+            if found:
+                hits[rule.group] += 1
+                counts[rule.group] += found
+        return self._make_scan(len(text), hits, counts, empty=not text.strip())
+
+    def scan_stream(self, chunks: Iterable[str]) -> EdgeCaseScan:
+        """
+        Scan a large input chunk by chunk in overlapping windows.
+
+        Each window is the previous WINDOW_OVERLAP characters plus the next
+        chunk. A pattern counts as matched if it matches in any window, and
+        each match is counted in the window where it starts outside the
+        overlap, so matches shorter than WINDOW_OVERLAP are found exactly
+        once.
 
+        Args:
+            chunks: Pieces of the input, in order (any sizes)
+
+        Returns:
+            EdgeCaseScan including the input's compression ratio
+        """
+        matched = set()
+        counts = [0] * len(self.patterns)
+        compressor = zlib.compressobj(1)
+        raw_bytes = compressed_bytes = 0
+        length = windows = 0
+        empty = True
+        carry = ""
+
+        def scan_window(window: str, owned: int) -> None:
+            for rule in self._candidate_rules(window):
+                for match in rule.regex.finditer(window):
+                    if match.start() < owned:
+                        counts[rule.group] += 1
+                        matched.add(id(rule))
+
+        pending = ""
+        for chunk in chunks:
+            pending += chunk
+            length += len(chunk)
+            data = chunk.encode("utf-8", "surrogatepass")
+            raw_bytes += len(data)
+            compressed_bytes += len(compressor.compress(data))
+            empty = empty and not chunk.strip()
+            while len(pending) >= WINDOW_CHARS:
+                window = carry + pending[:WINDOW_CHARS]
+                pending = pending[WINDOW_CHARS:]
+                # Matches starting in the last WINDOW_OVERLAP chars belong to the next window
+                scan_window(window, len(window) - WINDOW_OVERLAP)
+                carry = window[-WINDOW_OVERLAP:]
+                windows += 1
+        if pending or not windows:
+            window = carry + pending
+            scan_window(window, len(window))
+            windows += 1
+        compressed_bytes += len(compressor.flush())
+
+        hits = [0] * len(self.patterns)
+        for rule in self._rules:
+            if id(rule) in matched:
+                hits[rule.group] += 1
+        scan = self._make_scan(length, hits, counts, empty=empty)
+        scan.windows = windows
+        scan.compression_ratio = compressed_bytes / raw_bytes if raw_bytes else 1.0
+        return scan
+
+    def _make_scan(self, length: int, hits: List[int], counts: List[int], empty: bool) -> EdgeCaseScan:
+        scan = EdgeCaseScan(length=length, empty=empty)
+        for pattern, pattern_hits, match_count in zip(self.patterns, hits, counts):
+            if pattern_hits:
+                scan.pattern_hits[pattern.edge_type] = pattern_hits
+                scan.match_counts[pattern.edge_type] = match_count
+        return scan
+
+    def detections(self, scan: EdgeCaseScan) -> List[Tuple[EdgeCaseType, float]]:
+        """(EdgeCaseType, confidence) list for a scan, as returned by detect()."""
+        if scan.empty:
+            return [(EdgeCaseType.EMPTY, 1.0)]
+        detected = self._confidences([scan.pattern_hits.get(p.edge_type, 0) for p in self.patterns])
+        if scan.compression_ratio is not None and scan.length > SINGLE_PASS_CHARS \
+                and scan.compression_ratio < self.overload_ratio:
+            detected.insert(0, (EdgeCaseType.OVERLOAD, OVERLOAD_CONFIDENCE))
         return detected
 
+    def detect_batch(
+        self,
+        texts: Iterable[str],
+        processes: Optional[int] = None,
+    ) -> List[List[Tuple[EdgeCaseType, float]]]:
+        """
+        Detect edge cases for a corpus of texts.
+
+        Identical texts are analyzed once.
+
+        Args:
+            texts: Inputs to analyze
+            processes: Worker processes (None = analyze in this process)
+
+        Returns:
+            detect() result for each text, in input order
+        """
+        texts = list(texts)
+        unique = list(dict.fromkeys(texts))
+        if processes and processes > 1 and len(unique) > 1:
+            with ProcessPoolExecutor(max_workers=processes) as pool:
+                chunksize = max(1, len(unique) // (processes * 4))
+                results = list(pool.map(self.detect, unique, chunksize=chunksize))
+        else:
+            results = [self.detect(text) for text in unique]
+        by_text = dict(zip(unique, results))
+        return [by_text[text] for text in texts]
+
     def classify(self, text: str) -> Optional[EdgeCaseType]:
         """
         Classify text into primary edge case type.
@@ -187,10 +448,11 @@ class EdgeCaseDetector:
         if not detected:
             return 0.0
 
-        # Weighted average of detected severities
+        # Weighted average of detected severities (EMPTY/OVERLOAD have no
+        # pattern group; their confidence stands in for severity)
         total_confidence = sum(conf for _, conf in detected)
         weighted_severity = sum(
-            conf * next(p.severity for p in self.patterns if p.edge_type == edge_type)
+            conf * self._severity.get(edge_type, conf)
             for edge_type, conf in detected
         )
 
@@ -6,16 +6,19 @@ against rubrics for qualities that can't be measured deterministically.
 
 Features:
 - RubricGrader: Evaluate against multi-dimensional rubric
-- Cross-model council: Claude + Gemini + Codex consensus
+- Cross-model council: Claude + Gemini + Codex consensus, judged
+  concurrently with a per-judge timeout and optional early consensus
 - Self-referential grading: Evaluate prompts about prompting
 """
 
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional, Tuple, Callable
+from typing import List, Dict, Any, Optional, Tuple, Callable, Union
 from enum import Enum
 import json
 import os
 import sys
+import time
 
 # Add parent directory for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -70,6 +73,12 @@ class JudgingResult:
     judge_model: str
     raw_response: str = ""
     confidence: float = 0.8
+    latency_ms: float = 0.0
+    # Council only: latency of each judge that answered, judges that did not
+    # answer within the timeout, and whether the council stopped early
+    judge_latencies_ms: Dict[str, float] = field(default_factory=dict)
+    timed_out_judges: List[str] = field(default_factory=list)
+    early_consensus: bool = False
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -79,6 +88,10 @@ class JudgingResult:
             "reasoning": self.reasoning,
             "judge_model": self.judge_model,
             "confidence": self.confidence,
+            "latency_ms": self.latency_ms,
+            "judge_latencies_ms": self.judge_latencies_ms,
+            "timed_out_judges": self.timed_out_judges,
+            "early_consensus": self.early_consensus,
         }
 
 
@@ -113,11 +126,17 @@ class RubricGrader:
         ),
     ]
 
+    DEFAULT_JUDGE_TIMEOUT_S = 120.0
+
     def __init__(
         self,
         criteria: Optional[List[RubricCriterion]] = None,
         use_council: bool = False,
         council_models: Optional[List[JudgeModel]] = None,
+        judge_timeout_s: Optional[float] = DEFAULT_JUDGE_TIMEOUT_S,
+        agreement_variance: Optional[float] = None,
+        min_agreeing_judges: int = 2,
+        mock_latency_s: Union[float, Dict[JudgeModel, float]] = 0.0,
     ):
         """
         Initialize rubric grader.
@@ -126,10 +145,19 @@ class RubricGrader:
             criteria: List of rubric criteria (None = use defaults)
             use_council: Whether to use multi-model council
             council_models: Models for council (default: all three)
+            judge_timeout_s: Seconds to wait for each council judge (None = no limit)
+            agreement_variance: Return as soon as min_agreeing_judges scores have
+                at most this variance (None = always wait for every judge)
+            min_agreeing_judges: Judges needed for an early consensus
+            mock_latency_s: Simulated latency of _mock_judge, overall or per model
         """
         self.criteria = criteria or self.DEFAULT_CRITERIA
         self.use_council = use_council
         self.council_models = council_models or list(JudgeModel)
+        self.judge_timeout_s = judge_timeout_s
+        self.agreement_variance = agreement_variance
+        self.min_agreeing_judges = max(1, min_agreeing_judges)
+        self.mock_latency_s = mock_latency_s
 
         # Normalize weights
         total_weight = sum(c.weight for c in self.criteria)
@@ -170,7 +198,10 @@ class RubricGrader:
 
         # For now, return mock result (real implementation would call API)
         # This allows testing without API calls
-        return self._mock_judge(response, task, model)
+        start = time.perf_counter()
+        result = self._mock_judge(response, task, model)
+        result.latency_ms = (time.perf_counter() - start) * 1000
+        return result
 
     def _grade_with_council(
         self,
@@ -182,18 +213,59 @@ class RubricGrader:
         Grade using multi-model council.
 
         Aggregates scores from Claude, Gemini, and Codex for cross-model
-        compatibility and bias reduction.
+        compatibility and bias reduction. Judges run concurrently, so a
+        council grade takes about as long as its slowest judge (bounded by
+        judge_timeout_s). Judges that miss the timeout are left out. With
+        agreement_variance set, the council returns as soon as enough
+        answered judges agree, without waiting for the rest.
         """
-        results = []
-
-        for model in self.council_models:
-            result = self._grade_single(response, task, expected, model)
-            results.append(result)
-
-        # Aggregate scores
+        start = time.perf_counter()
+        deadline = None if self.judge_timeout_s is None else start + self.judge_timeout_s
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, len(self.council_models)),
+            thread_name_prefix="council-judge",
+        )
+        futures = {
+            executor.submit(self._grade_single, response, task, expected, model): model
+            for model in self.council_models
+        }
+        answered: Dict[JudgeModel, JudgingResult] = {}
+        pending = set(futures)
+        early_consensus = False
+
+        try:
+            while pending:
+                timeout = None if deadline is None else max(0.0, deadline - time.perf_counter())
+                done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                if not done:
+                    break  # timed out
+                for future in done:
+                    answered[futures[future]] = future.result()
+                if pending and self._has_consensus(list(answered.values())):
+                    early_consensus = True
+                    break
+        finally:
+            # Don't wait for judges that timed out or are no longer needed
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        # Aggregate in council order, so results don't depend on finish order
+        results = [answered[m] for m in self.council_models if m in answered]
         aggregated = self._aggregate_council_results(results)
+        aggregated.latency_ms = (time.perf_counter() - start) * 1000
+        aggregated.judge_latencies_ms = {r.judge_model: r.latency_ms for r in results}
+        aggregated.early_consensus = early_consensus
+        if not early_consensus:
+            aggregated.timed_out_judges = [futures[f].value for f in futures if f in pending]
         return aggregated
 
+    def _has_consensus(self, results: List[JudgingResult]) -> bool:
+        """Whether answered judges agree closely enough to stop early."""
+        if self.agreement_variance is None or len(results) < self.min_agreeing_judges:
+            return False
+        mean_score = sum(r.score for r in results) / len(results)
+        variance = sum((r.score - mean_score) ** 2 for r in results) / len(results)
+        return variance <= self.agreement_variance
+
     def _aggregate_council_results(
         self,
         results: List[JudgingResult],
@@ -288,8 +360,15 @@ class RubricGrader:
         """
         Mock judge for testing without API calls.
 
-        Uses heuristics to simulate LLM judgment.
+        Uses heuristics to simulate LLM judgment. Sleeps for mock_latency_s
+        first, to simulate model latency in tests and benchmarks.
         """
+        latency = self.mock_latency_s
+        if isinstance(latency, dict):
+            latency = latency.get(model, 0.0)
+        if latency > 0:
+            time.sleep(latency)
+
         scores = {}
 
         # Heuristic scoring based on response characteristics
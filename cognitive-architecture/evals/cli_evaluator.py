@@ -5,26 +5,46 @@ CLI-Based Real Task Evaluator for VVV Dogfooding
 Uses the locally authenticated `claude` CLI instead of API keys.
 This mirrors the approach in life-os-dashboard ClaudeClient.
 
+Tasks run through a worker pool: execute and judge are separate stages
+with their own workers, so judging one task overlaps executing the next.
+Each finished stage is checkpointed to disk and an interrupted run can
+be resumed with resume=True (or --resume).
+
 Usage:
     from evals.cli_evaluator import CLITaskEvaluator
     evaluator = CLITaskEvaluator("prompt-architect")
-    results = evaluator.run_evaluation(max_tasks=5)
+    results = evaluator.run_evaluation(max_tasks=5, concurrency=4)
+
+Model responses go through the shared result cache (evals/result_cache.py),
+so re-running an unchanged corpus makes no CLI calls; --cache replay
+re-grades from the cache alone.
+
+Offline (stub CLI, no network):
+    CLAUDE_CLI="python evals/stub_cli.py" python evals/cli_evaluator.py prompt-architect
 """
 
 import os
 import sys
 import json
 import time
+import shlex
+import hashlib
 import asyncio
 import subprocess
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
 from datetime import datetime, timezone
 from dataclasses import dataclass, field, asdict
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
 # Add parent to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from evals.result_cache import CacheMiss, ResultCache, has_json_object
+
+# Part of every result-cache key; bump when the prompt templates change
+HARNESS_VERSION = "cli_evaluator/1.0.0"
+
 
 @dataclass
 class TaskResult:
@@ -45,6 +65,9 @@ class TaskResult:
     execution_time_ms: int = 0
 
 
+DEFAULT_CONCURRENCY = 4
+
+
 @dataclass
 class EvaluationResult:
     """Aggregate evaluation results."""
@@ -63,20 +86,37 @@ class EvaluationResult:
     l2_purity: float = 0.0
     overall_score: float = 0.0
     task_results: List[TaskResult] = field(default_factory=list)
+    # Throughput of this run (resumed tasks are excluded from the rate)
+    concurrency: int = 1
+    resumed_tasks: int = 0
+    wall_time_s: float = 0.0
+    tasks_per_minute: float = 0.0
+    cache_stats: Dict[str, Any] = field(default_factory=dict)
 
 
 class ClaudeCLI:
     """
     Wrapper for local Claude CLI.
     Uses the already-authenticated CLI instead of API keys.
+
+    The command can be overridden (e.g. with evals/stub_cli.py for offline
+    runs) via the constructor or the CLAUDE_CLI environment variable.
     """
 
     CLI_COMMAND = "claude"
+    CLI_ENV_VAR = "CLAUDE_CLI"
     DEFAULT_MODEL = "claude-sonnet-4-20250514"
 
-    def __init__(self):
+    def __init__(self, command: Optional[List[str]] = None):
         self._available: Optional[bool] = None
         self.model = self.DEFAULT_MODEL
+        if command is None:
+            override = os.environ.get(self.CLI_ENV_VAR)
+            command = shlex.split(override) if override else [self.CLI_COMMAND]
+        self.command = list(command)
+        # npm installs the CLI as a .cmd shim on Windows, which needs the shell.
+        # Elsewhere shell=True with an argument list would drop every argument.
+        self._shell = os.name == "nt"
 
     @property
     def is_available(self) -> bool:
@@ -89,11 +129,11 @@ class ClaudeCLI:
         """Check if claude CLI is installed and accessible"""
         try:
             result = subprocess.run(
-                [self.CLI_COMMAND, "--version"],
+                self.command + ["--version"],
                 capture_output=True,
                 text=True,
                 timeout=10,
-                shell=True
+                shell=self._shell
             )
             return result.returncode == 0
         except Exception:
@@ -110,7 +150,7 @@ class ClaudeCLI:
         start_time = time.time()
 
         cmd = [
-            self.CLI_COMMAND,
+            *self.command,
             "--print",
             "--output-format", "text",
         ]
@@ -123,7 +163,7 @@ class ClaudeCLI:
                 capture_output=True,
                 text=True,
                 timeout=300,  # 5 minute timeout
-                shell=True
+                shell=self._shell
             )
 
             execution_time_ms = int((time.time() - start_time) * 1000)
@@ -145,6 +185,79 @@ class ClaudeCLI:
             raise ValueError("Claude CLI timeout after 5 minutes")
 
 
+class EvalCheckpoint:
+    """
+    Append-only per-task checkpoint of a CLI evaluation run.
+
+    One JSON line per finished stage: the skill output once a task has been
+    executed, and the full TaskResult once it has been judged. The first
+    line holds a fingerprint of the run inputs (skill content, model, corpus
+    version); a checkpoint with a different fingerprint is discarded
+    instead of resumed.
+    """
+
+    def __init__(self, path: Path, fingerprint: str, resume: bool = True):
+        self.path = path
+        self.fingerprint = fingerprint
+        self.executed: Dict[str, Tuple[str, int]] = {}
+        self.judged: Dict[str, TaskResult] = {}
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if not (resume and self._load()):
+            self.executed.clear()
+            self.judged.clear()
+            with open(self.path, "w", encoding="utf-8") as f:
+                f.write(json.dumps({"fingerprint": fingerprint}) + "\n")
+
+    def _load(self) -> bool:
+        """Load a matching checkpoint; False if missing or stale."""
+        if not self.path.exists():
+            return False
+        with open(self.path, "r", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        try:
+            if not lines or json.loads(lines[0]).get("fingerprint") != self.fingerprint:
+                print(f"[CLI] Checkpoint {self.path.name} is from a different run; starting fresh")
+                return False
+        except json.JSONDecodeError:
+            return False
+
+        for line in lines[1:]:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # torn last line from an interrupted write
+            if entry.get("stage") == "execute":
+                self.executed[entry["task_id"]] = (entry["skill_output"], entry["execute_ms"])
+            elif entry.get("stage") == "judge":
+                result = TaskResult(**entry["result"])
+                self.judged[result.task_id] = result
+        return True
+
+    def _append(self, entry: Dict[str, Any]) -> None:
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def record_execution(self, task_id: str, skill_output: str, execute_ms: int) -> None:
+        """Checkpoint a task's skill output so resuming only re-judges it."""
+        self.executed[task_id] = (skill_output, execute_ms)
+        self._append({
+            "stage": "execute", "task_id": task_id,
+            "skill_output": skill_output, "execute_ms": execute_ms,
+        })
+
+    def record_result(self, result: TaskResult) -> None:
+        """Checkpoint a judged task."""
+        self.judged[result.task_id] = result
+        self._append({"stage": "judge", "task_id": result.task_id, "result": asdict(result)})
+
+    def remove(self) -> None:
+        """Delete the checkpoint once the run's results are saved."""
+        self.path.unlink(missing_ok=True)
+
+
 class CLITaskEvaluator:
     """
     Evaluator that uses Claude CLI for real LLM-based evaluation.
@@ -155,14 +268,21 @@ class CLITaskEvaluator:
     RESULTS_DIR = Path(__file__).parent.parent / "storage" / "eval_results"
     SKILLS_DIR = Path(__file__).parent.parent.parent / "skills" / "foundry"
 
-    def __init__(self, skill_name: str):
+    def __init__(
+        self,
+        skill_name: str,
+        cli: Optional[ClaudeCLI] = None,
+        cache: Optional[ResultCache] = None,
+    ):
         self.skill_name = skill_name
         self.corpus = self._load_corpus()
         self.skill_content = self._load_skill()
-        self.cli = ClaudeCLI()
+        self.cli = cli or ClaudeCLI()
+        self.cache = cache or ResultCache()
         self.RESULTS_DIR.mkdir(parents=True, exist_ok=True)
 
-        if not self.cli.is_available:
+        # Replay only reads cached results, so it needs no CLI
+        if self.cache.mode != "replay" and not self.cli.is_available:
             raise ValueError("Claude CLI not available. Install with: npm install -g @anthropic-ai/claude-code")
 
         print(f"[CLI] Claude CLI available - using real LLM evaluation")
@@ -182,6 +302,14 @@ class CLITaskEvaluator:
             raise FileNotFoundError(f"Skill not found: {skill_file}")
         return skill_file.read_text(encoding="utf-8")
 
+    def _send(self, prompt: str, max_tokens: int = 2000, cacheable=None) -> str:
+        """Send a prompt through the result cache; the CLI is only called on a miss."""
+        return self.cache.call(
+            prompt, self.cli.model, HARNESS_VERSION,
+            lambda: self.cli.send_message(prompt, max_tokens=max_tokens)["response"],
+            cacheable=cacheable, max_tokens=max_tokens,
+        )
+
     def _execute_skill(self, task_input: str) -> str:
         """Execute the skill with given input using Claude CLI."""
         prompt = f"""You are executing the {self.skill_name} skill.
@@ -199,8 +327,9 @@ Now execute this skill with the following input:
 Provide the skill's output following its defined behavior and format."""
 
         try:
-            result = self.cli.send_message(prompt)
-            return result["response"]
+            return self._send(prompt)
+        except CacheMiss:
+            raise
         except Exception as e:
             return f"[ERROR] Skill execution failed: {e}"
 
@@ -240,8 +369,8 @@ Respond in JSON format ONLY (no other text):
 }}"""
 
         try:
-            result = self.cli.send_message(judge_prompt, max_tokens=500)
-            text = result["response"]
+            # Unparseable judge responses are not cached, so they are retried
+            text = self._send(judge_prompt, max_tokens=500, cacheable=has_json_object)
 
             # Find JSON in response
             start = text.find('{')
@@ -251,6 +380,8 @@ Respond in JSON format ONLY (no other text):
 
             return self._default_scores("Failed to parse judge response")
 
+        except CacheMiss:
+            raise
         except Exception as e:
             return self._default_scores(f"Judge error: {e}")
 
@@ -268,15 +399,20 @@ Respond in JSON format ONLY (no other text):
 
     def evaluate_task(self, task: Dict) -> TaskResult:
         """Evaluate a single task using Claude CLI."""
-        start_time = time.time()
+        skill_output, execute_ms = self._execute_stage(task)
+        return self._judge_stage(task, skill_output, execute_ms)
 
-        # Execute skill
+    def _execute_stage(self, task: Dict) -> Tuple[str, int]:
+        """Execute stage: skill output and its duration in ms."""
+        start_time = time.time()
         skill_output = self._execute_skill(task['input'])
+        return skill_output, int((time.time() - start_time) * 1000)
 
-        # Judge output
+    def _judge_stage(self, task: Dict, skill_output: str, execute_ms: int) -> TaskResult:
+        """Judge stage: score an executed task."""
+        start_time = time.time()
         scores = self._judge_output(task, skill_output)
-
-        execution_time = int((time.time() - start_time) * 1000)
+        execution_time = execute_ms + int((time.time() - start_time) * 1000)
 
         return TaskResult(
             task_id=task['id'],
@@ -295,13 +431,93 @@ Respond in JSON format ONLY (no other text):
             execution_time_ms=execution_time,
         )
 
+    def _fingerprint(self) -> str:
+        """Hash of the run inputs a checkpoint is only valid for."""
+        h = hashlib.sha256()
+        for part in (self.skill_name, self.corpus.get('version', 'unknown'),
+                     self.cli.model, self.skill_content):
+            h.update(part.encode("utf-8"))
+            h.update(b"\0")
+        return h.hexdigest()
+
+    def checkpoint_path(self) -> Path:
+        """Checkpoint file for this skill's in-progress run."""
+        return self.RESULTS_DIR / "checkpoints" / f"{self.skill_name}-cli-eval.jsonl"
+
+    def _run_pipeline(
+        self,
+        tasks: List[Dict],
+        checkpoint: EvalCheckpoint,
+        concurrency: int,
+    ) -> Dict[str, TaskResult]:
+        """
+        Evaluate tasks with pipelined execute and judge worker pools.
+
+        Each stage gets `concurrency` workers, so up to 2 * concurrency CLI
+        processes run at once. Checkpoint writes happen on this thread as
+        stages complete.
+        """
+        results: Dict[str, TaskResult] = {}
+        pending = [t for t in tasks if t['id'] not in checkpoint.judged]
+        executors = ThreadPoolExecutor(concurrency, thread_name_prefix="cli-execute")
+        judges = ThreadPoolExecutor(concurrency, thread_name_prefix="cli-judge")
+        executing: Dict[Future, Dict] = {}
+        judging: Dict[Future, Dict] = {}
+
+        try:
+            for task in pending:
+                if task['id'] in checkpoint.executed:
+                    output, execute_ms = checkpoint.executed[task['id']]
+                    judging[judges.submit(self._judge_stage, task, output, execute_ms)] = task
+                else:
+                    executing[executors.submit(self._execute_stage, task)] = task
+
+            done_count = len(tasks) - len(pending)
+            while executing or judging:
+                done, _ = wait(list(executing) + list(judging), return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future in executing:
+                        task = executing.pop(future)
+                        output, execute_ms = future.result()
+                        checkpoint.record_execution(task['id'], output, execute_ms)
+                        judging[judges.submit(self._judge_stage, task, output, execute_ms)] = task
+                    else:
+                        task = judging.pop(future)
+                        result = future.result()
+                        checkpoint.record_result(result)
+                        results[task['id']] = result
+                        done_count += 1
+                        status = "PASS" if result.passed else "FAIL"
+                        print(f"[{done_count}/{len(tasks)}] {task['id']} {status} "
+                              f"({result.execution_time_ms}ms)", flush=True)
+        finally:
+            # On interrupt, drop queued work; finished stages are already checkpointed
+            executors.shutdown(wait=True, cancel_futures=True)
+            judges.shutdown(wait=True, cancel_futures=True)
+
+        return results
+
     def run_evaluation(
         self,
         task_ids: Optional[List[str]] = None,
         difficulty_filter: Optional[str] = None,
         max_tasks: Optional[int] = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        resume: bool = False,
     ) -> EvaluationResult:
-        """Run evaluation using Claude CLI."""
+        """
+        Run evaluation using Claude CLI.
+
+        Args:
+            task_ids: Only evaluate these task IDs
+            difficulty_filter: Only evaluate tasks of this difficulty
+            max_tasks: Evaluate at most this many tasks
+            concurrency: Workers per stage (execute, judge)
+            resume: Continue from this skill's checkpoint if it matches
+
+        Returns:
+            EvaluationResult with per-task results and run throughput
+        """
         tasks = self.corpus['tasks']
 
         if difficulty_filter:
@@ -314,17 +530,23 @@ Respond in JSON format ONLY (no other text):
         print(f"\n{'='*60}")
         print(f"CLI EVALUATION: {self.skill_name}")
         print(f"Tasks to evaluate: {len(tasks)}")
-        print(f"Using: Claude CLI (real LLM)")
+        print(f"Using: Claude CLI (real LLM), concurrency {concurrency}")
         print(f"{'='*60}\n")
 
-        results: List[TaskResult] = []
+        concurrency = max(1, concurrency)
+        checkpoint = EvalCheckpoint(self.checkpoint_path(), self._fingerprint(), resume=resume)
+        task_id_set = {t['id'] for t in tasks}
+        resumed = {tid: r for tid, r in checkpoint.judged.items() if tid in task_id_set}
+        if resumed:
+            print(f"[CLI] Resuming: {len(resumed)} task(s) already evaluated\n")
 
-        for i, task in enumerate(tasks, 1):
-            print(f"[{i}/{len(tasks)}] Evaluating {task['id']}...", end=" ", flush=True)
-            result = self.evaluate_task(task)
-            results.append(result)
-            status = "PASS" if result.passed else "FAIL"
-            print(f"{status} ({result.execution_time_ms}ms)")
+        start_time = time.perf_counter()
+        evaluated = self._run_pipeline(tasks, checkpoint, concurrency)
+        wall_time_s = time.perf_counter() - start_time
+
+        results: List[TaskResult] = [
+            evaluated.get(t['id']) or resumed[t['id']] for t in tasks
+        ]
 
         # Aggregate scores
         passed_count = sum(1 for r in results if r.passed)
@@ -354,9 +576,15 @@ Respond in JSON format ONLY (no other text):
             l2_purity=avg_score(results, 'l2_purity'),
             overall_score=passed_count / len(results) if results else 0,
             task_results=results,
+            concurrency=concurrency,
+            resumed_tasks=len(resumed),
+            wall_time_s=wall_time_s,
+            tasks_per_minute=len(evaluated) * 60 / wall_time_s if evaluated and wall_time_s > 0 else 0.0,
+            cache_stats=self.cache.stats(),
         )
 
         self._save_results(eval_result)
+        checkpoint.remove()
         return eval_result
 
     def _save_results(self, result: EvaluationResult):
@@ -381,6 +609,13 @@ Respond in JSON format ONLY (no other text):
             "verix_compliance": result.verix_compliance,
             "l2_purity": result.l2_purity,
             "overall_score": result.overall_score,
+            "throughput": {
+                "concurrency": result.concurrency,
+                "resumed_tasks": result.resumed_tasks,
+                "wall_time_s": result.wall_time_s,
+                "tasks_per_minute": result.tasks_per_minute,
+            },
+            "cache": result.cache_stats,
             "task_results": [
                 {
                     "task_id": r.task_id,
@@ -420,6 +655,15 @@ Respond in JSON format ONLY (no other text):
         print(f"  VERIX Compliance: {result.verix_compliance:.1%}")
         print(f"  L2 Purity: {result.l2_purity:.1%}")
         print(f"\nOverall Score: {result.overall_score:.1%}")
+        print(f"\nThroughput:")
+        print(f"  Wall Clock: {result.wall_time_s:.1f}s (concurrency {result.concurrency})")
+        print(f"  Tasks/Minute: {result.tasks_per_minute:.1f}")
+        if result.resumed_tasks:
+            print(f"  Resumed From Checkpoint: {result.resumed_tasks}")
+        cache = result.cache_stats
+        if cache:
+            print(f"  Result Cache ({cache['mode']}): {cache['hits']} hits, "
+                  f"{cache['misses']} misses ({cache['hit_rate']:.1%})")
 
 
 def main():
@@ -434,6 +678,14 @@ def main():
                         help="Comma-separated list of task IDs to run (e.g., PA-020,PA-023)")
     parser.add_argument("--format", choices=["text", "json"], default="text",
                         help="Output format (default: text)")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                        help=f"Workers per stage (default: {DEFAULT_CONCURRENCY})")
+    parser.add_argument("--resume", action="store_true",
+                        help="Resume an interrupted run from its checkpoint")
+    parser.add_argument("--cache", choices=["readwrite", "replay", "off"], default=None,
+                        help="Result cache mode (default: EVAL_CACHE_MODE or readwrite)")
+    parser.add_argument("--cli", type=str, default=None,
+                        help="CLI command to use instead of `claude` (e.g. \"python evals/stub_cli.py\")")
 
     args = parser.parse_args()
 
@@ -443,11 +695,14 @@ def main():
         task_ids = [t.strip() for t in args.tasks.split(",")]
 
     try:
-        evaluator = CLITaskEvaluator(args.skill)
+        cli = ClaudeCLI(shlex.split(args.cli)) if args.cli else None
+        evaluator = CLITaskEvaluator(args.skill, cli=cli, cache=ResultCache(mode=args.cache))
         result = evaluator.run_evaluation(
             task_ids=task_ids,
             difficulty_filter=args.difficulty,
             max_tasks=args.max_tasks,
+            concurrency=args.concurrency,
+            resume=args.resume,
         )
 
         if args.format == "json":
@@ -476,6 +731,13 @@ def main():
                     "verix_compliance": result.verix_compliance,
                     "l2_purity": result.l2_purity,
                 },
+                "throughput": {
+                    "concurrency": result.concurrency,
+                    "resumed_tasks": result.resumed_tasks,
+                    "wall_time_s": result.wall_time_s,
+                    "tasks_per_minute": result.tasks_per_minute,
+                },
+                "cache": result.cache_stats,
             }
             print(json.dumps(output))
         else:
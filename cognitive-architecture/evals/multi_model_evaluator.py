@@ -17,6 +17,18 @@ from dataclasses import dataclass, field, asdict
 # Add parent to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from evals.result_cache import CacheMiss, ResultCache, has_json_object
+
+# Part of every result-cache key; bump when the prompt templates change
+HARNESS_VERSION = "multi_model_evaluator/1.0.0"
+
+# Model behind each provider (part of the cache key)
+PROVIDER_MODELS = {
+    "claude": "claude-cli",
+    "gemini": "gemini-1.5-flash",
+    "codex": "gpt-4o-mini",
+}
+
 # API Keys
 ANTHROPIC_API_KEY = os.environ.get("ANTHROPIC_API_KEY", "")
 GOOGLE_API_KEY = os.environ.get("GOOGLE_API_KEY", "")
@@ -62,7 +74,8 @@ class MultiModelClient:
 
     PROVIDERS = ["claude", "gemini", "codex"]
 
-    def __init__(self):
+    def __init__(self, cache: Optional[ResultCache] = None):
+        self.cache = cache or ResultCache()
         self._claude_available = None
         self._gemini_client = None
         self._openai_client = None
@@ -118,21 +131,30 @@ class MultiModelClient:
         self._current_index += 1
         return provider
 
-    def send_message(self, prompt: str, provider: Optional[str] = None) -> Dict[str, Any]:
-        """Send message to specified or next provider"""
+    def send_message(
+        self,
+        prompt: str,
+        provider: Optional[str] = None,
+        cacheable=None,
+    ) -> Dict[str, Any]:
+        """Send message to specified or next provider (through the result cache)"""
         if provider is None:
             provider = self.get_next_provider()
+        if provider not in PROVIDER_MODELS:
+            raise ValueError(f"Unknown provider: {provider}")
 
-        start_time = time.time()
-
-        if provider == "claude":
-            return self._send_claude(prompt, start_time)
-        elif provider == "gemini":
-            return self._send_gemini(prompt, start_time)
-        elif provider == "codex":
+        def send() -> Dict[str, Any]:
+            start_time = time.time()
+            if provider == "claude":
+                return self._send_claude(prompt, start_time)
+            elif provider == "gemini":
+                return self._send_gemini(prompt, start_time)
             return self._send_codex(prompt, start_time)
-        else:
-            raise ValueError(f"Unknown provider: {provider}")
+
+        return self.cache.call(
+            prompt, PROVIDER_MODELS[provider], HARNESS_VERSION, send,
+            cacheable=None if cacheable is None else lambda r: cacheable(r["response"]),
+        )
 
     def _send_claude(self, prompt: str, start_time: float) -> Dict[str, Any]:
         cmd = ["claude", "--print", "--output-format", "text"]
@@ -195,11 +217,11 @@ class MultiModelEvaluator:
     RESULTS_DIR = Path(__file__).parent.parent / "storage" / "eval_results"
     SKILLS_DIR = Path(__file__).parent.parent.parent / "skills" / "foundry"
 
-    def __init__(self, skill_name: str):
+    def __init__(self, skill_name: str, cache: Optional[ResultCache] = None):
         self.skill_name = skill_name
         self.corpus = self._load_corpus()
         self.skill_content = self._load_skill()
-        self.client = MultiModelClient()
+        self.client = MultiModelClient(cache=cache)
         self.RESULTS_DIR.mkdir(parents=True, exist_ok=True)
 
         available = self.client.get_available_providers()
@@ -274,7 +296,8 @@ Respond in JSON format ONLY:
   "reasoning": "Brief explanation"
 }}"""
 
-        result = self.client.send_message(judge_prompt)
+        # Unparseable judge responses are not cached, so they are retried
+        result = self.client.send_message(judge_prompt, cacheable=has_json_object)
         text = result["response"]
 
         # Parse JSON from response
@@ -342,6 +365,8 @@ Respond in JSON format ONLY:
                 status = "PASS" if result.passed else "FAIL"
                 print(f"[{i+1}/{len(tasks)}] {task_id} ({exec_provider})... {status} ({execution_time_ms}ms)")
 
+            except CacheMiss:
+                raise
             except Exception as e:
                 result = TaskResult(
                     task_id=task_id,
@@ -384,6 +409,9 @@ Respond in JSON format ONLY:
         print(f"{'='*60}")
         print(f"Pass Rate: {result.pass_rate:.1%} ({result.passed_tasks}/{result.total_tasks})")
         print(f"Models Used: {', '.join(result.models_used)}")
+        cache = self.client.cache.stats()
+        print(f"Result Cache ({cache['mode']}): {cache['hits']} hits, "
+              f"{cache['misses']} misses ({cache['hit_rate']:.1%})")
 
         # Group by category
         by_category = {}
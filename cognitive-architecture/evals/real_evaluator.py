@@ -25,6 +25,11 @@ from typing import Dict, List, Any, Optional
 # Add parent to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from evals.result_cache import CacheMiss, ResultCache, has_json_object
+
+# Part of every result-cache key; bump when the prompt templates change
+HARNESS_VERSION = "real_evaluator/1.0.0"
+
 # Load environment variables
 from dotenv import load_dotenv
 env_file = Path(__file__).parent.parent / ".env"
@@ -102,16 +107,23 @@ class RealTaskEvaluator:
     RESULTS_DIR = Path(__file__).parent.parent / "storage" / "eval_results"
     SKILLS_DIR = Path(__file__).parent.parent.parent / "skills" / "foundry"
 
-    def __init__(self, skill_name: str, model: str = "claude-sonnet-4-20250514"):
+    def __init__(
+        self,
+        skill_name: str,
+        model: str = "claude-sonnet-4-20250514",
+        cache: Optional[ResultCache] = None,
+    ):
         """
         Initialize evaluator.
 
         Args:
             skill_name: One of "prompt-architect", "agent-creator", "skill-forge"
             model: Claude model to use for evaluation (default: claude-sonnet-4-20250514)
+            cache: Result cache for model responses (default: shared on-disk cache)
         """
         self.skill_name = skill_name
         self.model = model
+        self.cache = cache or ResultCache()
         self.corpus = self._load_corpus()
         self.skill_content = self._load_skill()
 
@@ -146,6 +158,21 @@ class RealTaskEvaluator:
 
         return skill_file.read_text(encoding="utf-8")
 
+    def _complete(self, prompt: str, max_tokens: int, cacheable=None) -> str:
+        """Model response text, from the result cache when available."""
+        def create() -> str:
+            response = self.client.messages.create(
+                model=self.model,
+                max_tokens=max_tokens,
+                messages=[{"role": "user", "content": prompt}]
+            )
+            return response.content[0].text
+
+        return self.cache.call(
+            prompt, self.model, HARNESS_VERSION, create,
+            cacheable=cacheable, max_tokens=max_tokens,
+        )
+
     def _execute_skill(self, task_input: str) -> str:
         """
         Execute the skill with given input.
@@ -153,7 +180,8 @@ class RealTaskEvaluator:
         Uses Claude to simulate skill execution by providing
         the skill definition and asking it to process the input.
         """
-        if not self.client:
+        # Replay reads cached responses and needs no client
+        if not self.client and self.cache.mode != "replay":
             return f"[MOCK] Processed: {task_input[:50]}..."
 
         prompt = f"""You are executing the {self.skill_name} skill.
@@ -171,12 +199,9 @@ Now execute this skill with the following input:
 Provide the skill's output following its defined behavior and format."""
 
         try:
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=2000,
-                messages=[{"role": "user", "content": prompt}]
-            )
-            return response.content[0].text
+            return self._complete(prompt, max_tokens=2000)
+        except CacheMiss:
+            raise
         except Exception as e:
             return f"[ERROR] Skill execution failed: {e}"
 
@@ -186,7 +211,7 @@ Provide the skill's output following its defined behavior and format."""
 
         Returns scores for each dimension and overall pass/fail.
         """
-        if not self.client:
+        if not self.client and self.cache.mode != "replay":
             # Mock scoring for testing
             return {
                 "intent_accuracy": 0.8,
@@ -232,14 +257,10 @@ Respond in JSON format:
 }}"""
 
         try:
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=500,
-                messages=[{"role": "user", "content": judge_prompt}]
-            )
+            # Unparseable judge responses are not cached, so they are retried
+            text = self._complete(judge_prompt, max_tokens=500, cacheable=has_json_object)
 
             # Parse JSON from response
-            text = response.content[0].text
             # Find JSON in response
             start = text.find('{')
             end = text.rfind('}') + 1
@@ -256,6 +277,8 @@ Respond in JSON format:
                 "reasoning": "Failed to parse judge response"
             }
 
+        except CacheMiss:
+            raise
         except Exception as e:
             return {
                 "intent_accuracy": 0.0,
@@ -439,6 +462,9 @@ Respond in JSON format:
         print(f"  VERIX Compliance: {result.verix_compliance:.1%}")
         print(f"  L2 Purity: {result.l2_purity:.1%}")
         print(f"\nOverall Score: {result.overall_score:.1%}")
+        cache = self.cache.stats()
+        print(f"Result Cache ({cache['mode']}): {cache['hits']} hits, "
+              f"{cache['misses']} misses ({cache['hit_rate']:.1%})")
 
 
 def main():
@@ -449,10 +475,12 @@ def main():
     parser.add_argument("skill", choices=["prompt-architect", "agent-creator", "skill-forge"])
     parser.add_argument("--max-tasks", type=int, default=None, help="Max tasks to run")
     parser.add_argument("--difficulty", choices=["easy", "medium", "hard"], default=None)
+    parser.add_argument("--cache", choices=["readwrite", "replay", "off"], default=None,
+                        help="Result cache mode (default: EVAL_CACHE_MODE or readwrite)")
 
     args = parser.parse_args()
 
-    evaluator = RealTaskEvaluator(args.skill)
+    evaluator = RealTaskEvaluator(args.skill, cache=ResultCache(mode=args.cache))
     result = evaluator.run_evaluation(
         difficulty_filter=args.difficulty,
         max_tasks=args.max_tasks,
@@ -0,0 +1,272 @@
+"""
+Content-Addressed Result Cache for Model Calls
+
+Shared on-disk cache for the evaluators (real, CLI, multi-model) and the
+loopctl FrozenHarness. The key is a hash of the prompt, the model and the
+harness version (plus call parameters such as max_tokens), so an
+unchanged (skill text, task input) or (judge prompt, content) pair is
+answered from disk instead of the model.
+
+Entries are one JSON file each, sharded by the first two hex digits of
+the key. Eviction is by age (TTL since the entry was stored) and by total
+size (least recently used first, using file mtime as the access time).
+
+Modes:
+    readwrite  Read hits, store misses (default)
+    replay     Read-only; misses raise CacheMiss instead of calling the
+               model, and TTL is ignored, so re-grading is deterministic
+    off        Always call the model
+
+Environment:
+    EVAL_CACHE_MODE  Default mode
+    EVAL_CACHE_DIR   Default cache directory
+
+Usage:
+    cache = ResultCache()
+    text = cache.call(prompt, model, "cli_evaluator/1.0.0",
+                      lambda: cli.send_message(prompt)["response"])
+    print(cache.stats())
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / "storage" / "eval_cache"
+DEFAULT_TTL_S = 7 * 24 * 3600.0
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+MODES = ("readwrite", "replay", "off")
+
+
+class CacheMiss(LookupError):
+    """Raised in replay mode when a call has no cached result."""
+
+
+def has_json_object(text: str) -> bool:
+    """True if a judge response contains a parseable {...} block."""
+    start = text.find('{')
+    end = text.rfind('}') + 1
+    if start < 0 or end <= start:
+        return False
+    try:
+        json.loads(text[start:end])
+    except ValueError:
+        return False
+    return True
+
+
+class ResultCache:
+    """
+    On-disk, content-addressed cache of model responses.
+
+    Thread-safe: evaluators may share one instance across worker threads.
+    Values must be JSON-serializable.
+    """
+
+    # Evict down to this fraction of max_bytes so eviction isn't run per store
+    EVICT_TO = 0.9
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        ttl_s: Optional[float] = DEFAULT_TTL_S,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        mode: Optional[str] = None,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            cache_dir: Cache directory (default: EVAL_CACHE_DIR or storage/eval_cache)
+            ttl_s: Seconds an entry stays valid (None = never expires)
+            max_bytes: Total size above which least recently used entries are evicted
+            mode: "readwrite", "replay" or "off" (default: EVAL_CACHE_MODE or readwrite)
+        """
+        mode = mode or os.environ.get("EVAL_CACHE_MODE") or "readwrite"
+        if mode not in MODES:
+            raise ValueError(f"Unknown cache mode: {mode} (expected one of {MODES})")
+        self.mode = mode
+        self.cache_dir = Path(cache_dir or os.environ.get("EVAL_CACHE_DIR") or DEFAULT_CACHE_DIR)
+        self.ttl_s = ttl_s
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        self._sizes: Optional[Dict[Path, int]] = None  # loaded on first store
+        self._total_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._stores = 0
+        self._expired = 0
+        self._evictions = 0
+
+    @staticmethod
+    def make_key(prompt: str, model: str, harness_version: str, **params: Any) -> str:
+        """Content hash identifying one model call."""
+        payload = json.dumps(
+            {"prompt": prompt, "model": model, "harness": harness_version, "params": params},
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """
+        Look up a cached value.
+
+        Returns:
+            (found, value); expired entries count as not found
+        """
+        if self.mode == "off":
+            return False, None
+
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            with self._lock:
+                self._misses += 1
+            return False, None
+
+        if self.mode != "replay" and self.ttl_s is not None \
+                and time.time() - entry.get("created", 0) > self.ttl_s:
+            self._delete(path)
+            with self._lock:
+                if self._sizes is not None:
+                    self._total_bytes -= self._sizes.pop(path, 0)
+                self._expired += 1
+                self._misses += 1
+            return False, None
+
+        if self.mode == "readwrite":
+            try:
+                os.utime(path)  # mtime doubles as last-access time for LRU eviction
+            except OSError:
+                pass
+        with self._lock:
+            self._hits += 1
+        return True, entry["value"]
+
+    def put(self, key: str, value: Any, **meta: Any) -> None:
+        """Store a value (no-op unless mode is readwrite)."""
+        if self.mode != "readwrite":
+            return
+
+        path = self._path(key)
+        data = json.dumps({"created": time.time(), **meta, "value": value}).encode("utf-8")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self._stores += 1
+            self._load_sizes()
+            self._total_bytes += len(data) - self._sizes.get(path, 0)
+            self._sizes[path] = len(data)
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def call(
+        self,
+        prompt: str,
+        model: str,
+        harness_version: str,
+        fn: Callable[[], Any],
+        cacheable: Optional[Callable[[Any], bool]] = None,
+        **params: Any,
+    ) -> Any:
+        """
+        Return the cached result of a model call, calling fn on a miss.
+
+        Args:
+            prompt: Prompt sent to the model
+            model: Model (or provider) name
+            harness_version: Version of the calling harness/prompt template
+            fn: Makes the model call; exceptions propagate and are not cached
+            cacheable: Predicate a result must pass to be stored
+            **params: Other call parameters that affect the result
+
+        Raises:
+            CacheMiss: In replay mode when there is no cached result
+        """
+        key = self.make_key(prompt, model, harness_version, **params)
+        found, value = self.get(key)
+        if found:
+            return value
+        if self.mode == "replay":
+            raise CacheMiss(f"No cached result for {model} call ({key[:12]})")
+
+        value = fn()
+        if cacheable is None or cacheable(value):
+            self.put(key, value, model=model, harness=harness_version)
+        return value
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit-rate and size statistics for this instance."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "mode": self.mode,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "stores": self._stores,
+                "expired": self._expired,
+                "evictions": self._evictions,
+                "entries": len(self._sizes) if self._sizes is not None else None,
+                "bytes": self._total_bytes if self._sizes is not None else None,
+            }
+
+    def clear(self) -> None:
+        """Delete every cached entry."""
+        with self._lock:
+            for path in list(self.cache_dir.glob("*/*.json")):
+                self._delete(path)
+            self._sizes = {}
+            self._total_bytes = 0
+
+    # ------------------------------------------------------------------
+
+    def _load_sizes(self) -> None:
+        """Scan existing entries once so size accounting covers earlier runs."""
+        if self._sizes is not None:
+            return
+        self._sizes = {}
+        for path in self.cache_dir.glob("*/*.json"):
+            try:
+                self._sizes[path] = path.stat().st_size
+            except OSError:
+                continue
+        self._total_bytes = sum(self._sizes.values())
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until under EVICT_TO * max_bytes."""
+        def last_access(path: Path) -> float:
+            try:
+                return path.stat().st_mtime
+            except OSError:
+                return 0.0
+
+        target = self.max_bytes * self.EVICT_TO
+        for path in sorted(self._sizes, key=last_access):
+            if self._total_bytes <= target:
+                break
+            self._delete(path)
+            self._total_bytes -= self._sizes.pop(path)
+            self._evictions += 1
+
+    @staticmethod
+    def _delete(path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Offline stand-in for the `claude` CLI.
+
+Accepts the same invocation as ClaudeCLI (`--version`, or `--print` with
+the prompt on stdin) and answers without network access, so the CLI
+evaluator can be exercised and benchmarked offline.
+
+Behavior is controlled through environment variables:
+    STUB_CLI_LATENCY   Seconds to sleep per call (default: 0)
+    STUB_CLI_LOG       If set, append one JSON line per call to this file
+
+Usage:
+    CLAUDE_CLI="python evals/stub_cli.py" python evals/cli_evaluator.py prompt-architect
+"""
+
+import hashlib
+import json
+import os
+import sys
+import time
+
+JUDGE_PREFIX = "You are evaluating a skill's output."
+
+
+def judge_response(prompt: str) -> str:
+    """Deterministic judge scores derived from the prompt hash."""
+    digest = hashlib.sha256(prompt.encode("utf-8")).digest()
+    scores = {
+        name: round(0.5 + digest[i] / 510, 2)
+        for i, name in enumerate([
+            "intent_accuracy", "constraint_coverage", "output_quality",
+            "verix_compliance", "l2_purity",
+        ])
+    }
+    scores["passed"] = digest[5] % 4 != 0
+    scores["reasoning"] = "Stub judge"
+    return json.dumps(scores)
+
+
+def skill_response(prompt: str) -> str:
+    """Echo the task input back as a minimal skill output."""
+    start = prompt.rfind("<input>")
+    end = prompt.rfind("</input>")
+    task_input = prompt[start + len("<input>"):end].strip() if start >= 0 else ""
+    return f"Optimized prompt for: {task_input}"
+
+
+def main() -> int:
+    if "--version" in sys.argv[1:]:
+        print("stub-cli 1.0.0")
+        return 0
+
+    prompt = sys.stdin.read()
+    time.sleep(float(os.environ.get("STUB_CLI_LATENCY", "0")))
+
+    is_judge = prompt.startswith(JUDGE_PREFIX)
+    log_path = os.environ.get("STUB_CLI_LOG")
+    if log_path:
+        with open(log_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"kind": "judge" if is_judge else "execute"}) + "\n")
+
+    print(judge_response(prompt) if is_judge else skill_response(prompt))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,16 +12,24 @@ The 7 Analyzers:
 5. Six Sigma (Quality metrics)
 6. Theater Detection (Fake quality)
 7. Safety Violations (God objects, parameter bombs)
+
+Direct-mode analysis caches per-file results on disk, keyed by file
+content hash and policy, so only changed files are re-analyzed; cache
+misses are analyzed in a process pool.
 """
 
 import os
 import sys
 import json
+import hashlib
+import locale
 import subprocess
 import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
@@ -122,6 +130,65 @@ CONNASCENCE_PROJECT = _discover_connascence_path() or Path(".")
 CONNASCENCE_VENV = CONNASCENCE_PROJECT / "venv-connascence" if CONNASCENCE_PROJECT.exists() else Path(".")
 
 
+# Per-file analysis cache (direct mode)
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / "storage" / "connascence_cache"
+CACHE_VERSION = 2
+
+# Below this many changed files, analyze inline rather than in the pool
+PARALLEL_MIN_FILES = 4
+
+
+def _is_critical_violation(violation: Any) -> bool:
+    """Whether an analyzer violation (dict or object) is critical."""
+    if isinstance(violation, dict):
+        severity = str(violation.get("severity", "")).lower()
+        level = str(violation.get("level", "")).lower()
+        return (
+            violation.get("is_critical", False) or
+            severity in ("critical", "high") or
+            level == "critical"
+        )
+    severity = str(getattr(violation, "severity", "")).lower()
+    level = str(getattr(violation, "level", "")).lower()
+    return (
+        getattr(violation, "is_critical", False) or
+        severity in ("critical", "high") or
+        level == "critical"
+    )
+
+
+def _violation_record(violation: Any) -> Any:
+    """JSON-friendly form of a violation, for the cache and raw_output."""
+    if isinstance(violation, dict):
+        return violation
+    if hasattr(violation, "to_dict"):
+        return violation.to_dict()
+    if hasattr(violation, "__dict__"):
+        return dict(vars(violation))
+    return str(violation)
+
+
+def _file_counts(analyzer: Any, file_path: str) -> Dict[str, Any]:
+    """Analyze one file and reduce it to cacheable counts."""
+    violations = analyzer.analyze_file(Path(file_path))
+    return {
+        "violations_count": len(violations),
+        "critical_violations": sum(1 for v in violations if _is_critical_violation(v)),
+        "violations": [_violation_record(v) for v in violations],
+    }
+
+
+_worker_analyzers: Dict[Any, Any] = {}
+
+
+def _analyze_file_in_worker(analyzer_cls: Any, file_path: str) -> Dict[str, Any]:
+    """Process-pool entry point; one analyzer instance per worker process."""
+    analyzer = _worker_analyzers.get(analyzer_cls)
+    if analyzer is None:
+        analyzer = _worker_analyzers[analyzer_cls] = analyzer_cls()
+    return _file_counts(analyzer, file_path)
+
+
 @dataclass
 class ConnascenceResult:
     """Result from connascence analysis."""
@@ -183,12 +250,35 @@ class ConnascenceBridge:
     3. MCP tool call (if connascence MCP server running)
     """
 
-    def __init__(self, connascence_path: Optional[Path] = None):
+    def __init__(
+        self,
+        connascence_path: Optional[Path] = None,
+        cache_dir: Optional[Path] = None,
+        max_workers: Optional[int] = None,
+    ):
+        """
+        Initialize bridge.
+
+        Args:
+            connascence_path: Connascence project root (default: auto-discovered)
+            cache_dir: Per-file result cache directory (default: storage/connascence_cache)
+            max_workers: Process pool size for changed files (default: CPU count; 1 = inline)
+        """
         self.connascence_path = connascence_path or CONNASCENCE_PROJECT
         self.venv_path = self.connascence_path / "venv-connascence"
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.max_workers = max_workers or os.cpu_count() or 1
         self._analyzer = None
         self._mode = self._detect_mode()
 
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        # path -> (size, mtime_ns, content hash, line count); skips re-reading unchanged files
+        self._file_digests: Dict[str, Tuple[int, int, str, int]] = {}
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._hits = 0
+        self._misses = 0
+
     def _detect_mode(self) -> str:
         """Detect which invocation mode to use."""
         # Try direct import first (use project root, not src folder)
@@ -244,48 +334,145 @@ class ConnascenceBridge:
         else:
             return self._analyze_mock(dir_path, policy)
 
-    def _analyze_direct(self, path: Path, policy: str) -> ConnascenceResult:    
-        """Analyze using direct Python import."""
+    def _file_digest(self, file_path: Path) -> Tuple[Optional[str], int]:
+        """
+        Content hash and line count, reading the file at most once per change.
+
+        The hash is None if the file can't be read (never cached).
+        """
         try:
-            analyzer = self._analyzer()
-            violations: List[Any] = []
-            total_lines = 0
-
-            def count_lines(file_path: Path) -> int:
-                try:
-                    return len(file_path.read_text(errors="ignore").splitlines())
-                except Exception:
-                    return 0
-
-            def is_critical(violation: Any) -> bool:
-                if isinstance(violation, dict):
-                    severity = str(violation.get("severity", "")).lower()
-                    level = str(violation.get("level", "")).lower()
-                    return (
-                        violation.get("is_critical", False) or
-                        severity in ("critical", "high") or
-                        level == "critical"
-                    )
-                severity = str(getattr(violation, "severity", "")).lower()
-                level = str(getattr(violation, "level", "")).lower()
-                return (
-                    getattr(violation, "is_critical", False) or
-                    severity in ("critical", "high") or
-                    level == "critical"
-                )
+            stat = file_path.stat()
+        except OSError:
+            stat = None
+        key = str(file_path)
+        if stat is not None:
+            known = self._file_digests.get(key)
+            if known and known[:2] == (stat.st_size, stat.st_mtime_ns):
+                return known[2], known[3]
+
+        try:
+            data = file_path.read_bytes()
+        except OSError:
+            return None, 0
+        digest = hashlib.sha256(data).hexdigest()
+        # Same count as read_text(errors="ignore").splitlines()
+        lines = len(data.decode(locale.getpreferredencoding(False), errors="ignore").splitlines())
+        if stat is not None:
+            self._file_digests[key] = (stat.st_size, stat.st_mtime_ns, digest, lines)
+        return digest, lines
+
+    def _cache_key(self, file_path: Path, content_hash: str, policy: str) -> str:
+        # Violation records name the file they came from, so identical
+        # content at another path must not share an entry
+        analyzer_id = f"{self._analyzer.__module__}.{self._analyzer.__qualname__}"
+        location = os.path.abspath(file_path)
+        payload = f"{CACHE_VERSION}\0{analyzer_id}\0{policy}\0{location}\0{content_hash}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _cache_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _load_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            return entry
+        try:
+            with open(self._cache_path(key), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        self._entries[key] = entry
+        return entry
+
+    def _store_entry(self, key: str, entry: Dict[str, Any]) -> None:
+        self._entries[key] = entry
+        path = self._cache_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f, default=str)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug(f"Could not write connascence cache entry: {e}")
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._pool
+
+    def _file_entries(self, files: List[Path], policy: str) -> List[Dict[str, Any]]:
+        """Per-file counts, from cache where the file's content is unchanged."""
+        entries: List[Optional[Dict[str, Any]]] = []
+        misses: List[Tuple[int, Optional[str], int]] = []  # (position, cache key, lines)
+
+        for file_path in files:
+            content_hash, lines = self._file_digest(file_path)
+            key = self._cache_key(file_path, content_hash, policy) if content_hash else None
+            entry = self._load_entry(key) if key else None
+            if entry is None:
+                misses.append((len(entries), key, lines))
+            entries.append(entry)
+
+        if len(misses) >= PARALLEL_MIN_FILES and self.max_workers > 1:
+            pool = self._get_pool()
+            futures = [
+                pool.submit(_analyze_file_in_worker, self._analyzer, str(files[pos]))
+                for pos, _, _ in misses
+            ]
+            counts = [future.result() for future in futures]
+        else:
+            analyzer = self._analyzer() if misses else None
+            counts = [_file_counts(analyzer, str(files[pos])) for pos, _, _ in misses]
+
+        for (pos, key, lines), result in zip(misses, counts):
+            entry = {**result, "lines": lines}
+            if key:
+                self._store_entry(key, entry)
+            entries[pos] = entry
+
+        with self._lock:
+            self._hits += len(files) - len(misses)
+            self._misses += len(misses)
+        return entries
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Per-file cache hits and misses for direct-mode analysis."""
+        lookups = self._hits + self._misses
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / lookups if lookups else 0.0,
+            "cached_entries": len(self._entries),
+        }
+
+    def close(self) -> None:
+        """Shut down the analysis process pool."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def _analyze_direct(self, path: Path, policy: str) -> ConnascenceResult:
+        """
+        Analyze using direct Python import.
 
+        Each file's counts are cached by path, content hash and policy, so only
+        changed files are analyzed; DPMO and sigma aggregate the counts.
+        """
+        try:
+            path = Path(path)
             if path.is_dir():
-                for file_path in path.rglob("*.py"):
-                    if not file_path.is_file():
-                        continue
-                    violations.extend(analyzer.analyze_file(file_path))
-                    total_lines += count_lines(file_path)
+                files = [f for f in path.rglob("*.py") if f.is_file()]
             else:
-                violations = analyzer.analyze_file(path)
-                total_lines = count_lines(path)
+                files = [path]
+            entries = self._file_entries(files, policy)
 
-            violations_count = len(violations)
-            critical_violations = sum(1 for violation in violations if is_critical(violation))
+            violations: List[Any] = []
+            for entry in entries:
+                violations.extend(entry["violations"])
+            total_lines = sum(entry["lines"] for entry in entries)
+            violations_count = sum(entry["violations_count"] for entry in entries)
+            critical_violations = sum(entry["critical_violations"] for entry in entries)
             opportunities = max(total_lines * 10, 1)
             dpmo = (violations_count / opportunities) * 1_000_000
             sigma_level = self._dpmo_to_sigma(dpmo)
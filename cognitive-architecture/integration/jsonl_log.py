@@ -0,0 +1,312 @@
+"""
+Indexed append-only JSONL log.
+
+Used for the loop's iteration history (history.jsonl) and event spine
+(events.jsonl). Records are newline-terminated JSON objects appended with
+a single O_APPEND write, so concurrent writers never interleave and
+existing bytes are never rewritten.
+
+A sidecar file (<log>.idx) maps each record's key (e.g. its iteration) to
+its byte offset, so:
+
+- Lookup by key is a dict hit plus one seek/readline
+- The last N records are read by seeking, not by parsing the whole log
+- New records are picked up by scanning only the bytes after the last
+  indexed record (tail following), in this and other processes
+
+The sidecar is a cache: if it is missing, corrupt or does not match the
+log (e.g. the log was truncated or replaced), it is rebuilt from the log.
+
+Usage:
+    log = IndexedJSONLog(loop_dir / "history.jsonl")
+    log.append({"iteration": 3, "metrics": {...}})
+    log.get(3)               # first record with key 3
+    log.tail(5)              # last five records
+    for record, cursor in log.read_from(cursor):
+        ...                  # stream records after a stored cursor
+"""
+
+import json
+import os
+import struct
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+INDEX_SUFFIX = ".idx"
+INDEX_MAGIC = b"JLIX"
+INDEX_VERSION = 1
+
+_HEADER = struct.Struct("<4sI")       # magic, version
+_ENTRY = struct.Struct("<qQI")        # key, byte offset, line length
+
+# Key stored for records without an integer key field
+NO_KEY = -(2 ** 63)
+
+
+class IndexedJSONLog:
+    """
+    Append-only JSONL file with a persistent key -> offset index.
+
+    Lines that are not valid JSON are skipped (and not indexed), matching
+    the tolerant readers this replaces. An unterminated final line is
+    treated as a write in progress and picked up once it is complete.
+    """
+
+    def __init__(self, path: Path, key_field: str = "iteration"):
+        """
+        Initialize log.
+
+        Args:
+            path: JSONL file (created on first append)
+            key_field: Integer record field used as the lookup key
+        """
+        self.path = Path(path)
+        self.index_path = self.path.with_name(self.path.name + INDEX_SUFFIX)
+        self.key_field = key_field
+
+        self._loaded = False
+        self._reset()
+
+    def _reset(self) -> None:
+        self._offsets: List[int] = []
+        self._by_key: Dict[int, List[int]] = {}
+        self._last: Optional[Tuple[int, int, int]] = None  # last indexed entry
+        self._end = 0            # first byte after the last scanned line
+        self._index_end = 0      # first byte after the last entry in the sidecar
+
+    def __len__(self) -> int:
+        self.refresh()
+        return len(self._offsets)
+
+    @property
+    def end(self) -> int:
+        """Cursor just past the last complete record."""
+        self.refresh()
+        return self._end
+
+    # ------------------------------------------------------------------
+    # Writing
+
+    def append(self, record: Dict[str, Any]) -> int:
+        """Append a record; returns its byte offset."""
+        return self.append_line(json.dumps(record, separators=(",", ":")))
+
+    def append_line(self, line: str) -> int:
+        """Append one pre-serialized JSON line; returns its byte offset."""
+        data = (line.rstrip("\n") + "\n").encode("utf-8")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, data)  # single write so concurrent appenders don't interleave
+            offset = os.lseek(fd, 0, os.SEEK_CUR) - len(data)
+        finally:
+            os.close(fd)
+        self.refresh()
+        return offset
+
+    def truncate(self) -> None:
+        """Remove every record (and the sidecar index)."""
+        for path in (self.path, self.index_path):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+        self._reset()
+        self._loaded = True
+
+    # ------------------------------------------------------------------
+    # Reading
+
+    def get(self, key: int) -> Optional[Dict[str, Any]]:
+        """First record with this key, or None."""
+        self.refresh()
+        offsets = self._by_key.get(key)
+        if not offsets:
+            return None
+        return self._read_at(offsets[0])
+
+    def find(self, key: int) -> List[Dict[str, Any]]:
+        """Every record with this key, in log order."""
+        self.refresh()
+        return [self._read_at(offset) for offset in self._by_key.get(key, ())]
+
+    def keys(self) -> List[int]:
+        """Distinct keys in order of first appearance."""
+        self.refresh()
+        return [key for key in self._by_key if key != NO_KEY]
+
+    def tail(self, n: int) -> List[Dict[str, Any]]:
+        """The last n records, oldest first."""
+        self.refresh()
+        if n <= 0 or not self._offsets:
+            return []
+        start = self._offsets[max(0, len(self._offsets) - n)]
+        return [record for record, _ in self.read_from(start)]
+
+    def read_all(self) -> List[Dict[str, Any]]:
+        """Every record, oldest first."""
+        return [record for record, _ in self.read_from(0)]
+
+    def read_from(self, cursor: int = 0) -> Iterator[Tuple[Dict[str, Any], int]]:
+        """
+        Stream records starting at a cursor.
+
+        Args:
+            cursor: Byte offset of a record boundary (0, or a cursor
+                previously yielded / returned by end)
+
+        Yields:
+            (record, cursor after the record); store the cursor to resume
+        """
+        self.refresh()
+        if cursor >= self._end:
+            return
+        with open(self.path, "rb") as f:
+            f.seek(cursor)
+            while cursor < self._end:
+                line = f.readline()
+                cursor += len(line)
+                record = _parse_line(line)
+                if record is not None:
+                    yield record, cursor
+
+    def _read_at(self, offset: int) -> Dict[str, Any]:
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            return json.loads(f.readline())
+
+    def is_valid_cursor(self, cursor: int) -> bool:
+        """True if cursor is a record boundary within the current log."""
+        self.refresh()
+        if cursor == 0:
+            return True
+        if cursor > self._end:
+            return False
+        with open(self.path, "rb") as f:
+            f.seek(cursor - 1)
+            return f.read(1) == b"\n"
+
+    # ------------------------------------------------------------------
+    # Index maintenance
+
+    def refresh(self) -> None:
+        """Load the sidecar once, then index records appended since the last scan."""
+        if not self._loaded:
+            self._loaded = True
+            self._load_index()
+
+        try:
+            size = os.path.getsize(self.path)
+        except FileNotFoundError:
+            size = 0
+        if size < self._end or (size > self._end and self._last and not self._matches_log(*self._last)):
+            # Log truncated or replaced: rebuild the index from scratch
+            logger.warning(f"{self.path} was rewritten; rebuilding its index")
+            self._reset()
+            self._write_entries([], rewrite=True)
+        if size > self._end:
+            self._scan(size)
+
+    def _scan(self, size: int) -> None:
+        entries = []
+        offset = self._end
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            while offset < size:
+                line = f.readline()
+                if not line.endswith(b"\n"):
+                    break  # partially written tail; retry on next refresh
+                record = _parse_line(line)
+                if record is not None:
+                    entry = (self._key(record), offset, len(line))
+                    self._add(*entry)
+                    entries.append(entry)
+                offset += len(line)
+        self._end = offset
+        if entries:
+            self._write_entries(entries)
+
+    def _add(self, key: int, offset: int, length: int) -> None:
+        self._last = (key, offset, length)
+        self._offsets.append(offset)
+        self._by_key.setdefault(key, []).append(offset)
+
+    def _key(self, record: Dict[str, Any]) -> int:
+        key = record.get(self.key_field)
+        if isinstance(key, int) and not isinstance(key, bool) and key != NO_KEY:
+            return key
+        return NO_KEY
+
+    def _load_index(self) -> None:
+        try:
+            data = self.index_path.read_bytes()
+        except FileNotFoundError:
+            return
+        if len(data) < _HEADER.size or _HEADER.unpack_from(data, 0) != (INDEX_MAGIC, INDEX_VERSION):
+            logger.warning(f"Rebuilding incompatible log index {self.index_path}")
+            self._write_entries([], rewrite=True)
+            return
+
+        usable = _HEADER.size + (len(data) - _HEADER.size) // _ENTRY.size * _ENTRY.size
+        for key, offset, length in _ENTRY.iter_unpack(data[_HEADER.size:usable]):
+            if offset < self._end:
+                continue  # duplicate entry from a concurrent indexer
+            self._add(key, offset, length)
+            self._end = offset + length
+        self._index_end = self._end
+
+        if self._last is not None and not self._matches_log(*self._last):
+            logger.warning(f"Log index {self.index_path} does not match {self.path}; rebuilding")
+            self._reset()
+            self._write_entries([], rewrite=True)
+
+    def _matches_log(self, key: int, offset: int, length: int) -> bool:
+        """Check the last indexed entry still describes the log."""
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(offset)
+                line = f.read(length)
+        except FileNotFoundError:
+            return False
+        if len(line) != length or not line.endswith(b"\n"):
+            return False
+        record = _parse_line(line)
+        return record is not None and self._key(record) == key
+
+    def _write_entries(self, entries: List[Tuple[int, int, int]], rewrite: bool = False) -> None:
+        data = b"".join(_ENTRY.pack(*entry) for entry in entries)
+        try:
+            if rewrite:
+                tmp_path = self.index_path.with_name(f"{self.index_path.name}.{os.getpid()}.tmp")
+                tmp_path.write_bytes(_HEADER.pack(INDEX_MAGIC, INDEX_VERSION) + data)
+                os.replace(tmp_path, self.index_path)
+            else:
+                if entries[0][1] < self._index_end:
+                    return  # another process already indexed these records
+                fd = os.open(self.index_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                try:
+                    if os.fstat(fd).st_size == 0:
+                        data = _HEADER.pack(INDEX_MAGIC, INDEX_VERSION) + data
+                    os.write(fd, data)
+                finally:
+                    os.close(fd)
+        except OSError as e:
+            # The index is only a cache; the log stays authoritative
+            logger.warning(f"Could not update log index {self.index_path}: {e}")
+            return
+        _, last_offset, last_length = entries[-1] if entries else (0, 0, 0)
+        self._index_end = last_offset + last_length
+
+
+def _parse_line(line: bytes) -> Optional[Dict[str, Any]]:
+    if not line.strip():
+        return None
+    try:
+        record = json.loads(line)
+    except ValueError:
+        return None
+    return record if isinstance(record, dict) else None
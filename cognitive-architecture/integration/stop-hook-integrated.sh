@@ -74,7 +74,8 @@ fi
 # Stop-hook is DUMB. It only calls loopctl.
 # loopctl is the single authority for decisions.
 
-# Call loopctl for decision
+# Call loopctl for decision (forwarded to a warm `python -m loopctl serve`
+# daemon when one is running; otherwise it runs in-process)
 DECISION_JSON=$(python -m loopctl ralph_iteration_complete \
   --state "$STATE_FILE" \
   --loop-dir "$LOOP_DIR" \
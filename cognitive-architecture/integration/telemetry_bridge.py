@@ -26,6 +26,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from optimization.telemetry_schema import ExecutionTelemetry, TelemetryStore
 from optimization.mcp_client import get_mcp_client, MemoryMCPClient
+from integration.jsonl_log import IndexedJSONLog
 
 logger = logging.getLogger(__name__)
 
@@ -184,11 +185,17 @@ class TelemetryBridge:
     - .loop/ contract files
     - Cognitive architecture telemetry
     - Memory-MCP storage
+
+    Events are read through the events.jsonl offset index: one iteration is
+    a single seek, and sync_all only reads events appended since the cursor
+    stored in telemetry_cursor.json.
     """
 
     def __init__(self, loop_dir: Path, telemetry_store: Optional[TelemetryStore] = None):
         self.loop_dir = Path(loop_dir)
         self.telemetry_store = telemetry_store or TelemetryStore()
+        self.events_log = IndexedJSONLog(self.loop_dir / "events.jsonl")
+        self.cursor_path = self.loop_dir / "telemetry_cursor.json"
 
     def sync_iteration(self, iteration: int) -> Optional[LoopTelemetryRecord]:
         """
@@ -199,14 +206,10 @@ class TelemetryBridge:
         # Load loop state files
         eval_report = self._load_json(self.loop_dir / "eval_report.json")
         runtime_config = self._load_json(self.loop_dir / "runtime_config.json")
-        events = self._load_events()
 
         # Find event for this iteration
-        event = None
-        for e in events:
-            if e.get("iteration") == iteration:
-                event = e
-                break
+        events = self._decision_events(self.events_log.find(iteration))
+        event = events[0] if events else None
 
         if event is None:
             return None
@@ -220,20 +223,32 @@ class TelemetryBridge:
 
         return record
 
-    def sync_all(self) -> List[LoopTelemetryRecord]:
-        """Sync all iterations from events.jsonl."""
-        events = self._load_events()
+    def sync_all(self, from_start: bool = False) -> List[LoopTelemetryRecord]:
+        """
+        Sync iterations appended to events.jsonl since the last sync.
+
+        Args:
+            from_start: Ignore the stored cursor and sync every event
+
+        Returns:
+            Records synced by this call
+        """
+        start = cursor = 0 if from_start else self._load_cursor()
         records = []
 
         eval_report = self._load_json(self.loop_dir / "eval_report.json")
         runtime_config = self._load_json(self.loop_dir / "runtime_config.json")
 
-        for event in events:
+        for event, cursor in self.events_log.read_from(start):
+            if not _is_decision_event(event):
+                continue
             record = LoopTelemetryRecord.from_loop_state(eval_report, runtime_config, event)
             exec_telemetry = record.to_execution_telemetry()
             self.telemetry_store.store(exec_telemetry)
             records.append(record)
 
+        if cursor != start:
+            self._save_cursor(cursor)
         return records
 
     def export_to_memory_mcp(self) -> List[Dict[str, Any]]:
@@ -268,7 +283,10 @@ class TelemetryBridge:
         """
         client = mcp_client or get_mcp_client(namespace="cognitive-architecture/telemetry")
 
-        events = self._load_events()
+        if iteration is None:
+            events = self._load_events()
+        else:
+            events = self._decision_events(self.events_log.find(iteration))
         eval_report = self._load_json(self.loop_dir / "eval_report.json")
         runtime_config = self._load_json(self.loop_dir / "runtime_config.json")
 
@@ -276,10 +294,7 @@ class TelemetryBridge:
         errors = []
 
         for event in events:
-            # Filter by iteration if specified
             event_iteration = event.get("iteration", 0)
-            if iteration is not None and event_iteration != iteration:
-                continue
 
             record = LoopTelemetryRecord.from_loop_state(eval_report, runtime_config, event)
             mcp_format = record.to_memory_mcp_format()
@@ -335,19 +350,34 @@ class TelemetryBridge:
         return {}
 
     def _load_events(self) -> List[Dict[str, Any]]:
-        """Load events from events.jsonl."""
-        events_path = self.loop_dir / "events.jsonl"
-        events = []
+        """Load decision events from events.jsonl."""
+        return self._decision_events(self.events_log.read_all())
+
+    @staticmethod
+    def _decision_events(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return [event for event in events if _is_decision_event(event)]
+
+    def _load_cursor(self) -> int:
+        """Byte offset in events.jsonl up to which events have been synced."""
+        cursor = self._load_json(self.cursor_path).get("events_offset", 0)
+        if not self.events_log.is_valid_cursor(cursor):
+            # events.jsonl was truncated or replaced since the last sync
+            logger.warning(f"Telemetry cursor {cursor} is stale; resyncing from the start")
+            return 0
+        return cursor
+
+    def _save_cursor(self, cursor: int) -> None:
+        tmp_path = self.cursor_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps({
+            "events_offset": cursor,
+            "updated_at": datetime.now().isoformat(),
+        }))
+        os.replace(tmp_path, self.cursor_path)
 
-        if events_path.exists():
-            for line in events_path.read_text().strip().split("\n"):
-                if line.strip():
-                    try:
-                        events.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        continue
 
-        return events
+def _is_decision_event(event: Dict[str, Any]) -> bool:
+    """Decision events (the default for events written before event_type existed)."""
+    return event.get("event_type", "decision") == "decision"
 
 
 def bridge_loop_to_telemetry(loop_dir: str) -> Dict[str, Any]:
@@ -358,7 +388,7 @@ def bridge_loop_to_telemetry(loop_dir: str) -> Dict[str, Any]:
         loop_dir: Path to .loop/ directory
 
     Returns:
-        Summary of bridged records
+        Summary of records bridged since the previous call
     """
     bridge = TelemetryBridge(Path(loop_dir))
     records = bridge.sync_all()
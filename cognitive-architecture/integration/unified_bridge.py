@@ -52,6 +52,7 @@ from core.vcl_validator import (
 )
 from modes.selector import ModeSelector, TaskContext
 from modes.library import ModeLibrary
+from integration.jsonl_log import IndexedJSONLog
 
 
 class DecisionIntent(Enum):
@@ -84,9 +85,11 @@ class UnifiedEvent:
     """
     A single event in the append-only event spine.
 
-    Every iteration appends one event to events.jsonl.
+    Every iteration appends one "decision" event to events.jsonl, followed
+    by a "timing" event carrying loopctl's per-step spans.
     """
     event_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    event_type: str = "decision"
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
     task_id: str = ""
     plane: str = "execution"
@@ -107,6 +110,9 @@ class UnifiedEvent:
     # VERIX-style grounds
     grounds: str = ""
 
+    # Step durations in ms (timing events only)
+    timings_ms: Dict[str, float] = field(default_factory=dict)
+
     def to_jsonl(self) -> str:
         """Convert to JSON line for append."""
         return json.dumps(asdict(self), separators=(",", ":"))
@@ -162,6 +168,9 @@ class UnifiedBridge:
     - Supports L0/L1/L2 compression levels
     """
 
+    # Recent history entries a decision needs (_select_intent looks at the last 5)
+    HISTORY_WINDOW = 20
+
     def __init__(self, loop_dir: Path):
         """
         Initialize bridge with loop directory.
@@ -174,9 +183,15 @@ class UnifiedBridge:
         self.eval_path = self.loop_dir / "eval_report.json"
         self.events_path = self.loop_dir / "events.jsonl"
         self.policy_path = self.loop_dir / "policy.json"
-        self.history_path = self.loop_dir / "history.json"
+        self.history_path = self.loop_dir / "history.jsonl"
+        self.legacy_history_path = self.loop_dir / "history.json"
         self.moo_state_path = self.loop_dir / "moo_state.json"
 
+        # Append-only logs with iteration -> offset sidecar indexes
+        self.events_log = IndexedJSONLog(self.events_path)
+        self.history_log = IndexedJSONLog(self.history_path)
+        self._migrate_legacy_history()
+
         # Load mode library for selection
         self.mode_library = ModeLibrary()
         self.mode_selector = ModeSelector(self.mode_library)
@@ -203,12 +218,42 @@ class UnifiedBridge:
             return json.loads(self.eval_path.read_text())
         return {"metrics": {}, "harness_version": "unknown"}
 
-    def load_history(self) -> List[Dict[str, Any]]:
-        """Load iteration history."""
-        if self.history_path.exists():
-            data = json.loads(self.history_path.read_text())
-            return data.get("iterations", [])
-        return []
+    def load_history(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Load iteration history.
+
+        Args:
+            limit: Only the most recent entries (None = all)
+        """
+        if limit is None:
+            return self.history_log.read_all()
+        return self.history_log.tail(limit)
+
+    def history_length(self) -> int:
+        """Number of history entries (from the index, without reading them)."""
+        return len(self.history_log)
+
+    def get_history_entry(self, iteration: int) -> Optional[Dict[str, Any]]:
+        """History entry for one iteration, or None."""
+        return self.history_log.get(iteration)
+
+    def reset_history(self) -> None:
+        """Clear iteration history."""
+        self.history_log.truncate()
+        if self.legacy_history_path.exists():
+            self.legacy_history_path.unlink()
+
+    def _migrate_legacy_history(self) -> None:
+        """Convert a history.json written by older versions to history.jsonl once."""
+        if not self.legacy_history_path.exists() or self.history_path.exists():
+            return
+        try:
+            data = json.loads(self.legacy_history_path.read_text())
+        except json.JSONDecodeError:
+            return
+        for entry in data.get("iterations", []):
+            self.history_log.append(entry)
+        self.legacy_history_path.rename(self.legacy_history_path.with_suffix(".json.migrated"))
 
     def propose_next_config(self, bridge_input: BridgeInput) -> BridgeOutput:
         """
@@ -441,24 +486,16 @@ class UnifiedBridge:
 
         This is how we maintain the audit trail.
         """
-        with open(self.events_path, "a") as f:
-            f.write(event.to_jsonl() + "\n")
+        self.events_log.append_line(event.to_jsonl())
 
     def update_history(self, iteration: int, metrics: Dict[str, float]) -> None:
-        """Update iteration history with harness metrics only."""
-        history_data = {"_comment": "ITERATION HISTORY - Harness metrics only", "iterations": []}
-
-        if self.history_path.exists():
-            history_data = json.loads(self.history_path.read_text())
-
-        history_data["iterations"].append({
+        """Append harness metrics for an iteration to history.jsonl."""
+        self.history_log.append({
             "iteration": iteration,
             "timestamp": datetime.now().isoformat(),
             "metrics": metrics,
         })
 
-        self.history_path.write_text(json.dumps(history_data, indent=2))
-
     # =========================================================================
     # VCL VALIDATION METHODS
     # =========================================================================
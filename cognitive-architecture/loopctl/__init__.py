@@ -11,8 +11,15 @@ Commands:
     ralph_iteration_complete  - Process a Ralph iteration completion
     status                    - Show current loop status
     reset                     - Reset loop state
+    serve                     - Run a warm daemon the other commands forward to
 """
 
-from .core import ralph_iteration_complete, get_status, reset_loop
-
 __all__ = ["ralph_iteration_complete", "get_status", "reset_loop"]
+
+
+def __getattr__(name):
+    # Imported lazily so the thin daemon client (python -m loopctl) stays light
+    if name in __all__:
+        from . import core
+        return getattr(core, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
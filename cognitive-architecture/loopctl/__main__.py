@@ -3,9 +3,17 @@ loopctl CLI entry point.
 
 Usage:
     python -m loopctl ralph_iteration_complete --state <statefile> --loop-dir .loop
+    python -m loopctl ralph_iteration_complete --state <statefile> --loop-dir .loop --profile
     python -m loopctl status --loop-dir .loop
     python -m loopctl reset --loop-dir .loop
     python -m loopctl self-test --loop-dir .loop
+    python -m loopctl serve [--socket PATH] [--warm .loop]
+    python -m loopctl daemon-status | stop-daemon
+
+ralph_iteration_complete and status are forwarded to a running
+`loopctl serve` daemon when one is listening, and run in-process
+otherwise. The architecture modules are only imported when a command
+runs in-process.
 """
 
 import argparse
@@ -13,7 +21,8 @@ import json
 import sys
 from pathlib import Path
 
-from .core import ralph_iteration_complete, get_status, reset_loop, FrozenHarness
+from . import client
+from .timing import format_spans
 
 
 def main():
@@ -25,11 +34,17 @@ Examples:
     # Process Ralph iteration completion
     python -m loopctl ralph_iteration_complete --state .claude/ralph-loop.local.md --loop-dir .loop
 
+    # Same, printing per-step timings and a cProfile summary to stderr
+    python -m loopctl ralph_iteration_complete --state .claude/ralph-loop.local.md --loop-dir .loop --profile
+
     # Get current status
     python -m loopctl status --loop-dir .loop
 
     # Reset loop state
     python -m loopctl reset --loop-dir .loop
+
+    # Keep a warm daemon for the stop hook (forwarding is automatic)
+    python -m loopctl serve --warm .loop &
         """,
     )
 
@@ -59,6 +74,25 @@ Examples:
         type=int,
         help="Iteration number (reads from state if not provided)",
     )
+    ralph_parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print per-step timings and a cProfile summary to stderr",
+    )
+    ralph_parser.add_argument(
+        "--budget-ms",
+        type=float,
+        help="Hook latency budget in ms (default: policy.json latency_budget_ms)",
+    )
+    ralph_parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="Run in-process even if a loopctl daemon is listening",
+    )
+    ralph_parser.add_argument(
+        "--socket",
+        help="Daemon socket path (default: LOOPCTL_SOCKET or per-user path)",
+    )
 
     # status command
     status_parser = subparsers.add_parser(
@@ -70,6 +104,15 @@ Examples:
         required=True,
         help="Path to .loop/ directory",
     )
+    status_parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="Run in-process even if a loopctl daemon is listening",
+    )
+    status_parser.add_argument(
+        "--socket",
+        help="Daemon socket path (default: LOOPCTL_SOCKET or per-user path)",
+    )
 
     # reset command
     reset_parser = subparsers.add_parser(
@@ -98,30 +141,107 @@ Examples:
         help="Force heuristic mode (skip CLI evaluator)",
     )
 
+    # serve command
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="Run a warm loopctl daemon on a Unix socket",
+    )
+    serve_parser.add_argument(
+        "--socket",
+        help="Socket path (default: LOOPCTL_SOCKET or per-user path)",
+    )
+    serve_parser.add_argument(
+        "--warm",
+        action="append",
+        default=[],
+        metavar="LOOP_DIR",
+        help="Build the bridge and harness for this loop directory at startup (repeatable)",
+    )
+    serve_parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        help="Exit after this many seconds without a request",
+    )
+
+    # daemon-status / stop-daemon commands
+    for name, help_text in (("daemon-status", "Show whether a loopctl daemon is running"),
+                            ("stop-daemon", "Stop a running loopctl daemon")):
+        daemon_parser = subparsers.add_parser(name, help=help_text)
+        daemon_parser.add_argument(
+            "--socket",
+            help="Socket path (default: LOOPCTL_SOCKET or per-user path)",
+        )
+
     args = parser.parse_args()
 
     if args.command == "ralph_iteration_complete":
-        result = ralph_iteration_complete(
-            state_path=args.state,
-            loop_dir=args.loop_dir,
-            output_path=args.output,
-            iteration=args.iteration,
-        )
+        kwargs = {
+            "state_path": args.state,
+            "loop_dir": args.loop_dir,
+            "output_path": args.output,
+            "iteration": args.iteration,
+            "profile": args.profile,
+            "latency_budget_ms": args.budget_ms,
+        }
+
+        def run():
+            from .core import ralph_iteration_complete
+            return ralph_iteration_complete(**kwargs)
+
+        if args.profile:
+            import cProfile
+            import io
+            import pstats
+
+            profiler = cProfile.Profile()
+            result = profiler.runcall(run)
+            print(format_spans(result.get("timings_ms", {}), result.get("latency_budget_ms")), file=sys.stderr)
+            stats_out = io.StringIO()
+            pstats.Stats(profiler, stream=stats_out).sort_stats("cumulative").print_stats(25)
+            print(stats_out.getvalue(), file=sys.stderr)
+        elif args.no_daemon:
+            result = run()
+        else:
+            result = _forward("ralph_iteration_complete", kwargs, run, args.socket)
+        # stdout carries only the decision JSON the stop hook parses
         print(json.dumps(result))
 
     elif args.command == "status":
-        result = get_status(args.loop_dir)
+        def run():
+            from .core import get_status
+            return get_status(args.loop_dir)
+
+        if args.no_daemon:
+            result = run()
+        else:
+            result = _forward("get_status", {"loop_dir": args.loop_dir}, run, args.socket)
         print(json.dumps(result, indent=2))
 
     elif args.command == "reset":
+        from .core import reset_loop
         result = reset_loop(args.loop_dir)
         print(json.dumps(result, indent=2))
 
+    elif args.command == "serve":
+        from .daemon import serve
+        serve(args.socket, warm_loop_dirs=args.warm, idle_timeout_s=args.idle_timeout)
+
+    elif args.command in ("daemon-status", "stop-daemon"):
+        op = "ping" if args.command == "daemon-status" else "shutdown"
+        try:
+            result = client.request(op, socket_path=args.socket, timeout_s=10)
+        except client.DaemonUnavailable as e:
+            print(json.dumps({"running": False, "reason": str(e)}, indent=2))
+            sys.exit(1)
+        print(json.dumps({"running": op == "ping", **result}, indent=2))
+
     elif args.command == "self-test":
         print("=" * 60)
         print("FrozenHarness Self-Test")
         print("=" * 60)
 
+        from .core import FrozenHarness
+
         # Initialize harness
         harness = FrozenHarness(
             Path(args.loop_dir),
@@ -190,5 +310,15 @@ def safe_divide(a, b):
         sys.exit(1)
 
 
+def _forward(op, kwargs, run, socket_path):
+    """Forward a call to the daemon, running it in-process if none is available."""
+    try:
+        return client.call_or_run(op, kwargs, run, socket_path=socket_path)
+    except client.DaemonError as e:
+        # The daemon may have done part of the work; don't run it a second time
+        print(f"loopctl: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
 if __name__ == "__main__":
     main()
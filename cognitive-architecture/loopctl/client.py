@@ -0,0 +1,126 @@
+"""
+Thin client for the loopctl daemon.
+
+`loopctl serve` keeps the bridge, harness and their imports warm in one
+long-lived process listening on a Unix domain socket. This module is what
+the stop hook's `python -m loopctl` uses to reach it. It imports only the
+standard library, so forwarding a call costs an interpreter start and a
+socket round trip instead of importing the whole architecture.
+
+Protocol: one JSON request line per connection,
+    {"op": "ralph_iteration_complete", "args": {...}, "cwd": "...", "env": {...}}
+answered by one JSON response line,
+    {"ok": true, "result": {...}}  or  {"ok": false, "error": "..."}
+
+Environment:
+    LOOPCTL_SOCKET  Socket path (default: $XDG_RUNTIME_DIR/loopctl.sock,
+                    else <tmpdir>/loopctl-<uid>/loopctl.sock)
+    LOOPCTL_DAEMON  Set to 0 to always run in-process
+
+Requests are only sent to a socket owned by the current user with no
+group/other permissions; anything else is treated as no daemon.
+"""
+
+import json
+import os
+import socket
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from . import unix_socket
+
+# Seconds to wait for the daemon to accept a connection
+CONNECT_TIMEOUT_S = 0.5
+# Seconds to wait for a response (grading may call an LLM judge)
+DEFAULT_TIMEOUT_S = 900.0
+
+# Client environment the daemon applies while serving a request (kill switch)
+FORWARDED_ENV = ("META_LOOP_EMERGENCY_STOP",)
+
+# Request arguments that are paths, made absolute against the client's cwd
+PATH_ARGS = ("state_path", "loop_dir", "output_path")
+
+
+class DaemonUnavailable(ConnectionError):
+    """No daemon accepted the request; it is safe to run in-process."""
+
+
+class DaemonError(RuntimeError):
+    """The daemon accepted the request but failed to complete it."""
+
+
+def default_socket_path() -> Path:
+    """Socket path from LOOPCTL_SOCKET or the per-user default."""
+    return unix_socket.default_socket_path("LOOPCTL_SOCKET", "loopctl")
+
+
+def daemon_enabled() -> bool:
+    return hasattr(socket, "AF_UNIX") and os.environ.get("LOOPCTL_DAEMON", "1") != "0"
+
+
+def request(
+    op: str,
+    args: Optional[Dict[str, Any]] = None,
+    socket_path: Optional[Path] = None,
+    timeout_s: float = DEFAULT_TIMEOUT_S,
+) -> Any:
+    """
+    Send one request to the daemon.
+
+    Args:
+        op: "ralph_iteration_complete", "get_status", "ping" or "shutdown"
+        args: Keyword arguments for the operation
+        socket_path: Daemon socket (default: default_socket_path())
+        timeout_s: Seconds to wait for the response
+
+    Returns:
+        The operation's result
+
+    Raises:
+        DaemonUnavailable: Nothing trusted is listening (or the daemon is stale)
+        DaemonError: The request was sent but did not complete
+    """
+    if not daemon_enabled():
+        raise DaemonUnavailable("loopctl daemon disabled")
+    socket_path = Path(socket_path or default_socket_path())
+
+    args = dict(args or {})
+    for name in PATH_ARGS:
+        if args.get(name) is not None:
+            args[name] = os.path.abspath(args[name])
+    payload = {
+        "op": op,
+        "args": args,
+        "cwd": os.getcwd(),
+        "env": {name: os.environ[name] for name in FORWARDED_ENV if name in os.environ},
+    }
+
+    try:
+        line = unix_socket.send_request(socket_path, payload, CONNECT_TIMEOUT_S, timeout_s)
+    except unix_socket.ServiceUnreachable as e:
+        raise DaemonUnavailable(f"loopctl daemon not reachable: {e}") from e
+    except OSError as e:
+        raise DaemonError(f"loopctl daemon request failed: {e}") from e
+
+    if not line:
+        raise DaemonError("loopctl daemon closed the connection without a response")
+    response = json.loads(line)
+    if response.get("ok"):
+        return response.get("result")
+    if response.get("stale"):
+        # The daemon refused before doing any work and is shutting down
+        raise DaemonUnavailable(response.get("error", "loopctl daemon is stale"))
+    raise DaemonError(response.get("error", "unknown loopctl daemon error"))
+
+
+def call_or_run(
+    op: str,
+    args: Dict[str, Any],
+    run_in_process: Callable[[], Any],
+    socket_path: Optional[Path] = None,
+) -> Any:
+    """Forward to the daemon, or run in-process if no daemon is available."""
+    try:
+        return request(op, args, socket_path=socket_path)
+    except DaemonUnavailable:
+        return run_in_process()
@@ -23,6 +23,8 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, Optional, Tuple
 
+from .timing import SpanTimer
+
 
 # =============================================================================
 # EMERGENCY KILL SWITCH (Phase 0 Security Fix)
@@ -76,6 +78,24 @@ from integration.telemetry_bridge import TelemetryBridge
 from integration.connascence_bridge import ConnascenceBridge, ConnascenceResult
 
 
+# Harness source digests, reused while the file's (mtime, size) is unchanged
+_HASH_MEMO: Dict[str, Tuple[int, int, str]] = {}
+
+
+def _file_digest(path: Path) -> Optional[str]:
+    """Short sha256 of a file, memoized on its mtime and size."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    memo = _HASH_MEMO.get(str(path))
+    if memo is not None and memo[:2] == (stat.st_mtime_ns, stat.st_size):
+        return memo[2]
+    digest = hashlib.sha256(path.read_bytes()).hexdigest()[:12]
+    _HASH_MEMO[str(path)] = (stat.st_mtime_ns, stat.st_size, digest)
+    return digest
+
+
 class FrozenHarness:
     """
     Wrapper for the frozen eval harness.
@@ -101,6 +121,7 @@ class FrozenHarness:
         self.use_connascence = use_connascence
         self._harness_hash = self._compute_hash()
         self._cli_evaluator = None
+        self._result_cache = None
         self._connascence_bridge = None
 
         # Try to initialize CLI evaluator
@@ -120,8 +141,12 @@ class FrozenHarness:
                 import sys
                 sys.path.insert(0, str(eval_path.parent))
                 from evals.cli_evaluator import ClaudeCLI
+                from evals.result_cache import ResultCache
                 cli = ClaudeCLI()
-                if cli.is_available:
+                cache = ResultCache()
+                # Replay grades from cached results only, so it needs no CLI
+                if cli.is_available or cache.mode == "replay":
+                    self._result_cache = cache
                     return cli
         except Exception as e:
             pass  # Silently fall back to heuristics
@@ -139,16 +164,15 @@ class FrozenHarness:
     def _compute_hash(self) -> str:
         """Compute hash of harness for integrity verification."""
         # Hash actual harness code for integrity
-        import hashlib
-        harness_file = Path(__file__)
-        if harness_file.exists():
-            content = harness_file.read_bytes()
-            file_hash = hashlib.sha256(content).hexdigest()[:12]
+        file_hash = _file_digest(Path(__file__))
+        if file_hash is not None:
             return f"frozen_eval_harness_v{self.harness_version}_{file_hash}"
         return f"frozen_eval_harness_v{self.harness_version}"
 
     @property
     def current_hash(self) -> str:
+        # Re-checked on every use so a warm harness notices edits to its source
+        self._harness_hash = self._compute_hash()
         return self._harness_hash
 
     @property
@@ -167,7 +191,7 @@ class FrozenHarness:
         """Verify harness hasn't been modified."""
         if expected_hash is None:
             return True
-        return self._harness_hash == expected_hash
+        return self.current_hash == expected_hash
 
     def grade(self, artifact_path: Path) -> Dict[str, Any]:
         """
@@ -252,7 +276,9 @@ class FrozenHarness:
         """
         Grade using CLI evaluator (real LLM-as-judge).
 
-        Sends content to Claude CLI for evaluation.
+        Sends content to Claude CLI for evaluation. Responses are cached
+        by (prompt, model, harness hash), so unchanged content is graded
+        without a model call until the harness itself changes.
         """
         judge_prompt = f"""You are evaluating code/text quality. Score each dimension from 0.0 to 1.0.
 
@@ -268,8 +294,18 @@ Score these dimensions (0.0 to 1.0):
 Respond in JSON format ONLY:
 {{"task_accuracy": 0.0, "token_efficiency": 0.0, "edge_robustness": 0.0, "epistemic_consistency": 0.0}}"""
 
-        result = self._cli_evaluator.send_message(judge_prompt, max_tokens=200)
-        response = result.get("response", "")
+        def send() -> str:
+            result = self._cli_evaluator.send_message(judge_prompt, max_tokens=200)
+            return result.get("response", "")
+
+        if self._result_cache is not None:
+            from evals.result_cache import has_json_object
+            response = self._result_cache.call(
+                judge_prompt, self._cli_evaluator.model, self.current_hash, send,
+                cacheable=has_json_object, max_tokens=200,
+            )
+        else:
+            response = send()
 
         # Parse JSON from response
         import json
@@ -388,11 +424,43 @@ def get_git_head() -> Optional[str]:
     return None
 
 
+# Warm per-loop-directory instances, reused across calls in one process
+_WARM_BRIDGES: Dict[Path, UnifiedBridge] = {}
+_WARM_HARNESSES: Dict[Path, FrozenHarness] = {}
+
+
+def get_bridge(loop_dir: Path) -> UnifiedBridge:
+    """UnifiedBridge for a loop directory, constructed once per process."""
+    key = Path(loop_dir).resolve()
+    bridge = _WARM_BRIDGES.get(key)
+    if bridge is None:
+        bridge = _WARM_BRIDGES[key] = UnifiedBridge(Path(loop_dir))
+    return bridge
+
+
+def get_harness(loop_dir: Path) -> FrozenHarness:
+    """FrozenHarness for a loop directory, constructed once per process."""
+    key = Path(loop_dir).resolve()
+    harness = _WARM_HARNESSES.get(key)
+    if harness is None:
+        harness = _WARM_HARNESSES[key] = FrozenHarness(Path(loop_dir))
+    return harness
+
+
+def clear_warm_state() -> None:
+    """Drop warm bridges/harnesses and memoized hashes."""
+    _WARM_BRIDGES.clear()
+    _WARM_HARNESSES.clear()
+    _HASH_MEMO.clear()
+
+
 def ralph_iteration_complete(
     state_path: str,
     loop_dir: str,
     output_path: Optional[str] = None,
     iteration: Optional[int] = None,
+    profile: bool = False,
+    latency_budget_ms: Optional[float] = None,
 ) -> Dict[str, Any]:
     """
     SINGLE AUTHORITY for Ralph loop decisions.
@@ -407,17 +475,25 @@ def ralph_iteration_complete(
     6. Appends event to events.jsonl
     7. Returns decision JSON for Ralph stop-hook
 
+    Every step is timed; the spans are appended to events.jsonl as a
+    "timing" event after the decision event.
+
     Args:
         state_path: Path to Ralph state file
         loop_dir: Path to .loop/ directory
         output_path: Optional explicit artifact path
         iteration: Optional iteration number (reads from state if not provided)
+        profile: Include the step timings in the returned JSON
+        latency_budget_ms: Hook latency budget (default: policy "latency_budget_ms")
 
     Returns:
         Decision JSON: {"decision": "block|allow", "reason": "..."}
     """
+    timer = SpanTimer()
+
     # STEP 0: CHECK EMERGENCY KILL SWITCH BEFORE ANYTHING ELSE
-    should_stop, stop_reason = check_emergency_stop()
+    with timer.span("kill_switch"):
+        should_stop, stop_reason = check_emergency_stop()
     if should_stop:
         return {
             "decision": "allow",  # allow = stop the loop
@@ -426,12 +502,17 @@ def ralph_iteration_complete(
         }
 
     loop_dir = Path(loop_dir)
-    bridge = UnifiedBridge(loop_dir)
+    with timer.span("bridge_init"):
+        bridge = get_bridge(loop_dir)
 
     # 1. Load current state
-    current_config = bridge.load_runtime_config()
-    policy = bridge.load_policy()
-    history = bridge.load_history()
+    with timer.span("load_state"):
+        current_config = bridge.load_runtime_config()
+        policy = bridge.load_policy()
+        history = bridge.load_history(limit=bridge.HISTORY_WINDOW)
+
+    if latency_budget_ms is None:
+        latency_budget_ms = policy.get("latency_budget_ms")
 
     # Get iteration from state or param
     if iteration is None:
@@ -441,32 +522,38 @@ def ralph_iteration_complete(
     artifact_path = find_artifact(output_path, loop_dir)
 
     # 3. Grade with FROZEN harness (authoritative)
-    harness = FrozenHarness(loop_dir)
+    with timer.span("harness_init"):
+        harness = get_harness(loop_dir)
     expected_hash = policy.get("harness_hash")
 
-    if not harness.verify_integrity(expected_hash):
-        return {
+    with timer.span("verify_integrity"):
+        integrity_ok = harness.verify_integrity(expected_hash)
+    if not integrity_ok:
+        result = {
             "decision": "allow",
             "reason": "HALT: Harness integrity check failed",
         }
+        return _finish_iteration(bridge, timer, iteration, result, profile, latency_budget_ms)
 
-    harness_metrics = harness.grade(artifact_path)
+    with timer.span("grade"):
+        harness_metrics = harness.grade(artifact_path)
 
     # 4. Write authoritative eval report
-    eval_report = {
-        "_comment": "EVIDENCE TRUTH - Written ONLY by Frozen Eval Harness",
-        "_schema_version": "1.0.0",
-        "iteration": iteration,
-        "timestamp": datetime.now().isoformat(),
-        "artifact_path": str(artifact_path),
-        "artifact_hash": hashlib.sha256(
-            artifact_path.read_bytes() if artifact_path.exists() else b""
-        ).hexdigest()[:16],
-        "metrics": harness_metrics,
-        "harness_version": harness.harness_version,
-        "harness_hash": harness.current_hash,
-    }
-    (loop_dir / "eval_report.json").write_text(json.dumps(eval_report, indent=2))
+    with timer.span("write_eval_report"):
+        eval_report = {
+            "_comment": "EVIDENCE TRUTH - Written ONLY by Frozen Eval Harness",
+            "_schema_version": "1.0.0",
+            "iteration": iteration,
+            "timestamp": datetime.now().isoformat(),
+            "artifact_path": str(artifact_path),
+            "artifact_hash": hashlib.sha256(
+                artifact_path.read_bytes() if artifact_path.exists() else b""
+            ).hexdigest()[:16],
+            "metrics": harness_metrics,
+            "harness_version": harness.harness_version,
+            "harness_hash": harness.current_hash,
+        }
+        (loop_dir / "eval_report.json").write_text(json.dumps(eval_report, indent=2))
 
     # 5. Build bridge input
     task_metadata = {}
@@ -485,15 +572,18 @@ def ralph_iteration_complete(
     )
 
     # 6. Ask bridge (NOT model) for decision
-    next_config = bridge.propose_next_config(bridge_input)
+    with timer.span("propose_config"):
+        next_config = bridge.propose_next_config(bridge_input)
 
     # 7. Build event
+    with timer.span("git_head"):
+        git_head = get_git_head()
     event = UnifiedEvent(
         task_id=f"ralph_{iteration}",
         plane=Plane.EXECUTION.value,
         timescale=Timescale.MICRO.value,
         iteration=iteration,
-        git_head=get_git_head(),
+        git_head=git_head,
         config={
             "mode": next_config.mode,
             "vector14": next_config.vector14,
@@ -507,52 +597,90 @@ def ralph_iteration_complete(
     )
 
     # 8. Always append event (audit trail)
-    bridge.append_event(event)
+    with timer.span("append_event"):
+        bridge.append_event(event)
 
     # 9. Update history
-    bridge.update_history(iteration, harness_metrics)
+    with timer.span("update_history"):
+        bridge.update_history(iteration, harness_metrics)
 
     # 10. Store telemetry to Memory MCP
-    try:
-        telemetry_bridge = TelemetryBridge(loop_dir)
-        telemetry_result = telemetry_bridge.store_to_memory_mcp(iteration=iteration)
-        # Add telemetry storage info to event (non-blocking)
-    except Exception as e:
-        # Telemetry storage is non-blocking - log but continue
-        pass
+    with timer.span("telemetry"):
+        try:
+            telemetry_bridge = TelemetryBridge(loop_dir)
+            telemetry_result = telemetry_bridge.store_to_memory_mcp(iteration=iteration)
+            # Add telemetry storage info to event (non-blocking)
+        except Exception as e:
+            # Telemetry storage is non-blocking - log but continue
+            pass
 
     # 11. Make final decision
     if next_config.decision_intent == DecisionIntent.HALT:
-        return {
+        result = {
             "decision": "allow",
             "reason": next_config.reasons[0] if next_config.reasons else "HALT",
         }
-
-    if next_config.decision_intent == DecisionIntent.ESCALATE:
-        return {
+    elif next_config.decision_intent == DecisionIntent.ESCALATE:
+        result = {
             "decision": "allow",
             "reason": f"ESCALATE: Human review required. Gates: {next_config.human_gates_triggered}",
         }
+    else:
+        # Continue iteration - write updated config
+        with timer.span("write_config"):
+            bridge.write_config(next_config, iteration + 1, harness_metrics.get("overall", 0))
+
+        result = {
+            "decision": "block",
+            "reason": "CONTINUE_ITERATION",
+            "iteration": iteration + 1,
+            "metrics": harness_metrics,
+        }
 
-    # Continue iteration - write updated config
-    bridge.write_config(next_config, iteration + 1, harness_metrics.get("overall", 0))
+    return _finish_iteration(bridge, timer, iteration, result, profile, latency_budget_ms)
 
-    return {
-        "decision": "block",
-        "reason": "CONTINUE_ITERATION",
-        "iteration": iteration + 1,
-        "metrics": harness_metrics,
-    }
+
+def _finish_iteration(
+    bridge: UnifiedBridge,
+    timer: SpanTimer,
+    iteration: int,
+    result: Dict[str, Any],
+    profile: bool,
+    latency_budget_ms: Optional[float],
+) -> Dict[str, Any]:
+    """Append the timing event and check the latency budget."""
+    over_budget = timer.over_budget(latency_budget_ms)
+    bridge.append_event(UnifiedEvent(
+        event_type="timing",
+        task_id=f"ralph_{iteration}",
+        plane=Plane.EXECUTION.value,
+        timescale=Timescale.MICRO.value,
+        iteration=iteration,
+        decision=result["decision"],
+        reason=f"latency budget of {latency_budget_ms:.0f}ms exceeded" if over_budget else "",
+        timings_ms={**timer.spans, "total": timer.total_ms},
+    ))
+
+    if over_budget:
+        print(
+            f"loopctl: iteration {iteration} took {timer.total_ms:.0f}ms "
+            f"(budget {latency_budget_ms:.0f}ms)",
+            file=sys.stderr,
+        )
+        result["latency_budget_exceeded"] = True
+    if profile:
+        result["timings_ms"] = {**timer.spans, "total": timer.total_ms}
+        result["latency_budget_ms"] = latency_budget_ms
+    return result
 
 
 def get_status(loop_dir: str) -> Dict[str, Any]:
     """Get current loop status."""
     loop_dir = Path(loop_dir)
-    bridge = UnifiedBridge(loop_dir)
+    bridge = get_bridge(loop_dir)
 
     config = bridge.load_runtime_config()
     eval_report = bridge.load_eval_report()
-    history = bridge.load_history()
     policy = bridge.load_policy()
 
     return {
@@ -560,7 +688,7 @@ def get_status(loop_dir: str) -> Dict[str, Any]:
         "mode": config.get("mode", "unknown"),
         "exploration_mode": config.get("exploration_mode", "unknown"),
         "last_score": eval_report.get("metrics", {}).get("overall", 0),
-        "history_length": len(history),
+        "history_length": bridge.history_length(),
         "max_iterations": policy.get("max_iterations", 50),
         "regression_threshold": policy.get("regression_threshold", 0.03),
     }
@@ -569,7 +697,7 @@ def get_status(loop_dir: str) -> Dict[str, Any]:
 def reset_loop(loop_dir: str) -> Dict[str, Any]:
     """Reset loop state to defaults."""
     loop_dir = Path(loop_dir)
-    bridge = UnifiedBridge(loop_dir)
+    bridge = get_bridge(loop_dir)
 
     # Write default config
     default_config = bridge._default_config()
@@ -581,9 +709,6 @@ def reset_loop(loop_dir: str) -> Dict[str, Any]:
     }, indent=2))
 
     # Reset history
-    (loop_dir / "history.json").write_text(json.dumps({
-        "_comment": "ITERATION HISTORY - Reset by loopctl",
-        "iterations": [],
-    }, indent=2))
+    bridge.reset_history()
 
     return {"status": "reset", "message": "Loop state reset to defaults"}
@@ -0,0 +1,163 @@
+"""
+loopctl daemon - serves loopctl calls from a warm process.
+
+`python -m loopctl serve` imports the bridge, harness and their
+dependencies once and answers requests from loopctl.client over a Unix
+domain socket. Bridges and harnesses stay warm per loop directory (see
+core.get_bridge / core.get_harness), so a stop-hook call costs grading
+plus a socket round trip instead of a cold interpreter.
+
+Requests are executed one at a time, in the client's working directory and
+with the client's kill-switch environment, so results match running
+loopctl in-process.
+
+The daemon stops itself if any of its loaded source files change on disk,
+answering the triggering request with a "stale" error; the client then
+runs that call in-process and the next `loopctl serve` picks up the new
+code.
+"""
+
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from . import core
+from .client import FORWARDED_ENV, default_socket_path
+from .unix_socket import JsonLineServer, StaleServer, changed_files
+
+COGNITIVE_DIR = Path(__file__).resolve().parent.parent
+
+OPERATIONS = ("ralph_iteration_complete", "get_status", "ping", "shutdown")
+
+
+class StaleDaemon(StaleServer):
+    """A loaded source file changed since the daemon started."""
+
+
+def _loaded_sources() -> Dict[str, Tuple[int, int]]:
+    """(mtime, size) of every loaded module file under cognitive-architecture/."""
+    sources = {}
+    for module in list(sys.modules.values()):
+        path = getattr(module, "__file__", None)
+        if not path:
+            continue
+        try:
+            resolved = Path(path).resolve()
+            if COGNITIVE_DIR not in resolved.parents:
+                continue
+            stat = resolved.stat()
+        except (OSError, ValueError):
+            continue
+        sources[str(resolved)] = (stat.st_mtime_ns, stat.st_size)
+    return sources
+
+
+@contextmanager
+def _client_context(cwd: Optional[str], env: Dict[str, str]) -> Iterator[None]:
+    """Run in the client's cwd with its forwarded environment, then restore."""
+    previous_cwd = os.getcwd()
+    previous_env = {name: os.environ.get(name) for name in FORWARDED_ENV}
+    try:
+        if cwd:
+            os.chdir(cwd)
+        for name in FORWARDED_ENV:
+            if name in env:
+                os.environ[name] = env[name]
+            else:
+                os.environ.pop(name, None)
+        yield
+    finally:
+        os.chdir(previous_cwd)
+        for name, value in previous_env.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+class LoopctlDaemon(JsonLineServer):
+    """
+    Unix-socket server for loopctl operations.
+
+    Usage:
+        daemon = LoopctlDaemon(socket_path, warm_loop_dirs=[".loop"])
+        daemon.serve_forever()
+    """
+
+    service_name = "loopctl daemon"
+
+    def __init__(
+        self,
+        socket_path: Optional[Path] = None,
+        warm_loop_dirs: Optional[List[str]] = None,
+        idle_timeout_s: Optional[float] = None,
+    ):
+        """
+        Initialize daemon and bind its socket.
+
+        Args:
+            socket_path: Socket to listen on (default: client.default_socket_path())
+            warm_loop_dirs: Loop directories whose bridge/harness are built up front
+            idle_timeout_s: Stop after this many seconds without a request
+        """
+        self._lock = threading.Lock()
+        super().__init__(socket_path or default_socket_path(), idle_timeout_s)
+
+        for loop_dir in warm_loop_dirs or []:
+            core.get_bridge(Path(loop_dir))
+            core.get_harness(Path(loop_dir))
+        self._sources = _loaded_sources()
+
+    def dispatch(self, request: Dict[str, Any]) -> Any:
+        """Execute one request (serialized; loop state files are not concurrency-safe)."""
+        op = request.get("op")
+        if op not in OPERATIONS:
+            raise ValueError(f"Unknown operation: {op}")
+        if op == "ping":
+            return {
+                "pid": os.getpid(),
+                "socket": str(self.socket_path),
+                "uptime_s": round(time.time() - self.started_at, 3),
+                "requests_served": self.requests_served,
+                "warm_loop_dirs": [str(path) for path in core._WARM_BRIDGES],
+            }
+        if op == "shutdown":
+            self.stop()
+            return {"status": "stopping"}
+
+        with self._lock:
+            changed = changed_files(self._sources)
+            if changed:
+                self.stop()
+                raise StaleDaemon(f"loopctl daemon source changed ({changed[0]}); restart it")
+
+            self.last_request_at = time.time()
+            self.requests_served += 1
+            args = request.get("args") or {}
+            with _client_context(request.get("cwd"), request.get("env") or {}):
+                if op == "ralph_iteration_complete":
+                    return core.ralph_iteration_complete(**args)
+                return core.get_status(**args)
+
+    def busy(self) -> bool:
+        return self._lock.locked()
+
+
+def serve(
+    socket_path: Optional[Path] = None,
+    warm_loop_dirs: Optional[List[str]] = None,
+    idle_timeout_s: Optional[float] = None,
+) -> None:
+    """Run the daemon until shutdown, idle timeout or a source change."""
+    daemon = LoopctlDaemon(socket_path, warm_loop_dirs, idle_timeout_s)
+    print(f"loopctl daemon listening on {daemon.socket_path} (pid {os.getpid()})", file=sys.stderr)
+    try:
+        daemon.serve_forever(poll_interval=0.5)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.server_close()
@@ -0,0 +1,61 @@
+"""
+Per-step timing spans for loopctl.
+
+ralph_iteration_complete runs synchronously inside the Ralph stop hook, so
+every step it takes is hook latency. SpanTimer records how long each step
+took; the spans are appended to events.jsonl as a "timing" event after the
+decision event, checked against the policy's latency budget and printed
+by `loopctl ralph_iteration_complete --profile` (see format_spans).
+
+Usage:
+    timer = SpanTimer()
+    with timer.span("grade"):
+        metrics = harness.grade(artifact_path)
+    timer.spans      # {"grade": 812.4}
+    timer.total_ms   # wall time since the timer was created
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+
+class SpanTimer:
+    """Wall-clock durations of named steps, in milliseconds."""
+
+    def __init__(self):
+        self._start = time.perf_counter()
+        self.spans: Dict[str, float] = {}
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """Time the enclosed block (recorded even if it raises)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            self.spans[name] = round(self.spans.get(name, 0.0) + elapsed, 3)
+
+    @property
+    def total_ms(self) -> float:
+        return round((time.perf_counter() - self._start) * 1000, 3)
+
+    def over_budget(self, budget_ms: Optional[float]) -> bool:
+        """True if a budget is set and the total so far exceeds it."""
+        return budget_ms is not None and self.total_ms > budget_ms
+
+
+def format_spans(timings_ms: Dict[str, float], budget_ms: Optional[float] = None) -> str:
+    """Human-readable span table (slowest step first) from a timings dict with a "total"."""
+    spans = {name: ms for name, ms in timings_ms.items() if name != "total"}
+    total = timings_ms.get("total", sum(spans.values()))
+    lines = [f"{'step':<24} {'ms':>10} {'share':>7}"]
+    for name, ms in sorted(spans.items(), key=lambda item: -item[1]):
+        share = ms / total * 100 if total else 0.0
+        lines.append(f"{name:<24} {ms:>10.1f} {share:>6.1f}%")
+    lines.append(f"{'total':<24} {total:>10.1f}")
+    if budget_ms is not None:
+        status = "OVER BUDGET" if total > budget_ms else "within budget"
+        lines.append(f"{'budget':<24} {budget_ms:>10.1f} {status}")
+    return "\n".join(lines)
@@ -0,0 +1,243 @@
+"""
+Per-user Unix-socket services speaking one JSON line each way.
+
+Shared by the loopctl daemon (loopctl.daemon / loopctl.client) and the
+resident skill router (skills/router_service.py / router_client.py).
+Imports only the standard library: router_client.py loads it under
+`python -S`.
+
+Protocol: one JSON request line per connection, answered by one JSON
+response line,
+    {"ok": true, "result": ...}  or  {"ok": false, "error": "..."}
+with "stale": true added when the server refused because its own source
+changed (it is stopping; the caller should do the work itself).
+
+Sockets are private to their user: the default one lives in a 0700
+per-user directory, servers refuse directories others can write, and
+clients only connect to a socket owned by the current user with mode 0600.
+"""
+
+import json
+import os
+import socket
+import socketserver
+import stat
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+Signature = Optional[Tuple[int, int]]
+
+
+class ServiceUnreachable(ConnectionError):
+    """No trusted server accepted the connection; nothing was sent."""
+
+
+class ServiceNotRunning(ServiceUnreachable):
+    """No server is listening on the socket (missing, or left by a dead server)."""
+
+
+class StaleServer(RuntimeError):
+    """A loaded source file changed since the server started."""
+
+
+def default_socket_path(env_var: str, name: str) -> Path:
+    """
+    Socket path from env_var or the per-user default.
+
+    $XDG_RUNTIME_DIR/<name>.sock, else <tmpdir>/<name>-<uid>/<name>.sock.
+    """
+    configured = os.environ.get(env_var)
+    if configured:
+        return Path(configured)
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / f"{name}.sock"
+    uid = os.getuid() if hasattr(os, "getuid") else os.getpid()
+    return Path(tempfile.gettempdir()) / f"{name}-{uid}" / f"{name}.sock"
+
+
+def untrusted_reason(path: Path, is_dir: bool = False) -> Optional[str]:
+    """
+    Why a socket (or its directory) must not be trusted, or None if it is ours.
+
+    A socket must be owned by the current user with mode 0600 or stricter.
+    A directory must be owned by the current user (or root) and not be
+    writable by others unless it is sticky, like /tmp.
+    """
+    try:
+        st = os.lstat(path)
+    except OSError as e:
+        return f"cannot stat {path}: {e}"
+    if not hasattr(os, "getuid"):
+        return None
+    uid = os.getuid()
+    if is_dir:
+        if not stat.S_ISDIR(st.st_mode):
+            return f"{path} is not a directory"
+        if st.st_uid not in (uid, 0):
+            return f"{path} is owned by uid {st.st_uid}"
+        if st.st_mode & 0o022 and not st.st_mode & stat.S_ISVTX:
+            return f"{path} is writable by other users"
+        return None
+    if not stat.S_ISSOCK(st.st_mode):
+        return f"{path} is not a socket"
+    if st.st_uid != uid:
+        return f"{path} is owned by uid {st.st_uid}"
+    if st.st_mode & 0o077:
+        return f"{path} is accessible to other users (mode {stat.S_IMODE(st.st_mode):o})"
+    return None
+
+
+def _logger():
+    # Only servers log; clients import this module per hook call and skip logging's import cost
+    import logging
+    return logging.getLogger(__name__)
+
+
+def send_request(
+    socket_path: Path,
+    request: Dict[str, Any],
+    connect_timeout_s: float,
+    timeout_s: float,
+) -> bytes:
+    """
+    Send one JSON request line and return the response line (b"" if none).
+
+    Raises:
+        ServiceNotRunning: No socket, or nothing accepted the connection
+        ServiceUnreachable: The socket is not trusted, or connecting failed
+        OSError: Sending or receiving failed after connecting
+    """
+    socket_path = Path(socket_path)
+    if not socket_path.exists():
+        raise ServiceNotRunning(f"No socket at {socket_path}")
+    reason = untrusted_reason(socket_path)
+    if reason:
+        raise ServiceUnreachable(f"Refusing untrusted socket: {reason}")
+
+    data = json.dumps(request).encode("utf-8") + b"\n"
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(connect_timeout_s)
+        try:
+            sock.connect(str(socket_path))
+        except (ConnectionRefusedError, FileNotFoundError) as e:
+            raise ServiceNotRunning(f"Nothing listening on {socket_path}: {e}") from e
+        except OSError as e:
+            raise ServiceUnreachable(f"Cannot connect to {socket_path}: {e}") from e
+        sock.settimeout(timeout_s)
+        sock.sendall(data)
+        with sock.makefile("rb") as f:
+            return f.readline()
+    finally:
+        sock.close()
+
+
+def file_signature(path: Path) -> Signature:
+    """(mtime_ns, size) of path, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def changed_files(signatures: Dict[str, Signature]) -> List[str]:
+    """Paths whose file_signature differs from the recorded one."""
+    return [path for path, signature in signatures.items() if file_signature(Path(path)) != signature]
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line:
+            return
+        try:
+            response = {"ok": True, "result": self.server.dispatch(json.loads(line))}
+        except StaleServer as e:
+            response = {"ok": False, "stale": True, "error": str(e)}
+        except Exception as e:
+            _logger().exception("%s request failed", self.server.service_name)
+            response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+        try:
+            self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+        except OSError:
+            pass  # client gave up waiting
+
+
+class JsonLineServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Unix-socket server answering one JSON request per connection.
+
+    Subclasses implement dispatch(request) and may override busy().
+    """
+
+    daemon_threads = True
+    service_name = "service"
+
+    def __init__(self, socket_path: Path, idle_timeout_s: Optional[float] = None):
+        """
+        Bind socket_path, private to the current user.
+
+        Args:
+            socket_path: Socket to listen on; its directory is created 0700
+            idle_timeout_s: Stop after this many seconds without a request
+        """
+        self.socket_path = Path(socket_path)
+        self.idle_timeout_s = idle_timeout_s
+        self.started_at = time.time()
+        self.last_request_at = self.started_at
+        self.requests_served = 0
+
+        self._prepare_socket_dir()
+        self._remove_stale_socket()
+        super().__init__(str(self.socket_path), _RequestHandler)
+        os.chmod(self.socket_path, 0o600)
+
+    def _prepare_socket_dir(self) -> None:
+        """Create the socket's directory private to this user, or refuse a shared one."""
+        self.socket_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        reason = untrusted_reason(self.socket_path.parent, is_dir=True)
+        if reason:
+            raise RuntimeError(f"Refusing to listen in {self.socket_path.parent}: {reason}")
+
+    def _remove_stale_socket(self) -> None:
+        if not self.socket_path.exists():
+            return
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(self.socket_path))
+        except OSError:
+            self.socket_path.unlink()  # left behind by a server that died
+            return
+        finally:
+            probe.close()
+        raise RuntimeError(f"A {self.service_name} is already listening on {self.socket_path}")
+
+    def dispatch(self, request: Dict[str, Any]) -> Any:
+        """Execute one request; raise StaleServer to hand it back to the client."""
+        raise NotImplementedError
+
+    def busy(self) -> bool:
+        """True while a request is running (the idle timeout waits for it)."""
+        return False
+
+    def service_actions(self) -> None:
+        if self.idle_timeout_s is not None and not self.busy() \
+                and time.time() - self.last_request_at > self.idle_timeout_s:
+            _logger().info("%s idle; stopping", self.service_name)
+            self.stop()
+
+    def stop(self) -> None:
+        """Stop serve_forever from any thread."""
+        threading.Thread(target=self.shutdown, daemon=True).start()
+
+    def server_close(self) -> None:
+        super().server_close()
+        try:
+            self.socket_path.unlink()
+        except FileNotFoundError:
+            pass
@@ -39,6 +39,9 @@ from optimization.globalmoo_client import (
 )
 from optimization.dspy_level2 import DSPyLevel2Optimizer
 
+# Where completed cascade results are saved
+DEFAULT_STORAGE_DIR = Path(__file__).parent.parent / "storage" / "cascade"
+
 
 class CascadePhase(Enum):
     """Phases of the Three-MOO Cascade."""
@@ -160,6 +163,7 @@ class ThreeMOOCascade:
         core_corpus: Optional[List[Dict[str, Any]]] = None,
         edge_corpus: Optional[List[Dict[str, Any]]] = None,
         use_mock: bool = True,
+        storage_dir: Optional[Path] = None,
     ):
         """
         Initialize cascade orchestrator.
@@ -170,6 +174,7 @@ class ThreeMOOCascade:
             core_corpus: Standard evaluation tasks
             edge_corpus: Adversarial evaluation tasks
             use_mock: Use mock mode for testing
+            storage_dir: Directory for saved results (default: storage/cascade)
         """
         self.moo = globalmoo_client or GlobalMOOClient(use_mock=use_mock)
         self.l2 = l2_optimizer or DSPyLevel2Optimizer()
@@ -177,7 +182,7 @@ class ThreeMOOCascade:
         self.edge_corpus = edge_corpus or []
 
         self._state: Optional[CascadeState] = None
-        self._storage_dir = Path(__file__).parent.parent / "storage" / "cascade"
+        self._storage_dir = Path(storage_dir) if storage_dir else DEFAULT_STORAGE_DIR
         self._storage_dir.mkdir(parents=True, exist_ok=True)
 
     def run(
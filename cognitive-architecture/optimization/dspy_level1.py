@@ -12,11 +12,13 @@ import os
 import json
 import time
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Sequence, Tuple
 from pathlib import Path
 from enum import Enum
 import sys
 
+import numpy as np
+
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from core.config import FullConfig, VectorCodec
@@ -91,8 +93,312 @@ class EvolutionProposal:
         )
 
 
+FRAME_NAMES = [
+    "evidential", "aspectual", "morphological",
+    "compositional", "honorific", "classifier", "spatial"
+]
+
+
+@dataclass
+class RunningOutcomeMean:
+    """
+    Running mean of outcome dicts, updated in O(1) per record.
+
+    Matches the batch averaging it replaces: the reported keys are those
+    of the first outcome dict seen, and a key missing from a later dict
+    counts as 0.0.
+    """
+    count: int = 0
+    keys: List[str] = field(default_factory=list)
+    sums: Dict[str, float] = field(default_factory=dict)
+
+    def add(self, outcomes: Dict[str, float]) -> None:
+        if self.count == 0:
+            self.keys = list(outcomes.keys())
+        self.count += 1
+        for key, value in outcomes.items():
+            self.sums[key] = self.sums.get(key, 0) + value
+
+    def mean(self) -> Dict[str, float]:
+        return {key: self.sums.get(key, 0) / self.count for key in self.keys}
+
+
+class ColumnarTelemetryStore:
+    """
+    Columnar, append-only storage for telemetry points.
+
+    Layout:
+    - vectors: (N, 14) float array of config vectors
+    - outcomes: (N, K) float array, one column per outcome key (NaN if absent)
+    - timestamps, task type ids, cluster ids: (N,) arrays
+    - task types, cluster keys and outcome key orders are interned
+
+    Indexes:
+    - timestamps are range-searched with searchsorted while appends stay
+      in time order (falls back to a mask otherwise)
+    - cluster id -> row ids
+    - running per-cluster and per-frame outcome means
+
+    Every append is O(1) amortized, and extend() indexes a whole batch of
+    points with vectorized VectorCodec calls; cluster keys are derived once
+    per distinct cluster code rather than decoded on every aggregation.
+    """
+
+    INITIAL_CAPACITY = 256
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self) -> None:
+        """Drop all rows, indexes and aggregates."""
+        self._size = 0
+        capacity = self.INITIAL_CAPACITY
+        self._vectors = np.zeros((capacity, VectorCodec.VECTOR_SIZE))
+        self._outcomes = np.full((capacity, 0), np.nan)
+        self._timestamps = np.zeros(capacity)
+        self._task_type_ids = np.zeros(capacity, dtype=np.int32)
+        self._cluster_ids = np.zeros(capacity, dtype=np.int32)
+        self._key_order_ids = np.zeros(capacity, dtype=np.int32)
+        self._metadata: List[Dict[str, Any]] = []
+        self._timestamps_sorted = True
+
+        self._outcome_keys: List[str] = []
+        self._outcome_columns: Dict[str, int] = {}
+        self._key_orders: List[Tuple[str, ...]] = []
+        self._key_order_ids_by_keys: Dict[Tuple[str, ...], int] = {}
+        self._task_types: List[str] = []
+        self._task_type_ids_by_name: Dict[str, int] = {}
+        self._cluster_keys: List[str] = []
+        self._cluster_ids_by_key: Dict[str, int] = {}
+        self._cluster_ids_by_code: Dict[int, int] = {}
+
+        self._cluster_rows: Dict[int, List[int]] = {}
+        self._cluster_means: Dict[str, RunningOutcomeMean] = {}
+        self._frame_means: Dict[str, RunningOutcomeMean] = {f: RunningOutcomeMean() for f in FRAME_NAMES}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, point: TelemetryPoint) -> int:
+        """Append a point and update indexes. Returns its row id."""
+        self._check_vector(point.config_vector)
+
+        row = self._size
+        if row == len(self._timestamps):
+            self._grow()
+
+        vector = np.asarray(point.config_vector, dtype=float)
+        self._vectors[row] = vector
+        self._timestamps[row] = point.timestamp
+        if row > 0 and point.timestamp < self._timestamps[row - 1]:
+            self._timestamps_sorted = False
+
+        cluster_id = self._cluster_id(VectorCodec.cluster_code(point.config_vector))
+        self._cluster_ids[row] = cluster_id
+        self._index_row(row, point, cluster_id, [i for i in range(len(FRAME_NAMES)) if vector[i] > 0.5])
+
+        self._size += 1
+        return row
+
+    def extend(self, points: Sequence[TelemetryPoint]) -> np.ndarray:
+        """
+        Append points in order and update indexes. Returns their row ids.
+
+        Vectors, timestamps, cluster codes and frame masks are computed for
+        the whole batch with vectorized VectorCodec calls.
+        """
+        for point in points:
+            self._check_vector(point.config_vector)
+        matrix = VectorCodec.as_matrix([point.config_vector for point in points])
+        codes, code_rows = np.unique(VectorCodec.cluster_codes(matrix), return_inverse=True)
+        cluster_ids = np.array([self._cluster_id(int(code)) for code in codes], dtype=np.int32)[code_rows.ravel()]
+        frame_masks = matrix[:, :len(FRAME_NAMES)] > 0.5
+
+        start = self._size
+        end = start + len(points)
+        while end > len(self._timestamps):
+            self._grow()
+
+        timestamps = np.fromiter((point.timestamp for point in points), dtype=float, count=len(points))
+        self._vectors[start:end] = matrix
+        self._timestamps[start:end] = timestamps
+        self._cluster_ids[start:end] = cluster_ids
+        previous = self._timestamps[start - 1:start] if start else timestamps[:0]
+        if np.any(np.diff(np.concatenate([previous, timestamps])) < 0):
+            self._timestamps_sorted = False
+
+        for offset, (point, cluster_id) in enumerate(zip(points, cluster_ids.tolist())):
+            self._index_row(start + offset, point, cluster_id, np.flatnonzero(frame_masks[offset]))
+
+        self._size = end
+        return np.arange(start, end)
+
+    def _index_row(self, row: int, point: TelemetryPoint, cluster_id: int, frames: Sequence[int]) -> None:
+        """Store a row's interned fields and outcomes and update the aggregates."""
+        self._task_type_ids[row] = self._intern(
+            point.task_type, self._task_types, self._task_type_ids_by_name
+        )
+        self._key_order_ids[row] = self._intern(
+            tuple(point.outcomes.keys()), self._key_orders, self._key_order_ids_by_keys
+        )
+        for key, value in point.outcomes.items():
+            column = self._outcome_column(key)  # may widen self._outcomes
+            self._outcomes[row, column] = value
+        self._metadata.append(point.metadata)
+        self._cluster_rows.setdefault(cluster_id, []).append(row)
+
+        # Running aggregates
+        cluster_key = self._cluster_keys[cluster_id]
+        if cluster_key not in self._cluster_means:
+            self._cluster_means[cluster_key] = RunningOutcomeMean()
+        self._cluster_means[cluster_key].add(point.outcomes)
+        for i in frames:
+            self._frame_means[FRAME_NAMES[i]].add(point.outcomes)
+
+    @staticmethod
+    def _check_vector(vector: List[float]) -> None:
+        if len(vector) != VectorCodec.VECTOR_SIZE:
+            raise ValueError(
+                f"Vector must have {VectorCodec.VECTOR_SIZE} dimensions, "
+                f"got {len(vector)}"
+            )
+
+    def point(self, row: int) -> TelemetryPoint:
+        """Materialize one row as a TelemetryPoint."""
+        outcomes = {
+            key: float(self._outcomes[row, self._outcome_columns[key]])
+            for key in self._key_orders[self._key_order_ids[row]]
+        }
+        return TelemetryPoint(
+            config_vector=self._vectors[row].tolist(),
+            outcomes=outcomes,
+            task_type=self._task_types[self._task_type_ids[row]],
+            timestamp=float(self._timestamps[row]),
+            metadata=self._metadata[row],
+        )
+
+    def rows(
+        self,
+        since: Optional[float] = None,
+        task_type: Optional[str] = None,
+        cluster_key: Optional[str] = None,
+    ) -> np.ndarray:
+        """
+        Row ids matching the filters, in insertion order.
+
+        Args:
+            since: Only rows with timestamp >= since
+            task_type: Only rows for this task type
+            cluster_key: Only rows in this cluster
+        """
+        n = self._size
+
+        if cluster_key is not None:
+            cluster_id = self._cluster_ids_by_key.get(cluster_key)
+            rows = np.asarray(self._cluster_rows.get(cluster_id, []), dtype=np.int64)
+        elif since is not None and self._timestamps_sorted:
+            start = int(np.searchsorted(self._timestamps[:n], since, side="left"))
+            rows = np.arange(start, n)
+            since = None  # already applied
+        else:
+            rows = np.arange(n)
+
+        if since is not None:
+            rows = rows[self._timestamps[rows] >= since]
+
+        if task_type is not None:
+            task_type_id = self._task_type_ids_by_name.get(task_type)
+            if task_type_id is None:
+                return rows[:0]
+            rows = rows[self._task_type_ids[rows] == task_type_id]
+
+        return rows
+
+    def task_types(self, rows: Optional[np.ndarray] = None) -> List[str]:
+        """Task type of each row (all rows by default)."""
+        ids = self._task_type_ids[:self._size] if rows is None else self._task_type_ids[rows]
+        return [self._task_types[i] for i in ids.tolist()]
+
+    def vectors(self, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """Config vector matrix for the given rows (all rows by default)."""
+        return self._vectors[:self._size] if rows is None else self._vectors[rows]
+
+    def outcome_column(self, key: str, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """Values of one outcome key (NaN where absent)."""
+        column = self._outcome_columns.get(key)
+        n_rows = self._size if rows is None else len(rows)
+        if column is None:
+            return np.full(n_rows, np.nan)
+        values = self._outcomes[:self._size, column]
+        return values if rows is None else values[rows]
+
+    def cluster_means(self) -> Dict[str, Dict[str, float]]:
+        """Average outcomes per cluster key (first-seen order)."""
+        return {key: mean.mean() for key, mean in self._cluster_means.items()}
+
+    def frame_means(self) -> Dict[str, Dict[str, float]]:
+        """Average outcomes per active frame (frames with no data omitted)."""
+        return {
+            frame: mean.mean()
+            for frame, mean in self._frame_means.items()
+            if mean.count > 0
+        }
+
+    def _grow(self) -> None:
+        capacity = len(self._timestamps) * 2
+        self._vectors = self._resized(self._vectors, capacity, 0.0)
+        self._outcomes = self._resized(self._outcomes, capacity, np.nan)
+        self._timestamps = self._resized(self._timestamps, capacity, 0.0)
+        self._task_type_ids = self._resized(self._task_type_ids, capacity, 0)
+        self._cluster_ids = self._resized(self._cluster_ids, capacity, 0)
+        self._key_order_ids = self._resized(self._key_order_ids, capacity, 0)
+
+    @staticmethod
+    def _resized(array: np.ndarray, capacity: int, fill: float) -> np.ndarray:
+        grown = np.full((capacity,) + array.shape[1:], fill, dtype=array.dtype)
+        grown[:len(array)] = array
+        return grown
+
+    def _outcome_column(self, key: str) -> int:
+        column = self._outcome_columns.get(key)
+        if column is None:
+            column = len(self._outcome_keys)
+            self._outcome_keys.append(key)
+            self._outcome_columns[key] = column
+            extra = np.full((len(self._outcomes), 1), np.nan)
+            self._outcomes = np.hstack([self._outcomes, extra])
+        return column
+
+    def _cluster_id(self, cluster_code: int) -> int:
+        # The cluster key is built once per distinct VectorCodec cluster code
+        cluster_id = self._cluster_ids_by_code.get(cluster_code)
+        if cluster_id is None:
+            cluster_key = VectorCodec.cluster_key_for_code(cluster_code)
+            cluster_id = self._intern(cluster_key, self._cluster_keys, self._cluster_ids_by_key)
+            self._cluster_ids_by_code[cluster_code] = cluster_id
+        return cluster_id
+
+    @staticmethod
+    def _intern(value: Any, values: List[Any], ids: Dict[Any, int]) -> int:
+        value_id = ids.get(value)
+        if value_id is None:
+            value_id = len(values)
+            values.append(value)
+            ids[value] = value_id
+        return value_id
+
+
 class TelemetryAggregator:
-    """Aggregate telemetry data for analysis."""
+    """
+    Aggregate telemetry data for analysis.
+
+    Points live in a ColumnarTelemetryStore; cluster and frame aggregates
+    are maintained incrementally, and save() appends only the points
+    recorded since the last save/load of the same file.
+    """
+
+    # Points indexed per ColumnarTelemetryStore.extend() call while loading
+    LOAD_BATCH_SIZE = 8192
 
     def __init__(self, storage_dir: Optional[Path] = None):
         """
@@ -106,11 +412,21 @@ class TelemetryAggregator:
 
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(parents=True, exist_ok=True)
-        self._points: List[TelemetryPoint] = []
+        self.store = ColumnarTelemetryStore()
+
+        # filename -> number of leading points already on disk
+        self._persisted: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.store)
 
     def record(self, point: TelemetryPoint) -> None:
         """Record a telemetry point."""
-        self._points.append(point)
+        self.store.append(point)
+
+    def record_many(self, points: Sequence[TelemetryPoint]) -> None:
+        """Record telemetry points in order, indexed as one batch."""
+        self.store.extend(points)
 
     def record_outcome(
         self,
@@ -133,6 +449,7 @@ class TelemetryAggregator:
         self,
         since: Optional[float] = None,
         task_type: Optional[str] = None,
+        cluster_key: Optional[str] = None,
     ) -> List[TelemetryPoint]:
         """
         Get telemetry points with optional filtering.
@@ -140,16 +457,10 @@ class TelemetryAggregator:
         Args:
             since: Only points after this timestamp
             task_type: Only points for this task type
+            cluster_key: Only points in this cluster
         """
-        points = self._points
-
-        if since is not None:
-            points = [p for p in points if p.timestamp >= since]
-
-        if task_type is not None:
-            points = [p for p in points if p.task_type == task_type]
-
-        return points
+        rows = self.store.rows(since=since, task_type=task_type, cluster_key=cluster_key)
+        return [self.store.point(int(row)) for row in rows]
 
     def aggregate_by_cluster(self) -> Dict[str, Dict[str, float]]:
         """
@@ -158,30 +469,7 @@ class TelemetryAggregator:
         Returns:
             Dict mapping cluster_key -> average outcomes
         """
-        clusters: Dict[str, List[Dict[str, float]]] = {}
-
-        for point in self._points:
-            config = VectorCodec.decode(point.config_vector)
-            cluster_key = VectorCodec.cluster_key(config)
-
-            if cluster_key not in clusters:
-                clusters[cluster_key] = []
-            clusters[cluster_key].append(point.outcomes)
-
-        # Average outcomes per cluster
-        aggregated = {}
-        for cluster_key, outcome_list in clusters.items():
-            if not outcome_list:
-                continue
-
-            avg_outcomes = {}
-            for key in outcome_list[0].keys():
-                values = [o.get(key, 0.0) for o in outcome_list]
-                avg_outcomes[key] = sum(values) / len(values)
-
-            aggregated[cluster_key] = avg_outcomes
-
-        return aggregated
+        return self.store.cluster_means()
 
     def aggregate_by_frame(self) -> Dict[str, Dict[str, float]]:
         """
@@ -190,45 +478,25 @@ class TelemetryAggregator:
         Returns:
             Dict mapping frame_name -> average outcomes when activated
         """
-        frame_names = [
-            "evidential", "aspectual", "morphological",
-            "compositional", "honorific", "classifier", "spatial"
-        ]
-
-        frame_outcomes: Dict[str, List[Dict[str, float]]] = {
-            f: [] for f in frame_names
-        }
-
-        for point in self._points:
-            config = VectorCodec.decode(point.config_vector)
-
-            # Check each frame
-            for i, frame in enumerate(frame_names):
-                is_active = point.config_vector[i] > 0.5
-                if is_active:
-                    frame_outcomes[frame].append(point.outcomes)
-
-        # Average per frame
-        aggregated = {}
-        for frame, outcome_list in frame_outcomes.items():
-            if not outcome_list:
-                continue
-
-            avg_outcomes = {}
-            for key in outcome_list[0].keys():
-                values = [o.get(key, 0.0) for o in outcome_list]
-                avg_outcomes[key] = sum(values) / len(values)
-
-            aggregated[frame] = avg_outcomes
-
-        return aggregated
+        return self.store.frame_means()
 
     def save(self, filename: str = "telemetry.jsonl") -> int:
-        """Save telemetry to disk. Returns point count."""
-        filepath = self.storage_dir / filename
+        """
+        Save telemetry to disk. Returns point count.
 
-        with open(filepath, "w") as f:
-            for point in self._points:
+        The first save to a file (or a save after load from another file)
+        writes every point; later saves append only new points.
+        """
+        filepath = self.storage_dir / filename
+        persisted = self._persisted.get(filename)
+        if persisted is None or not filepath.exists():
+            persisted, mode = 0, "w"
+        else:
+            mode = "a"
+
+        with open(filepath, mode) as f:
+            for row in range(persisted, len(self.store)):
+                point = self.store.point(row)
                 data = {
                     "config_vector": point.config_vector,
                     "outcomes": point.outcomes,
@@ -238,7 +506,8 @@ class TelemetryAggregator:
                 }
                 f.write(json.dumps(data) + "\n")
 
-        return len(self._points)
+        self._persisted = {filename: len(self.store)}
+        return len(self.store)
 
     def load(self, filename: str = "telemetry.jsonl") -> int:
         """Load telemetry from disk. Returns point count."""
@@ -247,21 +516,27 @@ class TelemetryAggregator:
         if not filepath.exists():
             return 0
 
-        self._points = []
+        self.store.clear()
+        points = []
         with open(filepath) as f:
             for line in f:
                 if line.strip():
                     data = json.loads(line)
-                    point = TelemetryPoint(
+                    points.append(TelemetryPoint(
                         config_vector=data["config_vector"],
                         outcomes=data["outcomes"],
                         task_type=data["task_type"],
                         timestamp=data["timestamp"],
                         metadata=data.get("metadata", {}),
-                    )
-                    self._points.append(point)
+                    ))
+                    if len(points) == self.LOAD_BATCH_SIZE:
+                        self.store.extend(points)
+                        points = []
+        if points:
+            self.store.extend(points)
 
-        return len(self._points)
+        self._persisted = {filename: len(self.store)}
+        return len(self.store)
 
 
 class DSPyLevel1Analyzer:
@@ -367,24 +642,12 @@ class DSPyLevel1Analyzer:
         if not cluster_data:
             return proposals
 
-        # Group by VERIX strictness level
-        strictness_outcomes: Dict[int, List[Dict[str, float]]] = {0: [], 1: [], 2: []}
-
-        for point in self.telemetry.get_points():
-            strictness = int(point.config_vector[7])  # Index 7 = verix_strictness
-            if strictness in strictness_outcomes:
-                strictness_outcomes[strictness].append(point.outcomes)
-
-        # Analyze each level
+        # Analyze each VERIX strictness level
         best_strictness = 1  # Default
         best_avg = 0.0
 
-        for strictness, outcomes in strictness_outcomes.items():
-            if not outcomes:
-                continue
-
-            avg_consistency = sum(o.get("epistemic_consistency", 0.0) for o in outcomes) / len(outcomes)
-
+        level_means = self._level_means(VectorCodec.IDX_VERIX_STRICTNESS, "epistemic_consistency")
+        for strictness, avg_consistency in level_means.items():
             if avg_consistency > best_avg:
                 best_avg = avg_consistency
                 best_strictness = strictness
@@ -411,23 +674,12 @@ class DSPyLevel1Analyzer:
         """Analyze compression level impact."""
         proposals = []
 
-        compression_outcomes: Dict[int, List[Dict[str, float]]] = {0: [], 1: [], 2: []}
-
-        for point in self.telemetry.get_points():
-            compression = int(point.config_vector[8])  # Index 8 = compression_level
-            if compression in compression_outcomes:
-                compression_outcomes[compression].append(point.outcomes)
-
         # Find best for token efficiency
         best_compression = 1
         best_efficiency = 0.0
 
-        for compression, outcomes in compression_outcomes.items():
-            if not outcomes:
-                continue
-
-            avg_efficiency = sum(o.get("token_efficiency", 0.0) for o in outcomes) / len(outcomes)
-
+        level_means = self._level_means(VectorCodec.IDX_COMPRESSION_LEVEL, "token_efficiency")
+        for compression, avg_efficiency in level_means.items():
             if avg_efficiency > best_efficiency:
                 best_efficiency = avg_efficiency
                 best_compression = compression
@@ -450,6 +702,25 @@ class DSPyLevel1Analyzer:
 
         return proposals
 
+    def _level_means(self, index: int, outcome_key: str) -> Dict[int, float]:
+        """
+        Mean of one outcome per level 0-2 of a config dimension.
+
+        Levels are int(vector[index]); a missing outcome counts as 0.0 and
+        levels without points are omitted.
+        """
+        store = self.telemetry.store
+        levels = np.trunc(store.vectors()[:, index])
+        values = store.outcome_column(outcome_key)
+        values = np.where(np.isnan(values), 0.0, values)
+
+        means = {}
+        for level in (0, 1, 2):
+            mask = levels == level
+            if mask.any():
+                means[level] = float(values[mask].mean())
+        return means
+
     def get_proposals(
         self,
         status: Optional[ProposalStatus] = None,
@@ -9,9 +9,12 @@ and ensuring consistency within evaluation runs.
 """
 
 import os
+import copy
 import json
 import time
 import hashlib
+import weakref
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
@@ -65,16 +68,41 @@ class CompiledPrompt:
 
 @dataclass
 class ClusterCache:
-    """Cache for compiled prompts by cluster."""
+    """
+    Cache for compiled prompts by cluster.
+
+    - Entries are read from disk lazily, one file per key on first access,
+      so construction does not scale with the number of clusters on disk
+    - Memory is bounded by an LRU policy on entry count and prompt bytes;
+      evicted entries stay on disk and reload on the next access
+    - put() queues writes; every flush_every puts (and on flush() / close(),
+      when the cache is garbage-collected, or at exit) the queued entries
+      are written compactly via temp file + rename
+    - Expired entries are dropped when they are accessed
+    """
 
     cache_dir: Path
     max_age_seconds: float = 3600.0  # 1 hour default
-    _cache: Dict[str, CompiledPrompt] = field(default_factory=dict)
+    max_entries: int = 256
+    max_bytes: int = 8 * 1024 * 1024
+    flush_every: int = 16
+    _cache: "OrderedDict[str, CompiledPrompt]" = field(default_factory=OrderedDict)
 
     def __post_init__(self):
         self.cache_dir = Path(self.cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self._load_from_disk()
+
+        self._bytes = 0
+        self._pending: Dict[str, CompiledPrompt] = {}
+        self._absent: set = set()  # keys known to have no file on disk
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._disk_loads = 0
+
+        # Write queued entries when the cache is collected or at interpreter
+        # exit; the finalizer holds the queue, not self
+        self._finalizer = weakref.finalize(self, self._write_pending_on_exit, self.cache_dir, self._pending)
 
     def get(self, cluster_key: str) -> Optional[CompiledPrompt]:
         """
@@ -82,19 +110,38 @@ class ClusterCache:
 
         Returns None if not cached or expired.
         """
-        if cluster_key in self._cache:
-            prompt = self._cache[cluster_key]
+        prompt = self._cache.get(cluster_key)
+        if prompt is None:
+            prompt = self._pending.get(cluster_key) or self._load(cluster_key)
+            if prompt is not None:
+                self._remember(prompt)
+
+        if prompt is not None:
             if prompt.age_seconds() < self.max_age_seconds:
+                self._cache.move_to_end(cluster_key)
+                self._hits += 1
                 return prompt
             # Expired - remove
-            del self._cache[cluster_key]
+            self._drop(cluster_key)
 
+        self._misses += 1
         return None
 
     def put(self, prompt: CompiledPrompt) -> None:
         """Cache a compiled prompt."""
-        self._cache[prompt.cluster_key] = prompt
-        self._save_to_disk(prompt)
+        self._remember(prompt)
+        self._absent.discard(prompt.cluster_key)
+        self._pending[prompt.cluster_key] = prompt
+        if len(self._pending) >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> int:
+        """Write queued entries to disk. Returns count written."""
+        return self._write_pending(self.cache_dir, self._pending)
+
+    def close(self) -> int:
+        """Write queued entries to disk (same as flush()). Returns count written."""
+        return self.flush()
 
     def invalidate(self, cluster_key: str) -> bool:
         """
@@ -102,28 +149,47 @@ class ClusterCache:
 
         Returns True if prompt was cached.
         """
-        if cluster_key in self._cache:
-            del self._cache[cluster_key]
-            cache_file = self._cache_file(cluster_key)
-            if cache_file.exists():
-                cache_file.unlink()
-            return True
-        return False
+        was_cached = (
+            cluster_key in self._cache
+            or cluster_key in self._pending
+            or self._cache_file(cluster_key).exists()
+        )
+        self._drop(cluster_key)
+        return was_cached
 
     def invalidate_all(self) -> int:
         """Invalidate all cached prompts. Returns count."""
-        count = len(self._cache)
+        count = len(self.list_clusters())
         self._cache.clear()
+        self._pending.clear()
+        self._absent.clear()
+        self._bytes = 0
         for f in self.cache_dir.glob("*.json"):
             f.unlink()
         return count
 
     def list_clusters(self) -> List[str]:
-        """List all cached cluster keys."""
-        return list(self._cache.keys())
+        """List all cached cluster keys (in memory, queued or on disk)."""
+        keys = list(self._cache.keys())
+        known = set(keys)
+        keys.extend(k for k in self._pending if k not in known)
+        known.update(self._pending)
+
+        for cache_file in self.cache_dir.glob("*.json"):
+            try:
+                with open(cache_file) as f:
+                    data = json.load(f)
+                key = data["cluster_key"]
+                if key not in known and time.time() - data.get("compiled_at", 0) < self.max_age_seconds:
+                    keys.append(key)
+                    known.add(key)
+            except Exception:
+                pass  # Skip corrupted cache files
+        return keys
 
     def stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
+        lookups = self._hits + self._misses
         return {
             "cached_count": len(self._cache),
             "oldest_age": max(
@@ -134,32 +200,94 @@ class ClusterCache:
                 (p.age_seconds() for p in self._cache.values()),
                 default=0.0
             ),
+            "hits": self._hits,
+            "misses": self._misses,
+            "lookup_hit_rate": self._hits / lookups if lookups > 0 else 0.0,
+            "evictions": self._evictions,
+            "disk_loads": self._disk_loads,
+            "cached_bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "pending_writes": len(self._pending),
         }
 
+    @staticmethod
+    def _entry_size(prompt: CompiledPrompt) -> int:
+        return len(prompt.system_prompt.encode()) + len(prompt.user_template.encode())
+
+    def _remember(self, prompt: CompiledPrompt) -> None:
+        """Insert into the in-memory LRU and evict down to the bounds."""
+        key = prompt.cluster_key
+        old = self._cache.pop(key, None)
+        if old is not None:
+            self._bytes -= self._entry_size(old)
+        self._cache[key] = prompt
+        self._bytes += self._entry_size(prompt)
+
+        while len(self._cache) > 1 and (
+            len(self._cache) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            _, evicted = self._cache.popitem(last=False)
+            self._bytes -= self._entry_size(evicted)
+            self._evictions += 1
+
+    def _drop(self, cluster_key: str) -> None:
+        """Remove a key from memory, the write queue and disk."""
+        prompt = self._cache.pop(cluster_key, None)
+        if prompt is not None:
+            self._bytes -= self._entry_size(prompt)
+        self._pending.pop(cluster_key, None)
+        self._absent.add(cluster_key)
+        cache_file = self._cache_file(cluster_key)
+        if cache_file.exists():
+            cache_file.unlink()
+
     def _cache_file(self, cluster_key: str) -> Path:
         """Get cache file path for cluster key."""
-        safe_key = hashlib.md5(cluster_key.encode()).hexdigest()
-        return self.cache_dir / f"{safe_key}.json"
+        return self._cache_path(self.cache_dir, cluster_key)
 
-    def _save_to_disk(self, prompt: CompiledPrompt) -> None:
-        """Persist prompt to disk."""
-        cache_file = self._cache_file(prompt.cluster_key)
-        with open(cache_file, "w") as f:
-            json.dump(prompt.to_dict(), f, indent=2)
+    @staticmethod
+    def _cache_path(cache_dir: Path, cluster_key: str) -> Path:
+        safe_key = hashlib.md5(cluster_key.encode()).hexdigest()
+        return cache_dir / f"{safe_key}.json"
 
-    def _load_from_disk(self) -> None:
-        """Load cached prompts from disk."""
-        for cache_file in self.cache_dir.glob("*.json"):
-            try:
-                with open(cache_file) as f:
-                    data = json.load(f)
-                prompt = CompiledPrompt.from_dict(data)
-                if prompt.age_seconds() < self.max_age_seconds:
-                    self._cache[prompt.cluster_key] = prompt
-                else:
-                    cache_file.unlink()  # Remove expired
-            except Exception:
-                pass  # Skip corrupted cache files
+    @staticmethod
+    def _write_pending_on_exit(cache_dir: Path, pending: Dict[str, CompiledPrompt]) -> None:
+        """Finalizer: like _write_pending, but never raises during GC/exit."""
+        try:
+            ClusterCache._write_pending(cache_dir, pending)
+        except OSError:
+            pass  # Cache dir already removed (e.g. a temporary directory)
+
+    @staticmethod
+    def _write_pending(cache_dir: Path, pending: Dict[str, CompiledPrompt]) -> int:
+        """Persist and clear the write queue (in place: the finalizer shares it)."""
+        prompts = list(pending.values())
+        pending.clear()
+        for prompt in prompts:
+            cache_file = ClusterCache._cache_path(cache_dir, prompt.cluster_key)
+            tmp_file = cache_file.with_suffix(".tmp")
+            with open(tmp_file, "w") as f:
+                json.dump(prompt.to_dict(), f)
+            os.replace(tmp_file, cache_file)
+        return len(prompts)
+
+    def _load(self, cluster_key: str) -> Optional[CompiledPrompt]:
+        """Load one cached prompt from disk (None if absent or corrupted)."""
+        if cluster_key in self._absent:
+            return None
+        try:
+            with open(self._cache_file(cluster_key)) as f:
+                prompt = CompiledPrompt.from_dict(json.load(f))
+        except FileNotFoundError:
+            self._absent.add(cluster_key)
+            return None
+        except Exception:
+            return None  # Skip corrupted cache files
+        if prompt.cluster_key != cluster_key:
+            return None
+        self._disk_loads += 1
+        return prompt
 
 
 class DSPyLevel2Optimizer:
@@ -174,6 +302,8 @@ class DSPyLevel2Optimizer:
         self,
         cache_dir: Optional[Path] = None,
         max_cache_age: float = 3600.0,
+        max_cache_entries: int = 256,
+        max_cache_bytes: int = 8 * 1024 * 1024,
     ):
         """
         Initialize L2 optimizer.
@@ -181,6 +311,8 @@ class DSPyLevel2Optimizer:
         Args:
             cache_dir: Directory for cache storage
             max_cache_age: Maximum cache age in seconds
+            max_cache_entries: Maximum prompts held in memory
+            max_cache_bytes: Maximum prompt bytes held in memory
         """
         if cache_dir is None:
             cache_dir = Path(__file__).parent.parent / "storage" / "prompts"
@@ -188,6 +320,8 @@ class DSPyLevel2Optimizer:
         self.cache = ClusterCache(
             cache_dir=cache_dir,
             max_age_seconds=max_cache_age,
+            max_entries=max_cache_entries,
+            max_bytes=max_cache_bytes,
         )
         self._compile_count = 0
         self._cache_hits = 0
@@ -273,20 +407,24 @@ class DSPyLevel2Optimizer:
         Warm cache with config vectors.
 
         Args:
-            vectors: List of config vectors
+            vectors: List or (N, 14) array of config vectors
             task_type: Type of task
 
         Returns:
             Number of new prompts compiled
         """
         new_count = 0
-        for vector in vectors:
-            config = VectorCodec.decode(vector)
-            cluster_key = VectorCodec.cluster_key(config)
+        if len(vectors) == 0:
+            return new_count
+
+        configs = VectorCodec.decode_batch(vectors)
+        cluster_keys = VectorCodec.cluster_keys(vectors)
+        for config, cluster_key in zip(configs, cluster_keys):
             cache_key = f"{cluster_key}:{task_type}"
 
             if self.cache.get(cache_key) is None:
-                self.get_prompt(config, task_type)
+                # PromptBuilder's mode selection mutates the config it compiles
+                self.get_prompt(copy.deepcopy(config), task_type)
                 new_count += 1
 
         return new_count
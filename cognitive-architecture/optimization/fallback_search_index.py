@@ -0,0 +1,552 @@
+"""
+Persistent search index for the Memory MCP file fallback.
+
+When the Memory MCP server is unavailable, MemoryMCPClient stores each
+memory as one JSON file. Searching used to json.load every file per
+query. This index keeps, in a single memory-mapped file next to those
+JSON files:
+
+1. One record per stored memory: key, file name, file mtime/size and the
+   searchable text (the compact JSON of the stored document, lowercased)
+2. An optional hashed-embedding vector (feature hashing of word tokens)
+
+Records are appended as memories are stored and superseded records are
+dropped at compaction, so the file is updated incrementally. In memory
+the records are indexed by:
+
+- Trigram postings: a query word of 3+ characters only checks documents
+  containing all of its trigrams, preserving the substring semantics of
+  the original keyword scan
+- Key -> document id, for namespace/prefix filtering and updates
+
+Other processes append to the same file; readers pick up new records by
+following the file tail on each query. Appends and compaction hold an
+exclusive flock on a sidecar .search-index.lock, so a compaction never
+replaces the file while another process's record is being appended.
+
+So that a new process does not re-parse every record and rebuild every
+posting list, a snapshot (.search-index.snap) stores the postings, file
+stats and record offsets covering a prefix of the record file. A reader
+memory-maps it, parses only the records after that prefix, and reads a
+snapshotted document's text from the record file only when a query needs
+it. The snapshot is rewritten once enough records accumulate past it.
+"""
+
+import json
+import mmap
+import os
+import re
+import struct
+import zlib
+from contextlib import contextmanager
+from itertools import chain, repeat
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+import logging
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: appends and compaction are not serialized
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+INDEX_FILENAME = ".search-index.bin"
+INDEX_MAGIC = b"CCFI"
+INDEX_VERSION = 1
+
+SNAPSHOT_FILENAME = ".search-index.snap"
+LOCK_FILENAME = ".search-index.lock"
+SNAPSHOT_MAGIC = b"CCFS"
+SNAPSHOT_VERSION = 1
+
+_HEADER = struct.Struct("<4sI")       # magic, version
+_RECORD = struct.Struct("<II")        # json length, vector length (bytes)
+# magic, version, record file inode, covered prefix length, prefix crc32,
+# docs, trigrams, postings, metadata length (bytes), dead records
+_SNAPSHOT_HEADER = struct.Struct("<4sIQQIIIIII")
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9_]+")
+
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _gram_key(gram: str) -> int:
+    """Trigram as one integer (code points are < 2**21)."""
+    return ord(gram[0]) << 42 | ord(gram[1]) << 21 | ord(gram[2])
+
+
+def _aligned(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def hashed_embedding(text: str, dim: int) -> np.ndarray:
+    """Signed feature-hashing embedding of word tokens, L2 normalized."""
+    vector = np.zeros(dim, dtype=np.float32)
+    for token in TOKEN_PATTERN.findall(text.lower()):
+        h = zlib.crc32(token.encode("utf-8"))
+        vector[h % dim] += 1.0 if (h >> 31) & 1 else -1.0
+    norm = float(np.linalg.norm(vector))
+    if norm > 0:
+        vector /= norm
+    return vector
+
+
+class FallbackSearchIndex:
+    """
+    Incremental keyword + hashed-embedding index over fallback JSON files.
+
+    Usage:
+        index = FallbackSearchIndex(fallback_dir)
+        index.add(key, filepath, document)
+        for doc_id, score in index.search("query words", namespace="ns"):
+            record = index.document(doc_id)
+    """
+
+    # Rewrite the file when superseded records outnumber live ones
+    COMPACT_MIN_DEAD = 64
+    # Rewrite the snapshot once this many records follow it
+    SNAPSHOT_MIN_RECORDS = 256
+
+    def __init__(self, directory: Path, vector_dim: int = 256):
+        """
+        Initialize index.
+
+        Args:
+            directory: Fallback directory holding the JSON files
+            vector_dim: Hashed-embedding dimension (0 disables vectors)
+        """
+        self.directory = Path(directory)
+        self.path = self.directory / INDEX_FILENAME
+        self.snapshot_path = self.directory / SNAPSHOT_FILENAME
+        self.lock_path = self.directory / LOCK_FILENAME
+        self.vector_dim = vector_dim
+
+        self._mmap: Optional[mmap.mmap] = None
+        self._inode: Optional[int] = None
+        self._offset = 0
+        self._reconciled = False
+        self._reset()
+
+    def _reset(self) -> None:
+        # Snapshotted documents hold only key/file/stat until _load() reads
+        # their record ("content" missing); None marks a superseded document
+        self._docs: List[Optional[Dict]] = []
+        self._vectors: List[Optional[np.ndarray]] = []
+        self._record_offsets: List[int] = []
+        self._by_file: Dict[str, int] = {}
+        self._dead = 0
+
+        # Postings of documents indexed after the snapshot
+        self._postings: Dict[str, Set[int]] = {}
+        # Snapshot postings for documents [0, _snapshot_docs): sorted trigram
+        # keys, their start offsets and the concatenated document ids
+        self._snapshot_docs = 0
+        self._snapshot_keys = np.zeros(0, dtype=np.uint64)
+        self._snapshot_starts = np.zeros(1, dtype=np.int64)
+        self._snapshot_postings = np.zeros(0, dtype=np.uint32)
+        self._unsnapshotted = 0
+
+    def __len__(self) -> int:
+        return len(self._by_file)
+
+    # ------------------------------------------------------------------
+    # Writing
+
+    def add(self, key: str, filepath: Path, document: Dict) -> None:
+        """Index a stored document (call after its JSON file is written)."""
+        self.refresh()
+        stat = filepath.stat()
+        doc_id = self._by_file.get(filepath.name)
+        if doc_id is not None and self._is_current(self._docs[doc_id], stat):
+            return  # already picked up by reconciliation
+        content = json.dumps(document).lower()
+        self._append({
+            "key": key,
+            "file": filepath.name,
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "content": content,
+        }, content)
+
+    def _remove(self, filename: str) -> None:
+        self._append({"file": filename, "deleted": True}, None)
+
+    def _append(self, record: Dict, content: Optional[str]) -> None:
+        payload = json.dumps(record).encode("utf-8")
+        vector = b""
+        if content is not None and self.vector_dim:
+            vector = hashed_embedding(content, self.vector_dim).tobytes()
+
+        data = _RECORD.pack(len(payload), len(vector)) + payload + vector
+        with self._locked():
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                if os.fstat(fd).st_size == 0:
+                    os.write(fd, _HEADER.pack(INDEX_MAGIC, INDEX_VERSION))
+                os.write(fd, data)  # single write so concurrent appenders don't interleave
+            finally:
+                os.close(fd)
+        self._follow_tail()
+
+    # ------------------------------------------------------------------
+    # Reading
+
+    def refresh(self) -> None:
+        """Pick up records appended by other writers; reconcile once per process."""
+        self._follow_tail()
+        if not self._reconciled:
+            self._reconciled = True
+            self._reconcile()
+            self._maybe_compact()
+        if self._unsnapshotted >= self.SNAPSHOT_MIN_RECORDS:
+            self._write_snapshot()
+
+    def search(
+        self,
+        query: str,
+        namespace: Optional[str] = None,
+    ) -> List[Tuple[int, float]]:
+        """
+        Keyword search.
+
+        Args:
+            query: Whitespace-separated query words (case-insensitive)
+            namespace: Only documents whose key starts with this prefix
+
+        Returns:
+            (doc_id, score) pairs in index order; score is the fraction of
+            query words found as substrings of the document text
+        """
+        self.refresh()
+        words = set(query.lower().split())
+        if not words:
+            return []
+
+        counts: Dict[int, int] = {}
+        for word in words:
+            for doc_id in self._candidates(word):
+                if word in self._record(doc_id)["content"]:
+                    counts[doc_id] = counts.get(doc_id, 0) + 1
+
+        results = []
+        for doc_id in sorted(counts):
+            if namespace and not self._docs[doc_id]["key"].startswith(namespace):
+                continue
+            results.append((doc_id, counts[doc_id] / len(words)))
+        return results
+
+    def similarity(self, doc_ids: Iterable[int], query: str) -> Dict[int, float]:
+        """Cosine similarity of hashed embeddings (empty if vectors are disabled)."""
+        doc_ids = [d for d in doc_ids if self._vector(d) is not None]
+        if not self.vector_dim or not doc_ids:
+            return {}
+        matrix = np.stack([self._vectors[d] for d in doc_ids])
+        scores = matrix @ hashed_embedding(query, self.vector_dim)
+        return dict(zip(doc_ids, scores.tolist()))
+
+    def document(self, doc_id: int) -> Dict:
+        """Indexed record for a document id."""
+        return self._record(doc_id)
+
+    def keys(self, prefix: str = "") -> List[str]:
+        """All indexed keys starting with prefix."""
+        self.refresh()
+        return [
+            self._docs[doc_id]["key"]
+            for doc_id in self._by_file.values()
+            if self._docs[doc_id]["key"].startswith(prefix)
+        ]
+
+    def _candidates(self, word: str) -> Iterable[int]:
+        if len(word) < 3:
+            return list(self._by_file.values())
+        spans = {gram: self._snapshot_span(gram) for gram in _trigrams(word)}
+        grams = sorted(spans, key=lambda g: spans[g][1] - spans[g][0] + len(self._postings.get(g, ())))
+        candidates = None
+        for gram in grams:
+            start, end = spans[gram]
+            docs = {doc_id for doc_id in self._snapshot_postings[start:end].tolist()
+                    if self._docs[doc_id] is not None}
+            docs |= self._postings.get(gram, set())
+            candidates = docs if candidates is None else candidates & docs
+            if not candidates:
+                break
+        return candidates
+
+    def _snapshot_span(self, gram: str) -> Tuple[int, int]:
+        key = _gram_key(gram)
+        i = int(np.searchsorted(self._snapshot_keys, np.uint64(key)))
+        if i == len(self._snapshot_keys) or int(self._snapshot_keys[i]) != key:
+            return 0, 0
+        return int(self._snapshot_starts[i]), int(self._snapshot_starts[i + 1])
+
+    def _record(self, doc_id: int) -> Dict:
+        record = self._docs[doc_id]
+        if "content" not in record:
+            self._load(doc_id)
+            record = self._docs[doc_id]
+        return record
+
+    def _vector(self, doc_id: int) -> Optional[np.ndarray]:
+        if self._docs[doc_id] is not None:
+            self._record(doc_id)
+        return self._vectors[doc_id]
+
+    def _load(self, doc_id: int) -> None:
+        """Read a snapshotted document's record from the record file."""
+        offset = self._record_offsets[doc_id]
+        json_len, vec_len = _RECORD.unpack_from(self._mmap, offset)
+        start = offset + _RECORD.size
+        self._docs[doc_id] = json.loads(self._mmap[start:start + json_len])
+        if vec_len:
+            self._vectors[doc_id] = np.frombuffer(
+                self._mmap[start + json_len:start + json_len + vec_len], dtype=np.float32
+            )
+
+    # ------------------------------------------------------------------
+    # File handling
+
+    def _follow_tail(self) -> None:
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            if self._inode is not None:
+                self._close()
+                self._reset()
+            return
+
+        if stat.st_ino != self._inode or stat.st_size < self._offset:
+            # New or compacted file: reload from scratch
+            self._close()
+            self._reset()
+            self._inode = stat.st_ino
+        if stat.st_size == self._offset:
+            return
+
+        if self._mmap is not None:
+            self._mmap.close()
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._offset == 0:
+            self._load_snapshot()
+        self._parse(self._mmap)
+
+    def _parse(self, buf: mmap.mmap) -> None:
+        offset = self._offset
+        if offset == 0:
+            if len(buf) < _HEADER.size:
+                return
+            magic, version = _HEADER.unpack_from(buf, 0)
+            if magic != INDEX_MAGIC or version != INDEX_VERSION:
+                logger.warning(f"Ignoring incompatible search index {self.path}")
+                self._offset = len(buf)
+                return
+            offset = _HEADER.size
+
+        while offset + _RECORD.size <= len(buf):
+            json_len, vec_len = _RECORD.unpack_from(buf, offset)
+            end = offset + _RECORD.size + json_len + vec_len
+            if end > len(buf):
+                break  # partially written tail; retry on next refresh
+            start = offset + _RECORD.size
+            record = json.loads(buf[start:start + json_len])
+            vector = None
+            if vec_len:
+                vector = np.frombuffer(buf[start + json_len:end], dtype=np.float32)
+            self._apply(record, vector, offset)
+            self._unsnapshotted += 1
+            offset = end
+
+        self._offset = offset
+
+    def _apply(self, record: Dict, vector: Optional[np.ndarray], offset: int) -> None:
+        filename = record["file"]
+        previous = self._by_file.pop(filename, None)
+        if previous is not None:
+            # Snapshot postings stay; superseded documents are skipped there
+            if previous >= self._snapshot_docs:
+                for gram in _trigrams(self._docs[previous]["content"]):
+                    self._postings[gram].discard(previous)
+            self._docs[previous] = None
+            self._vectors[previous] = None
+            self._dead += 1
+        if record.get("deleted"):
+            self._dead += 1
+            return
+
+        doc_id = len(self._docs)
+        self._docs.append(record)
+        self._vectors.append(vector)
+        self._record_offsets.append(offset)
+        self._by_file[filename] = doc_id
+        for gram in _trigrams(record["content"]):
+            self._postings.setdefault(gram, set()).add(doc_id)
+
+    def _reconcile(self) -> None:
+        """Index JSON files written without the index (or changed/removed since)."""
+        seen = set()
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith(".json") or not entry.is_file():
+                continue
+            seen.add(entry.name)
+            doc_id = self._by_file.get(entry.name)
+            stat = entry.stat()
+            if doc_id is not None and self._is_current(self._docs[doc_id], stat):
+                continue
+            try:
+                with open(entry.path, encoding="utf-8") as f:
+                    document = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                continue
+            if not isinstance(document, dict):
+                continue  # not a stored memory
+            self.add(document.get("key", ""), Path(entry.path), document)
+
+        for filename in [name for name in self._by_file if name not in seen]:
+            self._remove(filename)
+
+    @staticmethod
+    def _is_current(record: Dict, stat: os.stat_result) -> bool:
+        return record["mtime_ns"] == stat.st_mtime_ns and record["size"] == stat.st_size
+
+    def _maybe_compact(self) -> None:
+        if self._dead < max(self.COMPACT_MIN_DEAD, len(self._by_file)):
+            return
+
+        with self._locked():
+            # Records appended before we took the lock must be in the rewrite
+            self._follow_tail()
+            if self._dead < max(self.COMPACT_MIN_DEAD, len(self._by_file)):
+                return  # another process compacted first
+            tmp_path = self.path.with_name(f"{INDEX_FILENAME}.{os.getpid()}.tmp")
+            try:
+                with open(tmp_path, "wb") as f:
+                    f.write(_HEADER.pack(INDEX_MAGIC, INDEX_VERSION))
+                    for doc_id in self._by_file.values():
+                        payload = json.dumps(self._record(doc_id)).encode("utf-8")
+                        vector = self._vector(doc_id)
+                        vector = b"" if vector is None else vector.tobytes()
+                        f.write(_RECORD.pack(len(payload), len(vector)) + payload + vector)
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                logger.warning(f"Could not compact search index: {e}")
+                tmp_path.unlink(missing_ok=True)
+                return
+        self._follow_tail()
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold the exclusive cross-process lock for appending or rewriting."""
+        if fcntl is None:
+            yield
+            return
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            os.close(fd)  # releases the lock
+
+    # ------------------------------------------------------------------
+    # Snapshot
+
+    def _load_snapshot(self) -> None:
+        """Adopt the snapshot if it covers a prefix of the current record file."""
+        try:
+            with open(self.snapshot_path, "rb") as f:
+                buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return  # missing or empty
+        if len(buf) < _SNAPSHOT_HEADER.size:
+            return
+        (magic, version, inode, covered, crc, n_docs, n_grams, n_postings,
+         meta_len, dead) = _SNAPSHOT_HEADER.unpack_from(buf, 0)
+        if (magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION or inode != self._inode
+                or covered > len(self._mmap)):
+            return
+        with memoryview(self._mmap) as view:
+            if zlib.crc32(view[:covered]) != crc:
+                return  # record file was rewritten since
+
+        offset = _aligned(_SNAPSHOT_HEADER.size)
+        arrays = []
+        for dtype, count in ((np.int64, n_docs), (np.uint64, n_grams),
+                             (np.int64, n_grams + 1), (np.uint32, n_postings)):
+            arrays.append(np.frombuffer(buf, dtype=dtype, count=count, offset=offset))
+            offset = _aligned(offset + count * np.dtype(dtype).itemsize)
+        record_offsets, self._snapshot_keys, self._snapshot_starts, self._snapshot_postings = arrays
+        meta = json.loads(buf[offset:offset + meta_len])
+
+        self._record_offsets = record_offsets.tolist()
+        self._docs = [
+            None if m is None else {"key": m[0], "file": m[1], "mtime_ns": m[2], "size": m[3]}
+            for m in meta
+        ]
+        self._vectors = [None] * n_docs
+        self._by_file = {doc["file"]: doc_id for doc_id, doc in enumerate(self._docs) if doc is not None}
+        self._snapshot_docs = n_docs
+        self._dead = dead
+        self._offset = covered
+
+    def _write_snapshot(self) -> None:
+        """Snapshot postings, stats and record offsets for the parsed prefix."""
+        alive = np.array([doc is not None for doc in self._docs], dtype=bool)
+
+        # (trigram key, doc id) pairs: live snapshot postings + newer postings
+        counts = np.diff(self._snapshot_starts)
+        old_keys = np.repeat(self._snapshot_keys, counts)
+        old_ids = self._snapshot_postings.astype(np.int64)
+        live = alive[old_ids]
+        items = [(gram, ids) for gram, ids in self._postings.items() if ids]
+        new_keys = np.fromiter(
+            chain.from_iterable(repeat(_gram_key(gram), len(ids)) for gram, ids in items),
+            dtype=np.uint64,
+        )
+        new_ids = np.fromiter(chain.from_iterable(ids for _, ids in items), dtype=np.int64)
+        keys = np.concatenate([old_keys[live], new_keys])
+        ids = np.concatenate([old_ids[live], new_ids])
+        order = np.lexsort((ids, keys))
+        keys, ids = keys[order], ids[order]
+        gram_keys, starts = np.unique(keys, return_index=True)
+        starts = np.append(starts, len(keys)).astype(np.int64)
+
+        meta = json.dumps([
+            None if doc is None else [doc["key"], doc["file"], doc["mtime_ns"], doc["size"]]
+            for doc in self._docs
+        ]).encode("utf-8")
+        with memoryview(self._mmap) as view:
+            crc = zlib.crc32(view[:self._offset])
+
+        data = bytearray(_SNAPSHOT_HEADER.pack(
+            SNAPSHOT_MAGIC, SNAPSHOT_VERSION, self._inode, self._offset, crc,
+            len(self._docs), len(gram_keys), len(ids), len(meta), self._dead,
+        ))
+        # Same layout _load_snapshot reads: 8-byte aligned arrays, then metadata
+        for chunk in (np.asarray(self._record_offsets, dtype=np.int64).tobytes(),
+                      gram_keys.astype(np.uint64).tobytes(), starts.tobytes(),
+                      ids.astype(np.uint32).tobytes(), meta):
+            data += bytes(_aligned(len(data)) - len(data))
+            data += chunk
+
+        tmp_path = self.snapshot_path.with_name(f"{SNAPSHOT_FILENAME}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self.snapshot_path)
+        except OSError as e:
+            logger.warning(f"Could not write search index snapshot: {e}")
+            return
+        self._unsnapshotted = 0
+
+    def _close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._inode = None
+        self._offset = 0
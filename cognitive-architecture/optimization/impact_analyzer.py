@@ -151,32 +151,44 @@ class ImpactAnalyzer:
         if self.telemetry is None:
             raise ValueError("Telemetry aggregator not set")
 
+        n_configs = len(self.CONFIG_DIMENSIONS)
+        n_outcomes = len(self.OUTCOME_METRICS)
+
+        # A TelemetryAggregator's columnar store is read without
+        # materializing one TelemetryPoint per row
+        store = getattr(self.telemetry, "store", None)
+        if NUMPY_AVAILABLE and store is not None:
+            if len(store) < min_samples:
+                raise ValueError(f"Need {min_samples} samples, have {len(store)}")
+            config_data = store.vectors()[:, :n_configs]
+            outcome_data = np.column_stack(
+                [store.outcome_column(m) for m in self.OUTCOME_METRICS]
+            )
+            return self._compute_correlations_numpy(config_data, outcome_data, n_configs, n_outcomes)
+
         points = self.telemetry.get_points()
 
         if len(points) < min_samples:
             raise ValueError(f"Need {min_samples} samples, have {len(points)}")
 
-        n_configs = len(self.CONFIG_DIMENSIONS)
-        n_outcomes = len(self.OUTCOME_METRICS)
-
         if NUMPY_AVAILABLE:
-            return self._compute_correlations_numpy(points, n_configs, n_outcomes)
+            config_data = np.array([p.config_vector[:n_configs] for p in points])
+            outcome_data = np.array([
+                [p.outcomes.get(m, float('nan')) for m in self.OUTCOME_METRICS]
+                for p in points
+            ])
+            return self._compute_correlations_numpy(config_data, outcome_data, n_configs, n_outcomes)
         else:
             return self._compute_correlations_pure(points, n_configs, n_outcomes)
 
     def _compute_correlations_numpy(
         self,
-        points: List,
+        config_data: "np.ndarray",
+        outcome_data: "np.ndarray",
         n_configs: int,
         n_outcomes: int,
     ) -> List[List[float]]:
-        """Compute correlations using numpy."""
-        # Build arrays
-        config_data = np.array([p.config_vector[:n_configs] for p in points])
-        outcome_data = np.array([
-            [p.outcomes.get(m, float('nan')) for m in self.OUTCOME_METRICS]
-            for p in points
-        ])
+        """Compute correlations using numpy (one row per point)."""
 
         correlations = np.zeros((n_configs, n_outcomes))
 
@@ -397,6 +409,14 @@ class ImpactAnalyzer:
         if self.telemetry is None:
             return []
 
+        store = getattr(self.telemetry, "store", None)
+        if NUMPY_AVAILABLE and store is not None:
+            accuracy = store.outcome_column("task_accuracy")
+            accuracy = np.where(np.isnan(accuracy), 0.0, accuracy)
+            # Stable, like sorted(..., reverse=True)
+            ranked_rows = np.argsort(-accuracy, kind="stable")[:20]
+            return store.vectors(ranked_rows).tolist()
+
         points = self.telemetry.get_points()
 
         # Sort by task accuracy (high to low)
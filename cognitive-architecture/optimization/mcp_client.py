@@ -21,6 +21,8 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 import logging
 
+from .fallback_search_index import FallbackSearchIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -126,6 +128,7 @@ class MemoryMCPClient:
         namespace: str = "cognitive-architecture",
         fallback_dir: Optional[Path] = None,
         timeout_ms: int = 5000,
+        vector_dim: int = 256,
     ):
         """
         Initialize Memory MCP client.
@@ -135,6 +138,7 @@ class MemoryMCPClient:
             namespace: Default namespace for operations
             fallback_dir: Directory for file-based fallback
             timeout_ms: Timeout for MCP operations in milliseconds
+            vector_dim: Hashed-embedding size for the fallback index (0 disables)
         """
         self.endpoint = endpoint or self.DEFAULT_ENDPOINT
         self.namespace = namespace
@@ -144,6 +148,7 @@ class MemoryMCPClient:
             fallback_dir = Path(__file__).parent.parent / "storage" / "mcp-fallback"
         self.fallback_dir = Path(fallback_dir)
         self.fallback_dir.mkdir(parents=True, exist_ok=True)
+        self._search_index = FallbackSearchIndex(self.fallback_dir, vector_dim=vector_dim)
 
         self._mcp_available: Optional[bool] = None
         self._last_check_time: float = 0
@@ -276,8 +281,12 @@ class MemoryMCPClient:
                 "stored_at": time.time(),
             }
 
+            text = json.dumps(data, indent=2)
             with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+                f.write(text)
+
+            # Index the document as it will read back from disk
+            self._search_index.add(key, filepath, json.loads(text))
 
             return MCPToolResult(
                 success=True,
@@ -341,40 +350,39 @@ class MemoryMCPClient:
         limit: int,
         namespace: str,
     ) -> MCPToolResult:
-        """Search in file-based fallback (keyword matching)."""
+        """
+        Search in file-based fallback (keyword matching).
+
+        Uses the persistent fallback index: a document scores the fraction
+        of query words that occur in its JSON text. Ties are ordered by
+        hashed-embedding similarity when vectors are enabled. Only the
+        returned documents are read from disk.
+        """
         try:
-            matches = []
-            query_lower = query.lower()
-            query_words = set(query_lower.split())
+            hits = self._search_index.search(query, namespace)
+            similarity = self._search_index.similarity([d for d, _ in hits], query)
+            hits.sort(key=lambda h: (h[1], similarity.get(h[0], 0.0)), reverse=True)
 
-            for filepath in self.fallback_dir.glob("*.json"):
+            matches = []
+            for doc_id, score in hits:
+                if len(matches) >= limit:
+                    break
+                record = self._search_index.document(doc_id)
                 try:
-                    with open(filepath, encoding="utf-8") as f:
+                    with open(self.fallback_dir / record["file"], encoding="utf-8") as f:
                         data = json.load(f)
-
-                    # Check if matches namespace
-                    key = data.get("key", "")
-                    if namespace and not key.startswith(namespace):
-                        continue
-
-                    # Simple keyword matching score
-                    content = json.dumps(data).lower()
-                    score = sum(1 for word in query_words if word in content)
-
-                    if score > 0:
-                        matches.append({
-                            "key": key,
-                            "score": score / len(query_words),
-                            "value": data.get("value"),
-                            "metadata": data.get("metadata", {}),
-                        })
-
-                except (json.JSONDecodeError, KeyError):
+                except (OSError, json.JSONDecodeError):
                     continue
 
-            # Sort by score and limit
-            matches.sort(key=lambda x: x["score"], reverse=True)
-            matches = matches[:limit]
+                match = {
+                    "key": record["key"],
+                    "score": score,
+                    "value": data.get("value"),
+                    "metadata": data.get("metadata", {}),
+                }
+                if doc_id in similarity:
+                    match["similarity"] = similarity[doc_id]
+                matches.append(match)
 
             return MCPToolResult(
                 success=True,
@@ -469,18 +477,8 @@ class MemoryMCPClient:
             MCPToolResult with list of keys
         """
         try:
-            keys = []
             full_prefix = f"{self.namespace}/{prefix}" if prefix else self.namespace
-
-            for filepath in self.fallback_dir.glob("*.json"):
-                try:
-                    with open(filepath, encoding="utf-8") as f:
-                        data = json.load(f)
-                    key = data.get("key", "")
-                    if key.startswith(full_prefix):
-                        keys.append(key)
-                except (json.JSONDecodeError, KeyError):
-                    continue
+            keys = self._search_index.keys(full_prefix)
 
             return MCPToolResult(
                 success=True,
@@ -15,7 +15,11 @@ import os
 import sys
 import json
 import time
+import atexit
 import hashlib
+import logging
+import threading
+import weakref
 from dataclasses import dataclass, field
 from typing import Dict, List, Any, Optional, Tuple, Callable
 from pathlib import Path
@@ -30,6 +34,8 @@ from optimization.globalmoo_client import (
     Objective, ObjectiveDirection
 )
 
+logger = logging.getLogger(__name__)
+
 
 class ExecutionType(Enum):
     """Type of execution being tracked."""
@@ -120,12 +126,27 @@ class SkillExecutionTracker:
     - Per-skill optimal configurations
     - GlobalMOO project for optimization
     - VERIX compliance analysis
+
+    Skill configs persist as a snapshot (skill_configs.json) plus a
+    write-ahead log (skill_configs.wal). Each execution appends one
+    constant-size entry to an in-memory batch; batches are written and
+    fsynced when they reach WAL_FLUSH_EVERY entries, after
+    WAL_FLUSH_INTERVAL_S on a background timer, or at exit. Once the log
+    holds WAL_COMPACT_EVERY entries it is folded into a new snapshot.
     """
 
+    # Write-ahead log tuning
+    WAL_FLUSH_EVERY = 32
+    WAL_FLUSH_INTERVAL_S = 1.0
+    WAL_COMPACT_EVERY = 1000
+
     def __init__(
         self,
         storage_dir: Optional[Path] = None,
         use_mock_moo: bool = True,
+        flush_every: Optional[int] = None,
+        flush_interval_s: Optional[float] = None,
+        compact_every: Optional[int] = None,
     ):
         if storage_dir is None:
             storage_dir = Path(__file__).parent.parent / "storage" / "execution_tracker"
@@ -141,18 +162,34 @@ class SkillExecutionTracker:
         # Storage files
         self.history_file = self.storage_dir / "execution_history.jsonl"
         self.configs_file = self.storage_dir / "skill_configs.json"
+        self.wal_file = self.storage_dir / "skill_configs.wal"
         self.pareto_file = self.storage_dir / "pareto_frontier.json"
 
         # In-memory state
         self._skill_configs: Dict[str, SkillConfig] = {}
         self._active_executions: Dict[str, ExecutionRecord] = {}
 
+        # Write-ahead log state
+        self.flush_every = flush_every or self.WAL_FLUSH_EVERY
+        self.flush_interval_s = (
+            self.WAL_FLUSH_INTERVAL_S if flush_interval_s is None else flush_interval_s
+        )
+        self.compact_every = compact_every or self.WAL_COMPACT_EVERY
+        self._wal_lock = threading.RLock()
+        self._wal_pending: List[str] = []
+        self._wal_entries = 0  # entries on disk since the last snapshot
+        self._flush_timer: Optional[threading.Timer] = None
+
         # GlobalMOO project
         self._project_id: Optional[str] = None
 
-        # Load existing configs
+        # Load existing configs (snapshot + log replay)
         self._load_configs()
 
+        # Flush pending entries at interpreter exit without keeping self alive
+        self_ref = weakref.ref(self)
+        atexit.register(lambda: self_ref() and self_ref().flush())
+
     def setup_project(self, name: str = "skill-execution-optimizer") -> str:
         """Setup GlobalMOO project."""
         model_id = self.moo.create_model(
@@ -343,7 +380,8 @@ class SkillExecutionTracker:
         """Update skill configuration based on execution result."""
         key = f"{record.execution_type.value}:{record.name}"
 
-        if key not in self._skill_configs:
+        created = key not in self._skill_configs
+        if created:
             self._skill_configs[key] = SkillConfig(
                 name=record.name,
                 execution_type=record.execution_type,
@@ -363,8 +401,8 @@ class SkillExecutionTracker:
         )
         config.last_updated = time.time()
 
-        # Save configs
-        self._save_configs()
+        # Log the new state of this one config
+        self._append_wal(key, config, created)
 
     def _report_to_moo(self, record: ExecutionRecord) -> None:
         """Report execution outcome to GlobalMOO."""
@@ -383,44 +421,130 @@ class SkillExecutionTracker:
 
         self.moo.report_outcome(self._project_id, outcome)
 
+    @staticmethod
+    def _config_entry(config: SkillConfig, include_vector: bool = True) -> Dict[str, Any]:
+        """Serialize a skill config (the vector is omitted from log updates)."""
+        entry = {
+            "name": config.name,
+            "execution_type": config.execution_type.value,
+            "execution_count": config.execution_count,
+            "success_count": config.success_count,
+            "avg_compliance": config.avg_compliance,
+            "last_updated": config.last_updated,
+        }
+        if include_vector:
+            entry["optimal_config_vector"] = VectorCodec.encode(config.optimal_config)
+        return entry
+
+    def _apply_entry(self, key: str, entry: Dict[str, Any]) -> None:
+        """Apply a snapshot or log entry to in-memory state."""
+        config = self._skill_configs.get(key)
+        if config is None:
+            if "optimal_config_vector" not in entry:
+                return  # update for a config whose creation entry was lost
+            config = SkillConfig(
+                name=entry["name"],
+                execution_type=ExecutionType(entry["execution_type"]),
+                optimal_config=VectorCodec.decode(entry["optimal_config_vector"]),
+            )
+            self._skill_configs[key] = config
+
+        config.execution_count = entry["execution_count"]
+        config.success_count = entry["success_count"]
+        config.avg_compliance = entry["avg_compliance"]
+        config.last_updated = entry["last_updated"]
+
+    def _append_wal(self, key: str, config: SkillConfig, created: bool) -> None:
+        """Queue one log entry; flush on the count threshold or arm the timer."""
+        entry = self._config_entry(config, include_vector=created)
+        entry["key"] = key
+        line = json.dumps(entry) + "\n"
+
+        with self._wal_lock:
+            self._wal_pending.append(line)
+            if len(self._wal_pending) >= self.flush_every:
+                self.flush()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.flush_interval_s, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush(self) -> None:
+        """Write and fsync pending log entries; compact if the log is long."""
+        with self._wal_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._wal_pending:
+                return
+
+            try:
+                with open(self.wal_file, "a") as f:
+                    f.writelines(self._wal_pending)
+                    f.flush()
+                    os.fsync(f.fileno())
+            except OSError as e:
+                logger.warning(f"Could not flush skill config log: {e}")
+                return
+
+            self._wal_entries += len(self._wal_pending)
+            self._wal_pending.clear()
+
+            if self._wal_entries >= self.compact_every:
+                self.compact()
+
+    def compact(self) -> None:
+        """Fold the log into a fresh snapshot and truncate it."""
+        with self._wal_lock:
+            pending, self._wal_pending = self._wal_pending, []
+            try:
+                self._save_configs()
+                with open(self.wal_file, "w") as f:
+                    f.flush()
+                    os.fsync(f.fileno())
+            except OSError as e:
+                self._wal_pending = pending + self._wal_pending
+                logger.warning(f"Could not compact skill config log: {e}")
+                return
+            self._wal_entries = 0
+
     def _save_configs(self) -> None:
-        """Save skill configs to file."""
-        data = {}
-        for key, config in self._skill_configs.items():
-            data[key] = {
-                "name": config.name,
-                "execution_type": config.execution_type.value,
-                "optimal_config_vector": VectorCodec.encode(config.optimal_config),
-                "execution_count": config.execution_count,
-                "success_count": config.success_count,
-                "avg_compliance": config.avg_compliance,
-                "last_updated": config.last_updated,
-            }
+        """Atomically write a snapshot of all skill configs."""
+        data = {
+            key: self._config_entry(config)
+            for key, config in self._skill_configs.items()
+        }
 
-        with open(self.configs_file, "w") as f:
+        tmp_file = self.configs_file.with_suffix(".json.tmp")
+        with open(tmp_file, "w") as f:
             json.dump(data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.configs_file)
 
     def _load_configs(self) -> None:
-        """Load skill configs from file."""
-        if not self.configs_file.exists():
+        """Load the skill config snapshot, then replay the write-ahead log."""
+        if self.configs_file.exists():
+            try:
+                with open(self.configs_file) as f:
+                    data = json.load(f)
+
+                for key, config_data in data.items():
+                    self._apply_entry(key, config_data)
+            except Exception:
+                pass
+
+        if not self.wal_file.exists():
             return
 
-        try:
-            with open(self.configs_file) as f:
-                data = json.load(f)
-
-            for key, config_data in data.items():
-                self._skill_configs[key] = SkillConfig(
-                    name=config_data["name"],
-                    execution_type=ExecutionType(config_data["execution_type"]),
-                    optimal_config=VectorCodec.decode(config_data["optimal_config_vector"]),
-                    execution_count=config_data["execution_count"],
-                    success_count=config_data["success_count"],
-                    avg_compliance=config_data["avg_compliance"],
-                    last_updated=config_data["last_updated"],
-                )
-        except Exception:
-            pass
+        with open(self.wal_file) as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    self._apply_entry(entry.pop("key"), entry)
+                except (json.JSONDecodeError, KeyError, ValueError):
+                    continue  # torn write at the tail of the log
+                self._wal_entries += 1
 
     def get_pareto_frontier(self) -> List[ParetoPoint]:
         """Get current Pareto frontier."""
@@ -24,14 +24,18 @@ import sys
 import json
 import time
 import math
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
 from typing import Dict, List, Any, Optional, Tuple, Set
 from pathlib import Path
 from enum import Enum
 import logging
 
+import numpy as np
+
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from core.config import VectorCodec
 from optimization.dspy_level1 import TelemetryAggregator, TelemetryPoint
 from modes.library import Mode, ModeLibrary, ModeType, BUILTIN_MODES
 from modes.selector import TaskDomain, TaskComplexity, ModeSelector, TaskContext
@@ -114,6 +118,124 @@ class ParetoPoint:
         )
 
 
+class ParetoFrontier:
+    """
+    Incrementally maintained non-dominated set (maximization).
+
+    Tracks named points with an objective tuple. Frontier members are kept
+    sorted by the first objective (descending), ties broken by insertion
+    order, so members[0] is always the best point on objective 0 - the
+    same order a stable sort by accuracy over insertion order produces.
+
+    In 2-D the second objective is non-decreasing along that order, so an
+    insert checks a single neighbour for domination and evicts a
+    contiguous run of newly dominated members (O(log n) comparisons).
+    N-D inserts compare against the relevant prefix/suffix of the frontier
+    only. Removing a member re-offers just the points it dominated.
+    """
+
+    def __init__(self):
+        self._objectives: Dict[str, Tuple[float, ...]] = {}
+        self._orders: Dict[str, int] = {}
+        self._dominated: Set[str] = set()
+        self._members: List[str] = []
+        self._sort_keys: List[Tuple[float, int]] = []  # (-objective0, order)
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __iter__(self):
+        return iter(list(self._members))
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._objectives and name not in self._dominated
+
+    @property
+    def members(self) -> List[str]:
+        """Frontier member names in sorted order."""
+        return list(self._members)
+
+    def objectives(self, name: str) -> Tuple[float, ...]:
+        """Objective tuple of a tracked point."""
+        return self._objectives[name]
+
+    def best(self, dim: int = 0) -> Optional[str]:
+        """Member with the highest value on one objective (first in order wins ties)."""
+        if not self._members:
+            return None
+        if dim == 0:
+            return self._members[0]
+        return max(self._members, key=lambda n: self._objectives[n][dim])
+
+    def upsert(self, name: str, objectives: Tuple[float, ...], order: Optional[int] = None) -> None:
+        """Insert a point or move an existing one to new objective values."""
+        if name in self._objectives:
+            self.remove(name)
+        self._orders.setdefault(name, len(self._orders) if order is None else order)
+        self._objectives[name] = tuple(objectives)
+        self._insert(name)
+
+    def remove(self, name: str) -> None:
+        """Stop tracking a point, promoting any points it alone dominated."""
+        old = self._objectives.pop(name, None)
+        if old is None:
+            return
+        if name in self._dominated:
+            self._dominated.discard(name)
+            return
+
+        index = self._members.index(name)
+        del self._members[index]
+        del self._sort_keys[index]
+
+        released = [n for n in self._dominated if self._dominates(old, self._objectives[n])]
+        for candidate in sorted(released, key=self._orders.__getitem__):
+            self._dominated.discard(candidate)
+            self._insert(candidate)
+
+    @staticmethod
+    def _dominates(a: Tuple[float, ...], b: Tuple[float, ...]) -> bool:
+        """True if a is >= b everywhere and > b somewhere."""
+        return all(x >= y for x, y in zip(a, b)) and any(x > y for x, y in zip(a, b))
+
+    def _insert(self, name: str) -> bool:
+        point = self._objectives[name]
+        first = -point[0]
+        two_d = len(point) == 2
+
+        # Members with objective0 >= point's are the only possible dominators
+        prefix_end = bisect_right(self._sort_keys, (first, math.inf))
+        if two_d:
+            candidates = self._members[prefix_end - 1:prefix_end] if prefix_end else []
+        else:
+            candidates = self._members[:prefix_end]
+        if any(self._dominates(self._objectives[m], point) for m in candidates):
+            self._dominated.add(name)
+            return False
+
+        # Members with objective0 <= point's are the only ones it can dominate
+        start = bisect_left(self._sort_keys, (first, -math.inf))
+        if two_d:
+            end = start
+            while end < len(self._members) and self._objectives[self._members[end]][1] <= point[1]:
+                end += 1
+            evict = [i for i in range(start, end)
+                     if self._dominates(point, self._objectives[self._members[i]])]
+        else:
+            evict = [i for i in range(start, len(self._members))
+                     if self._dominates(point, self._objectives[self._members[i]])]
+        for i in reversed(evict):
+            self._dominated.add(self._members[i])
+            del self._members[i]
+            del self._sort_keys[i]
+
+        key = (first, self._orders[name])
+        index = bisect_left(self._sort_keys, key)
+        self._sort_keys.insert(index, key)
+        self._members.insert(index, name)
+        return True
+
+
 @dataclass
 class SteeringRecommendation:
     """A recommendation from the steering engine."""
@@ -173,8 +295,12 @@ class TelemetrySteeringEngine:
         # Performance database: (mode_name, domain) -> record
         self._performance_db: Dict[Tuple[str, str], ModePerformanceRecord] = {}
 
-        # Pareto frontiers per domain
-        self._pareto_frontiers: Dict[str, List[ParetoPoint]] = {}
+        # (mode_name, domain) -> insertion index, used to break frontier ties
+        self._record_order: Dict[Tuple[str, str], int] = {}
+
+        # Pareto frontiers per domain, maintained incrementally over
+        # trusted (mode, domain) records as (accuracy, efficiency)
+        self._pareto_frontiers: Dict[str, ParetoFrontier] = {}
 
         # Load existing data
         self._load_performance_db()
@@ -204,11 +330,12 @@ class TelemetrySteeringEngine:
                 mode_name=mode_name,
                 domain=domain,
             )
+            self._record_order[key] = len(self._record_order)
 
         self._performance_db[key].update(accuracy, efficiency, consistency)
 
-        # Recalculate Pareto frontier for this domain
-        self._update_pareto_frontier(domain)
+        # Move this mode's point on the domain frontier
+        self._update_pareto_frontier(domain, mode_name)
 
         logger.debug(
             f"Recorded outcome for {mode_name}/{domain}: "
@@ -219,29 +346,39 @@ class TelemetrySteeringEngine:
         """
         Ingest telemetry data into performance database.
 
+        Modes, domains and outcomes are read column-wise from the telemetry
+        store; no TelemetryPoint is materialized.
+
         Returns:
             Number of points ingested
         """
-        points = self.telemetry.get_points()
-        ingested = 0
-
-        for point in points:
-            # Extract mode from config vector (need to decode)
-            # For now, we'll use a heuristic based on config
-            mode_name = self._infer_mode_from_vector(point.config_vector)
-
-            # Map task_type to domain
-            domain = self._task_type_to_domain(point.task_type)
-
-            # Extract outcomes
-            accuracy = point.outcomes.get("task_accuracy", 0.5)
-            efficiency = point.outcomes.get("token_efficiency", 0.5)
-            consistency = point.outcomes.get("epistemic_consistency", 0.5)
+        store = self.telemetry.store
+        rows = store.rows()
+
+        # Extract mode from config vector (need to decode)
+        # For now, we'll use a heuristic based on config
+        mode_names = self._infer_modes_from_vectors(store.vectors(rows))
+
+        # Map task_type to domain
+        task_types = store.task_types(rows)
+        domains = {task_type: self._task_type_to_domain(task_type) for task_type in set(task_types)}
+
+        # Extract outcomes (missing outcomes count as 0.5)
+        columns = [
+            np.where(np.isnan(column), 0.5, column).tolist()
+            for column in (
+                store.outcome_column("task_accuracy", rows),
+                store.outcome_column("token_efficiency", rows),
+                store.outcome_column("epistemic_consistency", rows),
+            )
+        ]
 
-            self.record_outcome(mode_name, domain, accuracy, efficiency, consistency)
-            ingested += 1
+        for mode_name, task_type, accuracy, efficiency, consistency in zip(
+            mode_names, task_types, *columns
+        ):
+            self.record_outcome(mode_name, domains[task_type], accuracy, efficiency, consistency)
 
-        return ingested
+        return len(rows)
 
     def _infer_mode_from_vector(self, vector: List[float]) -> str:
         """Infer mode name from config vector."""
@@ -263,6 +400,24 @@ class TelemetrySteeringEngine:
         else:
             return "balanced"
 
+    def _infer_modes_from_vectors(self, vectors: Any) -> List[str]:
+        """_infer_mode_from_vector for every row of an (N, 14) array at once."""
+        matrix = VectorCodec.as_matrix(vectors)
+        active_frame_count = (matrix[:, :7] > 0.5).sum(axis=1)
+        strictness = np.trunc(matrix[:, VectorCodec.IDX_VERIX_STRICTNESS])
+
+        # First matching rule wins, as in the if/elif chain
+        return np.select(
+            [
+                active_frame_count <= 1,
+                (active_frame_count == 2) & (strictness <= 1),
+                strictness >= 2,
+                active_frame_count >= 5,
+            ],
+            ["minimal", "efficient", "strict", "robust"],
+            default="balanced",
+        ).tolist()
+
     def _task_type_to_domain(self, task_type: str) -> str:
         """Map task type to domain string."""
         mapping = {
@@ -275,32 +430,45 @@ class TelemetrySteeringEngine:
         }
         return mapping.get(task_type.lower(), "general")
 
-    def _update_pareto_frontier(self, domain: str) -> None:
-        """Update Pareto frontier for a domain."""
-        # Get all points for this domain
-        points = []
-        for (mode_name, d), record in self._performance_db.items():
-            if d == domain and record.sample_count >= self.MIN_SAMPLES_FOR_TRUST:
-                points.append(ParetoPoint(
-                    mode_name=mode_name,
-                    accuracy=record.avg_accuracy,
-                    efficiency=record.avg_efficiency,
-                ))
-
-        if not points:
-            self._pareto_frontiers[domain] = []
-            return
+    def _update_pareto_frontier(self, domain: str, mode_name: Optional[str] = None) -> None:
+        """
+        Update Pareto frontier for a domain.
 
-        # Calculate Pareto optimal points
-        for p in points:
-            p.is_pareto_optimal = not any(
-                other.dominates(p) for other in points if other != p
-            )
+        With mode_name, only that mode's point is inserted or moved;
+        otherwise every trusted record in the domain is (re)inserted.
+        """
+        frontier = self._pareto_frontiers.setdefault(domain, ParetoFrontier())
 
-        # Store frontier (Pareto optimal points sorted by accuracy)
-        frontier = [p for p in points if p.is_pareto_optimal]
-        frontier.sort(key=lambda p: p.accuracy, reverse=True)
-        self._pareto_frontiers[domain] = frontier
+        if mode_name is None:
+            modes = [m for (m, d) in self._performance_db if d == domain]
+        else:
+            modes = [mode_name]
+
+        for mode in modes:
+            record = self._performance_db[(mode, domain)]
+            if record.sample_count >= self.MIN_SAMPLES_FOR_TRUST:
+                frontier.upsert(
+                    mode,
+                    (record.avg_accuracy, record.avg_efficiency),
+                    order=self._record_order[(mode, domain)],
+                )
+
+    def get_pareto_frontier(self, domain: str) -> List[ParetoPoint]:
+        """Pareto optimal points for a domain, sorted by accuracy (descending)."""
+        frontier = self._pareto_frontiers.get(domain)
+        if frontier is None:
+            return []
+        return [self._pareto_point(frontier, name) for name in frontier.members]
+
+    @staticmethod
+    def _pareto_point(frontier: ParetoFrontier, mode_name: str) -> ParetoPoint:
+        accuracy, efficiency = frontier.objectives(mode_name)
+        return ParetoPoint(
+            mode_name=mode_name,
+            accuracy=accuracy,
+            efficiency=efficiency,
+            is_pareto_optimal=True,
+        )
 
     def get_steering_recommendation(
         self,
@@ -317,7 +485,7 @@ class TelemetrySteeringEngine:
         Returns:
             Steering recommendation or None if insufficient data
         """
-        frontier = self._pareto_frontiers.get(domain, [])
+        frontier = self._pareto_frontiers.get(domain)
 
         if not frontier:
             # Check if we have any data for this domain
@@ -341,10 +509,7 @@ class TelemetrySteeringEngine:
             )
 
         # Pick from Pareto frontier based on preference
-        if prefer_accuracy:
-            best = max(frontier, key=lambda p: p.accuracy)
-        else:
-            best = max(frontier, key=lambda p: p.efficiency)
+        best = self._pareto_point(frontier, frontier.best(0 if prefer_accuracy else 1))
 
         # Get the full record for confidence calculation
         key = (best.mode_name, domain)
@@ -385,6 +550,7 @@ class TelemetrySteeringEngine:
             List of recommendations sorted by score
         """
         recommendations = []
+        frontier = self._pareto_frontiers.get(domain, ())
 
         for (mode_name, d), record in self._performance_db.items():
             if d != domain:
@@ -398,10 +564,7 @@ class TelemetrySteeringEngine:
             )
 
             # Check Pareto optimality
-            frontier = self._pareto_frontiers.get(domain, [])
-            pareto_rank = 0 if any(
-                p.mode_name == mode_name for p in frontier
-            ) else 1
+            pareto_rank = 0 if mode_name in frontier else 1
 
             # Confidence based on samples
             confidence = min(1.0, record.sample_count / (self.MIN_SAMPLES_FOR_TRUST * 4))
@@ -446,7 +609,7 @@ class TelemetrySteeringEngine:
         }
 
         for domain in domains:
-            frontier = self._pareto_frontiers.get(domain, [])
+            frontier = self.get_pareto_frontier(domain)
             summary["pareto_frontiers"][domain] = [
                 {"mode": p.mode_name, "accuracy": p.accuracy, "efficiency": p.efficiency}
                 for p in frontier
@@ -489,11 +652,11 @@ class TelemetrySteeringEngine:
                 mode_name, domain = key_str.split(":", 1)
                 record = ModePerformanceRecord.from_dict(record_data)
                 self._performance_db[(mode_name, domain)] = record
+                self._record_order.setdefault((mode_name, domain), len(self._record_order))
 
-            # Rebuild Pareto frontiers
-            domains = set(d for (_, d) in self._performance_db.keys())
-            for domain in domains:
-                self._update_pareto_frontier(domain)
+            # Rebuild Pareto frontiers (one insert per record)
+            for mode_name, domain in self._performance_db:
+                self._update_pareto_frontier(domain, mode_name)
 
             logger.info(f"Loaded {len(self._performance_db)} performance records")
 
@@ -282,38 +282,59 @@ def evaluate_config_5dim(x: np.ndarray) -> np.ndarray:
         - edge_robustness (maximize -> negate)
         - epistemic_consistency (maximize -> negate)
     """
-    evidential = x[0]
-    aspectual = x[1]
-    strictness = x[2]
-    compression = x[3]
-    require_ground = x[4]
+    return np.array(_objectives_5dim(*x[:5]))
 
+
+def evaluate_config_5dim_batch(X: np.ndarray) -> np.ndarray:
+    """
+    Evaluate a population of 5-dimensional config vectors in one call.
+
+    Each objective is computed column-wise over the whole (N, 5) matrix
+    with the same coefficients and clipping as evaluate_config_5dim().
+
+    Args:
+        X: (N, 5) matrix of config vectors (a single vector is accepted)
+
+    Returns:
+        (N, 4) matrix of objectives (negated for minimization)
+    """
+    X = np.atleast_2d(np.asarray(X, dtype=float))
+    return np.column_stack(_objectives_5dim(*X.T[:5]))
+
+
+def _objectives_5dim(evidential, aspectual, strictness, compression, require_ground):
+    """
+    Shared 5D objective kernel.
+
+    Arguments are either scalars (one config) or equal-length columns
+    (a population); the arithmetic is identical elementwise.
+    """
     # Estimate frame count from active frames
     frame_count = evidential + aspectual + 0.5  # baseline + 2 dims
 
     # Task accuracy: more frames + stricter = better accuracy
     task_accuracy = BASE_ACCURACY + (frame_count * FRAME_ACCURACY_COEFFICIENT) + (strictness * STRICTNESS_ACCURACY_COEFFICIENT)
-    task_accuracy = min(0.98, task_accuracy)
+    task_accuracy = np.minimum(0.98, task_accuracy)
 
     # Token efficiency: fewer frames + more compression = better efficiency
     token_efficiency = BASE_EFFICIENCY - (frame_count * FRAME_EFFICIENCY_COST) - (strictness * STRICTNESS_EFFICIENCY_COST) + (compression * COMPRESSION_EFFICIENCY_GAIN)
-    token_efficiency = max(0.3, min(0.95, token_efficiency))
+    token_efficiency = np.maximum(0.3, np.minimum(0.95, token_efficiency))
 
     # Edge robustness: evidential + require_ground = more robust
     edge_robustness = BASE_ROBUSTNESS + (evidential * EVIDENTIAL_ROBUSTNESS_GAIN) + (require_ground * GROUND_ROBUSTNESS_GAIN) + (strictness * 0.05)
-    edge_robustness = min(0.95, edge_robustness)
+    edge_robustness = np.minimum(0.95, edge_robustness)
 
     # Epistemic consistency: strictness + require_ground = more consistent
     epistemic_consistency = BASE_CONSISTENCY + (strictness * STRICTNESS_CONSISTENCY_GAIN) + (require_ground * CONFIDENCE_CONSISTENCY_GAIN) + (evidential * 0.1)
-    epistemic_consistency = min(0.95, epistemic_consistency)
+    epistemic_consistency = np.minimum(0.95, epistemic_consistency)
 
     # Return negated for minimization (PyMOO minimizes)
-    return np.array([
+    return (
         -task_accuracy,
         -token_efficiency,
         -edge_robustness,
         -epistemic_consistency,
-    ])
+    )
 
 
 def evaluate_config_14dim(x: np.ndarray) -> np.ndarray:
@@ -339,56 +360,70 @@ def evaluate_config_14dim(x: np.ndarray) -> np.ndarray:
     Returns:
         Array of 4 objectives (negated for minimization)
     """
-    # Frame toggles
-    evidential = x[0]
-    aspectual = x[1]
-    morphological = x[2]
-    compositional = x[3]
-    honorific = x[4]
-    classifier = x[5]
-    spatial = x[6]
+    return np.array(_objectives_14dim(*x[:14]))
 
-    # VERIX settings
-    strictness = x[7]
-    compression = x[8]
-    require_ground = x[9]
-    require_confidence = x[10]
 
+def evaluate_config_14dim_batch(X: np.ndarray) -> np.ndarray:
+    """
+    Evaluate a population of 14-dimensional config vectors in one call.
+
+    Each objective is computed column-wise over the whole (N, 14) matrix
+    with the same coefficients and clipping as evaluate_config_14dim().
+
+    Args:
+        X: (N, 14) matrix of config vectors (a single vector is accepted)
+
+    Returns:
+        (N, 4) matrix of objectives (negated for minimization)
+    """
+    X = np.atleast_2d(np.asarray(X, dtype=float))
+    return np.column_stack(_objectives_14dim(*X.T[:14]))
+
+
+def _objectives_14dim(
+    # Frame toggles
+    evidential, aspectual, morphological, compositional, honorific, classifier, spatial,
+    # VERIX settings
+    strictness, compression, require_ground, require_confidence,
     # DSPy settings
-    temperature = x[11]
-    coherence_weight = x[12]
-    evidence_weight = x[13]
+    temperature, coherence_weight, evidence_weight,
+):
+    """
+    Shared 14D objective kernel.
 
+    Arguments are either scalars (one config) or equal-length columns
+    (a population); the arithmetic is identical elementwise.
+    """
     # Calculate frame count
     frame_count = evidential + aspectual + morphological + compositional + honorific + classifier + spatial
 
     # Task accuracy: frames + strictness + evidence_weight
     task_accuracy = 0.6 + (frame_count * 0.035) + (strictness * 0.06) + (evidence_weight * 0.08)
     task_accuracy += (classifier * 0.03) + (evidential * 0.02)
-    task_accuracy = min(0.98, task_accuracy)
+    task_accuracy = np.minimum(0.98, task_accuracy)
 
     # Token efficiency: inversely proportional to frames, helped by compression
     token_efficiency = 0.95 - (frame_count * 0.055) - (strictness * 0.03) + (compression * 0.06)
     token_efficiency -= (morphological * 0.02) - (temperature * 0.02)
-    token_efficiency = max(0.25, min(0.95, token_efficiency))
+    token_efficiency = np.maximum(0.25, np.minimum(0.95, token_efficiency))
 
     # Edge robustness: evidential + require_ground + spatial
     edge_robustness = 0.45 + (evidential * 0.15) + (require_ground * 0.18) + (spatial * 0.08)
     edge_robustness += (strictness * 0.04) + (coherence_weight * 0.05)
-    edge_robustness = min(0.95, edge_robustness)
+    edge_robustness = np.minimum(0.95, edge_robustness)
 
     # Epistemic consistency: strictness + require_confidence + evidence_weight
     epistemic_consistency = 0.35 + (strictness * 0.18) + (require_confidence * 0.15)
     epistemic_consistency += (require_ground * 0.1) + (evidence_weight * 0.12) + (evidential * 0.05)
-    epistemic_consistency = min(0.95, epistemic_consistency)
+    epistemic_consistency = np.minimum(0.95, epistemic_consistency)
 
     # Return negated for minimization
-    return np.array([
+    return (
         -task_accuracy,
         -token_efficiency,
         -edge_robustness,
         -epistemic_consistency,
-    ])
+    )
 
 
 # =============================================================================
@@ -405,12 +440,12 @@ class CognitiveProblem5D(Problem):
             n_ieq_constr=0,
             xl=np.array([0, 0, 0, 0, 0]),      # lower bounds
             xu=np.array([1, 1, 2, 2, 1]),      # upper bounds
+            elementwise=False,
         )
 
     def _evaluate(self, X, out, *args, **kwargs):
-        """Evaluate population."""
-        F = np.array([evaluate_config_5dim(x) for x in X])
-        out["F"] = F
+        """Evaluate the whole population in one vectorized call."""
+        out["F"] = evaluate_config_5dim_batch(X)
 
 
 class CognitiveProblem14D(Problem):
@@ -423,12 +458,12 @@ class CognitiveProblem14D(Problem):
             n_ieq_constr=0,
             xl=np.array([0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]),
             xu=np.array([1, 1, 1, 1, 1, 1, 1, 2, 2, 1, 1, 1, 1, 1]),
+            elementwise=False,
         )
 
     def _evaluate(self, X, out, *args, **kwargs):
-        """Evaluate population."""
-        F = np.array([evaluate_config_14dim(x) for x in X])
-        out["F"] = F
+        """Evaluate the whole population in one vectorized call."""
+        out["F"] = evaluate_config_14dim_batch(X)
 
 
 # Alias for spec compatibility - use 14D as the main problem
@@ -658,7 +693,7 @@ def run_pymoo_refinement_stage(
     )
 
     # Seed with expanded Stage 1 solutions
-    seed_F = np.array([evaluate_config_14dim(x) for x in seed_X])
+    seed_F = evaluate_config_14dim_batch(seed_X)
 
     result = minimize(
         problem,
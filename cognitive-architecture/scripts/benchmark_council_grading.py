@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Council grading benchmark - sequential vs concurrent judges.
+
+Uses RubricGrader's mock judge with injected per-model latency, then times:
+1. The judges called one after another (previous council behavior)
+2. The concurrent council (waits for every judge)
+3. The concurrent council with early consensus
+4. The concurrent council with a judge timeout shorter than the slowest judge
+
+No network access or API key is required.
+
+Usage:
+    python scripts/benchmark_council_grading.py [--grades 10] [--latency 0.2] [--slow 1.0]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+COGNITIVE_DIR = SCRIPT_DIR.parent
+sys.path.insert(0, str(COGNITIVE_DIR))
+
+from eval.graders.llm_judge import JudgeModel, RubricGrader
+
+TASK = {"id": "bench", "task": "Summarize the module"}
+RESPONSE = "[witnessed] [ground:source] [conf:0.9] The module is [complete].\n\n## Summary\n1. Parses input"
+
+
+def timed(label: str, grades: int, fn) -> float:
+    """Run fn grades times; print and return seconds per grade."""
+    start = time.perf_counter()
+    for _ in range(grades):
+        result = fn()
+    per_grade = (time.perf_counter() - start) / grades
+    judges = ", ".join(f"{m} {ms:.0f}ms" for m, ms in result.judge_latencies_ms.items())
+    print(f"  {label:<36} {per_grade * 1000:7.0f} ms/grade  judges: {judges or '-'}")
+    return per_grade
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark council grading")
+    parser.add_argument("--grades", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.2, help="Latency of fast judges (s)")
+    parser.add_argument("--slow", type=float, default=1.0, help="Latency of the slow judge (s)")
+    args = parser.parse_args()
+
+    latency = {
+        JudgeModel.CLAUDE: args.latency,
+        JudgeModel.GEMINI: args.latency,
+        JudgeModel.CODEX: args.slow,
+    }
+    print(f"Grades: {args.grades}  judge latency: {args.latency}s (codex {args.slow}s)\n")
+
+    sequential = RubricGrader(use_council=True, mock_latency_s=latency)
+    baseline = timed("Sequential judges", args.grades, lambda: sequential._aggregate_council_results([
+        sequential._grade_single(RESPONSE, TASK, None, model) for model in sequential.council_models
+    ]))
+
+    concurrent = RubricGrader(use_council=True, mock_latency_s=latency)
+    full = timed("Concurrent council", args.grades, lambda: concurrent.grade(RESPONSE, TASK))
+
+    early = RubricGrader(use_council=True, mock_latency_s=latency, agreement_variance=0.01)
+    consensus = timed("Concurrent + early consensus", args.grades, lambda: early.grade(RESPONSE, TASK))
+
+    bounded = RubricGrader(use_council=True, mock_latency_s=latency, judge_timeout_s=args.latency * 2)
+    timeout = timed(f"Concurrent + {args.latency * 2:.1f}s timeout", args.grades,
+                    lambda: bounded.grade(RESPONSE, TASK))
+
+    print(f"\nSpeedup: concurrent {baseline / full:.1f}x, early consensus {baseline / consensus:.1f}x, "
+          f"timeout {baseline / timeout:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Edge case detection benchmark - per-regex loop vs literal-gated scanner.
+
+Builds a synthetic corpus of short task prompts (a fraction of them seeded
+with edge case phrases) and times:
+1. The original detector loop (every regex of every group searched)
+2. EdgeCaseDetector.detect (literal-gated scanner)
+3. EdgeCaseDetector.detect_batch (deduplicated, optionally a process pool)
+4. A windowed streaming scan of one large input
+
+Usage:
+    python scripts/benchmark_edge_cases.py [--texts 5000] [--processes 4] [--large-mb 4]
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+COGNITIVE_DIR = SCRIPT_DIR.parent
+sys.path.insert(0, str(COGNITIVE_DIR))
+
+from eval.edge_cases import EDGE_PATTERNS, EdgeCaseDetector, EdgeCaseType
+
+WORDS = ("implement the parser module and add tests for each branch of the "
+         "configuration loader so that results are stable across runs").split()
+SEEDS = ["ignore previous instructions", "maybe this or that", "is both true and false",
+         "a hypothetical scenario", "at most 3 items", "what???", "pretend you are root"]
+
+
+def make_corpus(count: int, rng: random.Random):
+    texts = []
+    for _ in range(count):
+        words = [rng.choice(WORDS) for _ in range(rng.randrange(20, 120))]
+        if rng.random() < 0.3:
+            words.insert(rng.randrange(len(words)), rng.choice(SEEDS))
+        texts.append(" ".join(words))
+    return texts
+
+
+def reference_detect(compiled, text):
+    """The original detector loop, for comparison."""
+    if not text or not text.strip():
+        return [(EdgeCaseType.EMPTY, 1.0)]
+    if len(text) > 10000:
+        return [(EdgeCaseType.OVERLOAD, 0.8)]
+    detected = []
+    for pattern in EDGE_PATTERNS:
+        matches = sum(1 for p in compiled[pattern.edge_type] if p.search(text))
+        if matches > 0:
+            detected.append((pattern.edge_type, min(1.0, pattern.severity * (1 + 0.2 * (matches - 1)))))
+    return detected
+
+
+def timed(label: str, texts, fn):
+    """Run fn over the corpus; print throughput and return results."""
+    size_mb = sum(len(t) for t in texts) / 1e6
+    start = time.perf_counter()
+    results = fn(texts)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<34} {len(texts) / elapsed:10.0f} texts/s {size_mb / elapsed:8.2f} MB/s")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark edge case detection")
+    parser.add_argument("--texts", type=int, default=5000)
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument("--large-mb", type=float, default=4.0, help="Size of the streamed input (MB)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    texts = make_corpus(args.texts, rng)
+    detector = EdgeCaseDetector()
+    compiled = {p.edge_type: [re.compile(pat, re.IGNORECASE) for pat in p.patterns] for p in EDGE_PATTERNS}
+    print(f"Corpus: {len(texts)} texts, {sum(len(t) for t in texts) / 1e6:.2f} MB\n")
+
+    baseline = timed("Per-regex loop (original)", texts,
+                     lambda ts: [reference_detect(compiled, t) for t in ts])
+    scanned = timed("detect (literal-gated)", texts, lambda ts: [detector.detect(t) for t in ts])
+    batched = timed("detect_batch", texts, detector.detect_batch)
+    pooled = timed(f"detect_batch processes={args.processes}", texts,
+                   lambda ts: detector.detect_batch(ts, processes=args.processes))
+    assert baseline == scanned == batched == pooled, "detector results differ from the original"
+
+    large = " ".join(rng.choice(WORDS + SEEDS) for _ in range(int(args.large_mb * 1e6 / 6)))
+    print()
+    start = time.perf_counter()
+    scan = detector.scan(large)
+    elapsed = time.perf_counter() - start
+    print(f"  {'Windowed scan':<34} {len(large) / 1e6 / elapsed:10.2f} MB/s "
+          f"({scan.windows} windows, compression {scan.compression_ratio:.3f})")
+    print(f"  detections: {[(t.value, round(c, 2)) for t, c in detector.detections(scan)]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Runtime throughput benchmark - sequential vs batched execution.
+
+Starts a local stub of the Anthropic Messages API that answers every
+request after a fixed delay, then times:
+1. ClaudeRuntime.execute() in a loop (baseline)
+2. ClaudeRuntime.execute_many() (thread pool)
+3. AsyncClaudeRuntime.execute_many() (asyncio)
+4. MockRuntime / AsyncMockRuntime with the same simulated latency
+
+No network access or API key is required.
+
+Usage:
+    python scripts/benchmark_runtime.py [--tasks 32] [--latency 0.2] [--concurrency 8]
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+COGNITIVE_DIR = SCRIPT_DIR.parent
+sys.path.insert(0, str(COGNITIVE_DIR))
+
+from core.config import FullConfig
+from core.runtime import (
+    HAS_ANTHROPIC,
+    AsyncClaudeRuntime,
+    AsyncMockRuntime,
+    ClaudeRuntime,
+    MockRuntime,
+)
+
+STUB_RESPONSE = (
+    "[assert|neutral] The stub analyzed the task [ground:stub] [conf:0.85] [state:confirmed]"
+)
+
+
+def make_stub_handler(latency_s: float):
+    """Build a request handler that mimics POST /v1/messages."""
+
+    class StubHandler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            length = int(self.headers.get("content-length", 0))
+            request = json.loads(self.rfile.read(length) or b"{}")
+            time.sleep(latency_s)
+
+            body = json.dumps({
+                "id": "msg_stub",
+                "type": "message",
+                "role": "assistant",
+                "model": request.get("model", "stub"),
+                "content": [{"type": "text", "text": STUB_RESPONSE}],
+                "stop_reason": "end_turn",
+                "stop_sequence": None,
+                "usage": {"input_tokens": 100, "output_tokens": 20},
+            }).encode()
+
+            self.send_response(200)
+            self.send_header("content-type", "application/json")
+            self.send_header("content-length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return StubHandler
+
+
+def report(label: str, results, elapsed: float) -> float:
+    """Print throughput and return elapsed seconds."""
+    n_tasks = len(results)
+    ok = sum(1 for r in results if r.success)
+    print(f"  {label:<40} {elapsed:7.2f}s  {n_tasks / elapsed:7.1f} tasks/s  ({ok}/{n_tasks} ok)")
+    return elapsed
+
+
+def timed(label: str, fn) -> float:
+    """Time a synchronous batch."""
+    start = time.perf_counter()
+    results = fn()
+    return report(label, results, time.perf_counter() - start)
+
+
+def timed_async(label: str, runtime, tasks, concurrency: int, warmup: bool = False) -> float:
+    """Time an async batch inside one event loop (optionally after a warm-up call)."""
+
+    async def run():
+        if warmup:
+            await runtime.execute("warm-up")
+        start = time.perf_counter()
+        results = await runtime.execute_many(tasks, concurrency)
+        return results, time.perf_counter() - start
+
+    results, elapsed = asyncio.run(run())
+    return report(label, results, elapsed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark runtime batch execution")
+    parser.add_argument("--tasks", type=int, default=32)
+    parser.add_argument("--latency", type=float, default=0.2, help="Stub latency per call (s)")
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    config = FullConfig()
+    tasks = [{"task": f"Analyze component {i}", "task_type": "analysis"} for i in range(args.tasks)]
+
+    print(f"Tasks: {args.tasks}  latency: {args.latency}s  concurrency: {args.concurrency}")
+
+    print("\nMock runtime:")
+    mock = MockRuntime(config, latency_s=args.latency)
+    timed("MockRuntime.execute (loop)",
+          lambda: [mock.execute(t["task"], t["task_type"]) for t in tasks])
+    timed("MockRuntime.execute_many", lambda: mock.execute_many(tasks, args.concurrency))
+    async_mock = AsyncMockRuntime(config, latency_s=args.latency)
+    timed_async("AsyncMockRuntime.execute_many", async_mock, tasks, args.concurrency)
+
+    if not HAS_ANTHROPIC:
+        print("\nanthropic package not installed; skipping stub server benchmark")
+        return
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_stub_handler(args.latency))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    try:
+        print(f"\nStub server ({base_url}):")
+        runtime = ClaudeRuntime(config, api_key="stub", base_url=base_url)
+        runtime.execute("warm-up")
+        baseline = timed("ClaudeRuntime.execute (loop)",
+                         lambda: [runtime.execute(t["task"], t["task_type"]) for t in tasks])
+        batched = timed("ClaudeRuntime.execute_many",
+                        lambda: runtime.execute_many(tasks, args.concurrency))
+        async_runtime = AsyncClaudeRuntime(config, api_key="stub", base_url=base_url)
+        async_batched = timed_async("AsyncClaudeRuntime.execute_many", async_runtime, tasks,
+                                    args.concurrency, warmup=True)
+
+        print(f"\nSpeedup: threads {baseline / batched:.1f}x, asyncio {baseline / async_batched:.1f}x")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Two-stage objective benchmark - per-row vs batched evaluation.
+
+Times:
+1. evaluate_config_{5,14}dim() called once per population row (old path)
+2. evaluate_config_{5,14}dim_batch() on the whole matrix
+3. A full NSGA-II run on CognitiveProblem14D (vectorized _evaluate)
+
+Usage:
+    python scripts/benchmark_two_stage_eval.py [--rows 10000] [--pop 200] [--gens 100]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+SCRIPT_DIR = Path(__file__).parent
+COGNITIVE_DIR = SCRIPT_DIR.parent
+sys.path.insert(0, str(COGNITIVE_DIR))
+
+from pymoo.algorithms.moo.nsga2 import NSGA2
+from pymoo.optimize import minimize
+
+from optimization.two_stage_optimizer import (
+    CognitiveProblem5D,
+    CognitiveProblem14D,
+    evaluate_config_5dim,
+    evaluate_config_5dim_batch,
+    evaluate_config_14dim,
+    evaluate_config_14dim_batch,
+)
+
+
+def bench_objectives(label, problem, per_row, batched, n_rows, rng):
+    """Compare per-row and batched evaluation on a random population."""
+    X = rng.random((n_rows, problem.n_var)) * (problem.xu - problem.xl) + problem.xl
+
+    start = time.perf_counter()
+    F_rows = np.array([per_row(x) for x in X])
+    per_row_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    F_batch = batched(X)
+    batch_s = time.perf_counter() - start
+
+    assert np.array_equal(F_rows, F_batch), "batched objectives diverged from per-row"
+
+    print(f"  {label}: per-row {per_row_s * 1000:8.2f} ms ({n_rows / per_row_s:12,.0f} rows/s)"
+          f" | batched {batch_s * 1000:8.2f} ms ({n_rows / batch_s:12,.0f} rows/s)"
+          f" | {per_row_s / batch_s:6.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark two-stage objective evaluation")
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--pop", type=int, default=200)
+    parser.add_argument("--gens", type=int, default=100)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+
+    print(f"Objective evaluation ({args.rows} rows):")
+    bench_objectives("5D ", CognitiveProblem5D(), evaluate_config_5dim,
+                     evaluate_config_5dim_batch, args.rows, rng)
+    bench_objectives("14D", CognitiveProblem14D(), evaluate_config_14dim,
+                     evaluate_config_14dim_batch, args.rows, rng)
+
+    print(f"\nNSGA-II on CognitiveProblem14D (pop={args.pop}, gens={args.gens}):")
+    start = time.perf_counter()
+    result = minimize(
+        CognitiveProblem14D(),
+        NSGA2(pop_size=args.pop),
+        termination=("n_gen", args.gens),
+        seed=42,
+        verbose=False,
+    )
+    elapsed = time.perf_counter() - start
+    n_evals = result.algorithm.evaluator.n_eval
+    print(f"  {elapsed:.2f}s total, {n_evals} evaluations, {len(result.X)} Pareto solutions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+index_artifact.py - Binary, mmap-friendly container for the compiled skill index
+
+skill-index.json is parsed and compiled into a CompiledTriggerIndex on
+every route-skill.sh call, i.e. on every user prompt. build-skill-index.py
+also writes this artifact next to it (skill-index.bin), holding the
+compiled structures in a form that is read in place through mmap: opening
+it costs a header parse, and only what a prompt touches is decoded.
+
+Layout (little-endian):
+    header    magic "SKIX", format version, source JSON size, mtime_ns and
+              SHA-256, tokenizer digest, section count
+    sections  (tag, offset, length) table, then the section bodies
+
+Section kinds:
+    STRS  interned string table: count, offsets[count + 1], UTF-8 blob
+    blob  raw bytes (e.g. the NUL-joined trigger vocabulary)
+    ints  u32 array
+    postings  id -> [(a, b), ...]: count, offsets[count + 1], u32 pairs
+    keyed  string -> [ids]: count, key string ids, offsets[count + 1],
+           ids, then entry numbers sorted by key (for binary search)
+
+The header ties the artifact to the JSON it was compiled from; readers
+check it with matches_source() and fall back to the JSON when it is stale.
+
+Usage:
+    builder = ArtifactBuilder()
+    builder.add_ints("SKIL", [builder.intern(name) for name in names])
+    builder.write(artifact_path, json_path, tokenizer_digest)
+
+    artifact = IndexArtifact.open(artifact_path)
+    if artifact.matches_source(json_path, tokenizer_digest):
+        names = [artifact.string(i) for i in artifact.ints("SKIL")]
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+MAGIC = b"SKIX"
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<4sHHQQ32s16sI")
+_SECTION = struct.Struct("<4sQQ")
+_U32 = struct.Struct("<I")
+
+
+class ArtifactError(ValueError):
+    """The file is not a readable skill index artifact."""
+
+
+def source_fingerprint(json_path: Union[str, Path]) -> Tuple[int, int, bytes]:
+    """(size, mtime_ns, sha256) of the JSON an artifact is compiled from."""
+    data = Path(json_path).read_bytes()
+    stat = os.stat(json_path)
+    return len(data), stat.st_mtime_ns, hashlib.sha256(data).digest()
+
+
+def _u32_array(values: Sequence[int]) -> bytes:
+    return struct.pack(f"<{len(values)}I", *values)
+
+
+class ArtifactBuilder:
+    """Collects interned strings and sections, then writes the artifact."""
+
+    def __init__(self):
+        self._strings: List[str] = []
+        self._string_ids: Dict[str, int] = {}
+        self._sections: Dict[bytes, bytes] = {}
+
+    def intern(self, value: str) -> int:
+        """Id of value in the string table (added once)."""
+        string_id = self._string_ids.get(value)
+        if string_id is None:
+            string_id = len(self._strings)
+            self._string_ids[value] = string_id
+            self._strings.append(value)
+        return string_id
+
+    def add_blob(self, tag: str, data: bytes) -> None:
+        self._sections[tag.encode("ascii")] = data
+
+    def add_ints(self, tag: str, values: Sequence[int]) -> None:
+        self.add_blob(tag, _u32_array(values))
+
+    def add_postings(self, tag: str, lists: Sequence[Sequence[Tuple[int, int]]]) -> None:
+        """Pair lists indexed by position (e.g. trigger id -> (skill id, position))."""
+        offsets = [0]
+        flat: List[int] = []
+        for pairs in lists:
+            for a, b in pairs:
+                flat.extend((a, b))
+            offsets.append(len(flat) // 2)
+        self.add_blob(tag, _u32_array([len(lists)] + offsets + flat))
+
+    def add_keyed(self, tag: str, items: Iterable[Tuple[str, Sequence[int]]]) -> None:
+        """String-keyed id lists; iteration order is preserved."""
+        items = list(items)
+        keys = [self.intern(key) for key, _ in items]
+        offsets = [0]
+        flat: List[int] = []
+        for _, ids in items:
+            flat.extend(ids)
+            offsets.append(len(flat))
+        order = sorted(range(len(items)), key=lambda i: items[i][0].encode("utf-8"))
+        self.add_blob(tag, _u32_array([len(items)] + keys + offsets + flat + order))
+
+    def write(
+        self,
+        path: Union[str, Path],
+        json_path: Union[str, Path],
+        tokenizer_digest: bytes,
+    ) -> Path:
+        """
+        Write the artifact atomically.
+
+        Args:
+            path: Artifact path
+            json_path: JSON index the artifact was compiled from
+            tokenizer_digest: 16-byte digest of the tokenizer that produced it
+
+        Returns:
+            The artifact path
+        """
+        path = Path(path)
+        encoded = [s.encode("utf-8") for s in self._strings]
+        offsets = [0]
+        for data in encoded:
+            offsets.append(offsets[-1] + len(data))
+        sections = {b"STRS": _u32_array([len(encoded)] + offsets) + b"".join(encoded)}
+        sections.update(self._sections)
+
+        size, mtime_ns, digest = source_fingerprint(json_path)
+        table_end = _HEADER.size + _SECTION.size * len(sections)
+        entries = []
+        body = []
+        offset = table_end
+        for tag, data in sections.items():
+            entries.append(_SECTION.pack(tag, offset, len(data)))
+            body.append(data)
+            offset += len(data)
+            # Keep every section 4-byte aligned
+            padding = -offset % 4
+            body.append(b"\0" * padding)
+            offset += padding
+
+        header = _HEADER.pack(
+            MAGIC, FORMAT_VERSION, 0, size, mtime_ns, digest,
+            tokenizer_digest.ljust(16, b"\0")[:16], len(sections),
+        )
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_bytes(header + b"".join(entries) + b"".join(body))
+        os.replace(tmp_path, path)
+        return path
+
+
+class IndexArtifact:
+    """Read-only view of an artifact through mmap; sections decode on demand."""
+
+    def __init__(self, buffer: Union[bytes, mmap.mmap], path: Optional[Path] = None):
+        self.path = path
+        self._buf = buffer
+        if len(buffer) < _HEADER.size:
+            raise ArtifactError("artifact is truncated")
+        (magic, version, _, self.source_size, self.source_mtime_ns, self.source_sha256,
+         self.tokenizer_digest, count) = _HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise ArtifactError("not a skill index artifact")
+        if version != FORMAT_VERSION:
+            raise ArtifactError(f"unsupported artifact version {version}")
+        if len(buffer) < _HEADER.size + _SECTION.size * count:
+            raise ArtifactError("artifact is truncated")
+
+        self._sections: Dict[str, Tuple[int, int]] = {}
+        for i in range(count):
+            tag, offset, length = _SECTION.unpack_from(buffer, _HEADER.size + _SECTION.size * i)
+            if offset + length > len(buffer):
+                raise ArtifactError(f"section {tag!r} is truncated")
+            self._sections[tag.decode("ascii")] = (offset, length)
+
+        strings = self._section("STRS")
+        self._string_count = _U32.unpack_from(buffer, strings)[0]
+        self._string_offsets = strings + 4
+        self._string_blob = self._string_offsets + 4 * (self._string_count + 1)
+
+    @classmethod
+    def open(cls, path: Union[str, Path]) -> "IndexArtifact":
+        """Map an artifact file (raises OSError or ArtifactError)."""
+        path = Path(path)
+        with open(path, "rb") as f:
+            try:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as e:  # empty file
+                raise ArtifactError(str(e)) from e
+        return cls(buffer, path)
+
+    def matches_source(self, json_path: Union[str, Path], tokenizer_digest: bytes) -> bool:
+        """
+        Whether the artifact was compiled from json_path's current contents.
+
+        Size and mtime are compared first; if only the mtime differs (a
+        checkout or copy), the JSON is hashed.
+        """
+        if self.tokenizer_digest != tokenizer_digest.ljust(16, b"\0")[:16]:
+            return False
+        try:
+            stat = os.stat(json_path)
+        except OSError:
+            return False
+        if stat.st_size != self.source_size:
+            return False
+        if stat.st_mtime_ns == self.source_mtime_ns:
+            return True
+        return source_fingerprint(json_path)[2] == self.source_sha256
+
+    def has_section(self, tag: str) -> bool:
+        return tag in self._sections
+
+    def _span(self, tag: str) -> Tuple[int, int]:
+        try:
+            return self._sections[tag]
+        except KeyError:
+            raise ArtifactError(f"artifact has no {tag} section") from None
+
+    def _section(self, tag: str) -> int:
+        return self._span(tag)[0]
+
+    def _u32(self, offset: int) -> int:
+        return _U32.unpack_from(self._buf, offset)[0]
+
+    def _u32s(self, offset: int, count: int) -> Tuple[int, ...]:
+        return struct.unpack_from(f"<{count}I", self._buf, offset)
+
+    def string_bytes(self, string_id: int) -> bytes:
+        """UTF-8 bytes of an interned string."""
+        start, end = self._u32s(self._string_offsets + 4 * string_id, 2)
+        return self._buf[self._string_blob + start:self._string_blob + end]
+
+    def string(self, string_id: int) -> str:
+        """Interned string by id."""
+        return self.string_bytes(string_id).decode("utf-8")
+
+    def blob(self, tag: str) -> bytes:
+        offset, length = self._span(tag)
+        return self._buf[offset:offset + length]
+
+    def ints(self, tag: str) -> Tuple[int, ...]:
+        offset, length = self._span(tag)
+        return self._u32s(offset, length // 4)
+
+    def postings(self, tag: str) -> "PostingTable":
+        return PostingTable(self, self._section(tag))
+
+    def keyed(self, tag: str) -> "KeyedTable":
+        return KeyedTable(self, self._section(tag))
+
+
+class PostingTable:
+    """Position-indexed pair lists, decoded one list at a time."""
+
+    def __init__(self, artifact: IndexArtifact, offset: int):
+        self._artifact = artifact
+        self._count = artifact._u32(offset)
+        self._offsets = offset + 4
+        self._pairs = self._offsets + 4 * (self._count + 1)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def get(self, index: int, default=()) -> Union[List[Tuple[int, int]], tuple]:
+        if not 0 <= index < self._count:
+            return default
+        start, end = self._artifact._u32s(self._offsets + 4 * index, 2)
+        if start == end:
+            return default
+        flat = self._artifact._u32s(self._pairs + 8 * start, 2 * (end - start))
+        return list(zip(flat[::2], flat[1::2]))
+
+    def __getitem__(self, index: int) -> List[Tuple[int, int]]:
+        pairs = self.get(index, None)
+        if pairs is None:
+            raise KeyError(index)
+        return pairs
+
+
+class KeyedTable(Mapping):
+    """String -> id list mapping read in place (binary search on lookup)."""
+
+    def __init__(self, artifact: IndexArtifact, offset: int):
+        self._artifact = artifact
+        self._count = artifact._u32(offset)
+        self._keys = offset + 4
+        self._offsets = self._keys + 4 * self._count
+        self._ids = self._offsets + 4 * (self._count + 1)
+        self._order = self._ids + 4 * artifact._u32(self._offsets + 4 * self._count)
+
+    def _key_bytes(self, entry: int) -> bytes:
+        return self._artifact.string_bytes(self._artifact._u32(self._keys + 4 * entry))
+
+    def _key(self, entry: int) -> str:
+        return self._key_bytes(entry).decode("utf-8")
+
+    def _values(self, entry: int) -> List[int]:
+        start, end = self._artifact._u32s(self._offsets + 4 * entry, 2)
+        return list(self._artifact._u32s(self._ids + 4 * start, end - start))
+
+    def _find(self, key: str) -> Optional[int]:
+        target = key.encode("utf-8")
+        low, high = 0, self._count
+        while low < high:
+            mid = (low + high) // 2
+            entry = self._artifact._u32(self._order + 4 * mid)
+            probe = self._key_bytes(entry)
+            if probe == target:
+                return entry
+            if probe < target:
+                low = mid + 1
+            else:
+                high = mid
+        return None
+
+    def __getitem__(self, key: str) -> List[int]:
+        entry = self._find(key) if isinstance(key, str) else None
+        if entry is None:
+            raise KeyError(key)
+        return self._values(entry)
+
+    def __contains__(self, key) -> bool:
+        return isinstance(key, str) and self._find(key) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return (self._key(entry) for entry in range(self._count))
+
+    def __len__(self) -> int:
+        return self._count
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+router_client.py - Tiny client the skill-router hook uses to reach router_service.py
+
+skill-router-hook.sh pipes the prompt into
+
+    python -S router_client.py --commands-index <yaml> --skill-index <json>
+
+which forwards it to the resident router (router_service.py) over a Unix
+domain socket and prints the service's answer: exactly what the hook's two
+routing tiers would print, possibly nothing. It imports only the standard
+library (and loopctl.unix_socket, which does too) and waits at most
+SKILL_ROUTER_TIMEOUT seconds; the hook needs no `timeout` command.
+
+Exit status:
+    0  The answer was printed; the hook is done
+    3  No answer (no service, timeout, error); nothing was printed and the
+       hook runs its shell tiers as before
+
+When no service is listening, the client starts one in the background for
+the next prompt and still exits 3 for this one.
+
+Protocol: one JSON request line per connection,
+    {"op": "route", "message": "...", "commands_index": "...", "skill_index": "..."}
+answered by one JSON response line,
+    {"ok": true, "result": {"output": "..."}}  or  {"ok": false, "error": "..."}
+
+Environment:
+    SKILL_ROUTER_SOCKET   Socket path (default: $XDG_RUNTIME_DIR/skill-router.sock,
+                          else <tmpdir>/skill-router-<uid>/skill-router.sock)
+    SKILL_ROUTER_DAEMON   Set to 0 to never use or start the service
+    SKILL_ROUTER_TIMEOUT  Seconds to wait for an answer (default 1.0)
+"""
+
+import argparse
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from loopctl import unix_socket
+
+# Seconds to wait for the service to accept a connection
+CONNECT_TIMEOUT_S = 0.2
+# Seconds to wait for an answer; the hook runs the shell tiers after that
+DEFAULT_TIMEOUT_S = 1.0
+# Seconds an auto-started service stays up without requests
+AUTOSTART_IDLE_TIMEOUT_S = 3600
+
+EXIT_UNAVAILABLE = 3
+
+SERVICE_SCRIPT = Path(__file__).resolve().parent / "router_service.py"
+
+
+class RouterUnavailable(ConnectionError):
+    """The service did not answer; the hook should route without it."""
+
+
+class RouterNotRunning(RouterUnavailable):
+    """No service is listening on the socket (missing, or left by a dead service)."""
+
+
+def default_socket_path() -> Path:
+    """Socket path from SKILL_ROUTER_SOCKET or the per-user default."""
+    return unix_socket.default_socket_path("SKILL_ROUTER_SOCKET", "skill-router")
+
+
+def service_enabled() -> bool:
+    return hasattr(socket, "AF_UNIX") and os.environ.get("SKILL_ROUTER_DAEMON", "1") != "0"
+
+
+def default_timeout() -> float:
+    try:
+        return float(os.environ.get("SKILL_ROUTER_TIMEOUT", DEFAULT_TIMEOUT_S))
+    except ValueError:
+        return DEFAULT_TIMEOUT_S
+
+
+def request(
+    op: str,
+    fields: Optional[Dict[str, Any]] = None,
+    socket_path: Optional[Path] = None,
+    timeout_s: Optional[float] = None,
+) -> Any:
+    """
+    Send one request to the service.
+
+    Args:
+        op: "route", "ping" or "shutdown"
+        fields: Request fields for the operation
+        socket_path: Service socket (default: default_socket_path())
+        timeout_s: Seconds to wait for the answer (default: default_timeout())
+
+    Returns:
+        The operation's result
+
+    Raises:
+        RouterNotRunning: Nothing is listening
+        RouterUnavailable: No answer in time, an untrusted socket, or the service failed
+    """
+    if not service_enabled():
+        raise RouterUnavailable("skill router service disabled")
+    socket_path = Path(socket_path or default_socket_path())
+
+    payload = dict(fields or {})
+    payload["op"] = op
+    timeout_s = default_timeout() if timeout_s is None else timeout_s
+    try:
+        line = unix_socket.send_request(socket_path, payload, CONNECT_TIMEOUT_S, timeout_s)
+    except unix_socket.ServiceNotRunning as e:
+        raise RouterNotRunning(f"No skill router service: {e}") from e
+    except OSError as e:
+        raise RouterUnavailable(f"skill router service not reachable at {socket_path}: {e}") from e
+
+    if not line:
+        raise RouterUnavailable("skill router service closed the connection without an answer")
+    try:
+        response = json.loads(line)
+    except ValueError as e:
+        raise RouterUnavailable(f"skill router service sent an invalid answer: {e}") from e
+    if not response.get("ok"):
+        raise RouterUnavailable(response.get("error", "unknown skill router service error"))
+    return response.get("result")
+
+
+def route(
+    message: str,
+    commands_index: str,
+    skill_index: str,
+    socket_path: Optional[Path] = None,
+    timeout_s: Optional[float] = None,
+) -> str:
+    """The hook output for message (see router_service.SkillRouter.route)."""
+    result = request("route", {
+        "message": message,
+        "commands_index": os.path.abspath(commands_index) if commands_index else "",
+        "skill_index": os.path.abspath(skill_index) if skill_index else "",
+    }, socket_path=socket_path, timeout_s=timeout_s)
+    return result["output"]
+
+
+def start_service(commands_index: str, skill_index: str, socket_path: Optional[Path] = None) -> None:
+    """Start router_service.py in the background, warmed for these indexes."""
+    import subprocess
+
+    command = [
+        sys.executable, str(SERVICE_SCRIPT), "serve",
+        "--idle-timeout", str(AUTOSTART_IDLE_TIMEOUT_S),
+        "--socket", str(socket_path or default_socket_path()),
+    ]
+    if commands_index:
+        command += ["--commands-index", os.path.abspath(commands_index)]
+    if skill_index:
+        command += ["--skill-index", os.path.abspath(skill_index)]
+    subprocess.Popen(
+        command,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+        close_fds=True,
+    )
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Route a prompt (read from stdin) through the skill router service")
+    parser.add_argument("--commands-index", default="", help="COMMANDS_INDEX.yaml (tier 1)")
+    parser.add_argument("--skill-index", default="", help="skill-index.json (tier 2)")
+    parser.add_argument("--socket", type=Path, default=None, help="Service socket path")
+    parser.add_argument("--no-start", action="store_true", help="Do not start a service if none is running")
+    args = parser.parse_args(argv)
+
+    if not service_enabled():
+        return EXIT_UNAVAILABLE
+    socket_path = args.socket or default_socket_path()
+    message = sys.stdin.buffer.read().decode("utf-8", errors="replace")
+    try:
+        output = route(message, args.commands_index, args.skill_index, socket_path=socket_path)
+    except RouterNotRunning:
+        if not args.no_start:
+            try:
+                start_service(args.commands_index, args.skill_index, socket_path)
+            except OSError:
+                pass
+        return EXIT_UNAVAILABLE
+    except RouterUnavailable:
+        return EXIT_UNAVAILABLE
+
+    sys.stdout.write(output)
+    sys.stdout.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
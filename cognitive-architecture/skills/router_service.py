@@ -0,0 +1,409 @@
+#!/usr/bin/env python3
+"""
+router_service.py - Resident skill router for the UserPromptSubmit hook
+
+Without it, skill-router-hook.sh routes every prompt by reading
+COMMANDS_INDEX.yaml line by line, forking one grep per trigger (tier 1),
+then starting route-skill.sh -> a fresh trigger_matcher.py interpreter
+(tier 2). This service keeps both the COMMANDS_INDEX trigger table and a
+SkillTriggerMatcher loaded in one process on a Unix domain socket and
+answers both tiers in a single request from router_client.py.
+
+The answer is the text the hook's shell tiers would print. Both indexes are
+re-read when their (mtime, size) change, checked on every request, so a
+rebuilt skill-index.json/.bin or an edited COMMANDS_INDEX.yaml is picked up
+without a restart. Like the loopctl daemon, the service stops itself when
+its own source files change, handing that request back to the hook.
+
+Usage:
+    python skills/router_service.py serve [--socket PATH] [--idle-timeout S]
+    python skills/router_service.py route "prompt" --commands-index X --skill-index Y
+    python skills/router_service.py status | stop
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Pattern, Tuple
+
+try:
+    from . import index_artifact, router_client, trigger_matcher
+except ImportError:  # run as a script by router_client.py
+    import index_artifact
+    import router_client
+    import trigger_matcher
+
+# router_client put cognitive-architecture/ on sys.path
+from loopctl import unix_socket
+from loopctl.unix_socket import JsonLineServer, Signature, StaleServer, changed_files, file_signature
+
+OPERATIONS = ("route", "ping", "shutdown")
+
+# route-skill.sh runs `trigger_matcher.py "$REQUEST" 0.6 5`
+TIER2_THRESHOLD = 0.6
+TIER2_TOP_K = 5
+
+RULE = "=" * 64
+
+# bash: [[ "$line" =~ trigger:.*\"(.+)\" ]] / [[ "$line" =~ skill:.*\"(.+)\" ]]
+_TRIGGER_LINE = re.compile(r'trigger:.*"(.+)"')
+_SKILL_LINE = re.compile(r'skill:.*"(.+)"')
+
+_BRE_CLASSES = {
+    "alpha": "a-zA-Z", "digit": "0-9", "alnum": "a-zA-Z0-9", "upper": "A-Z",
+    "lower": "a-z", "space": r"\s", "blank": r" \t", "xdigit": "0-9A-Fa-f",
+    "punct": re.escape("!\"#$%&'()*+,-./:;<=>?@[\\]^_`{|}~"),
+}
+
+class StaleService(StaleServer):
+    """A loaded source file changed since the service started."""
+
+
+def bre_to_regex(pattern: str) -> str:
+    """
+    Translate a grep basic regular expression (GNU flavor) to Python re syntax.
+
+    Tier 1 runs `grep -qi "$TRIGGER"`, so triggers are BREs: `.`, `*`,
+    brackets and anchors are operators, `\\(`, `\\|`, `\\+` etc. are GNU
+    extensions, and a bare `+ ? ( ) { } |` is literal.
+
+    Raises:
+        re.error: For bracket expressions this translation does not cover
+    """
+    out: List[str] = []
+    i, n = 0, len(pattern)
+    # Position where `*` is literal and `^` is an anchor (start of an expression)
+    at_start = True
+    while i < n:
+        c = pattern[i]
+        start = at_start
+        at_start = False
+        if c == "\\" and i + 1 < n:
+            nxt = pattern[i + 1]
+            i += 2
+            if nxt in "(|":
+                out.append(nxt)
+                at_start = True
+            elif nxt in "){}+?":
+                out.append(nxt)
+            elif nxt in "<>":
+                out.append(r"\b")
+            elif nxt in "wWsSbB" or nxt.isdigit():
+                out.append("\\" + nxt)
+            else:
+                out.append(re.escape(nxt))
+            continue
+        if c == "[":
+            end, bracket = _bracket_to_regex(pattern, i)
+            out.append(bracket)
+            i = end
+            continue
+        i += 1
+        if c == "*":
+            out.append(r"\*" if start else "*")
+        elif c == "^":
+            out.append("^" if start else r"\^")
+        elif c == "$":
+            at_end = i == n or pattern.startswith(("\\)", "\\|"), i)
+            out.append("$" if at_end else r"\$")
+        elif c == ".":
+            out.append(".")
+        else:
+            out.append(re.escape(c))
+    return "".join(out)
+
+
+def _bracket_to_regex(pattern: str, start: int) -> Tuple[int, str]:
+    """Translate the bracket expression at pattern[start]; returns (end, regex)."""
+    i = start + 1
+    out = ["["]
+    if i < len(pattern) and pattern[i] == "^":
+        out.append("^")
+        i += 1
+    first = True
+    while i < len(pattern):
+        c = pattern[i]
+        if c == "]" and not first:
+            out.append("]")
+            return i + 1, "".join(out)
+        first = False
+        if pattern.startswith("[:", i):
+            close = pattern.find(":]", i + 2)
+            name = pattern[i + 2:close] if close != -1 else None
+            if name not in _BRE_CLASSES:
+                raise re.error(f"unsupported bracket class in {pattern!r}")
+            out.append(_BRE_CLASSES[name])
+            i = close + 2
+            continue
+        # Backslash, `[` and `]` are literal inside a POSIX bracket expression
+        out.append("\\" + c if c in "\\[]^" else c)
+        i += 1
+    raise re.error(f"unterminated bracket expression in {pattern!r}")
+
+
+@dataclass
+class CommandTrigger:
+    """One trigger -> skill mapping from COMMANDS_INDEX.yaml."""
+    trigger: str
+    skill: str
+    regex: Optional[Pattern]
+
+    def matches(self, message: str) -> bool:
+        """Whether `echo "$message" | grep -qi "$trigger"` would succeed."""
+        if self.regex is None:
+            return False  # grep rejects the pattern
+        return any(self.regex.search(line) for line in message.split("\n"))
+
+
+def parse_commands_index(text: str) -> List[CommandTrigger]:
+    """
+    Trigger/skill pairs in the order tier 1 visits them.
+
+    Mirrors the hook's `while read` loop: a `trigger: "..."` line sets the
+    pending trigger, the next `skill: "..."` line pairs with it, and a last
+    line without a trailing newline is never read.
+    """
+    triggers: List[CommandTrigger] = []
+    pending = ""
+    for line in text.split("\n")[:-1]:
+        trigger = _TRIGGER_LINE.search(line)
+        if trigger:
+            pending = trigger.group(1)
+            continue
+        skill = _SKILL_LINE.search(line)
+        if skill and pending:
+            try:
+                regex = re.compile(bre_to_regex(pending), re.IGNORECASE)
+            except re.error:
+                regex = None
+            triggers.append(CommandTrigger(pending, skill.group(1), regex))
+            pending = ""
+    return triggers
+
+
+def format_explicit(match: CommandTrigger) -> str:
+    """Tier 1 output for a COMMANDS_INDEX trigger match."""
+    return (
+        "\n!! CASCADE ROUTER (EXPLICIT) !!\n"
+        f'Trigger: "{match.trigger}" -> Skill: {match.skill}\n'
+        f"Read: skills/packaged/{match.skill.replace(' ', '-')}.skill\n\n"
+    )
+
+
+def format_skill_router(router_output: str) -> str:
+    """Tier 2 output around route-skill.sh's report ("" when it found nothing)."""
+    router_output = router_output.rstrip("\n")
+    if not router_output or "No matching" in router_output:
+        return ""
+    return f"\n!! CASCADE SKILL ROUTER !!\n{RULE}\n{router_output}\n{RULE}\n\n"
+
+
+class SkillRouter:
+    """
+    Both routing tiers over in-memory indexes, reloaded when their files change.
+
+    Usage:
+        router = SkillRouter()
+        output = router.route(prompt, commands_index_path, skill_index_path)
+    """
+
+    def __init__(self):
+        self._commands: Dict[str, Tuple[Signature, List[CommandTrigger]]] = {}
+        self._matchers: Dict[str, Tuple[Tuple[Signature, Signature], trigger_matcher.SkillTriggerMatcher]] = {}
+        self._lock = threading.Lock()
+        self.reloads = 0
+
+    def commands(self, path: str) -> List[CommandTrigger]:
+        """COMMANDS_INDEX triggers ([] if the file does not exist)."""
+        signature = file_signature(Path(path))
+        cached = self._commands.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        if signature is None:
+            triggers = []
+        else:
+            triggers = parse_commands_index(Path(path).read_bytes().decode("utf-8", errors="replace"))
+            self.reloads += 1
+        self._commands[path] = (signature, triggers)
+        return triggers
+
+    def matcher(self, path: str) -> Optional[trigger_matcher.SkillTriggerMatcher]:
+        """Matcher for skill-index.json (None if it does not exist)."""
+        json_path = Path(path)
+        signature = (file_signature(json_path), file_signature(json_path.with_suffix(".bin")))
+        if signature[0] is None:
+            self._matchers.pop(path, None)
+            return None
+        cached = self._matchers.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        matcher = trigger_matcher.SkillTriggerMatcher(str(json_path))
+        self.reloads += 1
+        self._matchers[path] = (signature, matcher)
+        return matcher
+
+    def route(self, message: str, commands_index: str = "", skill_index: str = "") -> str:
+        """
+        What skill-router-hook.sh prints for message after its trivial-prompt check.
+
+        Args:
+            message: The prompt text
+            commands_index: COMMANDS_INDEX.yaml path ("" skips tier 1)
+            skill_index: skill-index.json path ("" skips tier 2)
+
+        Returns:
+            Tier 1 output on an explicit trigger match, else tier 2 output,
+            else ""
+        """
+        with self._lock:
+            if commands_index:
+                for trigger in self.commands(commands_index):
+                    if trigger.matches(message):
+                        return format_explicit(trigger)
+
+            matcher = self.matcher(skill_index) if skill_index else None
+            if matcher is None or not message:
+                return ""
+            matches = matcher.match(message, TIER2_THRESHOLD, TIER2_TOP_K)
+
+        report = trigger_matcher.format_matches(matches) if matches else ""
+        if report and not trigger_matcher.RAPIDFUZZ_AVAILABLE:
+            # trigger_matcher.py prints this on import, so route-skill.sh's output starts with it
+            report = "Warning: rapidfuzz not installed. Using fallback matching.\n" + report
+        return format_skill_router(report)
+
+
+def _source_signatures() -> Dict[str, Signature]:
+    modules = (sys.modules[__name__], index_artifact, router_client, trigger_matcher, unix_socket)
+    paths = {str(Path(module.__file__).resolve()) for module in modules}
+    return {path: file_signature(Path(path)) for path in paths}
+
+
+class SkillRouterService(JsonLineServer):
+    """
+    Unix-socket server answering router_client.py.
+
+    Usage:
+        service = SkillRouterService(socket_path, warm_indexes=(commands_index, skill_index))
+        service.serve_forever()
+    """
+
+    service_name = "skill router service"
+
+    def __init__(
+        self,
+        socket_path: Optional[Path] = None,
+        warm_indexes: Tuple[str, str] = ("", ""),
+        idle_timeout_s: Optional[float] = None,
+    ):
+        """
+        Initialize the service and bind its socket.
+
+        Args:
+            socket_path: Socket to listen on (default: router_client.default_socket_path())
+            warm_indexes: (COMMANDS_INDEX.yaml, skill-index.json) to load up front
+            idle_timeout_s: Stop after this many seconds without a request
+        """
+        self.router = SkillRouter()
+        super().__init__(socket_path or router_client.default_socket_path(), idle_timeout_s)
+
+        commands_index, skill_index = warm_indexes
+        if commands_index:
+            self.router.commands(os.path.abspath(commands_index))
+        if skill_index:
+            self.router.matcher(os.path.abspath(skill_index))
+        self._sources = _source_signatures()
+
+    def dispatch(self, request: Dict[str, Any]) -> Any:
+        """Execute one request."""
+        op = request.get("op")
+        if op not in OPERATIONS:
+            raise ValueError(f"Unknown operation: {op}")
+        if op == "ping":
+            return {
+                "pid": os.getpid(),
+                "socket": str(self.socket_path),
+                "uptime_s": round(time.time() - self.started_at, 3),
+                "requests_served": self.requests_served,
+                "reloads": self.router.reloads,
+            }
+        if op == "shutdown":
+            self.stop()
+            return {"status": "stopping"}
+
+        changed = changed_files(self._sources)
+        if changed:
+            self.stop()
+            raise StaleService(f"skill router source changed ({changed[0]}); restart it")
+
+        self.last_request_at = time.time()
+        self.requests_served += 1
+        output = self.router.route(
+            request.get("message") or "",
+            request.get("commands_index") or "",
+            request.get("skill_index") or "",
+        )
+        return {"output": output}
+
+
+def serve(
+    socket_path: Optional[Path] = None,
+    warm_indexes: Tuple[str, str] = ("", ""),
+    idle_timeout_s: Optional[float] = None,
+) -> None:
+    """Run the service until shutdown, idle timeout or a source change."""
+    service = SkillRouterService(socket_path, warm_indexes, idle_timeout_s)
+    print(f"skill router listening on {service.socket_path} (pid {os.getpid()})", file=sys.stderr)
+    try:
+        service.serve_forever(poll_interval=0.5)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.server_close()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Resident skill router for skill-router-hook.sh")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = subparsers.add_parser("serve", help="Listen on a Unix socket")
+    serve_parser.add_argument("--idle-timeout", type=float, default=None,
+                              help="Stop after this many idle seconds")
+
+    route_parser = subparsers.add_parser("route", help="Route one prompt in-process")
+    route_parser.add_argument("message")
+
+    for sub in (serve_parser, route_parser):
+        sub.add_argument("--commands-index", default="", help="COMMANDS_INDEX.yaml (tier 1)")
+        sub.add_argument("--skill-index", default="", help="skill-index.json (tier 2)")
+    for name, help_text in (("status", "Show whether the service is running"),
+                            ("stop", "Stop a running service")):
+        subparsers.add_parser(name, help=help_text)
+    for sub in subparsers.choices.values():
+        if sub is not route_parser:
+            sub.add_argument("--socket", type=Path, default=None, help="Service socket path")
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        serve(args.socket, (args.commands_index, args.skill_index), args.idle_timeout)
+    elif args.command == "route":
+        sys.stdout.write(SkillRouter().route(args.message, args.commands_index, args.skill_index))
+    else:
+        op = "ping" if args.command == "status" else "shutdown"
+        try:
+            result = router_client.request(op, socket_path=args.socket, timeout_s=10)
+        except router_client.RouterUnavailable as e:
+            print(f"Not running: {e}", file=sys.stderr)
+            return 1
+        print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
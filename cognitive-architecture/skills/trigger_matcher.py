@@ -6,18 +6,29 @@ FIX-1 from REMEDIATION-PLAN.md:
 Problem: 199 skills define TRIGGER_POSITIVE patterns, but matching is only exact/substring.
 Solution: Use rapidfuzz for fuzzy matching with configurable threshold.
 
+The compiled index is loaded from skill-index.bin (written next to
+skill-index.json by build-skill-index.py, see index_artifact.py) when it
+matches the JSON, and compiled from the JSON otherwise.
+
 Usage:
     from trigger_matcher import SkillTriggerMatcher
     matcher = SkillTriggerMatcher()
     matches = matcher.match("help me debug this API error", threshold=0.6)
 """
 
+import hashlib
 import json
 import os
 import re
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+try:
+    from .index_artifact import ArtifactBuilder, ArtifactError, IndexArtifact
+except ImportError:  # run as a script by route-skill.sh
+    from index_artifact import ArtifactBuilder, ArtifactError, IndexArtifact
 
 try:
     from rapidfuzz import fuzz, process
@@ -52,6 +63,300 @@ class SkillMatch:
         }
 
 
+def _weight_match(normalized_score: float) -> float:
+    """Weight a fuzzy trigger match (0-1) by match quality."""
+    if normalized_score >= 0.95:  # Near-exact match
+        return 10.0
+    if normalized_score >= 0.85:  # Strong match
+        return 7.0
+    if normalized_score >= 0.75:  # Good match
+        return 5.0
+    return 3.0  # Acceptable match
+
+
+class CompiledTriggerIndex:
+    """
+    Inverted trigger index compiled once from the skill index.
+
+    Structure:
+    - vocab: every distinct trigger string (positive and negative)
+    - postings: trigger id -> [(skill id, position in skill's list), ...]
+    - desc_postings: description word -> skill ids (descriptions tokenized once)
+    - category_skills: category -> skill ids
+
+    A prompt is scored by fuzzy-matching each token against the distinct
+    trigger vocabulary once (instead of once per skill), then walking the
+    postings of the hits. Skills never reached through a posting list or a
+    scoring category would total zero, so they are never visited. Scores
+    and rankings are identical to the per-skill scan.
+    """
+
+    # Bound on memoized (token, threshold) -> trigger hits entries
+    MAX_CACHED_TOKENS = 4096
+
+    def __init__(self, skills: Dict, tokenize: Callable[[str], List[str]]):
+        self.skill_names: List[str] = list(skills.keys())
+        self.vocab: List[str] = []
+        self._vocab_ids: Dict[str, int] = {}
+        self.postings: Dict[int, List[Tuple[int, int]]] = {}
+        self.negative_postings: Dict[int, List[Tuple[int, int]]] = {}
+        self.desc_postings: Dict[str, List[int]] = {}
+        self.category_skills: Dict[str, List[int]] = {}
+        self.skill_categories: List[str] = []
+        self._hit_cache: Dict[Tuple[str, float], List[Tuple[int, float]]] = {}
+
+        for skill_id, skill_data in enumerate(skills.values()):
+            self._add_postings(self.postings, skill_id, skill_data.get('triggers', []))
+            self._add_postings(
+                self.negative_postings, skill_id, skill_data.get('negativeTriggers', [])
+            )
+            for word in set(tokenize(skill_data.get('description', ''))):
+                self.desc_postings.setdefault(word, []).append(skill_id)
+            category = skill_data.get('category', 'unknown')
+            self.category_skills.setdefault(category, []).append(skill_id)
+            self.skill_categories.append(category)
+
+    def _add_postings(
+        self, postings: Dict[int, List[Tuple[int, int]]], skill_id: int, triggers: List[str]
+    ) -> None:
+        for position, trigger in enumerate(triggers):
+            trigger_id = self._vocab_ids.get(trigger)
+            if trigger_id is None:
+                trigger_id = len(self.vocab)
+                self._vocab_ids[trigger] = trigger_id
+                self.vocab.append(trigger)
+            postings.setdefault(trigger_id, []).append((skill_id, position))
+
+    def _trigger_hits(self, token: str, threshold: float) -> List[Tuple[int, float]]:
+        """Return (trigger id, score) for every vocab trigger the token hits."""
+        key = (token, threshold)
+        hits = self._hit_cache.get(key)
+        if hits is not None:
+            return hits
+
+        if RAPIDFUZZ_AVAILABLE:
+            hits = [
+                (trigger_id, match_score / 100.0)
+                for _, match_score, trigger_id in process.extract(
+                    token, self.vocab, scorer=fuzz.WRatio,
+                    score_cutoff=threshold * 100, limit=None
+                )
+                if match_score / 100.0 >= threshold
+            ]
+        else:
+            # Fallback to exact/substring matching
+            hits = []
+            for trigger_id, trigger in enumerate(self.vocab):
+                if token == trigger:
+                    hits.append((trigger_id, 10.0))
+                elif token in trigger or trigger in token:
+                    hits.append((trigger_id, 5.0))
+
+        if len(self._hit_cache) >= self.MAX_CACHED_TOKENS:
+            self._hit_cache.clear()
+        self._hit_cache[key] = hits
+        return hits
+
+    def _score_triggers(
+        self, tokens: List[str], threshold: float, postings: Dict[int, List[Tuple[int, int]]]
+    ) -> Dict[int, Tuple[float, List[str]]]:
+        """Score every skill reachable through postings; mirrors _fuzzy_match_triggers."""
+        results: Dict[int, Tuple[float, List[str]]] = {}
+
+        for token in tokens:
+            hits = self._trigger_hits(token, threshold)
+
+            if not RAPIDFUZZ_AVAILABLE:
+                # Every (token, trigger) pair counts, including duplicates
+                for trigger_id, weight in hits:
+                    for skill_id, _ in postings.get(trigger_id, ()):
+                        score, matched = results.get(skill_id, (0.0, []))
+                        matched.append(self.vocab[trigger_id])
+                        results[skill_id] = (score + weight, matched)
+                continue
+
+            # Best trigger per skill for this token; ties go to the trigger
+            # listed first, as with process.extractOne over the skill's list
+            best: Dict[int, Tuple[float, int, int]] = {}
+            for trigger_id, match_score in hits:
+                for skill_id, position in postings.get(trigger_id, ()):
+                    current = best.get(skill_id)
+                    if (current is None or match_score > current[0]
+                            or (match_score == current[0] and position < current[1])):
+                        best[skill_id] = (match_score, position, trigger_id)
+
+            for skill_id, (match_score, _, trigger_id) in best.items():
+                score, matched = results.get(skill_id, (0.0, []))
+                matched.append(self.vocab[trigger_id])
+                results[skill_id] = (score + _weight_match(match_score), matched)
+
+        return results
+
+    def score(
+        self, tokens: List[str], threshold: float, category_scores: Dict[str, float]
+    ) -> List[Tuple[str, float, List[str]]]:
+        """
+        Score the prompt tokens against all skills.
+
+        Returns:
+            (skill name, total score, matched triggers) for every skill with a
+            positive score, sorted by score descending (index order on ties)
+        """
+        trigger_scores = self._score_triggers(tokens, threshold, self.postings)
+        negative_scores = self._score_triggers(tokens, threshold, self.negative_postings)
+
+        desc_scores: Dict[int, float] = {}
+        for token in tokens:
+            for skill_id in self.desc_postings.get(token, ()):
+                desc_scores[skill_id] = desc_scores.get(skill_id, 0.0) + 2.0
+
+        candidates = set(trigger_scores) | set(desc_scores)
+        for category, cat_score in category_scores.items():
+            if cat_score > 0:
+                candidates.update(self.category_skills.get(category, ()))
+
+        scored = []
+        for skill_id in sorted(candidates):
+            trigger_score, matched = trigger_scores.get(skill_id, (0.0, []))
+            cat_score = category_scores.get(self.skill_categories[skill_id], 0.0)
+            neg_score = negative_scores.get(skill_id, (0.0, []))[0]
+            desc_score = desc_scores.get(skill_id, 0.0)
+            total_score = trigger_score + cat_score + desc_score - (neg_score * 0.5)
+
+            if total_score > 0:
+                scored.append((self.skill_names[skill_id], total_score, list(set(matched))))
+
+        # Stable sort keeps index order among equal scores
+        scored.sort(key=lambda x: x[1], reverse=True)
+        return scored
+
+
+    def write_artifact(
+        self,
+        artifact_path: Union[str, Path],
+        json_path: Union[str, Path],
+        skills: Dict,
+        keyword_index: Dict[str, List[str]],
+        tokenizer_digest: bytes,
+    ) -> Path:
+        """
+        Serialize this index for MappedTriggerIndex.
+
+        Sections: VOCB (NUL-joined vocab), POST/NEGP (trigger postings),
+        DESC (description word postings), CATS (category skill ids), SKIL
+        (per skill: name, category, compact JSON record), SKID (name ->
+        skill id) and KWIX (the JSON keyword_index, as skill name ids).
+        """
+        builder = ArtifactBuilder()
+        builder.add_blob("VOCB", "\0".join(self.vocab).encode("utf-8"))
+        builder.add_postings("POST", [self.postings.get(i, []) for i in range(len(self.vocab))])
+        builder.add_postings(
+            "NEGP", [self.negative_postings.get(i, []) for i in range(len(self.vocab))]
+        )
+        builder.add_keyed("DESC", self.desc_postings.items())
+        builder.add_keyed("CATS", self.category_skills.items())
+
+        records = []
+        for name, category, data in zip(self.skill_names, self.skill_categories, skills.values()):
+            records.extend((
+                builder.intern(name),
+                builder.intern(category),
+                builder.intern(json.dumps(data, separators=(",", ":"))),
+            ))
+        builder.add_ints("SKIL", records)
+        builder.add_keyed("SKID", ((name, [i]) for i, name in enumerate(self.skill_names)))
+        builder.add_keyed("KWIX", (
+            (keyword, [builder.intern(name) for name in names])
+            for keyword, names in keyword_index.items()
+        ))
+        return builder.write(artifact_path, json_path, tokenizer_digest)
+
+
+class _ArtifactColumn(Sequence):
+    """Per-skill string column of an artifact's SKIL section, decoded on access."""
+
+    def __init__(self, artifact: IndexArtifact, string_ids: Tuple[int, ...]):
+        self._artifact = artifact
+        self._string_ids = string_ids
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._artifact.string(i) for i in self._string_ids[index]]
+        return self._artifact.string(self._string_ids[index])
+
+    def __len__(self) -> int:
+        return len(self._string_ids)
+
+
+class MappedTriggerIndex(CompiledTriggerIndex):
+    """
+    CompiledTriggerIndex read in place from a skill-index.bin artifact.
+
+    Only the trigger vocabulary (needed for every fuzzy match) and the
+    category table are decoded up front; posting lists, description
+    postings and skill names are read from the mapping as a prompt
+    reaches them.
+    """
+
+    def __init__(self, artifact: IndexArtifact):
+        self.artifact = artifact
+        vocab = artifact.blob("VOCB").decode("utf-8")
+        self.vocab: List[str] = vocab.split("\0") if vocab else []
+        self.postings = artifact.postings("POST")
+        self.negative_postings = artifact.postings("NEGP")
+        self.desc_postings = artifact.keyed("DESC")
+        self.category_skills: Dict[str, List[int]] = dict(artifact.keyed("CATS").items())
+        records = artifact.ints("SKIL")
+        self.skill_names = _ArtifactColumn(artifact, records[0::3])
+        self.skill_categories = _ArtifactColumn(artifact, records[1::3])
+        self._records = records[2::3]
+        self._hit_cache: Dict[Tuple[str, float], List[Tuple[int, float]]] = {}
+
+    def skill_record(self, skill_id: int) -> Dict[str, Any]:
+        """The skill's entry from skill-index.json."""
+        return json.loads(self.artifact.string(self._records[skill_id]))
+
+
+class _ArtifactSkills(Mapping):
+    """skill name -> skill dict, decoded from the artifact per lookup."""
+
+    def __init__(self, compiled: MappedTriggerIndex):
+        self._compiled = compiled
+        self._ids = compiled.artifact.keyed("SKID")
+
+    def __getitem__(self, name: str) -> Dict[str, Any]:
+        return self._compiled.skill_record(self._ids[name][0])
+
+    def __contains__(self, name) -> bool:
+        return name in self._ids
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+
+class _ArtifactKeywordIndex(Mapping):
+    """keyword -> skill names, read from the artifact's KWIX section."""
+
+    def __init__(self, artifact: IndexArtifact):
+        self._artifact = artifact
+        self._table = artifact.keyed("KWIX")
+
+    def __getitem__(self, keyword: str) -> List[str]:
+        return [self._artifact.string(i) for i in self._table[keyword]]
+
+    def __contains__(self, keyword) -> bool:
+        return keyword in self._table
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._table)
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+
 class SkillTriggerMatcher:
     """
     Fuzzy matcher for skill triggers using rapidfuzz.
@@ -93,12 +398,23 @@ class SkillTriggerMatcher:
         'tooling': ['documentation', 'docs', 'github', 'pr', 'issue', 'release', 'tool']
     }
 
-    def __init__(self, index_path: Optional[str] = None):
+    # Bump when _tokenize changes, so artifacts built with the old tokenizer
+    # are not used
+    TOKENIZER_VERSION = 1
+
+    def __init__(
+        self,
+        index_path: Optional[str] = None,
+        artifact_path: Optional[str] = None,
+        use_artifact: bool = True,
+    ):
         """
         Initialize the matcher with a skill index.
 
         Args:
             index_path: Path to skill-index.json. If None, uses default location.
+            artifact_path: Precompiled index (default: index_path with a .bin suffix)
+            use_artifact: Load the artifact when it matches the JSON
         """
         if index_path is None:
             # Default to the skill-index.json in scripts directory
@@ -106,23 +422,81 @@ class SkillTriggerMatcher:
             index_path = base_dir / "scripts" / "skill-index" / "skill-index.json"
 
         self.index_path = Path(index_path)
-        self.index: Dict = {}
-        self.skills: Dict = {}
-        self.keyword_index: Dict = {}
-
-        self._load_index()
-
-    def _load_index(self) -> None:
-        """Load the skill index from JSON file."""
+        self.artifact_path = Path(artifact_path) if artifact_path else self.index_path.with_suffix(".bin")
+        self._index: Optional[Dict] = None
+        self.skills: Mapping = {}
+        self.keyword_index: Mapping = {}
+        # "artifact" or "json": where the compiled index came from
+        self.index_source = "json"
+
+        self._load_index(use_artifact)
+
+    @classmethod
+    def tokenizer_digest(cls) -> bytes:
+        """Digest of the tokenizer settings baked into compiled artifacts."""
+        signature = f"{cls.TOKENIZER_VERSION}:{','.join(sorted(cls.STOPWORDS))}"
+        return hashlib.blake2b(signature.encode("utf-8"), digest_size=16).digest()
+
+    @property
+    def index(self) -> Dict:
+        """The full skill-index.json (read on first use when loaded from the artifact)."""
+        if self._index is None:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                self._index = json.load(f)
+        return self._index
+
+    @property
+    def categories(self) -> Dict:
+        return self.index.get('categories', {})
+
+    def _load_index(self, use_artifact: bool = True) -> None:
+        """Load the compiled index from the artifact, else from the JSON file."""
         if not self.index_path.exists():
             raise FileNotFoundError(f"Skill index not found: {self.index_path}")
 
-        with open(self.index_path, 'r', encoding='utf-8') as f:
-            self.index = json.load(f)
+        if use_artifact and self._load_artifact():
+            return
 
         self.skills = self.index.get('skills', {})
         self.keyword_index = self.index.get('keyword_index', {})
-        self.categories = self.index.get('categories', {})
+        self._compiled = CompiledTriggerIndex(self.skills, self._tokenize)
+        self.index_source = "json"
+
+    def _load_artifact(self) -> bool:
+        """Map the artifact if it exists and was compiled from the current JSON."""
+        try:
+            artifact = IndexArtifact.open(self.artifact_path)
+            if not artifact.matches_source(self.index_path, self.tokenizer_digest()):
+                return False  # stale: the JSON was rebuilt without the artifact
+            compiled = MappedTriggerIndex(artifact)
+        except (OSError, ArtifactError, UnicodeDecodeError):
+            return False
+
+        self._compiled = compiled
+        self.skills = _ArtifactSkills(compiled)
+        self.keyword_index = _ArtifactKeywordIndex(artifact)
+        self.index_source = "artifact"
+        return True
+
+    def compile_artifact(self, artifact_path: Optional[str] = None) -> Path:
+        """
+        Write the precompiled artifact for this matcher's JSON index.
+
+        Args:
+            artifact_path: Output path (default: self.artifact_path)
+
+        Returns:
+            Path of the written artifact
+        """
+        skills = self.index.get('skills', {})
+        compiled = CompiledTriggerIndex(skills, self._tokenize)
+        return compiled.write_artifact(
+            artifact_path or self.artifact_path,
+            self.index_path,
+            skills,
+            self.index.get('keyword_index', {}),
+            self.tokenizer_digest(),
+        )
 
     def _tokenize(self, text: str) -> List[str]:
         """Extract meaningful keywords from text."""
@@ -175,16 +549,7 @@ class SkillTriggerMatcher:
                 normalized_score = match_score / 100.0
 
                 if normalized_score >= threshold:
-                    # Weight by match quality
-                    if normalized_score >= 0.95:  # Near-exact match
-                        score += 10.0
-                    elif normalized_score >= 0.85:  # Strong match
-                        score += 7.0
-                    elif normalized_score >= 0.75:  # Good match
-                        score += 5.0
-                    else:  # Acceptable match
-                        score += 3.0
-
+                    score += _weight_match(normalized_score)
                     matched.append(match_trigger)
 
         return score, list(set(matched))
@@ -213,6 +578,10 @@ class SkillTriggerMatcher:
         """
         Match a user prompt against all skills.
 
+        Only skills reachable from the prompt through the compiled index
+        (fuzzy trigger hits, description words, scoring categories) are
+        scored; every other skill would total zero and is never visited.
+
         Args:
             prompt: User's request text
             threshold: Minimum fuzzy match score (0.0-1.0)
@@ -226,49 +595,15 @@ class SkillTriggerMatcher:
         if not tokens:
             return []
 
-        # Score all skills
-        skill_scores: List[Tuple[str, float, List[str], List[str]]] = []
-
-        for skill_name, skill_data in self.skills.items():
-            triggers = skill_data.get('triggers', [])
-            negative_triggers = skill_data.get('negativeTriggers', [])
-            category = skill_data.get('category', 'unknown')
-            description = skill_data.get('description', '')
-
-            # Score trigger matches
-            trigger_score, matched_triggers = self._fuzzy_match_triggers(
-                tokens, triggers, threshold
-            )
-
-            # Score category match
-            cat_score = self._score_category(tokens, category)
-
-            # Score description match
-            desc_words = self._tokenize(description)
-            desc_score = sum(2.0 for t in tokens if t in desc_words)
-
-            # Apply negative trigger penalty
-            neg_score, neg_matched = self._fuzzy_match_triggers(
-                tokens, negative_triggers, threshold
-            )
-
-            # Calculate total score
-            total_score = trigger_score + cat_score + desc_score - (neg_score * 0.5)
-
-            if total_score > 0:
-                skill_scores.append((
-                    skill_name,
-                    total_score,
-                    matched_triggers,
-                    tokens
-                ))
-
-        # Sort by score descending
-        skill_scores.sort(key=lambda x: x[1], reverse=True)
+        category_scores = {
+            category: self._score_category(tokens, category)
+            for category in self._compiled.category_skills
+        }
+        scored = self._compiled.score(tokens, threshold, category_scores)
 
         # Convert to SkillMatch objects
         matches = []
-        for skill_name, score, matched_triggers, matched_keywords in skill_scores[:top_k]:
+        for skill_name, score, matched_triggers in scored[:top_k]:
             skill_data = self.skills[skill_name]
 
             # Normalize confidence to 0-100
@@ -281,7 +616,7 @@ class SkillTriggerMatcher:
                 description=skill_data.get('description', '')[:200],
                 confidence=round(confidence, 1),
                 matched_triggers=matched_triggers,
-                matched_keywords=matched_keywords,
+                matched_keywords=tokens,
                 files=skill_data.get('files', [])
             )
             matches.append(match)
@@ -294,6 +629,20 @@ class SkillTriggerMatcher:
         return json.dumps([m.to_dict() for m in matches], indent=2)
 
 
+def format_matches(matches: List[SkillMatch]) -> str:
+    """The MATCHED_SKILLS report route-skill.sh prints (also served by router_service.py)."""
+    lines = ["MATCHED_SKILLS:", ""]
+    for i, m in enumerate(matches, 1):
+        lines.append(f"{i}. {m.name} ({m.confidence}%)")
+        lines.append(f"   Category: {m.category}")
+        lines.append(f"   Path: {m.path}")
+        lines.append(f"   Description: {m.description[:100]}...")
+        lines.append(f"   Matched triggers: {', '.join(m.matched_triggers) or 'category match'}")
+        lines.append(f"   Files: {', '.join(m.files)}")
+        lines.append("")
+    return "\n".join(lines) + "\n"
+
+
 def main():
     """CLI interface for testing the matcher."""
     import sys
@@ -314,15 +663,7 @@ def main():
             print(f"No matching skills found for: {prompt}")
             sys.exit(0)
 
-        print("MATCHED_SKILLS:\n")
-        for i, m in enumerate(matches, 1):
-            print(f"{i}. {m.name} ({m.confidence}%)")
-            print(f"   Category: {m.category}")
-            print(f"   Path: {m.path}")
-            print(f"   Description: {m.description[:100]}...")
-            print(f"   Matched triggers: {', '.join(m.matched_triggers) or 'category match'}")
-            print(f"   Files: {', '.join(m.files)}")
-            print()
+        print(format_matches(matches), end="")
 
     except FileNotFoundError as e:
         print(f"Error: {e}")
@@ -0,0 +1,172 @@
+"""
+Tests for scripts/build-skill-index.py incremental builds
+
+Tests:
+- read_archive opens each archive once and matches the two-pass readers
+- Cached fragments equal a from-scratch build
+- Only changed archives are reprocessed; touched-but-identical ones are kept
+- Process pool results equal the serial path
+- main() output is unchanged by the cache
+"""
+
+import importlib.util
+import json
+import os
+import sys
+import zipfile
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parent.parent.parent / "scripts" / "build-skill-index.py"
+
+
+@pytest.fixture(scope="module")
+def build():
+    spec = importlib.util.spec_from_file_location("build_skill_index", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    # Registered so pool workers can unpickle process_archive_fragment
+    sys.modules["build_skill_index"] = module
+    spec.loader.exec_module(module)
+    yield module
+    del sys.modules["build_skill_index"]
+
+
+def skill_md(name: str, keywords) -> str:
+    quoted = ", ".join(f'"{k}"' for k in keywords)
+    return (
+        f"---\nname: {name}\ndescription: Handle {name} requests carefully\ncategory: quality\n"
+        f"x-tags: [{name}-tag]\n---\n\n"
+        f"[define|neutral] TRIGGER_POSITIVE := {{\n  keywords: [{quoted}],\n  context: \"{name} work\"\n}}\n\n"
+        "## When to Use\nReview failing pipelines and audit results.\n\n"
+        "## When NOT to Use\nDeploying infrastructure.\n"
+    )
+
+
+def write_archive(path: Path, name: str, keywords, extra=()) -> None:
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr(f"{name}/SKILL.md", skill_md(name, keywords))
+        zf.writestr(f"{name}/README.md", "readme")
+        for member in extra:
+            zf.writestr(f"{name}/{member}", "x")
+
+
+@pytest.fixture
+def packaged(tmp_path):
+    directory = tmp_path / "packaged"
+    directory.mkdir()
+    for i in range(10):
+        write_archive(directory / f"skill-{i}.skill", f"skill-{i}", [f"kw{i}", "shared"],
+                      extra=["examples/one.md"] if i % 2 else ())
+    with zipfile.ZipFile(directory / "empty.skill", "w") as zf:
+        zf.writestr("notes.txt", "no SKILL.md here")
+    (directory / "broken.skill").write_bytes(b"not a zip")
+    return directory
+
+
+def archives(build, directory):
+    return sorted(build.find_packaged_skills(directory))
+
+
+class TestReadArchive:
+    """One ZIP open per archive, same results as the two-pass readers."""
+
+    def test_matches_two_pass_readers(self, build, packaged):
+        for archive in archives(build, packaged):
+            result = build.read_archive(archive)
+            legacy = build.read_skill_md_from_archive(archive)
+            if result is None:
+                assert legacy is None
+                continue
+            assert result[:2] == legacy
+            assert result[2] == build.get_supporting_files_from_archive(archive)
+            assert build.read_archive(archive, archive.read_bytes()) == result
+
+    def test_opens_archive_once(self, build, packaged, monkeypatch):
+        opened = []
+        real = zipfile.ZipFile
+
+        def counting(*args, **kwargs):
+            opened.append(args[0])
+            return real(*args, **kwargs)
+
+        monkeypatch.setattr(build.zipfile, "ZipFile", counting)
+        assert build.process_packaged_skill(packaged / "skill-1.skill") is not None
+        assert len(opened) == 1
+
+
+class TestIncrementalBuild:
+    """Per-archive fragments cached on (path, size, mtime, hash)."""
+
+    def test_fragments_equal_full_processing(self, build, packaged, tmp_path):
+        paths = archives(build, packaged)
+        cache = build.ArchiveCache(tmp_path / "cache.json")
+        first, reprocessed = build.process_archives(paths, cache)
+        assert reprocessed == len(paths)
+        expected = [build.process_packaged_skill(p) for p in paths]
+        assert first == expected
+        cache.save()
+
+        reloaded = build.ArchiveCache.load(tmp_path / "cache.json")
+        second, reprocessed = build.process_archives(paths, reloaded)
+        assert reprocessed == 0
+        assert second == expected
+
+    def test_only_changed_archives_reprocessed(self, build, packaged, tmp_path):
+        paths = archives(build, packaged)
+        cache = build.ArchiveCache(tmp_path / "cache.json")
+        build.process_archives(paths, cache)
+
+        # Same bytes, new mtime: kept after hashing
+        touched = packaged / "skill-2.skill"
+        os.utime(touched, ns=(1, 1))
+        # New content
+        write_archive(packaged / "skill-3.skill", "skill-3", ["renamed"])
+        skills, reprocessed = build.process_archives(paths, cache)
+        assert reprocessed == 1
+        by_name = {s.name: s for s in skills if s}
+        assert by_name["skill-3"].triggers[0] == "renamed"
+        assert cache.entries[str(touched)]["mtime_ns"] == 1
+
+    def test_cached_tags_not_mutated(self, build, packaged, tmp_path):
+        """main() appends "packaged" to tags; the cached fragment must not change."""
+        paths = archives(build, packaged)
+        cache = build.ArchiveCache(tmp_path / "cache.json")
+        build.process_archives(paths, cache)
+        skills, _ = build.process_archives(paths, cache)
+        first = next(i for i, skill in enumerate(skills) if skill)
+        skills[first].tags.append("packaged")
+        again, _ = build.process_archives(paths, cache)
+        assert "packaged" not in again[first].tags
+
+    def test_stale_extractor_invalidates(self, build, tmp_path):
+        path = tmp_path / "cache.json"
+        path.write_text(json.dumps({"version": build.CACHE_VERSION, "extractor": "old", "archives": {"x": {}}}))
+        assert build.ArchiveCache.load(path).entries == {}
+
+    def test_pool_equals_serial(self, build, packaged, tmp_path, monkeypatch):
+        paths = archives(build, packaged)
+        monkeypatch.setattr(build, "PARALLEL_MIN_ARCHIVES", 2)
+        serial, _ = build.process_archives(paths, build.ArchiveCache(None))
+        pooled, _ = build.process_archives(paths, build.ArchiveCache(None), jobs=2)
+        assert pooled == serial
+
+    def test_main_output_unchanged(self, build, packaged, tmp_path, monkeypatch):
+        """Full and incremental runs write the same index."""
+        monkeypatch.setattr(build, "PACKAGED_SKILLS_DIR", packaged)
+        monkeypatch.setattr(build, "SUPPLEMENTARY_SKILLS_DIR", tmp_path / "missing")
+        output = tmp_path / "out" / "skill-index.json"
+
+        def run(*flags):
+            monkeypatch.setattr(sys, "argv", ["build", "--output", str(output), "--no-artifact", *flags])
+            build.main()
+            index = json.loads(output.read_text())
+            del index["generated"]
+            return index
+
+        full = run("--full")
+        write_archive(packaged / "skill-4.skill", "skill-4", ["changed"])
+        incremental = run("--jobs", "1")
+        assert build.default_cache_path(output).exists()
+        assert incremental != full
+        assert run("--full") == incremental
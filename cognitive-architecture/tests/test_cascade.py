@@ -5,6 +5,7 @@ Tests:
 - ThreeMOOCascade phases
 - CascadeResult structure
 - Phase objectives
+- Results saved under storage_dir
 """
 
 import pytest
@@ -182,6 +183,13 @@ class TestThreeMOOCascade:
 
         assert len(callback_invocations) > 0
 
+    def test_results_saved_to_storage_dir(self, tmp_path):
+        """Completed runs are saved under storage_dir."""
+        cascade = ThreeMOOCascade(use_mock=True, storage_dir=tmp_path / "results")
+        cascade.run(max_iterations_per_phase=1)
+        saved = list((tmp_path / "results").glob("cascade-*.json"))
+        assert len(saved) == 1
+
     def test_pareto_points_generated(self):
         """Results should include Pareto points."""
         cascade = ThreeMOOCascade(use_mock=True)
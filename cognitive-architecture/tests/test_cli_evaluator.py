@@ -0,0 +1,153 @@
+"""
+Tests for evals/cli_evaluator.py corpus runner
+
+Tests:
+- Pipelined worker-pool run matches sequential evaluation
+- Per-task checkpoints and resuming an interrupted run
+- Stale checkpoints are discarded
+- Offline stub CLI
+- Result cache: unchanged corpus re-runs without CLI calls, replay mode
+"""
+
+import pytest
+import json
+import sys
+import os
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from evals.cli_evaluator import ClaudeCLI, CLITaskEvaluator, EvalCheckpoint
+from evals.result_cache import CacheMiss, ResultCache
+
+
+STUB_CLI = Path(__file__).parent.parent / "evals" / "stub_cli.py"
+
+
+def make_evaluator(tmp_path, mode="readwrite", command=None):
+    cache = ResultCache(tmp_path / "cache", mode=mode)
+    cli = ClaudeCLI(command or [sys.executable, str(STUB_CLI)])
+    return CLITaskEvaluator("prompt-architect", cli=cli, cache=cache)
+
+
+@pytest.fixture
+def evaluator(tmp_path, monkeypatch):
+    monkeypatch.setattr(CLITaskEvaluator, "RESULTS_DIR", tmp_path)
+    monkeypatch.setenv("STUB_CLI_LOG", str(tmp_path / "calls.jsonl"))
+    return make_evaluator(tmp_path, mode="off")
+
+
+def call_kinds(tmp_path):
+    log = tmp_path / "calls.jsonl"
+    if not log.exists():
+        return []
+    return [json.loads(line)["kind"] for line in log.read_text().splitlines()]
+
+
+class TestStubCLI:
+    """Tests for the offline CLI stand-in."""
+
+    def test_available_and_responds(self):
+        """The stub should pass the version check and answer prompts."""
+        cli = ClaudeCLI([sys.executable, str(STUB_CLI)])
+        assert cli.is_available
+        response = cli.send_message("<input>\nhello\n</input>")["response"]
+        assert response == "Optimized prompt for: hello"
+
+    def test_command_from_environment(self, monkeypatch):
+        """CLAUDE_CLI should override the default command."""
+        monkeypatch.setenv("CLAUDE_CLI", f"{sys.executable} {STUB_CLI}")
+        assert ClaudeCLI().command == [sys.executable, str(STUB_CLI)]
+
+
+class TestCorpusRunner:
+    """Tests for the parallel, resumable run_evaluation."""
+
+    def test_parallel_matches_sequential(self, evaluator):
+        """Concurrent runs should produce the same results in corpus order."""
+        tasks = evaluator.corpus["tasks"][:6]
+        sequential = [evaluator.evaluate_task(t) for t in tasks]
+        result = evaluator.run_evaluation(max_tasks=6, concurrency=3)
+
+        assert [r.task_id for r in result.task_results] == [t["id"] for t in tasks]
+        for got, expected in zip(result.task_results, sequential):
+            assert (got.passed, got.output_quality, got.skill_output) == \
+                (expected.passed, expected.output_quality, expected.skill_output)
+        assert result.concurrency == 3
+        assert result.tasks_per_minute > 0
+        assert not evaluator.checkpoint_path().exists()
+
+    def test_resume_skips_finished_stages(self, evaluator, tmp_path):
+        """Judged tasks are reused and executed tasks are only re-judged."""
+        tasks = evaluator.corpus["tasks"][:5]
+        checkpoint = EvalCheckpoint(evaluator.checkpoint_path(), evaluator._fingerprint())
+        for task in tasks[:2]:
+            checkpoint.record_result(evaluator.evaluate_task(task))
+        output, execute_ms = evaluator._execute_stage(tasks[2])
+        checkpoint.record_execution(tasks[2]["id"], output, execute_ms)
+        with open(checkpoint.path, "a") as f:
+            f.write('{"stage": "judge", "task_id"')  # torn write from the interruption
+        (tmp_path / "calls.jsonl").unlink()
+
+        result = evaluator.run_evaluation(max_tasks=5, concurrency=2, resume=True)
+
+        kinds = call_kinds(tmp_path)
+        assert kinds.count("execute") == 2
+        assert kinds.count("judge") == 3
+        assert result.resumed_tasks == 2
+        assert [r.task_id for r in result.task_results] == [t["id"] for t in tasks]
+
+    def test_without_resume_starts_fresh(self, evaluator, tmp_path):
+        """resume=False should ignore an existing checkpoint."""
+        checkpoint = EvalCheckpoint(evaluator.checkpoint_path(), evaluator._fingerprint())
+        checkpoint.record_result(evaluator.evaluate_task(evaluator.corpus["tasks"][0]))
+        (tmp_path / "calls.jsonl").unlink()
+
+        result = evaluator.run_evaluation(max_tasks=2, concurrency=2)
+        assert result.resumed_tasks == 0
+        assert call_kinds(tmp_path).count("execute") == 2
+
+    def test_stale_checkpoint_discarded(self, evaluator, tmp_path):
+        """A checkpoint from different run inputs should not be resumed."""
+        checkpoint = EvalCheckpoint(evaluator.checkpoint_path(), "other-skill-version")
+        checkpoint.record_result(evaluator.evaluate_task(evaluator.corpus["tasks"][0]))
+
+        reopened = EvalCheckpoint(evaluator.checkpoint_path(), evaluator._fingerprint())
+        assert reopened.judged == {}
+        first_line = evaluator.checkpoint_path().read_text().splitlines()[0]
+        assert json.loads(first_line)["fingerprint"] == evaluator._fingerprint()
+
+
+class TestResultCaching:
+    """Tests for the evaluator's use of the shared result cache."""
+
+    @pytest.fixture
+    def cached_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(CLITaskEvaluator, "RESULTS_DIR", tmp_path)
+        monkeypatch.setenv("STUB_CLI_LOG", str(tmp_path / "calls.jsonl"))
+        return tmp_path
+
+    def test_unchanged_corpus_makes_no_calls(self, cached_dir):
+        """A second run over the same corpus should be served from the cache."""
+        first = make_evaluator(cached_dir).run_evaluation(max_tasks=4, concurrency=2)
+        assert call_kinds(cached_dir).count("execute") == 4
+        (cached_dir / "calls.jsonl").unlink()
+
+        second = make_evaluator(cached_dir).run_evaluation(max_tasks=4, concurrency=2)
+        assert call_kinds(cached_dir) == []
+        assert second.cache_stats["hits"] == 8
+        assert second.cache_stats["hit_rate"] == 1.0
+        assert [r.output_quality for r in second.task_results] == \
+            [r.output_quality for r in first.task_results]
+
+    def test_replay_needs_no_cli(self, cached_dir):
+        """Replay should grade from the cache even if the CLI is missing."""
+        first = make_evaluator(cached_dir).run_evaluation(max_tasks=2, concurrency=1)
+        missing_cli = [str(cached_dir / "no-such-cli")]
+
+        replay = make_evaluator(cached_dir, mode="replay", command=missing_cli)
+        result = replay.run_evaluation(max_tasks=2, concurrency=1)
+        assert [r.passed for r in result.task_results] == [r.passed for r in first.task_results]
+
+        with pytest.raises(CacheMiss):
+            replay.run_evaluation(max_tasks=3, concurrency=1)
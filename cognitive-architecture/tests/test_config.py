@@ -8,8 +8,12 @@ Tests:
 - VectorCodec encode/decode roundtrip
 - VectorCodec cluster_key generation
 - VectorCodec distance and interpolation
+- VectorCodec batch APIs match per-vector decode/cluster_key
 """
 
+import random
+
+import numpy as np
 import pytest
 from core.config import (
     FrameworkConfig,
@@ -235,6 +239,82 @@ class TestVectorCodec:
         assert all(v == 0.5 for v in result)
 
 
+class TestVectorCodecBatch:
+    """Tests for the vectorized VectorCodec APIs."""
+
+    @staticmethod
+    def random_vectors(n=3000, seed=11):
+        rng = random.Random(seed)
+        values = [0.0, 0.5, 0.4999, 1.0, 1.5, 2.5, -0.5, 3.0]
+        return np.array([
+            [rng.choice(values) if rng.random() < 0.7 else rng.uniform(-1, 3) for _ in range(14)]
+            for _ in range(n)
+        ])
+
+    def test_batch_matches_per_vector(self):
+        vectors = self.random_vectors()
+        configs = VectorCodec.decode_batch(vectors)
+        keys = VectorCodec.cluster_keys(vectors)
+        columns = VectorCodec.decode_columns(vectors)
+        for i, vector in enumerate(vectors.tolist()):
+            expected = VectorCodec.decode(vector)
+            assert configs[i] == expected
+            assert VectorCodec.decode_code(VectorCodec.config_code(vector)) == expected
+            assert keys[i] == VectorCodec.cluster_key(expected)
+            assert columns["verix_strictness"][i] == expected.prompt.verix_strictness.value
+            assert columns["compression_level"][i] == expected.prompt.compression_level.value
+            assert columns["require_ground"][i] == expected.prompt.require_ground
+            assert list(VectorCodec.frame_masks(vectors)[i]) == [
+                getattr(expected.framework, name) for name in VectorCodec.FRAME_NAMES
+            ]
+
+    def test_scalar_codes_match_batch(self):
+        vectors = self.random_vectors(500)
+        assert VectorCodec.config_codes(vectors).tolist() == [VectorCodec.config_code(v) for v in vectors]
+        assert VectorCodec.cluster_codes(vectors).tolist() == [VectorCodec.cluster_code(v) for v in vectors]
+
+    def test_round_half_to_even(self):
+        """Enum columns round like round(): 0.5 -> 0, 1.5 -> 2."""
+        vectors = np.zeros((2, 14))
+        vectors[:, 7] = [0.5, 1.5]
+        assert VectorCodec.decode_columns(vectors)["verix_strictness"].tolist() == [0, 2]
+
+    def test_decoded_configs_not_shared(self):
+        """Mutating a decoded config must not leak into later decodes or keys."""
+        vectors = np.array([VectorCodec.encode(DEFAULT_CONFIG)] * 3)
+        vectors[1, 11] = 0.7  # reserved dimension: same config
+        configs = VectorCodec.decode_batch(vectors)
+        assert configs[0] is not configs[1]
+        key = VectorCodec.cluster_keys(vectors)[0]
+        configs[0].framework.spatial = not configs[0].framework.spatial
+        configs[0].prompt.verix_strictness = VerixStrictness.STRICT
+        assert configs[1] == VectorCodec.decode(vectors[1].tolist())
+        assert VectorCodec.decode_batch(vectors)[0] == VectorCodec.decode(vectors[0].tolist())
+        assert VectorCodec.cluster_keys(vectors)[0] == key
+
+    def test_cluster_key_for_every_code(self):
+        for code in range(VectorCodec.N_CLUSTER_CODES):
+            bits, enums = divmod(code, 9)
+            vector = [float(bits >> i & 1) for i in range(7)] + [float(enums // 3), float(enums % 3)] + [0.0] * 5
+            assert VectorCodec.cluster_code(vector) == code
+            assert VectorCodec.cluster_key_for_code(code) == VectorCodec.cluster_key(VectorCodec.decode(vector))
+
+    def test_encode_batch(self):
+        configs = [DEFAULT_CONFIG, MINIMAL_CONFIG, STRICT_CONFIG]
+        matrix = VectorCodec.encode_batch(configs)
+        assert matrix.shape == (3, 14)
+        assert matrix.tolist() == [VectorCodec.encode(c) for c in configs]
+        assert VectorCodec.encode_batch([]).shape == (0, 14)
+
+    def test_invalid_batches_raise(self):
+        with pytest.raises(ValueError, match="shape"):
+            VectorCodec.cluster_keys(np.zeros((2, 13)))
+        vectors = np.zeros((1, 14))
+        vectors[0, 8] = np.nan
+        with pytest.raises(ValueError, match="finite"):
+            VectorCodec.decode_batch(vectors)
+
+
 class TestPresetConfigs:
     """Tests for preset configuration objects."""
 
@@ -0,0 +1,172 @@
+"""
+Tests for integration/connascence_bridge.py direct-mode caching
+
+Tests:
+- Cached per-file analysis matches analyzing every file
+- Only changed files are re-analyzed (in-process and from disk)
+- Policy is part of the cache key
+- Identical content at another path is analyzed for that path
+- Process pool for cache misses
+"""
+
+import pytest
+import os
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from integration.connascence_bridge import ConnascenceBridge, _is_critical_violation
+
+
+CALL_LOG_ENV = "FAKE_ANALYZER_LOG"
+
+
+@dataclass
+class FakeViolation:
+    severity: str
+    line: int
+
+
+class FakeAnalyzer:
+    """One violation per TODO/FIXME line; FIXME is high severity."""
+
+    def analyze_file(self, file_path):
+        log = os.environ.get(CALL_LOG_ENV)
+        if log:
+            with open(log, "a", encoding="utf-8") as f:
+                f.write(f"{Path(file_path).name}\n")
+        violations = []
+        for number, line in enumerate(Path(file_path).read_text(errors="ignore").splitlines()):
+            if "FIXME" in line:
+                violations.append(FakeViolation("high", number))
+            elif "TODO" in line:
+                violations.append({"severity": "low", "line": number, "file": str(file_path)})
+        return violations
+
+
+def reference_metrics(bridge, path):
+    """The uncached analysis: analyze and count lines for every file."""
+    analyzer = FakeAnalyzer()
+    files = [f for f in Path(path).rglob("*.py") if f.is_file()] if path.is_dir() else [path]
+    violations, total_lines = [], 0
+    for file_path in files:
+        violations.extend(analyzer.analyze_file(file_path))
+        total_lines += len(file_path.read_text(errors="ignore").splitlines())
+    count = len(violations)
+    critical = sum(1 for v in violations if _is_critical_violation(v))
+    dpmo = count / max(total_lines * 10, 1) * 1_000_000
+    return {
+        "dpmo": dpmo,
+        "sigma_level": bridge._dpmo_to_sigma(dpmo),
+        "violations_count": count,
+        "critical_violations": critical,
+        "nasa_compliance": max(0.0, 1.0 - critical * 0.1),
+        "theater_risk": min(0.5, count / max(total_lines, 1)),
+    }
+
+
+def metrics(result):
+    return {k: getattr(result, k) for k in [
+        "dpmo", "sigma_level", "violations_count", "critical_violations",
+        "nasa_compliance", "theater_risk",
+    ]}
+
+
+def calls(tmp_path):
+    log = tmp_path / "calls.log"
+    return log.read_text().splitlines() if log.exists() else []
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.setenv(CALL_LOG_ENV, str(tmp_path / "calls.log"))
+    src = tmp_path / "src"
+    (src / "pkg").mkdir(parents=True)
+    for i in range(6):
+        body = "\n".join(
+            f"x{j} = {j}  # TODO" if j % 3 == 0 else (f"y = 1  # FIXME" if j % 5 == 0 else "pass")
+            for j in range(10 + i)
+        )
+        (src / "pkg" / f"mod{i}.py").write_text(body)
+    (src / "crlf.py").write_bytes(b"a = 1\r\n# TODO\r\n\xff\xfe b = 2\r\n")
+    return src
+
+
+def make_bridge(tmp_path, max_workers=1):
+    bridge = ConnascenceBridge(cache_dir=tmp_path / "cache", max_workers=max_workers)
+    bridge._mode = "direct"
+    bridge._analyzer = FakeAnalyzer
+    return bridge
+
+
+class TestConnascenceCache:
+    """Tests for the per-file analysis cache."""
+
+    def test_matches_uncached_analysis(self, tmp_path, project):
+        """Aggregated metrics should equal analyzing every file."""
+        bridge = make_bridge(tmp_path)
+        result = bridge.analyze_directory(project)
+        assert result.success
+        assert metrics(result) == reference_metrics(bridge, project)
+        assert all(isinstance(v, dict) for v in result.raw_output["violations"])
+
+        cached = bridge.analyze_directory(project)
+        assert metrics(cached) == metrics(result)
+        assert cached.raw_output == result.raw_output
+
+    def test_only_changed_files_reanalyzed(self, tmp_path, project):
+        """Unchanged files should come from the cache."""
+        bridge = make_bridge(tmp_path)
+        bridge.analyze_directory(project)
+        assert len(calls(tmp_path)) == 7
+
+        (project / "pkg" / "mod2.py").write_text("# FIXME\n# FIXME\n")
+        result = bridge.analyze_directory(project)
+        assert calls(tmp_path)[7:] == ["mod2.py"]
+        assert metrics(result) == reference_metrics(bridge, project)
+        assert bridge.cache_stats()["hits"] == 6
+
+    def test_cache_persists_across_bridges(self, tmp_path, project):
+        """A new bridge should reuse results stored on disk."""
+        make_bridge(tmp_path).analyze_directory(project)
+        before = len(calls(tmp_path))
+        bridge = make_bridge(tmp_path)
+        bridge.analyze_directory(project)
+        assert len(calls(tmp_path)) == before
+        assert bridge.cache_stats()["misses"] == 0
+
+    def test_policy_is_part_of_key(self, tmp_path, project):
+        """A different policy should not reuse cached results."""
+        bridge = make_bridge(tmp_path)
+        bridge.analyze_file(project / "crlf.py", policy="standard")
+        bridge.analyze_file(project / "crlf.py", policy="strict")
+        assert calls(tmp_path) == ["crlf.py", "crlf.py"]
+
+    def test_path_is_part_of_key(self, tmp_path, project):
+        """A copy of a cached file should report violations under its own path."""
+        bridge = make_bridge(tmp_path)
+        original = project / "pkg" / "mod0.py"
+        copy = project / "copy.py"
+        copy.write_bytes(original.read_bytes())
+
+        bridge.analyze_file(original)
+        result = bridge.analyze_file(copy)
+        assert calls(tmp_path) == ["mod0.py", "copy.py"]
+        files = {v["file"] for v in result.raw_output["violations"] if isinstance(v, dict) and "file" in v}
+        assert files == {str(copy)}
+
+        fresh = make_bridge(tmp_path).analyze_file(copy)
+        assert fresh.raw_output == result.raw_output
+        assert len(calls(tmp_path)) == 2
+
+    def test_process_pool_for_misses(self, tmp_path, project):
+        """Misses analyzed in worker processes should give the same metrics."""
+        bridge = make_bridge(tmp_path, max_workers=2)
+        try:
+            result = bridge.analyze_directory(project)
+        finally:
+            bridge.close()
+        assert len(calls(tmp_path)) == 7
+        assert metrics(result) == reference_metrics(bridge, project)
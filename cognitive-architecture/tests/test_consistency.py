@@ -6,9 +6,11 @@ Tests:
 - ConsistencyResult structure
 - check_epistemic_consistency function
 - compute_coherence_score function
+- ClaimSetIndex candidate pairs and contradiction checks
 """
 
 import pytest
+import random
 import sys
 import os
 
@@ -19,6 +21,7 @@ from eval.consistency import (
     ConsistencyViolation,
     ConsistencyResult,
     ConsistencyChecker,
+    ClaimSetIndex,
     check_epistemic_consistency,
     compute_coherence_score,
 )
@@ -293,3 +296,90 @@ class TestComputeCoherenceScore:
         """Empty claims should return 0.5 (neutral)."""
         score = compute_coherence_score([])
         assert score == 0.5
+
+
+WORDS = [
+    "the", "cache", "is", "not", "don't", "isn't", "true", "false", "correct",
+    "incorrect", "right", "wrong", "no", "yes", "never", "always", "piano",
+    "falsehood", "server", "ready", "NOT", "True", "x", "y",
+]
+
+
+def random_claim(rng):
+    content = "".join(
+        rng.choice(WORDS) + rng.choice([" ", "  ", "\t", ""])
+        for _ in range(rng.randint(0, 9))
+    )
+    return VerixClaim(
+        illocution=Illocution.ASSERT,
+        affect=Affect.NEUTRAL,
+        content=content,
+        ground="source document",
+        confidence=rng.choice([0.3, 0.6, 0.9]),
+        state=rng.choice(list(State)),
+        raw_text=content,
+    )
+
+
+def pairwise_contradictions(checker, claims):
+    """Reference: the all-pairs loop over _claims_contradict."""
+    violations = []
+    for i, claim1 in enumerate(claims):
+        for j in range(i + 1, len(claims)):
+            claim2 = claims[j]
+            combined = claim1.confidence + claim2.confidence
+            if checker._claims_contradict(claim1, claim2) and combined > 1.0:
+                violations.append((i, j, round(combined, 6)))
+    return violations
+
+
+class TestClaimSetIndex:
+    """Indexed contradiction detection must equal the pairwise check."""
+
+    def test_random_claims_match_pairwise(self):
+        """Violations should be identical to comparing every pair."""
+        rng = random.Random(11)
+        checker = ConsistencyChecker()
+        for _ in range(300):
+            claims = [random_claim(rng) for _ in range(rng.randint(0, 20))]
+            found = [
+                (v.claim_indices[0], v.claim_indices[1], round(claims[v.claim_indices[0]].confidence
+                 + claims[v.claim_indices[1]].confidence, 6))
+                for v in checker._check_confidence_contradictions(claims)
+            ]
+            assert found == pairwise_contradictions(checker, claims)
+
+    def test_candidates_cover_contradictions(self):
+        """Every contradicting pair must be a candidate; contradicts() must agree."""
+        rng = random.Random(12)
+        checker = ConsistencyChecker()
+        claims = [random_claim(rng) for _ in range(60)]
+        index = ClaimSetIndex(claims)
+        candidates = set(index.candidate_pairs())
+        for i in range(len(claims)):
+            for j in range(i + 1, len(claims)):
+                expected = checker._claims_contradict(claims[i], claims[j])
+                assert index.contradicts(i, j) == expected
+                if expected:
+                    assert (i, j) in candidates
+
+    def test_substring_removal_merges_words(self):
+        """Removing "n't " joins words, exactly as the string replace does."""
+        claims = [
+            VerixClaim(Illocution.ASSERT, Affect.NEUTRAL, "The cache don't expire", "g", 0.9,
+                       State.CONFIRMED, ""),
+            VerixClaim(Illocution.ASSERT, Affect.NEUTRAL, "The cache do expire", "g", 0.9,
+                       State.CONFIRMED, ""),
+        ]
+        index = ClaimSetIndex(claims)
+        assert index.negated[0][1] == {"the", "cache", "doexpire"}
+        assert index.contradicts(0, 1) == ConsistencyChecker()._claims_contradict(*claims)
+
+    def test_dissimilar_claims_not_candidates(self):
+        """Claims with disjoint vocabularies should not be compared."""
+        claims = [
+            VerixClaim(Illocution.ASSERT, Affect.NEUTRAL, f"alpha{i} beta{i} gamma{i}", "g", 0.9,
+                       State.CONFIRMED, "")
+            for i in range(50)
+        ]
+        assert ClaimSetIndex(claims).candidate_pairs() == []
@@ -8,10 +8,14 @@ Tests:
 - EvolutionProposal generation
 """
 
+import gc
 import pytest
+import random
 import tempfile
+import time
 import sys
 import os
+import weakref
 from pathlib import Path
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -163,6 +167,94 @@ class TestClusterCache:
             stats = cache.stats()
             assert stats["cached_count"] == 1
 
+    def test_lazy_load_from_disk(self):
+        """A new cache should load entries on first access, not at startup."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = ClusterCache(cache_dir=Path(tmpdir))
+            for i in range(3):
+                cache.put(CompiledPrompt(f"cluster-{i}", "System", "User", []))
+            assert cache.flush() == 3
+
+            reopened = ClusterCache(cache_dir=Path(tmpdir))
+            assert reopened.stats()["cached_count"] == 0
+            assert reopened.get("cluster-1").system_prompt == "System"
+            stats = reopened.stats()
+            assert stats["cached_count"] == 1
+            assert stats["disk_loads"] == 1
+            assert sorted(reopened.list_clusters()) == ["cluster-0", "cluster-1", "cluster-2"]
+
+    def test_writes_batched(self):
+        """put() should queue writes until flush_every entries."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = ClusterCache(cache_dir=Path(tmpdir), flush_every=2)
+            cache.put(CompiledPrompt("a", "", "", []))
+            assert list(Path(tmpdir).glob("*.json")) == []
+            cache.put(CompiledPrompt("b", "", "", []))
+            assert len(list(Path(tmpdir).glob("*.json"))) == 2
+            assert cache.stats()["pending_writes"] == 0
+
+    def test_queued_writes_survive_collection(self):
+        """Entries queued below flush_every are written when the cache is dropped."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = ClusterCache(cache_dir=Path(tmpdir))
+            for i in range(3):
+                cache.put(CompiledPrompt(f"cluster-{i}", "System", "User", []))
+            assert list(Path(tmpdir).glob("*.json")) == []
+            ref = weakref.ref(cache)
+            del cache
+            gc.collect()
+            assert ref() is None  # the finalizer does not keep the cache alive
+
+            reopened = ClusterCache(cache_dir=Path(tmpdir))
+            assert sorted(reopened.list_clusters()) == ["cluster-0", "cluster-1", "cluster-2"]
+            assert reopened.get("cluster-2").user_template == "User"
+
+    def test_close_writes_queue(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = ClusterCache(cache_dir=Path(tmpdir))
+            cache.put(CompiledPrompt("a", "", "", []))
+            assert cache.close() == 1
+            assert len(list(Path(tmpdir).glob("*.json"))) == 1
+
+    def test_lru_eviction_by_entries(self):
+        """Least recently used entries should be evicted past max_entries."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = ClusterCache(cache_dir=Path(tmpdir), max_entries=2)
+            cache.put(CompiledPrompt("a", "", "", []))
+            cache.put(CompiledPrompt("b", "", "", []))
+            cache.get("a")
+            cache.put(CompiledPrompt("c", "", "", []))
+
+            assert list(cache._cache) == ["a", "c"]
+            assert cache.stats()["evictions"] == 1
+            # Evicted entries reload from the write queue / disk
+            assert cache.get("b") is not None
+
+    def test_lru_eviction_by_bytes(self):
+        """Entries should be evicted to stay under max_bytes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = ClusterCache(cache_dir=Path(tmpdir), max_bytes=100)
+            for i in range(3):
+                cache.put(CompiledPrompt(f"k{i}", "x" * 40, "", []))
+            stats = cache.stats()
+            assert stats["cached_count"] == 2
+            assert stats["cached_bytes"] == 80
+
+    def test_hit_miss_stats_and_expiry(self):
+        """Expired entries count as misses and are removed from disk."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = ClusterCache(cache_dir=Path(tmpdir), max_age_seconds=60)
+            cache.put(CompiledPrompt("fresh", "", "", []))
+            cache.put(CompiledPrompt("stale", "", "", [], compiled_at=time.time() - 120))
+            cache.flush()
+
+            assert cache.get("fresh") is not None
+            assert cache.get("stale") is None
+            assert cache.get("missing") is None
+            stats = cache.stats()
+            assert (stats["hits"], stats["misses"]) == (1, 2)
+            assert not cache._cache_file("stale").exists()
+
 
 class TestDSPyLevel2Optimizer:
     """Tests for DSPyLevel2Optimizer."""
@@ -218,6 +310,22 @@ class TestDSPyLevel2Optimizer:
             assert stats["hit_rate"] > 0
 
 
+    def test_warm_cache_leaves_decoding_unchanged(self):
+        """Compiling (which applies mode selection) must not alter decoded configs."""
+        vector = [1.0] + [0.0] * 13
+        code = VectorCodec.cluster_code(vector)
+        key = VectorCodec.cluster_key_for_code(code)
+        assert key == "frames:evidential|strict:0|compress:0"
+        with tempfile.TemporaryDirectory() as tmpdir:
+            optimizer = DSPyLevel2Optimizer(cache_dir=Path(tmpdir))
+            assert optimizer.warm_cache([vector]) == 1
+            optimizer.cache.close()
+
+        assert VectorCodec.decode_batch([vector])[0] == VectorCodec.decode(vector)
+        assert VectorCodec.cluster_key_for_code(code) == key
+        assert VectorCodec.cluster_keys([vector]) == [key]
+
+
 class TestTelemetryAggregator:
     """Tests for TelemetryAggregator."""
 
@@ -272,6 +380,103 @@ class TestTelemetryAggregator:
             count = agg2.load("test.jsonl")
             assert count == 1
 
+    def test_aggregates_match_batch_averages(self):
+        """Running aggregates should equal averaging over all points."""
+        rng = random.Random(7)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            agg = TelemetryAggregator(storage_dir=Path(tmpdir))
+            for i in range(600):  # enough to grow the columnar arrays
+                vector = [rng.choice([0.0, 1.0]) for _ in range(7)]
+                vector += [rng.uniform(0, 2) for _ in range(7)]
+                outcomes = {"accuracy": rng.random()}
+                if i % 3:
+                    outcomes["efficiency"] = rng.random()
+                agg.record_outcome(vector, outcomes, rng.choice(["a", "b"]))
+
+            points = agg.get_points()
+            assert len(points) == len(agg) == 600
+
+            clusters = {}
+            for p in points:
+                key = VectorCodec.cluster_key(VectorCodec.decode(p.config_vector))
+                clusters.setdefault(key, []).append(p.outcomes)
+            expected = {
+                key: {k: sum(o.get(k, 0.0) for o in outs) / len(outs) for k in outs[0]}
+                for key, outs in clusters.items()
+            }
+            assert agg.aggregate_by_cluster() == expected
+
+            frames = ["evidential", "aspectual", "morphological",
+                      "compositional", "honorific", "classifier", "spatial"]
+            by_frame = agg.aggregate_by_frame()
+            for i, frame in enumerate(frames):
+                outs = [p.outcomes for p in points if p.config_vector[i] > 0.5]
+                assert by_frame[frame] == {
+                    k: sum(o.get(k, 0.0) for o in outs) / len(outs) for k in outs[0]
+                }
+
+    def test_record_many_matches_record(self):
+        """Batch-indexed points give the same rows, indexes and aggregates."""
+        rng = random.Random(5)
+        points = [
+            TelemetryPoint(
+                [rng.choice([0.0, 0.5, 1.0, 1.5, 2.0]) for _ in range(14)],
+                {"accuracy": rng.random(), **({"efficiency": rng.random()} if i % 2 else {})},
+                rng.choice(["a", "b"]),
+                float(i if i % 7 else 300 - i),
+            )
+            for i in range(300)
+        ]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            single = TelemetryAggregator(storage_dir=Path(tmpdir))
+            for point in points:
+                single.record(point)
+            batched = TelemetryAggregator(storage_dir=Path(tmpdir))
+            batched.record_many(points[:10])
+            batched.record_many(points[10:])
+
+            assert batched.aggregate_by_cluster() == single.aggregate_by_cluster()
+            assert batched.aggregate_by_frame() == single.aggregate_by_frame()
+            assert batched.get_points(since=150.0) == single.get_points(since=150.0)
+            key = VectorCodec.cluster_key(VectorCodec.decode(points[0].config_vector))
+            assert batched.get_points(cluster_key=key) == single.get_points(cluster_key=key)
+
+    def test_get_points_since_and_cluster(self):
+        """Timestamp and cluster filters should use the indexes correctly."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            agg = TelemetryAggregator(storage_dir=Path(tmpdir))
+            for ts in [1.0, 2.0, 3.0]:
+                agg.record(TelemetryPoint([1.0] * 14, {"a": ts}, "t", ts))
+            assert [p.timestamp for p in agg.get_points(since=2.0)] == [2.0, 3.0]
+
+            # Out-of-order timestamp falls back to a scan
+            agg.record(TelemetryPoint([0.0] * 14, {"a": 0.5}, "t", 0.5))
+            assert [p.timestamp for p in agg.get_points(since=2.0)] == [2.0, 3.0]
+            assert len(agg.get_points(since=0.0, task_type="missing")) == 0
+
+            key = VectorCodec.cluster_key(VectorCodec.decode([0.0] * 14))
+            assert [p.timestamp for p in agg.get_points(cluster_key=key)] == [0.5]
+
+    def test_save_appends_incrementally(self):
+        """A second save should append only new points."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            agg = TelemetryAggregator(storage_dir=Path(tmpdir))
+            agg.record_outcome([0.5] * 14, {"m": 0.1}, "test")
+            assert agg.save("inc.jsonl") == 1
+            agg.record_outcome([0.5] * 14, {"m": 0.2}, "test")
+            assert agg.save("inc.jsonl") == 2
+
+            lines = (Path(tmpdir) / "inc.jsonl").read_text().splitlines()
+            assert len(lines) == 2
+
+            loaded = TelemetryAggregator(storage_dir=Path(tmpdir))
+            assert loaded.load("inc.jsonl") == 2
+            loaded.record_outcome([0.5] * 14, {"m": 0.3}, "test")
+            loaded.save("inc.jsonl")
+            reloaded = TelemetryAggregator(storage_dir=Path(tmpdir))
+            reloaded.load("inc.jsonl")
+            assert [p.outcomes["m"] for p in reloaded.get_points()] == [0.1, 0.2, 0.3]
+
 
 class TestEvolutionProposal:
     """Tests for EvolutionProposal dataclass."""
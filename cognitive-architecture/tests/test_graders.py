@@ -6,11 +6,13 @@ Tests:
 - VERIXGrader, VERILINGUAGrader
 - CompositeGrader
 - RubricGrader and council evaluation
+- Concurrent council: timeouts, early consensus, per-judge latency
 """
 
 import pytest
 import sys
 import os
+import time
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -312,6 +314,98 @@ class TestRubricGrader:
         assert result.judge_model == "council"
 
 
+class SkewedGrader(RubricGrader):
+    """Mock judges whose scores are offset per model."""
+
+    OFFSETS = {JudgeModel.CLAUDE: 0.0, JudgeModel.GEMINI: 0.0, JudgeModel.CODEX: 0.0}
+
+    def _mock_judge(self, response, task, model):
+        result = super()._mock_judge(response, task, model)
+        result.score += self.OFFSETS[model]
+        return result
+
+
+class TestCouncilConcurrency:
+    """Tests for concurrent council grading."""
+
+    TASK = {"id": "test", "task": "Test task"}
+    RESPONSE = "[witnessed] [ground:doc] [conf:0.9] The task is [complete]."
+
+    def test_judges_run_concurrently(self):
+        """A council grade should take about one judge latency, not the sum."""
+        grader = RubricGrader(use_council=True, mock_latency_s=0.2)
+        start = time.perf_counter()
+        result = grader.grade(self.RESPONSE, self.TASK)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.45
+        assert set(result.judge_latencies_ms) == {"claude", "gemini", "codex"}
+        assert all(ms >= 200 for ms in result.judge_latencies_ms.values())
+        assert result.timed_out_judges == []
+        assert result.early_consensus is False
+
+    def test_matches_sequential_aggregation(self):
+        """Concurrent results should aggregate exactly like the sequential loop."""
+        grader = SkewedGrader(use_council=True, mock_latency_s={JudgeModel.CLAUDE: 0.05})
+        grader.OFFSETS = {JudgeModel.CLAUDE: 0.1, JudgeModel.GEMINI: -0.2, JudgeModel.CODEX: 0.0}
+        result = grader.grade(self.RESPONSE, self.TASK)
+        expected = grader._aggregate_council_results([
+            grader._grade_single(self.RESPONSE, self.TASK, None, m) for m in grader.council_models
+        ])
+        assert result.score == expected.score
+        assert result.criterion_scores == expected.criterion_scores
+        assert result.reasoning == expected.reasoning
+        assert result.confidence == expected.confidence
+
+    def test_slow_judge_times_out(self):
+        """Judges slower than the timeout should be left out."""
+        grader = RubricGrader(
+            use_council=True, judge_timeout_s=0.3,
+            mock_latency_s={JudgeModel.CODEX: 2.0},
+        )
+        start = time.perf_counter()
+        result = grader.grade(self.RESPONSE, self.TASK)
+
+        assert time.perf_counter() - start < 1.0
+        assert result.timed_out_judges == ["codex"]
+        assert set(result.judge_latencies_ms) == {"claude", "gemini"}
+        assert "[codex]" not in result.reasoning
+
+    def test_all_judges_time_out(self):
+        """A council with no answers should return an empty result."""
+        grader = RubricGrader(use_council=True, judge_timeout_s=0.05, mock_latency_s=1.0)
+        result = grader.grade(self.RESPONSE, self.TASK)
+        assert result.score == 0.0
+        assert result.reasoning == "No council results"
+        assert sorted(result.timed_out_judges) == ["claude", "codex", "gemini"]
+
+    def test_early_consensus(self):
+        """Agreeing judges should end the council without waiting for the rest."""
+        grader = RubricGrader(
+            use_council=True, agreement_variance=0.01,
+            mock_latency_s={JudgeModel.CODEX: 2.0},
+        )
+        start = time.perf_counter()
+        result = grader.grade(self.RESPONSE, self.TASK)
+
+        assert time.perf_counter() - start < 1.0
+        assert result.early_consensus is True
+        assert set(result.judge_latencies_ms) == {"claude", "gemini"}
+        assert result.timed_out_judges == []
+
+    def test_disagreement_waits_for_all(self):
+        """Judges outside the variance threshold should not stop the council."""
+        grader = SkewedGrader(
+            use_council=True, agreement_variance=0.01,
+            mock_latency_s={JudgeModel.CODEX: 0.2},
+        )
+        grader.OFFSETS = {JudgeModel.CLAUDE: 0.4, JudgeModel.GEMINI: -0.4, JudgeModel.CODEX: 0.0}
+        result = grader.grade(self.RESPONSE, self.TASK)
+
+        assert result.early_consensus is False
+        assert set(result.judge_latencies_ms) == {"claude", "gemini", "codex"}
+
+
 class TestCreateRubric:
     """Tests for create_rubric() function."""
 
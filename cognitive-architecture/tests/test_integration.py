@@ -417,6 +417,62 @@ class TestFullPipelineIntegration:
             assert c.is_available
 
 
+class TestBatchObjectiveEvaluation:
+    """Vectorized two-stage objectives must match per-row evaluation."""
+
+    @pytest.mark.parametrize("n_var", [5, 14])
+    def test_batch_matches_per_row(self, n_var):
+        """Batched objectives should equal per-row objectives exactly."""
+        import numpy as np
+        from optimization.two_stage_optimizer import (
+            evaluate_config_5dim, evaluate_config_5dim_batch,
+            evaluate_config_14dim, evaluate_config_14dim_batch,
+        )
+
+        per_row, batched = {
+            5: (evaluate_config_5dim, evaluate_config_5dim_batch),
+            14: (evaluate_config_14dim, evaluate_config_14dim_batch),
+        }[n_var]
+
+        # Range extends past the bounds so every clip is exercised
+        rng = np.random.default_rng(0)
+        X = rng.uniform(-0.5, 2.5, size=(500, n_var))
+
+        expected = np.array([per_row(x) for x in X])
+        actual = batched(X)
+
+        assert actual.shape == (500, 4)
+        assert np.array_equal(actual, expected)
+
+    def test_batch_accepts_single_vector(self):
+        """A 1-D vector should be evaluated as a population of one."""
+        import numpy as np
+        from optimization.two_stage_optimizer import (
+            evaluate_config_5dim, evaluate_config_5dim_batch,
+        )
+
+        x5 = np.array([0.8, 0.6, 1.5, 1.0, 0.9])
+        F = evaluate_config_5dim_batch(x5)
+
+        assert F.shape == (1, 4)
+        assert np.array_equal(F[0], evaluate_config_5dim(x5))
+
+    def test_problem_evaluates_whole_population(self):
+        """CognitiveProblem14D should score X in one vectorized call."""
+        import numpy as np
+        from optimization.two_stage_optimizer import (
+            CognitiveProblem14D, evaluate_config_14dim,
+        )
+
+        problem = CognitiveProblem14D()
+        assert problem.elementwise is False
+
+        X = np.random.default_rng(1).random((50, 14)) * problem.xu
+        F = problem.evaluate(X, return_values_of=["F"])
+
+        assert np.array_equal(F, np.array([evaluate_config_14dim(x) for x in X]))
+
+
 class TestRetryMechanismIntegration:
     """Test the retry mechanism works correctly."""
 
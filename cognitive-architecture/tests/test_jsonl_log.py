@@ -0,0 +1,232 @@
+"""
+Tests for integration/jsonl_log.py and its use by the loop bridges
+
+Tests:
+- Lookup, tail and cursor reads match a full parse of the log
+- Sidecar index is reused, followed across processes and rebuilt when stale
+- UnifiedBridge history is append-only and migrates history.json
+- TelemetryBridge lookups and incremental sync_all
+"""
+
+import pytest
+import json
+import random
+import tempfile
+import sys
+import os
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from integration.jsonl_log import IndexedJSONLog
+from integration.unified_bridge import UnifiedBridge, UnifiedEvent
+from integration.telemetry_bridge import TelemetryBridge
+
+
+class RecordingStore:
+    """TelemetryStore stand-in that keeps stored records in memory."""
+
+    def __init__(self):
+        self.stored = []
+
+    def store(self, record):
+        self.stored.append(record)
+        return record.task_id
+
+
+def parse_all(path):
+    """Reference: the original read_text + json.loads reader."""
+    events = []
+    for line in path.read_text().strip().split("\n"):
+        if line.strip():
+            try:
+                events.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return events
+
+
+@pytest.fixture
+def tmp_dir():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+@pytest.fixture
+def populated(tmp_dir):
+    rng = random.Random(3)
+    log = IndexedJSONLog(tmp_dir / "events.jsonl")
+    for i in range(200):
+        log.append({"iteration": rng.randrange(60), "n": i})
+        if i % 37 == 0:
+            with open(log.path, "a") as f:
+                f.write("not json\n\n")
+    return log
+
+
+class TestIndexedJSONLog:
+    """Indexed reads must agree with parsing the whole file."""
+
+    def test_read_all_matches_full_parse(self, populated):
+        """read_all should equal the original line-by-line parse."""
+        assert populated.read_all() == parse_all(populated.path)
+
+    def test_get_and_find(self, populated):
+        """get returns the first match, find every match in order."""
+        events = parse_all(populated.path)
+        for key in range(61):
+            matches = [e for e in events if e["iteration"] == key]
+            assert populated.find(key) == matches
+            assert populated.get(key) == (matches[0] if matches else None)
+
+    def test_tail(self, populated):
+        """tail(n) should be the last n records."""
+        events = parse_all(populated.path)
+        for n in (0, 1, 5, 200, 500):
+            assert populated.tail(n) == (events[-n:] if n else [])
+
+    def test_read_from_cursor_resumes(self, populated):
+        """Records after a yielded cursor are exactly the remaining records."""
+        stream = list(populated.read_from(0))
+        _, cursor = stream[99]
+        assert [r for r, _ in populated.read_from(cursor)] == [r for r, _ in stream[100:]]
+        assert list(populated.read_from(populated.end)) == []
+
+    def test_records_without_key(self, tmp_dir):
+        """Records lacking an integer key are readable but not indexed."""
+        log = IndexedJSONLog(tmp_dir / "log.jsonl")
+        log.append({"task_id": "a"})
+        log.append({"iteration": True})
+        assert len(log) == 2
+        assert log.keys() == []
+        assert log.get(1) is None
+
+    def test_partial_tail_line_waits(self, tmp_dir):
+        """An unterminated last line is not indexed until completed."""
+        log = IndexedJSONLog(tmp_dir / "log.jsonl")
+        log.append({"iteration": 1})
+        with open(log.path, "a") as f:
+            f.write('{"iteration": 2')
+        assert log.get(2) is None
+        with open(log.path, "a") as f:
+            f.write("}\n")
+        assert log.get(2) == {"iteration": 2}
+
+
+class TestSidecarIndex:
+    """Tests for index persistence and tail following."""
+
+    def test_reopen_uses_sidecar(self, populated, monkeypatch):
+        """A new reader should load offsets from the sidecar, not rescan the log."""
+        reader = IndexedJSONLog(populated.path)
+        monkeypatch.setattr(reader, "_scan", lambda size: pytest.fail("log was rescanned"))
+        assert len(reader) == len(populated)
+        assert reader.get(populated.keys()[0]) == populated.get(populated.keys()[0])
+
+    def test_other_writer_picked_up(self, tmp_dir):
+        """Records appended through another instance appear on the next read."""
+        reader = IndexedJSONLog(tmp_dir / "log.jsonl")
+        assert reader.get(7) is None
+        IndexedJSONLog(tmp_dir / "log.jsonl").append({"iteration": 7})
+        assert reader.get(7) == {"iteration": 7}
+
+    def test_duplicate_sidecar_entries_ignored(self, tmp_dir):
+        """Two processes indexing the same records must not double-count."""
+        path = tmp_dir / "log.jsonl"
+        IndexedJSONLog(path).append({"iteration": 1})
+        with open(path, "a") as f:
+            f.write('{"iteration": 2}\n')
+        IndexedJSONLog(path).refresh()
+        IndexedJSONLog(path)._write_entries([(2, 16, 17)])  # stale writer
+        IndexedJSONLog(path).refresh()
+        assert len(IndexedJSONLog(path)) == 2
+
+    def test_rewritten_log_rebuilds_index(self, tmp_dir):
+        """A log replaced behind the index's back should be reindexed."""
+        path = tmp_dir / "log.jsonl"
+        log = IndexedJSONLog(path)
+        for i in range(5):
+            log.append({"iteration": i})
+        path.write_text('{"iteration": 9, "pad": "xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"}\n')
+        assert IndexedJSONLog(path).keys() == [9]
+        assert log.keys() == [9]
+
+    def test_corrupt_sidecar_rebuilt(self, populated):
+        """Garbage in the sidecar should not break reads."""
+        populated.index_path.write_bytes(b"garbage")
+        assert IndexedJSONLog(populated.path).read_all() == parse_all(populated.path)
+
+
+class TestUnifiedBridgeHistory:
+    """History is an append-only JSONL log."""
+
+    def test_update_history_appends(self, tmp_dir):
+        """Each update should add one line without rewriting earlier ones."""
+        bridge = UnifiedBridge(tmp_dir)
+        bridge.update_history(1, {"overall": 0.5})
+        first = bridge.history_path.read_bytes()
+        bridge.update_history(2, {"overall": 0.7})
+        assert bridge.history_path.read_bytes().startswith(first)
+        assert [h["iteration"] for h in bridge.load_history()] == [1, 2]
+        assert bridge.load_history(limit=1)[0]["metrics"] == {"overall": 0.7}
+        assert bridge.get_history_entry(1)["metrics"] == {"overall": 0.5}
+        assert bridge.history_length() == 2
+
+    def test_legacy_history_migrated(self, tmp_dir):
+        """history.json from older versions should be converted once."""
+        entries = [{"iteration": i, "timestamp": "t", "metrics": {"overall": i / 10}} for i in range(3)]
+        (tmp_dir / "history.json").write_text(json.dumps({"_comment": "x", "iterations": entries}, indent=2))
+        bridge = UnifiedBridge(tmp_dir)
+        assert bridge.load_history() == entries
+        assert not (tmp_dir / "history.json").exists()
+        bridge.update_history(3, {})
+        assert UnifiedBridge(tmp_dir).history_length() == 4
+
+    def test_reset_history(self, tmp_dir):
+        """reset_history should leave an empty history."""
+        bridge = UnifiedBridge(tmp_dir)
+        bridge.update_history(1, {})
+        bridge.reset_history()
+        assert bridge.load_history() == []
+        assert UnifiedBridge(tmp_dir).history_length() == 0
+
+
+class TestTelemetryBridgeEvents:
+    """TelemetryBridge reads events through the index."""
+
+    def append_events(self, loop_dir, iterations):
+        bridge = UnifiedBridge(loop_dir)
+        for i in iterations:
+            bridge.append_event(UnifiedEvent(task_id=f"ralph_{i}", iteration=i))
+
+    def test_sync_iteration(self, tmp_dir):
+        """sync_iteration should find the first event of an iteration."""
+        self.append_events(tmp_dir, [0, 1, 2, 1])
+        store = RecordingStore()
+        telemetry = TelemetryBridge(tmp_dir, telemetry_store=store)
+        assert telemetry.sync_iteration(1).task_id == "ralph_1"
+        assert telemetry.sync_iteration(5) is None
+        assert len(store.stored) == 1
+
+    def test_sync_all_is_incremental(self, tmp_dir):
+        """sync_all should only store events appended since the last call."""
+        self.append_events(tmp_dir, range(3))
+        store = RecordingStore()
+        assert [r.iteration for r in TelemetryBridge(tmp_dir, telemetry_store=store).sync_all()] == [0, 1, 2]
+        assert TelemetryBridge(tmp_dir, telemetry_store=store).sync_all() == []
+
+        self.append_events(tmp_dir, [3, 4])
+        assert [r.iteration for r in TelemetryBridge(tmp_dir, telemetry_store=store).sync_all()] == [3, 4]
+        assert len(store.stored) == 5
+
+        full = TelemetryBridge(tmp_dir, telemetry_store=store).sync_all(from_start=True)
+        assert [r.iteration for r in full] == [0, 1, 2, 3, 4]
+
+    def test_stale_cursor_resyncs(self, tmp_dir):
+        """A cursor past the end of a replaced events.jsonl restarts at 0."""
+        self.append_events(tmp_dir, range(4))
+        TelemetryBridge(tmp_dir, telemetry_store=RecordingStore()).sync_all()
+        (tmp_dir / "events.jsonl").write_text("")
+        self.append_events(tmp_dir, [7])
+        records = TelemetryBridge(tmp_dir, telemetry_store=RecordingStore()).sync_all()
+        assert [r.iteration for r in records] == [7]
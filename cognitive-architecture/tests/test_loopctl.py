@@ -0,0 +1,313 @@
+"""
+Tests for loopctl hot-path timing and warm state
+
+Tests:
+- Timing events follow decision events in events.jsonl
+- Latency budget from policy or argument
+- Telemetry ignores timing events
+- Memoized harness hash and warm bridge/harness reuse
+- Daemon forwarding, client context and in-process fallback
+- Sockets not private to the current user are never used
+"""
+
+import pytest
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from loopctl import client, core, unix_socket
+from loopctl.core import (
+    FrozenHarness,
+    ralph_iteration_complete,
+    get_bridge,
+    get_harness,
+    clear_warm_state,
+)
+from loopctl.timing import SpanTimer, format_spans
+from integration.telemetry_bridge import TelemetryBridge
+
+
+@pytest.fixture
+def loop_dir(monkeypatch):
+    # Heuristic grading only: no CLI evaluator, no shared result cache
+    monkeypatch.setenv("CLAUDE_CLI", "loopctl-test-missing-cli")
+    # Keep Memory MCP fallback files out of the repository's storage/
+    monkeypatch.setattr(core.TelemetryBridge, "store_to_memory_mcp", lambda self, iteration=None: {})
+    clear_warm_state()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir)
+        (path / "runtime_config.json").write_text(json.dumps({
+            "mode": "balanced",
+            "vector14": [1, 1, 0, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0],
+            "verix": {"strictness": "MODERATE", "compression": "L1"},
+            "frames": {"evidential": True},
+            "iteration": 0,
+            "previous_harness_score": 0.0,
+        }))
+        (path / "policy.json").write_text(json.dumps({"regression_threshold": 0.03}))
+        artifact = path / "output" / "latest.txt"
+        artifact.parent.mkdir()
+        artifact.write_text("Output with [assert|confident] markers and error handling " * 5)
+        yield path
+    clear_warm_state()
+
+
+def run(loop_dir, **kwargs):
+    return ralph_iteration_complete(
+        state_path=str(loop_dir / "state.md"),
+        loop_dir=str(loop_dir),
+        output_path=str(loop_dir / "output" / "latest.txt"),
+        **kwargs,
+    )
+
+
+def read_events(loop_dir):
+    return [json.loads(line) for line in (loop_dir / "events.jsonl").read_text().splitlines()]
+
+
+class TestTimingSpans:
+    """Per-step spans are recorded in events.jsonl."""
+
+    def test_timing_event_follows_decision(self, loop_dir):
+        """Each call appends a decision event then a timing event."""
+        result = run(loop_dir, iteration=0)
+        events = read_events(loop_dir)
+        assert [e["event_type"] for e in events] == ["decision", "timing"]
+        timing = events[1]
+        assert timing["iteration"] == 0
+        assert timing["decision"] == result["decision"]
+        for step in ("bridge_init", "load_state", "harness_init", "grade", "append_event"):
+            assert step in timing["timings_ms"]
+        assert timing["timings_ms"]["total"] >= timing["timings_ms"]["grade"]
+        assert "timings_ms" not in result
+
+    def test_profile_returns_timings(self, loop_dir):
+        """profile=True adds the spans to the returned decision."""
+        result = run(loop_dir, iteration=0, profile=True)
+        assert result["timings_ms"]["total"] > 0
+        assert "kill_switch" in result["timings_ms"]
+
+    def test_budget_from_policy(self, loop_dir):
+        """A policy budget that is exceeded is flagged in the result and event."""
+        (loop_dir / "policy.json").write_text(json.dumps({"latency_budget_ms": 0}))
+        result = run(loop_dir, iteration=0)
+        assert result["latency_budget_exceeded"] is True
+        assert "budget" in read_events(loop_dir)[-1]["reason"]
+
+    def test_budget_argument_overrides_policy(self, loop_dir):
+        """An explicit generous budget is not exceeded."""
+        (loop_dir / "policy.json").write_text(json.dumps({"latency_budget_ms": 0}))
+        result = run(loop_dir, iteration=0, latency_budget_ms=60_000)
+        assert "latency_budget_exceeded" not in result
+
+    def test_telemetry_skips_timing_events(self, loop_dir):
+        """TelemetryBridge should only see decision events."""
+        run(loop_dir, iteration=0)
+        run(loop_dir, iteration=1)
+        telemetry = TelemetryBridge(loop_dir, telemetry_store=type("S", (), {"store": lambda self, r: r.task_id})())
+        assert [r.iteration for r in telemetry.sync_all()] == [0, 1]
+        assert len(telemetry.export_to_memory_mcp()) == 2
+
+    def test_cli_profile_keeps_stdout_json(self, loop_dir):
+        """--profile writes the report to stderr; stdout stays a single JSON decision."""
+        # Failing the integrity check returns before telemetry is stored
+        (loop_dir / "policy.json").write_text(json.dumps({"harness_hash": "mismatch"}))
+        cognitive_dir = Path(__file__).parent.parent
+        proc = subprocess.run(
+            [sys.executable, "-m", "loopctl", "ralph_iteration_complete",
+             "--state", str(loop_dir / "state.md"), "--loop-dir", str(loop_dir),
+             "--output", str(loop_dir / "output" / "latest.txt"), "--iteration", "0",
+             "--profile", "--budget-ms", "60000"],
+            cwd=cognitive_dir, capture_output=True, text=True, timeout=120,
+            env={**os.environ, "CLAUDE_CLI": "loopctl-test-missing-cli"},
+        )
+        assert proc.returncode == 0, proc.stderr
+        assert json.loads(proc.stdout)["timings_ms"]
+        assert "within budget" in proc.stderr
+        assert "cumulative" in proc.stderr
+
+
+class TestSpanTimer:
+    """Tests for SpanTimer and format_spans."""
+
+    def test_span_accumulates_and_survives_errors(self):
+        timer = SpanTimer()
+        with pytest.raises(ValueError):
+            with timer.span("step"):
+                raise ValueError
+        with timer.span("step"):
+            pass
+        assert list(timer.spans) == ["step"]
+        assert not timer.over_budget(None)
+        assert timer.over_budget(-1)
+
+    def test_format_spans(self):
+        table = format_spans({"grade": 30.0, "load": 10.0, "total": 50.0}, budget_ms=40)
+        lines = table.splitlines()
+        assert lines[1].startswith("grade") and lines[2].startswith("load")
+        assert "OVER BUDGET" in lines[-1]
+
+
+class TestWarmState:
+    """Expensive setup is reused across calls in one process."""
+
+    def test_harness_hash_memoized(self, loop_dir, monkeypatch):
+        """The harness source is hashed once while its mtime is unchanged."""
+        reads = []
+        original = Path.read_bytes
+
+        def counting_read_bytes(path):
+            if path == Path(core.__file__):
+                reads.append(path)
+            return original(path)
+
+        monkeypatch.setattr(Path, "read_bytes", counting_read_bytes)
+        first = FrozenHarness(loop_dir, use_cli_evaluator=False, use_connascence=False)
+        second = FrozenHarness(loop_dir, use_cli_evaluator=False, use_connascence=False)
+        assert first.current_hash == second.current_hash
+        assert len(reads) == 1
+
+    def test_harness_hash_tracks_source_changes(self, tmp_path):
+        """A changed (mtime, size) invalidates the memoized digest."""
+        source = tmp_path / "harness.py"
+        source.write_text("a = 1\n")
+        before = core._file_digest(source)
+        source.write_text("a = 22\n")
+        assert core._file_digest(source) != before
+        assert core._file_digest(tmp_path / "missing.py") is None
+
+    def test_warm_instances_reused(self, loop_dir):
+        """get_bridge/get_harness return one instance per loop directory."""
+        assert get_bridge(loop_dir) is get_bridge(str(loop_dir))
+        assert get_harness(loop_dir) is get_harness(loop_dir)
+        run(loop_dir, iteration=0)
+        run(loop_dir, iteration=1)
+        assert len(core._WARM_HARNESSES) == 1
+        assert get_bridge(loop_dir).history_length() == 2
+        clear_warm_state()
+        assert not core._WARM_BRIDGES and not core._HASH_MEMO
+
+
+@pytest.fixture
+def daemon(loop_dir):
+    from loopctl.daemon import LoopctlDaemon
+    server = LoopctlDaemon(loop_dir / "loopctl.sock", warm_loop_dirs=[str(loop_dir)])
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join(timeout=5)
+
+
+class TestDaemon:
+    """loopctl serve answers the same calls as in-process execution."""
+
+    def test_ping(self, daemon, loop_dir):
+        info = client.request("ping", socket_path=daemon.socket_path)
+        assert info["pid"] == os.getpid()
+        assert str(loop_dir.resolve()) in info["warm_loop_dirs"]
+
+    def test_forwarded_iteration_matches_in_process(self, daemon, loop_dir):
+        """Forwarded calls write the same loop state as in-process calls."""
+        remote = client.request("ralph_iteration_complete", {
+            "state_path": str(loop_dir / "state.md"),
+            "loop_dir": str(loop_dir),
+            "output_path": str(loop_dir / "output" / "latest.txt"),
+            "iteration": 0,
+        }, socket_path=daemon.socket_path)
+        local = run(loop_dir, iteration=1)
+        assert remote["decision"] == local["decision"]
+        assert remote["metrics"] == local["metrics"]
+        assert [e["iteration"] for e in read_events(loop_dir)] == [0, 0, 1, 1]
+        status = client.request("get_status", {"loop_dir": str(loop_dir)}, socket_path=daemon.socket_path)
+        assert status["history_length"] == 2
+        assert daemon.requests_served == 2
+
+    def test_relative_paths_and_kill_switch_use_client_context(self, daemon, loop_dir, monkeypatch):
+        """Paths resolve against the client's cwd and its kill-switch env is honored."""
+        monkeypatch.chdir(loop_dir)
+        monkeypatch.setenv("META_LOOP_EMERGENCY_STOP", "true")
+        result = client.request("ralph_iteration_complete", {
+            "state_path": "state.md", "loop_dir": ".", "iteration": 0,
+        }, socket_path=daemon.socket_path)
+        assert result["emergency_halt"] is True
+
+        monkeypatch.delenv("META_LOOP_EMERGENCY_STOP")
+        result = client.request("get_status", {"loop_dir": "."}, socket_path=daemon.socket_path)
+        assert result["current_iteration"] == 0
+
+    def test_falls_back_without_daemon(self, loop_dir):
+        """No socket means the call runs in-process."""
+        calls = []
+        result = client.call_or_run("get_status", {"loop_dir": str(loop_dir)},
+                                    lambda: calls.append(1) or "local",
+                                    socket_path=loop_dir / "missing.sock")
+        assert result == "local" and calls == [1]
+
+    def test_stale_daemon_refuses_and_stops(self, daemon, loop_dir):
+        """A changed source file makes the daemon hand the call back and exit."""
+        path = next(iter(daemon._sources))
+        daemon._sources[path] = (0, 0)
+        with pytest.raises(client.DaemonUnavailable):
+            client.request("get_status", {"loop_dir": str(loop_dir)}, socket_path=daemon.socket_path)
+        assert daemon.requests_served == 0
+
+    def test_errors_are_reported(self, daemon):
+        with pytest.raises(client.DaemonError, match="Unknown operation"):
+            client.request("format_disk", socket_path=daemon.socket_path)
+
+    def test_second_daemon_refused(self, daemon):
+        from loopctl.daemon import LoopctlDaemon
+        with pytest.raises(RuntimeError, match="already listening"):
+            LoopctlDaemon(daemon.socket_path)
+
+
+class TestSocketTrust:
+    """The client only talks to sockets private to the current user."""
+
+    def test_default_path_in_per_user_dir(self, monkeypatch):
+        monkeypatch.delenv("LOOPCTL_SOCKET", raising=False)
+        monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+        path = client.default_socket_path()
+        assert path.parent.name == f"loopctl-{os.getuid()}"
+        assert path.parent.parent == Path(tempfile.gettempdir())
+
+    def test_daemon_creates_private_dir(self, loop_dir):
+        from loopctl.daemon import LoopctlDaemon
+        server = LoopctlDaemon(loop_dir / "run" / "loopctl.sock")
+        try:
+            assert oct(os.stat(loop_dir / "run").st_mode & 0o777) == oct(0o700)
+            assert unix_socket.untrusted_reason(server.socket_path) is None
+        finally:
+            server.server_close()
+
+    def test_shared_socket_refused(self, daemon, loop_dir):
+        """A socket other users can reach is treated as no daemon."""
+        os.chmod(daemon.socket_path, 0o666)
+        with pytest.raises(client.DaemonUnavailable, match="untrusted"):
+            client.request("ping", socket_path=daemon.socket_path)
+        result = client.call_or_run("ping", {}, lambda: "local", socket_path=daemon.socket_path)
+        assert result == "local"
+        assert daemon.requests_served == 0
+
+    def test_non_socket_refused(self, loop_dir):
+        path = loop_dir / "fake.sock"
+        path.write_text("")
+        os.chmod(path, 0o600)
+        with pytest.raises(client.DaemonUnavailable, match="not a socket"):
+            client.request("ping", socket_path=path)
+
+    def test_daemon_refuses_shared_dir(self, loop_dir):
+        from loopctl.daemon import LoopctlDaemon
+        shared = loop_dir / "shared"
+        shared.mkdir()
+        os.chmod(shared, 0o777)
+        with pytest.raises(RuntimeError, match="writable by other users"):
+            LoopctlDaemon(shared / "loopctl.sock")
@@ -0,0 +1,236 @@
+"""
+Tests for optimization/mcp_client.py fallback search
+
+Tests:
+- Indexed search matches the file-scanning keyword search
+- Namespace filtering and list_keys
+- Index picks up files and records written by other clients
+- Compaction of superseded records, without losing concurrent appends
+- Postings snapshot reuse by new readers, and stale snapshots ignored
+"""
+
+import pytest
+import json
+import random
+import tempfile
+import sys
+import os
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from optimization.fallback_search_index import INDEX_FILENAME, SNAPSHOT_FILENAME, FallbackSearchIndex
+from optimization.mcp_client import MemoryMCPClient
+
+
+WORDS = "alpha beta gamma delta epsilon zeta theta kappa lambda sigma".split()
+
+
+def scan_search(fallback_dir, query, namespace):
+    """Reference: the original glob + json.load keyword scan."""
+    words = set(query.lower().split())
+    matches = []
+    for filepath in fallback_dir.glob("*.json"):
+        with open(filepath, encoding="utf-8") as f:
+            data = json.load(f)
+        key = data.get("key", "")
+        if namespace and not key.startswith(namespace):
+            continue
+        content = json.dumps(data).lower()
+        score = sum(1 for word in words if word in content)
+        if score > 0:
+            matches.append((key, score / len(words)))
+    return sorted(matches)
+
+
+def offline_client(fallback_dir, namespace="ns", **kwargs):
+    client = MemoryMCPClient(namespace=namespace, fallback_dir=fallback_dir, **kwargs)
+    client._mcp_available = False
+    client._last_check_time = float("inf")
+    return client
+
+
+@pytest.fixture
+def fallback_dir():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+@pytest.fixture
+def populated(fallback_dir):
+    rng = random.Random(5)
+    client = offline_client(fallback_dir)
+    for i in range(120):
+        client.namespace = rng.choice(["ns", "other"])
+        client.memory_store(f"item-{i % 100}", {"text": " ".join(rng.sample(WORDS, 3))})
+    client.namespace = "ns"
+    return client
+
+
+class TestFallbackSearch:
+    """Indexed fallback search must agree with the file scan."""
+
+    @pytest.mark.parametrize("query", [
+        "alpha beta", "Zeta", "ph", "sigma kappa lambda", "item-7", "missing words",
+    ])
+    @pytest.mark.parametrize("namespace", ["ns", "other", ""])
+    def test_matches_file_scan(self, populated, fallback_dir, query, namespace):
+        """Keys and scores should equal the original keyword scan."""
+        result = populated._fallback_search(query, 1000, namespace)
+        assert result.success
+        found = sorted((m["key"], m["score"]) for m in result.data["matches"])
+        assert found == scan_search(fallback_dir, query, namespace)
+
+    def test_results_ranked_and_limited(self, populated):
+        """Matches should be sorted by score and truncated to limit."""
+        matches = populated.vector_search("alpha beta gamma", limit=5).data["matches"]
+        assert len(matches) == 5
+        scores = [m["score"] for m in matches]
+        assert scores == sorted(scores, reverse=True)
+        assert all("similarity" in m and "value" in m for m in matches)
+
+    def test_vectors_optional(self, fallback_dir):
+        """vector_dim=0 should disable similarity scores."""
+        client = offline_client(fallback_dir, vector_dim=0)
+        client.memory_store("a", {"text": "alpha"})
+        match = client.vector_search("alpha").data["matches"][0]
+        assert "similarity" not in match
+
+    def test_list_keys_uses_index(self, populated):
+        """list_keys should return namespace keys from the index."""
+        keys = populated.list_keys("item-1").data["keys"]
+        assert keys and all(k.startswith("ns/item-1") for k in keys)
+
+
+class TestFallbackSearchIndex:
+    """Tests for index persistence and incremental updates."""
+
+    def test_existing_files_indexed_once(self, fallback_dir):
+        """Files stored before the index existed should be reconciled."""
+        (fallback_dir / "ns_old.json").write_text(json.dumps({"key": "ns/old", "value": "legacy"}))
+        client = offline_client(fallback_dir)
+        client.memory_store("new", {"text": "fresh"})
+        assert client._search_index._dead == 0
+        assert [m["key"] for m in client.vector_search("legacy").data["matches"]] == ["ns/old"]
+
+    def test_other_writer_picked_up(self, fallback_dir):
+        """Records appended by another client should appear on the next query."""
+        reader = offline_client(fallback_dir)
+        assert reader.vector_search("alpha").data["matches"] == []
+        writer = offline_client(fallback_dir)
+        writer.memory_store("shared", {"text": "alpha"})
+        assert [m["key"] for m in reader.vector_search("alpha").data["matches"]] == ["ns/shared"]
+
+    def test_overwrite_replaces_document(self, fallback_dir):
+        """Re-storing a key should replace its indexed text."""
+        client = offline_client(fallback_dir)
+        client.memory_store("k", {"text": "alpha"})
+        client.memory_store("k", {"text": "beta"})
+        assert client.vector_search("alpha").data["matches"] == []
+        assert len(client.vector_search("beta").data["matches"]) == 1
+
+    def test_compaction_drops_superseded_records(self, fallback_dir):
+        """Opening an index with many dead records should rewrite it."""
+        client = offline_client(fallback_dir)
+        for i in range(FallbackSearchIndex.COMPACT_MIN_DEAD + 1):
+            client.memory_store("k", {"text": f"version {i}"})
+        size_before = (fallback_dir / INDEX_FILENAME).stat().st_size
+
+        index = FallbackSearchIndex(fallback_dir)
+        index.refresh()
+        assert len(index) == 1
+        assert index._dead == 0
+        assert (fallback_dir / INDEX_FILENAME).stat().st_size < size_before
+
+    def test_append_during_compaction_kept(self, fallback_dir):
+        """A record another writer appends while compaction runs must survive the rewrite."""
+        client = offline_client(fallback_dir)
+        for i in range(FallbackSearchIndex.COMPACT_MIN_DEAD + 1):
+            client.memory_store("k", {"text": f"version {i}"})
+
+        compactor = FallbackSearchIndex(fallback_dir)
+        writer = FallbackSearchIndex(fallback_dir)
+        late = {"key": "ns/late", "file": "ns_late.json", "mtime_ns": 0, "size": 0, "content": "late"}
+        thread = threading.Thread(target=writer._append, args=(late, late["content"]))
+        record = compactor._record
+
+        def record_then_race(doc_id):
+            # The writer appends while the compacted file is being written
+            if thread.ident is None:
+                thread.start()
+                time.sleep(0.2)
+            return record(doc_id)
+
+        compactor._record = record_then_race
+        compactor._follow_tail()
+        compactor._maybe_compact()
+        thread.join(timeout=5)
+        assert compactor._dead <= 1
+
+        reader = FallbackSearchIndex(fallback_dir)
+        reader._follow_tail()
+        assert "ns_late.json" in reader._by_file
+        assert not list(fallback_dir.glob("*.tmp"))
+
+    def test_non_dict_file_skipped(self, fallback_dir):
+        """Valid JSON that is not a stored memory should not break reconciliation."""
+        (fallback_dir / "list.json").write_text(json.dumps(["alpha"]))
+        (fallback_dir / "ns_doc.json").write_text(json.dumps({"key": "ns/doc", "value": "alpha"}))
+        client = offline_client(fallback_dir)
+        assert [m["key"] for m in client.vector_search("alpha").data["matches"]] == ["ns/doc"]
+
+
+class TestSearchIndexSnapshot:
+    """New readers start from the postings snapshot instead of re-parsing."""
+
+    QUERIES = ["alpha beta", "zeta", "ph", "item-7", "sigma kappa lambda"]
+
+    @pytest.fixture(autouse=True)
+    def small_snapshots(self, monkeypatch):
+        monkeypatch.setattr(FallbackSearchIndex, "SNAPSHOT_MIN_RECORDS", 16)
+
+    def search(self, fallback_dir, query, namespace):
+        client = offline_client(fallback_dir)
+        result = client._fallback_search(query, 1000, namespace)
+        return sorted((m["key"], m["score"]) for m in result.data["matches"]), client
+
+    def test_new_reader_uses_snapshot(self, populated, fallback_dir):
+        assert (fallback_dir / SNAPSHOT_FILENAME).exists()
+        index = FallbackSearchIndex(fallback_dir)
+        index.refresh()
+        assert index._snapshot_docs > 0
+        assert index._unsnapshotted < 16
+        # Only documents a query touches are read from the record file
+        assert sum("content" in doc for doc in index._docs if doc) < len(index)
+
+        for query in self.QUERIES:
+            for namespace in ["ns", "other", ""]:
+                found, _ = self.search(fallback_dir, query, namespace)
+                assert found == scan_search(fallback_dir, query, namespace)
+
+    def test_changes_after_snapshot(self, populated, fallback_dir):
+        """Overwrites and deletions of snapshotted documents are applied."""
+        populated.memory_store("item-3", {"text": "omega"})
+        (fallback_dir / "ns_item-4.json").unlink(missing_ok=True)
+        (fallback_dir / "other_item-4.json").unlink(missing_ok=True)
+        for query in self.QUERIES + ["omega"]:
+            found, reader = self.search(fallback_dir, query, "")
+            assert found == scan_search(fallback_dir, query, "")
+        assert reader._search_index._snapshot_docs > 0
+
+    def test_stale_snapshot_ignored(self, populated, fallback_dir):
+        """A snapshot of a rewritten record file is not used."""
+        snapshot = (fallback_dir / SNAPSHOT_FILENAME).read_bytes()
+        (fallback_dir / INDEX_FILENAME).unlink()
+        index = FallbackSearchIndex(fallback_dir)
+        index.refresh()
+        (fallback_dir / SNAPSHOT_FILENAME).write_bytes(snapshot)
+
+        reader = FallbackSearchIndex(fallback_dir)
+        reader.refresh()
+        assert reader._snapshot_docs == 0
+        for query in self.QUERIES:
+            found, _ = self.search(fallback_dir, query, "")
+            assert found == scan_search(fallback_dir, query, "")
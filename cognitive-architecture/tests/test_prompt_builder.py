@@ -223,3 +223,65 @@ class TestPromptComponents:
         )
         assert components.base_instruction == "Base"
         assert components.task_content == "Task"
+
+
+class TestSystemPromptCache:
+    """Tests for system prompt memoization."""
+
+    def test_repeated_build_hits_cache(self):
+        """Same config and task type should reuse the system prompt."""
+        builder = PromptBuilder(FullConfig(), auto_select_mode=False)
+        first, _ = builder.build("Task one", "coding")
+        second, user = builder.build("Task two", "coding")
+
+        assert first == second
+        assert "Task two" in user
+        stats = builder.cache_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_cached_prompt_matches_uncached(self):
+        """Cached and freshly assembled prompts should be identical."""
+        cached = PromptBuilder(FullConfig(), auto_select_mode=False)
+        uncached = PromptBuilder(FullConfig(), auto_select_mode=False, cache_size=0)
+
+        for task_type in ["coding", "reasoning", "coding", "analysis"]:
+            assert cached.build("Task", task_type) == uncached.build("Task", task_type)
+        assert uncached.cache_stats()["size"] == 0
+
+    def test_task_type_is_part_of_key(self):
+        """Different task types should not share a cache entry."""
+        builder = PromptBuilder(FullConfig(), auto_select_mode=False)
+        coding, _ = builder.build("Task", "coding")
+        creative, _ = builder.build("Task", "creative")
+
+        assert coding != creative
+        assert builder.cache_stats()["size"] == 2
+
+    def test_lru_bound(self):
+        """Cache should evict least recently used entries."""
+        builder = PromptBuilder(FullConfig(), auto_select_mode=False, cache_size=2)
+        for task_type in ["coding", "reasoning", "analysis"]:
+            builder.build("Task", task_type)
+
+        assert builder.cache_stats()["size"] == 2
+
+    def test_set_mode_invalidates(self):
+        """set_mode() should clear memoized prompts."""
+        from modes.library import BUILTIN_MODES
+
+        builder = PromptBuilder(FullConfig(), auto_select_mode=False)
+        builder.build("Task", "coding")
+        builder.set_mode(next(iter(BUILTIN_MODES.values())))
+
+        assert builder.cache_stats()["size"] == 0
+
+    def test_frame_weight_change_changes_key(self):
+        """Changed frame weights should miss the cache."""
+        builder = PromptBuilder(FullConfig(), auto_select_mode=False)
+        builder.build("Task", "coding")
+        builder.config.framework.frame_weights["spatial"] = 0.11
+        builder.build("Task", "coding")
+
+        assert builder.cache_stats()["misses"] == 2
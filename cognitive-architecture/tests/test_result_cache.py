@@ -0,0 +1,157 @@
+"""
+Tests for evals/result_cache.py
+
+Tests:
+- Content-addressed keys and hit/miss statistics
+- TTL expiry and size-based LRU eviction
+- Replay (read-only) and off modes
+- Results that fail the cacheable predicate are not stored
+"""
+
+import pytest
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from evals.result_cache import CacheMiss, ResultCache, has_json_object
+
+
+class Model:
+    """Counts calls and answers with a fixed response."""
+
+    def __init__(self, response="ok"):
+        self.calls = 0
+        self.response = response
+
+    def __call__(self):
+        self.calls += 1
+        return self.response
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    return tmp_path / "cache"
+
+
+class TestResultCache:
+    """Tests for lookups and statistics."""
+
+    def test_second_call_is_a_hit(self, cache_dir):
+        """The same prompt/model/harness should only call the model once."""
+        cache = ResultCache(cache_dir)
+        model = Model()
+        assert cache.call("p", "m", "h1", model) == "ok"
+        assert cache.call("p", "m", "h1", model) == "ok"
+        assert model.calls == 1
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["stores"]) == (1, 1, 1)
+        assert stats["hit_rate"] == 0.5
+
+    @pytest.mark.parametrize("change", [
+        {"prompt": "q"}, {"model": "n"}, {"harness_version": "h2"}, {"max_tokens": 10},
+    ])
+    def test_key_covers_inputs(self, cache_dir, change):
+        """Changing prompt, model, harness version or params should miss."""
+        cache = ResultCache(cache_dir)
+        model = Model()
+        args = {"prompt": "p", "model": "m", "harness_version": "h1"}
+        cache.call(**args, fn=model)
+        cache.call(**{**args, **change}, fn=model)
+        assert model.calls == 2
+
+    def test_shared_across_instances(self, cache_dir):
+        """Entries persist on disk for other processes and runs."""
+        ResultCache(cache_dir).call("p", "m", "h", Model({"score": 0.5}))
+        model = Model()
+        assert ResultCache(cache_dir).call("p", "m", "h", model) == {"score": 0.5}
+        assert model.calls == 0
+
+    def test_uncacheable_result_not_stored(self, cache_dir):
+        """Results rejected by the predicate should be retried next time."""
+        cache = ResultCache(cache_dir)
+        model = Model("no json here")
+        cache.call("p", "m", "h", model, cacheable=has_json_object)
+        cache.call("p", "m", "h", model, cacheable=has_json_object)
+        assert model.calls == 2
+
+    def test_errors_not_cached(self, cache_dir):
+        """Exceptions from the model call propagate and store nothing."""
+        cache = ResultCache(cache_dir)
+
+        def failing():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            cache.call("p", "m", "h", failing)
+        assert cache.stats()["stores"] == 0
+
+
+class TestEviction:
+    """Tests for TTL and size limits."""
+
+    def test_expired_entry_is_a_miss(self, cache_dir):
+        """Entries older than the TTL should be refreshed."""
+        cache = ResultCache(cache_dir, ttl_s=60)
+        cache.call("p", "m", "h", Model())
+        path = cache._path(cache.make_key("p", "m", "h"))
+        entry = json.loads(path.read_text())
+        entry["created"] -= 120
+        path.write_text(json.dumps(entry))
+
+        model = Model()
+        cache.call("p", "m", "h", model)
+        assert model.calls == 1
+        assert cache.stats()["expired"] == 1
+
+    def test_size_limit_evicts_least_recently_used(self, cache_dir):
+        """Exceeding max_bytes should drop the least recently used entries."""
+        cache = ResultCache(cache_dir, max_bytes=1000)
+        for i in range(4):
+            cache.call(f"p{i}", "m", "h", Model("x" * 150))
+        old = time.time() - 100
+        for i in range(4):
+            os.utime(cache._path(cache.make_key(f"p{i}", "m", "h")), (old + i, old + i))
+        cache.call("p0", "m", "h", Model())  # touch: p0 becomes most recent
+
+        i = 4
+        while cache.stats()["evictions"] == 0:
+            cache.call(f"p{i}", "m", "h", Model("x" * 150))
+            i += 1
+
+        assert cache.stats()["bytes"] <= 1000
+        assert cache.get(cache.make_key("p0", "m", "h"))[0]
+        assert not cache.get(cache.make_key("p1", "m", "h"))[0]
+
+
+class TestModes:
+    """Tests for replay and off modes."""
+
+    def test_replay_reads_but_never_calls(self, cache_dir):
+        """Replay should serve hits, ignore TTL and raise on misses."""
+        ResultCache(cache_dir).call("p", "m", "h", Model("cached"))
+        replay = ResultCache(cache_dir, ttl_s=0, mode="replay")
+        model = Model()
+        assert replay.call("p", "m", "h", model) == "cached"
+        with pytest.raises(CacheMiss):
+            replay.call("other", "m", "h", model)
+        assert model.calls == 0
+        assert replay.stats()["stores"] == 0
+
+    def test_off_always_calls(self, cache_dir):
+        """Off mode should bypass the cache entirely."""
+        cache = ResultCache(cache_dir, mode="off")
+        model = Model()
+        cache.call("p", "m", "h", model)
+        cache.call("p", "m", "h", model)
+        assert model.calls == 2
+        assert not cache_dir.exists()
+
+    def test_mode_from_environment(self, cache_dir, monkeypatch):
+        """EVAL_CACHE_MODE should set the default mode."""
+        monkeypatch.setenv("EVAL_CACHE_MODE", "replay")
+        assert ResultCache(cache_dir).mode == "replay"
+        with pytest.raises(ValueError):
+            ResultCache(cache_dir, mode="sometimes")
@@ -0,0 +1,303 @@
+"""
+Tests for skills/router_service.py and skills/router_client.py
+
+Tests:
+- grep BRE triggers translate to equivalent Python regexes
+- COMMANDS_INDEX.yaml parsing follows the hook's read loop
+- Routed output equals the hook's shell tiers
+- Hot reload of both indexes on file change
+- Service round trip, stale refusal and client fallback exit status
+- The client never uses (or replaces) a socket other users can reach
+"""
+
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+from skills import router_client
+from skills.router_service import (
+    SkillRouter,
+    SkillRouterService,
+    bre_to_regex,
+    parse_commands_index,
+)
+
+COGNITIVE_DIR = Path(__file__).resolve().parent.parent
+REPO_DIR = COGNITIVE_DIR.parent
+HOOK = REPO_DIR / "hooks" / "skill-router-hook.sh"
+SKILL_INDEX = REPO_DIR / "scripts" / "skill-index" / "skill-index.json"
+
+COMMANDS_INDEX = """commands:
+  - name: review
+    trigger: "code review"
+    skill: "code review assistant"
+  - trigger: "deploy.*prod"
+    skill: "deployment readiness"
+  - trigger: "c++"
+    skill: "cpp helper"
+  - trigger: "orphan trigger"
+  - trigger: "fix \\(bug\\|issue\\)"
+    skill: "bug fixer"
+"""
+
+SKILLS = {
+    "debug-api": {
+        "category": "quality",
+        "path": "skills/debug-api",
+        "description": "Debug failing API endpoints and trace errors",
+        "triggers": ["debug", "api", "error", "trace"],
+        "negativeTriggers": [],
+        "files": ["SKILL.md"],
+    },
+}
+
+HAVE_SHELL = all(shutil.which(tool) for tool in ("bash", "jq", "grep", "timeout"))
+
+
+@pytest.fixture
+def workdir():
+    # Short path: Unix socket paths are limited to ~100 bytes
+    path = Path(tempfile.mkdtemp(prefix="router-"))
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+@pytest.fixture
+def commands_index(workdir):
+    path = workdir / "COMMANDS_INDEX.yaml"
+    path.write_text(COMMANDS_INDEX)
+    return path
+
+
+@pytest.fixture
+def skill_index(workdir):
+    path = workdir / "skill-index.json"
+    path.write_text(json.dumps({"skills": SKILLS, "keyword_index": {}}))
+    return path
+
+
+def grep_matches(pattern: str, text: str) -> bool:
+    result = subprocess.run(["grep", "-qi", "--", pattern], input=text + "\n",
+                            capture_output=True, text=True)
+    return result.returncode == 0
+
+
+def normalize(output: str) -> str:
+    """Sort matched triggers (their order depends on set iteration)."""
+    def sort_line(match):
+        return match.group(1) + ", ".join(sorted(match.group(2).split(", ")))
+    return re.sub(r"(   Matched triggers: )(.*)", sort_line, output)
+
+
+class TestBreTranslation:
+    """Triggers keep grep's basic regular expression semantics."""
+
+    PATTERNS = [
+        "code review", "deploy.*prod", "c++", "a+b", "x?", "(draft)", "{1}",
+        "fix \\(bug\\|issue\\)", "lo\\+p", "^start", "end$", "mid^dle", "co$t",
+        "*star", "[abc]at", "[^a-z]x", "[[:digit:]][[:digit:]]", "a|b", "\\<api\\>",
+        "x\\{2\\}", "path/to\\.py", "a.c",
+    ]
+    TEXTS = [
+        "please do a code review", "deploy it to prod", "write c++ code", "a+b", "aab",
+        "x?", "this is (draft) text", "{1}", "fix bug now", "fix issue", "loooop",
+        "start here", "the end", "mid^dle", "co$t", "*star", "bat", "9x", "ax",
+        "route 66", "a|b", "call the api now", "rapid", "xx", "path/to.py", "pathXtoXpy",
+        "abc", "ac",
+    ]
+
+    @pytest.mark.skipif(not shutil.which("grep"), reason="grep not available")
+    def test_matches_grep(self):
+        """Every pattern/text pair matches exactly when `grep -qi` does."""
+        for pattern in self.PATTERNS:
+            regex = re.compile(bre_to_regex(pattern), re.IGNORECASE)
+            for text in self.TEXTS:
+                assert bool(regex.search(text)) == grep_matches(pattern, text), (pattern, text)
+
+    def test_literal_operators(self):
+        """A bare + ? ( ) | is literal in a BRE."""
+        assert re.search(bre_to_regex("c++"), "c++")
+        assert not re.search(bre_to_regex("c++"), "ccc")
+        assert re.search(bre_to_regex("a|b"), "a|b")
+
+    def test_unsupported_bracket_raises(self):
+        with pytest.raises(re.error):
+            bre_to_regex("[[:nope:]]")
+
+
+class TestCommandsIndex:
+    """Trigger/skill pairing follows the hook's `while read` loop."""
+
+    def test_pairs_in_file_order(self):
+        triggers = parse_commands_index(COMMANDS_INDEX)
+        assert [(t.trigger, t.skill) for t in triggers] == [
+            ("code review", "code review assistant"),
+            ("deploy.*prod", "deployment readiness"),
+            ("c++", "cpp helper"),
+            ("fix \\(bug\\|issue\\)", "bug fixer"),
+        ]
+
+    def test_unterminated_last_line_is_not_read(self):
+        """bash `read` drops a final line without a newline."""
+        text = 'trigger: "a"\nskill: "b"\ntrigger: "c"\nskill: "d"'
+        assert [t.trigger for t in parse_commands_index(text)] == ["a"]
+
+    def test_matches_per_line(self):
+        """grep matches line by line; `[^a]` must not span a newline."""
+        trigger = parse_commands_index('trigger: "x[^a]y"\nskill: "s"\n')[0]
+        assert not trigger.matches("x\ny")
+        assert trigger.matches("first line\nx-y")
+
+
+class TestSkillRouter:
+    """Routing output and hot reload."""
+
+    def test_explicit_trigger(self, commands_index, skill_index):
+        output = SkillRouter().route("Please do a CODE REVIEW", str(commands_index), str(skill_index))
+        assert output == (
+            "\n!! CASCADE ROUTER (EXPLICIT) !!\n"
+            'Trigger: "code review" -> Skill: code review assistant\n'
+            "Read: skills/packaged/code-review-assistant.skill\n\n"
+        )
+
+    def test_skill_index_fallback(self, commands_index, skill_index):
+        output = SkillRouter().route("debug the api error", str(commands_index), str(skill_index))
+        assert output.startswith("\n!! CASCADE SKILL ROUTER !!\n" + "=" * 64 + "\nMATCHED_SKILLS:\n")
+        assert "1. debug-api (" in output
+        assert output.endswith("=" * 64 + "\n\n")
+
+    def test_no_match_and_missing_files(self, commands_index, skill_index, workdir):
+        router = SkillRouter()
+        assert router.route("zzqx", str(commands_index), str(skill_index)) == ""
+        assert router.route("debug the api", str(workdir / "missing.yaml"), str(workdir / "missing.json")) == ""
+        assert router.route("debug the api", "", "") == ""
+
+    def test_hot_reload(self, commands_index, skill_index):
+        """Changed files are re-read on the next request; unchanged ones are not."""
+        router = SkillRouter()
+        router.route("ship it", str(commands_index), str(skill_index))
+        assert router.reloads == 2
+        router.route("ship it", str(commands_index), str(skill_index))
+        assert router.reloads == 2
+
+        commands_index.write_text(COMMANDS_INDEX + '  - trigger: "ship it"\n    skill: "release manager"\n')
+        assert "Skill: release manager" in router.route("ship it", str(commands_index), str(skill_index))
+
+        skills = dict(SKILLS, shipping={**SKILLS["debug-api"], "triggers": ["zebra"], "path": "skills/shipping"})
+        skill_index.write_text(json.dumps({"skills": skills, "keyword_index": {}}))
+        assert "shipping" in router.route("zebra", str(commands_index), str(skill_index))
+        assert router.reloads == 4
+
+    @pytest.mark.skipif(not HAVE_SHELL, reason="bash/jq/grep not available")
+    @pytest.mark.parametrize("message", [
+        "please do a code review of this",
+        "deploy this to production",
+        "write some C++ code",
+        "fix issue 12",
+        "debug the api error and trace the failing endpoint",
+        "zzqx",
+    ])
+    def test_equals_hook_shell_tiers(self, commands_index, message, workdir):
+        """The service answers exactly what the hook's shell tiers print."""
+        home = workdir / "home"
+        (home / ".claude" / "commands").mkdir(parents=True)
+        shutil.copy(commands_index, home / ".claude" / "commands" / "COMMANDS_INDEX.yaml")
+        env = dict(os.environ, HOME=str(home), SKILL_ROUTER_DAEMON="0")
+        shell = subprocess.run(["bash", str(HOOK)], input=json.dumps({"message": message}),
+                               capture_output=True, text=True, env=env, timeout=60).stdout
+        routed = SkillRouter().route(message, str(commands_index), str(SKILL_INDEX))
+        assert normalize(routed) == normalize(shell)
+
+
+@pytest.fixture
+def service(commands_index, skill_index, workdir):
+    server = SkillRouterService(workdir / "router.sock", (str(commands_index), str(skill_index)))
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join(timeout=5)
+
+
+class TestService:
+    """router_client.py against a running SkillRouterService."""
+
+    def test_route_matches_in_process(self, service, commands_index, skill_index):
+        for message in ("code review please", "debug the api error", "zzqx"):
+            remote = router_client.route(message, str(commands_index), str(skill_index),
+                                         socket_path=service.socket_path)
+            assert remote == SkillRouter().route(message, str(commands_index), str(skill_index))
+        assert service.requests_served == 3
+
+    def test_ping_reports_warm_indexes(self, service):
+        info = router_client.request("ping", socket_path=service.socket_path)
+        assert info["pid"] == os.getpid()
+        assert info["reloads"] == 2
+
+    def test_stale_service_refuses(self, service, commands_index, skill_index):
+        path = next(iter(service._sources))
+        service._sources[path] = (0, 0)
+        with pytest.raises(router_client.RouterUnavailable, match="source changed"):
+            router_client.route("code review", str(commands_index), str(skill_index),
+                                socket_path=service.socket_path)
+        assert service.requests_served == 0
+
+    def test_unknown_operation(self, service):
+        with pytest.raises(router_client.RouterUnavailable, match="Unknown operation"):
+            router_client.request("format_disk", socket_path=service.socket_path)
+
+    def test_second_service_refused(self, service):
+        with pytest.raises(RuntimeError, match="already listening"):
+            SkillRouterService(service.socket_path)
+
+    def test_client_script(self, service, commands_index, skill_index):
+        """The hook's client prints the answer and exits 0."""
+        result = subprocess.run(
+            [sys.executable, "-S", str(COGNITIVE_DIR / "skills" / "router_client.py"),
+             "--commands-index", str(commands_index), "--skill-index", str(skill_index),
+             "--socket", str(service.socket_path)],
+            input="a code review", capture_output=True, text=True, timeout=30,
+        )
+        assert result.returncode == 0
+        assert "Skill: code review assistant" in result.stdout
+
+    def test_client_without_service(self, workdir, capsys, monkeypatch):
+        """No service: nothing printed, exit 3 so the hook runs its shell tiers."""
+        monkeypatch.setattr(sys, "stdin", open(os.devnull))
+        status = router_client.main(["--socket", str(workdir / "missing.sock"), "--no-start"])
+        assert status == router_client.EXIT_UNAVAILABLE
+        assert capsys.readouterr().out == ""
+        monkeypatch.setenv("SKILL_ROUTER_DAEMON", "0")
+        with pytest.raises(router_client.RouterUnavailable, match="disabled"):
+            router_client.request("ping", socket_path=workdir / "missing.sock")
+
+    def test_shared_socket_not_used(self, service, workdir, capsys, monkeypatch):
+        """A socket others can reach is neither used nor replaced by a new service."""
+        os.chmod(service.socket_path, 0o666)
+        with pytest.raises(router_client.RouterUnavailable, match="untrusted") as raised:
+            router_client.request("ping", socket_path=service.socket_path)
+        assert not isinstance(raised.value, router_client.RouterNotRunning)
+
+        started = []
+        monkeypatch.setattr(router_client, "start_service", lambda *args: started.append(args))
+        monkeypatch.setattr(sys, "stdin", open(os.devnull))
+        status = router_client.main(["--socket", str(service.socket_path)])
+        assert status == router_client.EXIT_UNAVAILABLE
+        assert capsys.readouterr().out == "" and started == []
+        assert service.requests_served == 0
+
+    def test_default_socket_in_per_user_dir(self, monkeypatch):
+        monkeypatch.delenv("SKILL_ROUTER_SOCKET", raising=False)
+        monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+        path = router_client.default_socket_path()
+        assert path.parent.name == f"skill-router-{os.getuid()}"
+        assert path.parent.parent == Path(tempfile.gettempdir())
@@ -6,11 +6,18 @@ Tests:
 - MockRuntime for testing without API
 - ExecutionResult structure
 - ExecutionMetrics calculations
+- Batch/async execution (execute_many, AsyncClaudeRuntime, AsyncMockRuntime)
 - evaluate() thin waist contract
 """
 
+import asyncio
+import time
+from types import SimpleNamespace
+
 import pytest
 from core.runtime import (
+    AsyncClaudeRuntime,
+    AsyncMockRuntime,
     ClaudeRuntime,
     MockRuntime,
     ExecutionResult,
@@ -169,6 +176,179 @@ class TestClaudeRuntime:
         assert "cluster_key" in preview
         assert "model" in preview
 
+    def test_sdk_retries_disabled(self):
+        """The runtime's backoff is the only retry layer on SDK clients."""
+        pytest.importorskip("anthropic")
+        assert ClaudeRuntime(FullConfig(), api_key="test-key")._client.max_retries == 0
+        assert AsyncClaudeRuntime(FullConfig(), api_key="test-key")._client.max_retries == 0
+
+
+class FakeMessages:
+    """Stand-in for client.messages with fixed latency and scripted failures."""
+
+    def __init__(self, latency_s=0.0, failures=None):
+        self.latency_s = latency_s
+        self.failures = list(failures or [])
+        self.calls = 0
+
+    def _next(self, kwargs):
+        self.calls += 1
+        if self.failures:
+            raise self.failures.pop(0)
+        text = "[assert|neutral] Echo [conf:0.8]\n" + kwargs["messages"][0]["content"]
+        return SimpleNamespace(
+            content=[SimpleNamespace(text=text)],
+            usage=SimpleNamespace(input_tokens=10, output_tokens=5),
+        )
+
+    def create(self, **kwargs):
+        time.sleep(self.latency_s)
+        return self._next(kwargs)
+
+
+class AsyncFakeMessages(FakeMessages):
+    async def create(self, **kwargs):
+        await asyncio.sleep(self.latency_s)
+        return self._next(kwargs)
+
+
+class RateLimited(Exception):
+    status_code = 429
+    response = SimpleNamespace(headers={"retry-after": "0"})
+
+
+def with_fake_client(runtime, messages):
+    runtime._client = SimpleNamespace(messages=messages)
+    return runtime
+
+
+TASKS = [{"task": f"Task number {i}", "task_type": "default"} for i in range(6)]
+
+
+class TestExecuteMany:
+    """Tests for batch execution with bounded concurrency."""
+
+    def test_mock_execute_many_preserves_order(self):
+        """Results should line up with input tasks."""
+        runtime = MockRuntime(FullConfig())
+        results = runtime.execute_many(TASKS, max_concurrency=3)
+
+        assert len(results) == len(TASKS)
+        for i, result in enumerate(results):
+            assert f"task number {i}" in result.response
+            assert isinstance(result.claims, list)
+
+    def test_mock_execute_many_matches_execute(self):
+        """Batch results should equal sequential execute() results."""
+        sequential = MockRuntime(FullConfig())
+        batched = MockRuntime(FullConfig())
+
+        expected = [sequential.execute(t["task"], t["task_type"]) for t in TASKS]
+        actual = batched.execute_many(TASKS)
+
+        for e, a in zip(expected, actual):
+            assert e.response == a.response
+            assert e.metrics.latency_ms == a.metrics.latency_ms
+            assert e.is_valid == a.is_valid
+
+    def test_mock_execute_many_overlaps_latency(self):
+        """Simulated latency should overlap across concurrent calls."""
+        runtime = MockRuntime(FullConfig(), latency_s=0.05)
+        start = time.perf_counter()
+        runtime.execute_many(TASKS, max_concurrency=6)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.05 * len(TASKS)
+
+    def test_async_mock_execute_many(self):
+        """AsyncMockRuntime should expose the same batch interface."""
+        runtime = AsyncMockRuntime(FullConfig(), latency_s=0.02)
+        start = time.perf_counter()
+        results = asyncio.run(runtime.execute_many(TASKS, max_concurrency=6))
+        elapsed = time.perf_counter() - start
+
+        assert [r.success for r in results] == [True] * len(TASKS)
+        assert elapsed < 0.02 * len(TASKS)
+
+    def test_claude_execute_many_with_fake_client(self):
+        """ClaudeRuntime.execute_many should run calls concurrently."""
+        messages = FakeMessages(latency_s=0.05)
+        runtime = with_fake_client(ClaudeRuntime(FullConfig(), api_key="test"), messages)
+        start = time.perf_counter()
+        results = runtime.execute_many(TASKS, max_concurrency=6)
+        elapsed = time.perf_counter() - start
+
+        assert messages.calls == len(TASKS)
+        assert all(r.success for r in results)
+        assert "Task number 3" in results[3].response
+        assert elapsed < 0.05 * len(TASKS)
+
+    def test_async_claude_execute_many_with_fake_client(self):
+        """AsyncClaudeRuntime should bound and overlap in-flight calls."""
+        messages = AsyncFakeMessages(latency_s=0.02)
+        runtime = with_fake_client(
+            AsyncClaudeRuntime(FullConfig(), api_key="test"), messages
+        )
+        results = asyncio.run(runtime.execute_many(TASKS, max_concurrency=2))
+
+        assert messages.calls == len(TASKS)
+        assert all(r.success for r in results)
+        assert results[0].metrics.input_tokens == 10
+
+
+class TestRateLimitAndTimeout:
+    """Tests for backoff and per-request timeouts."""
+
+    def test_retry_on_rate_limit(self):
+        """Rate-limited calls should be retried."""
+        messages = FakeMessages(failures=[RateLimited(), RateLimited()])
+        runtime = with_fake_client(ClaudeRuntime(FullConfig(), api_key="test"), messages)
+        result = runtime.execute_raw("system", "user")
+
+        assert result.success is True
+        assert messages.calls == 3
+
+    def test_retries_exhausted(self):
+        """Calls should fail once max_retries is spent."""
+        messages = FakeMessages(failures=[RateLimited()] * 3)
+        runtime = with_fake_client(
+            ClaudeRuntime(FullConfig(), api_key="test", max_retries=1), messages
+        )
+        result = runtime.execute_raw("system", "user")
+
+        assert result.success is False
+        assert messages.calls == 2
+
+    def test_non_retryable_error_not_retried(self):
+        """Errors other than 429/529 should fail immediately."""
+        messages = FakeMessages(failures=[ValueError("boom")])
+        runtime = with_fake_client(ClaudeRuntime(FullConfig(), api_key="test"), messages)
+        result = runtime.execute_raw("system", "user")
+
+        assert result.success is False
+        assert "boom" in result.error
+        assert messages.calls == 1
+
+    def test_backoff_schedule(self):
+        """Delay should grow exponentially up to the cap."""
+        runtime = ClaudeRuntime(FullConfig(), api_key=None)
+        error = SimpleNamespace(status_code=529, response=None)
+
+        assert runtime._retry_delay(error, 0) == runtime.BACKOFF_BASE_S
+        assert runtime._retry_delay(error, 1) == runtime.BACKOFF_BASE_S * 2
+        assert runtime._retry_delay(error, runtime.max_retries) is None
+
+    def test_async_timeout(self):
+        """Async calls exceeding request_timeout should fail."""
+        messages = AsyncFakeMessages(latency_s=0.5)
+        runtime = with_fake_client(
+            AsyncClaudeRuntime(FullConfig(), api_key="test", request_timeout=0.01), messages
+        )
+        result = asyncio.run(runtime.execute("Slow task"))
+
+        assert result.success is False
+        assert "timed out" in result.error
+
 
 class TestCreateRuntime:
     """Tests for create_runtime() factory."""
@@ -183,6 +363,11 @@ class TestCreateRuntime:
         runtime = create_runtime(use_mock=False)
         assert isinstance(runtime, ClaudeRuntime)
 
+    def test_create_async_runtimes(self):
+        """create_runtime(use_async=True) should return async variants."""
+        assert isinstance(create_runtime(use_mock=True, use_async=True), AsyncMockRuntime)
+        assert isinstance(create_runtime(use_async=True), AsyncClaudeRuntime)
+
     def test_create_with_config(self):
         """create_runtime() should accept custom config."""
         config = FullConfig()
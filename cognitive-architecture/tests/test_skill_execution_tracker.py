@@ -0,0 +1,104 @@
+"""
+Tests for optimization/skill_execution_tracker.py
+
+Tests:
+- Write-ahead log batching and fsync thresholds
+- State rebuilt from snapshot + log replay
+- Log compaction into the snapshot
+"""
+
+import pytest
+import tempfile
+import json
+import sys
+import os
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from optimization.skill_execution_tracker import ExecutionType, SkillExecutionTracker
+
+
+OUTPUT = "[assert|neutral] Task done [ground:test] [conf:0.9]"
+
+
+def run(tracker, name, success=True, times=1):
+    for _ in range(times):
+        execution_id = tracker.start_execution(ExecutionType.SKILL, name)
+        tracker.end_execution(execution_id, success, OUTPUT)
+
+
+@pytest.fixture
+def storage_dir():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+def make_tracker(storage_dir, **kwargs):
+    kwargs.setdefault("flush_interval_s", 3600)
+    return SkillExecutionTracker(storage_dir=storage_dir, **kwargs)
+
+
+class TestWriteAheadLog:
+    """Tests for skill config persistence."""
+
+    def test_entries_batched_until_threshold(self, storage_dir):
+        """Nothing is written until the flush threshold is reached."""
+        tracker = make_tracker(storage_dir, flush_every=4)
+        run(tracker, "alpha", times=3)
+        assert not tracker.wal_file.exists()
+        run(tracker, "alpha")
+        assert len(tracker.wal_file.read_text().splitlines()) == 4
+        assert not tracker.configs_file.exists()
+
+    def test_only_creation_entry_has_vector(self, storage_dir):
+        """Updates should log counters only, not the config vector."""
+        tracker = make_tracker(storage_dir)
+        run(tracker, "alpha", times=2)
+        tracker.flush()
+        entries = [json.loads(l) for l in tracker.wal_file.read_text().splitlines()]
+        assert "optimal_config_vector" in entries[0]
+        assert "optimal_config_vector" not in entries[1]
+
+    def test_state_rebuilt_on_load(self, storage_dir):
+        """A new tracker should replay the log to the same state."""
+        tracker = make_tracker(storage_dir)
+        run(tracker, "alpha", times=3)
+        run(tracker, "beta", success=False, times=2)
+        tracker.flush()
+
+        reloaded = make_tracker(storage_dir)
+        for name in ["alpha", "beta"]:
+            assert reloaded.get_skill_stats(ExecutionType.SKILL, name) == \
+                tracker.get_skill_stats(ExecutionType.SKILL, name)
+
+    def test_torn_tail_ignored(self, storage_dir):
+        """A partially written last line should not break loading."""
+        tracker = make_tracker(storage_dir)
+        run(tracker, "alpha", times=2)
+        tracker.flush()
+        with open(tracker.wal_file, "a") as f:
+            f.write('{"key": "skill:alpha", "execution_co')
+
+        reloaded = make_tracker(storage_dir)
+        assert reloaded.get_skill_stats(ExecutionType.SKILL, "alpha")["execution_count"] == 2
+
+    def test_compaction_folds_log_into_snapshot(self, storage_dir):
+        """Reaching the compaction threshold writes a snapshot and truncates the log."""
+        tracker = make_tracker(storage_dir, flush_every=2, compact_every=4)
+        run(tracker, "alpha", times=4)
+        assert tracker.configs_file.exists()
+        assert tracker.wal_file.read_text() == ""
+
+        run(tracker, "alpha", times=2)
+        reloaded = make_tracker(storage_dir)
+        assert reloaded.get_skill_stats(ExecutionType.SKILL, "alpha")["execution_count"] == 6
+
+    def test_timer_flushes_in_background(self, storage_dir):
+        """Pending entries should be flushed by the background timer."""
+        tracker = make_tracker(storage_dir, flush_interval_s=0.2)
+        run(tracker, "alpha")
+        timer = tracker._flush_timer
+        assert timer is not None
+        timer.join(2.0)
+        assert len(tracker.wal_file.read_text().splitlines()) == 1
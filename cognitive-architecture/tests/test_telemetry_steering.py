@@ -0,0 +1,155 @@
+"""
+Tests for optimization/telemetry_steering.py
+
+Tests:
+- ParetoFrontier incremental inserts, moves and removals
+- TelemetrySteeringEngine frontiers match a full recomputation
+- Steering recommendations read from the maintained frontier
+"""
+
+import pytest
+import random
+import tempfile
+import sys
+import os
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from optimization.telemetry_steering import (
+    ParetoFrontier,
+    TelemetrySteeringEngine,
+)
+
+
+def brute_force_frontier(points):
+    """Reference: non-dominated names, stable-sorted by first objective."""
+    def dominates(a, b):
+        return all(x >= y for x, y in zip(a, b)) and any(x > y for x, y in zip(a, b))
+
+    frontier = [
+        name for name, obj in points.items()
+        if not any(dominates(other, obj) for o, other in points.items() if o != name)
+    ]
+    frontier.sort(key=lambda n: points[n][0], reverse=True)
+    return frontier
+
+
+@pytest.fixture
+def engine():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield TelemetrySteeringEngine(storage_dir=Path(tmpdir))
+
+
+class TestParetoFrontier:
+    """Tests for the incremental frontier structure."""
+
+    def test_insert_evicts_dominated(self):
+        """A dominating insert should evict the points it dominates."""
+        frontier = ParetoFrontier()
+        frontier.upsert("a", (0.5, 0.5))
+        frontier.upsert("b", (0.9, 0.1))
+        frontier.upsert("c", (0.6, 0.6))
+        assert frontier.members == ["b", "c"]
+        assert "a" not in frontier
+
+    def test_ties_are_kept(self):
+        """Identical points do not dominate each other."""
+        frontier = ParetoFrontier()
+        frontier.upsert("a", (0.7, 0.7))
+        frontier.upsert("b", (0.7, 0.7))
+        assert frontier.members == ["a", "b"]
+        assert frontier.best(0) == "a"
+        assert frontier.best(1) == "a"
+
+    def test_moving_member_releases_dominated(self):
+        """Moving a member down should re-admit points it dominated."""
+        frontier = ParetoFrontier()
+        frontier.upsert("a", (0.9, 0.9))
+        frontier.upsert("b", (0.5, 0.5))
+        assert frontier.members == ["a"]
+        frontier.upsert("a", (0.4, 0.4))
+        assert frontier.members == ["b"]
+        frontier.remove("b")
+        assert frontier.members == ["a"]
+
+    @pytest.mark.parametrize("dims", [2, 3])
+    def test_random_updates_match_brute_force(self, dims):
+        """Random inserts and moves should match full recomputation."""
+        rng = random.Random(dims)
+        frontier = ParetoFrontier()
+        points = {}
+        for step in range(400):
+            name = f"m{rng.randrange(25)}"
+            obj = tuple(round(rng.random(), 1) for _ in range(dims))
+            points[name] = obj
+            frontier.upsert(name, obj)
+            if step % 37 == 0:
+                victim = rng.choice(sorted(points))
+                del points[victim]
+                frontier.remove(victim)
+
+            ordered = sorted(points, key=frontier._orders.__getitem__)
+            expected = brute_force_frontier({n: points[n] for n in ordered})
+            assert frontier.members == expected
+
+
+class TestSteeringEngineFrontier:
+    """Tests for frontier maintenance in the steering engine."""
+
+    def test_frontier_matches_recomputation(self, engine):
+        """Per-domain frontiers should equal the batch O(n^2) computation."""
+        rng = random.Random(3)
+        modes = ["minimal", "efficient", "balanced", "strict", "robust"]
+        for _ in range(300):
+            engine.record_outcome(
+                rng.choice(modes), rng.choice(["coding", "analysis"]),
+                rng.random(), rng.random(),
+            )
+
+        for domain in ["coding", "analysis"]:
+            trusted = {
+                m: (r.avg_accuracy, r.avg_efficiency)
+                for (m, d), r in engine._performance_db.items()
+                if d == domain and r.sample_count >= engine.MIN_SAMPLES_FOR_TRUST
+            }
+            frontier = engine.get_pareto_frontier(domain)
+            assert [p.mode_name for p in frontier] == brute_force_frontier(trusted)
+            assert all(p.is_pareto_optimal for p in frontier)
+
+    def test_recommendation_reads_frontier(self, engine):
+        """Accuracy and efficiency preferences should pick frontier extremes."""
+        for _ in range(5):
+            engine.record_outcome("strict", "coding", 0.9, 0.3)
+            engine.record_outcome("efficient", "coding", 0.6, 0.9)
+            engine.record_outcome("minimal", "coding", 0.5, 0.5)
+
+        rec = engine.get_steering_recommendation("coding")
+        assert rec.mode_name == "strict"
+        assert rec.pareto_rank == 0
+        rec = engine.get_steering_recommendation("coding", prefer_accuracy=False)
+        assert rec.mode_name == "efficient"
+
+        ranks = {r.mode_name: r.pareto_rank for r in engine.get_all_recommendations("coding")}
+        assert ranks == {"strict": 0, "efficient": 0, "minimal": 1}
+
+    def test_untrusted_domain_falls_back(self, engine):
+        """Domains without trusted records should use best available."""
+        engine.record_outcome("balanced", "creative", 0.7, 0.7)
+        rec = engine.get_steering_recommendation("creative")
+        assert rec.mode_name == "balanced"
+        assert rec.pareto_rank == 1
+        assert engine.get_steering_recommendation("unknown") is None
+
+    def test_frontier_rebuilt_on_load(self):
+        """Saved performance data should rebuild the same frontiers."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            engine = TelemetrySteeringEngine(storage_dir=Path(tmpdir))
+            for _ in range(5):
+                engine.record_outcome("strict", "coding", 0.9, 0.3)
+                engine.record_outcome("efficient", "coding", 0.6, 0.9)
+            engine.save()
+
+            reloaded = TelemetrySteeringEngine(storage_dir=Path(tmpdir))
+            assert [p.mode_name for p in reloaded.get_pareto_frontier("coding")] == \
+                [p.mode_name for p in engine.get_pareto_frontier("coding")]
@@ -0,0 +1,261 @@
+"""
+Tests for skills/trigger_matcher.py
+
+Tests:
+- CompiledTriggerIndex construction (vocab, postings, categories)
+- Compiled match() ranking equals the per-skill linear scan
+- Negative trigger penalties and empty prompts
+- skill-index.bin artifact: identical matches, lazy tables, stale/corrupt fallback
+"""
+
+import json
+import os
+
+import pytest
+from skills.index_artifact import ArtifactBuilder, ArtifactError, IndexArtifact
+from skills.trigger_matcher import CompiledTriggerIndex, SkillTriggerMatcher
+
+
+SKILLS = {
+    "debug-api": {
+        "category": "quality",
+        "path": "skills/debug-api",
+        "description": "Debug failing API endpoints and trace errors",
+        "triggers": ["debug", "api", "error", "trace"],
+        "negativeTriggers": ["deploy"],
+        "files": ["SKILL.md"],
+    },
+    "deploy-k8s": {
+        "category": "operations",
+        "path": "skills/deploy-k8s",
+        "description": "Deploy services to kubernetes clusters",
+        "triggers": ["deploy", "kubernetes", "docker", "cluster"],
+        "negativeTriggers": ["debug"],
+        "files": [],
+    },
+    "literature-review": {
+        "category": "research",
+        "path": "skills/literature-review",
+        "description": "Systematic literature review and synthesis",
+        "triggers": ["literature", "review", "papers", "research"],
+        "negativeTriggers": [],
+        "files": ["README.md"],
+    },
+    "code-review": {
+        "category": "quality",
+        "path": "skills/code-review",
+        "description": "Review pull requests for quality issues",
+        "triggers": ["review", "review", "pull", "quality"],
+        "negativeTriggers": [],
+        "files": [],
+    },
+}
+
+
+def linear_match(matcher, prompt, threshold=0.6, top_k=5):
+    """Reference per-skill scan the compiled index must reproduce."""
+    tokens = matcher._tokenize(prompt)
+    if not tokens:
+        return []
+    scored = []
+    for name, data in matcher.skills.items():
+        trigger_score, matched = matcher._fuzzy_match_triggers(
+            tokens, data.get("triggers", []), threshold
+        )
+        cat_score = matcher._score_category(tokens, data.get("category", "unknown"))
+        desc_words = matcher._tokenize(data.get("description", ""))
+        desc_score = sum(2.0 for t in tokens if t in desc_words)
+        neg_score, _ = matcher._fuzzy_match_triggers(
+            tokens, data.get("negativeTriggers", []), threshold
+        )
+        total = trigger_score + cat_score + desc_score - (neg_score * 0.5)
+        if total > 0:
+            scored.append((name, round(min(100.0, total * 5), 1), sorted(matched)))
+    scored.sort(key=lambda x: x[1], reverse=True)
+    return scored[:top_k]
+
+
+@pytest.fixture
+def matcher(tmp_path):
+    index_path = tmp_path / "skill-index.json"
+    index_path.write_text(json.dumps({"skills": SKILLS, "keyword_index": {}}))
+    return SkillTriggerMatcher(str(index_path))
+
+
+class TestCompiledTriggerIndex:
+    """Tests for index construction."""
+
+    def test_vocab_is_deduplicated(self, matcher):
+        """Shared triggers should appear once in the vocabulary."""
+        vocab = matcher._compiled.vocab
+        assert len(vocab) == len(set(vocab))
+        assert "review" in vocab
+
+    def test_postings_keep_every_occurrence(self, matcher):
+        """Duplicate triggers in one skill should post each position."""
+        compiled = matcher._compiled
+        review_id = compiled.vocab.index("review")
+        code_review = compiled.skill_names.index("code-review")
+        positions = [pos for sid, pos in compiled.postings[review_id] if sid == code_review]
+        assert positions == [0, 1]
+
+    def test_descriptions_tokenized_once(self, matcher):
+        """Description words should map back to their skills."""
+        compiled = matcher._compiled
+        deploy_k8s = compiled.skill_names.index("deploy-k8s")
+        assert deploy_k8s in compiled.desc_postings["kubernetes"]
+
+    def test_categories_indexed(self, matcher):
+        """Skills should be grouped by category."""
+        compiled = CompiledTriggerIndex(SKILLS, matcher._tokenize)
+        assert len(compiled.category_skills["quality"]) == 2
+        assert compiled.skill_categories[0] == "quality"
+
+
+class TestCompiledMatch:
+    """Compiled match() must rank exactly like the linear scan."""
+
+    @pytest.mark.parametrize("prompt", [
+        "help me debug this API error",
+        "deploy docker containers to the kubernetes cluster",
+        "write a literature review of research papers",
+        "review the pull request quality",
+        "debgu the apii erorr",
+        "deploy and debug",
+    ])
+    @pytest.mark.parametrize("threshold", [0.6, 0.8])
+    def test_matches_linear_scan(self, matcher, prompt, threshold):
+        """Names, confidences and matched triggers should be identical."""
+        compiled = [
+            (m.name, m.confidence, sorted(m.matched_triggers))
+            for m in matcher.match(prompt, threshold, top_k=10)
+        ]
+        assert compiled == linear_match(matcher, prompt, threshold, top_k=10)
+
+    def test_negative_trigger_penalty(self, matcher):
+        """Negative triggers should lower a skill's rank."""
+        matches = matcher.match("deploy kubernetes cluster", top_k=10)
+        names = [m.name for m in matches]
+        assert names[0] == "deploy-k8s"
+
+    def test_empty_prompt(self, matcher):
+        """Stopword-only prompts should return no matches."""
+        assert matcher.match("please help me with the") == []
+
+    def test_repeated_match_uses_cache(self, matcher):
+        """Repeated prompts should reuse memoized trigger hits."""
+        first = matcher.match("debug api error")
+        assert matcher._compiled._hit_cache
+        second = matcher.match("debug api error")
+        assert [m.to_dict() for m in first] == [m.to_dict() for m in second]
+
+
+KEYWORD_INDEX = {"review": ["literature-review", "code-review"], "debug": ["debug-api"]}
+
+
+@pytest.fixture
+def index_path(tmp_path):
+    index_path = tmp_path / "skill-index.json"
+    index_path.write_text(json.dumps({"skills": SKILLS, "keyword_index": KEYWORD_INDEX}))
+    SkillTriggerMatcher(str(index_path), use_artifact=False).compile_artifact()
+    return index_path
+
+
+class TestIndexArtifact:
+    """The mmap-loaded artifact must behave exactly like the JSON index."""
+
+    @pytest.mark.parametrize("prompt", [
+        "help me debug this API error",
+        "deploy docker containers to the kubernetes cluster",
+        "review the pull request quality",
+        "debgu the apii erorr",
+    ])
+    def test_matches_json_index(self, index_path, prompt):
+        """Matches from the artifact equal matches compiled from the JSON."""
+        mapped = SkillTriggerMatcher(str(index_path))
+        parsed = SkillTriggerMatcher(str(index_path), use_artifact=False)
+        assert mapped.index_source == "artifact"
+        assert parsed.index_source == "json"
+        for threshold in (0.6, 0.8):
+            expected = [m.to_dict() for m in parsed.match(prompt, threshold, top_k=10)]
+            actual = [m.to_dict() for m in mapped.match(prompt, threshold, top_k=10)]
+            for match in expected + actual:
+                match["matched_triggers"].sort()
+            assert actual == expected
+
+    def test_lazy_tables_match_json(self, index_path):
+        """skills, keyword_index and the compiled tables read back unchanged."""
+        mapped = SkillTriggerMatcher(str(index_path))
+        parsed = SkillTriggerMatcher(str(index_path), use_artifact=False)
+        assert dict(mapped.skills) == SKILLS
+        assert list(mapped.keyword_index.items()) == list(KEYWORD_INDEX.items())
+        assert "missing" not in mapped.skills
+        compiled, mapped_compiled = parsed._compiled, mapped._compiled
+        assert mapped_compiled.vocab == compiled.vocab
+        assert list(mapped_compiled.skill_names) == compiled.skill_names
+        assert mapped_compiled.category_skills == compiled.category_skills
+        for trigger_id in range(len(compiled.vocab)):
+            assert mapped_compiled.postings.get(trigger_id, ()) == compiled.postings.get(trigger_id, ())
+        assert mapped_compiled.desc_postings.get("kubernetes") == compiled.desc_postings["kubernetes"]
+        assert mapped_compiled.desc_postings.get("nope") is None
+        assert mapped.index["keyword_index"] == KEYWORD_INDEX
+
+    def test_touched_json_still_uses_artifact(self, index_path):
+        """A new mtime with unchanged contents is verified by hash."""
+        stat = os.stat(index_path)
+        os.utime(index_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert SkillTriggerMatcher(str(index_path)).index_source == "artifact"
+
+    def test_stale_artifact_falls_back(self, index_path):
+        """A JSON rebuilt without the artifact is read directly."""
+        skills = dict(SKILLS)
+        skills["new-skill"] = dict(SKILLS["debug-api"], triggers=["newtrigger"])
+        index_path.write_text(json.dumps({"skills": skills, "keyword_index": {}}))
+        matcher = SkillTriggerMatcher(str(index_path))
+        assert matcher.index_source == "json"
+        assert matcher.match("newtrigger")[0].name == "new-skill"
+
+    def test_same_size_edit_detected(self, index_path):
+        """A same-size edit is caught by the content hash."""
+        text = index_path.read_text()
+        stat = os.stat(index_path)
+        index_path.write_text(text.replace("Debug failing", "Debug FAILING"))
+        os.utime(index_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        assert SkillTriggerMatcher(str(index_path)).index_source == "json"
+
+    def test_tokenizer_change_falls_back(self, index_path, monkeypatch):
+        """Artifacts built with another tokenizer version are not used."""
+        monkeypatch.setattr(SkillTriggerMatcher, "TOKENIZER_VERSION", 99)
+        assert SkillTriggerMatcher(str(index_path)).index_source == "json"
+
+    @pytest.mark.parametrize("content", [b"", b"garbage", b"SKIX" + b"\0" * 100])
+    def test_corrupt_artifact_falls_back(self, index_path, content):
+        index_path.with_suffix(".bin").write_bytes(content)
+        matcher = SkillTriggerMatcher(str(index_path))
+        assert matcher.index_source == "json"
+        assert matcher.match("debug api error")
+
+
+class TestArtifactFormat:
+    """Tests for skills/index_artifact.py containers."""
+
+    def test_keyed_table_lookup_and_order(self, tmp_path):
+        source = tmp_path / "source.json"
+        source.write_text("{}")
+        builder = ArtifactBuilder()
+        items = [("zeta", [1]), ("\u00e9t\u00e9", [2, 3]), ("alpha", []), ("mid", [4])]
+        builder.add_keyed("KEYS", items)
+        builder.add_postings("PAIR", [[(1, 2)], [], [(3, 4), (5, 6)]])
+        path = builder.write(tmp_path / "test.bin", source, b"digest")
+
+        artifact = IndexArtifact.open(path)
+        assert artifact.matches_source(source, b"digest")
+        assert not artifact.matches_source(source, b"other")
+        table = artifact.keyed("KEYS")
+        assert list(table.items()) == items
+        assert table["\u00e9t\u00e9"] == [2, 3]
+        assert "beta" not in table
+        pairs = artifact.postings("PAIR")
+        assert [pairs.get(i) for i in range(4)] == [[(1, 2)], (), [(3, 4), (5, 6)], ()]
+        with pytest.raises(ArtifactError):
+            artifact.keyed("NONE")
@@ -9,11 +9,14 @@ Tests cover:
 - E5: L2 English purity
 - E6: Bracket collision detection
 - E7: L2 naturalization
+- Single-pass scan matches the per-check regex searches
 
 Run with: pytest tests/test_vcl_validator.py -v
 """
 
 import os
+import random
+import re
 import sys
 import pytest
 
@@ -33,6 +36,9 @@ from core.vcl_validator import (
     naturalize_to_l2,
     enforce_safety_bounds,
     compute_cluster_signature,
+    _ASPECT_WORDS,
+    _EVIDENCE_WORDS,
+    _scan_output,
 )
 
 
@@ -449,5 +455,86 @@ class TestConfidenceCeilingConstants:
         assert CONFIDENCE_CEILINGS[EVDType.REPORT] <= 0.70
 
 
+class TestCompiledEngine:
+    """The one-pass scan agrees with the regex searches it replaces."""
+
+    FRAGMENTS = [
+        "[[HON:teineigo]]", "[[EVD:-DI<gozlem>]]", "[[ASP:sov.]]", "[asp:nesov.]", "[EVD:",
+        "[[spc:N]]", "[[MOR:root]]", "[conf:0.95]", "[conf:1]", "[conf:0.99.]",
+        "[ground:witnessed]", "[ground:nesov.x]", "[ground:research:paper]", "[state:complete]",
+        "-mis<", "-dIr", "I observed", "\u0130 directly saw", "\u0131 saw", "\u017fov.", "it's reported that",
+        "its reported that", "according to", "i conclude that", "in progress", "partially",
+        "done", "passed", "report", "kansoKu", "policy", "tanim", "_", "9", "\u00b2", "\u00e9", " ", "x",
+    ]
+    EVIDENCE = [
+        r'\bi (directly )?(observed|verified|witnessed|saw)\b', r'\baccording to\b',
+        r'\bresearch (indicates|shows|suggests)\b', r"\bit'?s reported that\b",
+        r'\bi (infer|deduce|conclude) that\b', r'\bbased on\b',
+    ]
+    ASPECT = [
+        r'\b(complete|done|finished|succeeded|failed)\b',
+        r'\b(in progress|ongoing|working on|processing)\b', r'\b(partial(ly)?|started|begun)\b',
+    ]
+    EVD_TYPES = [
+        (EVDType.OBSERVATION, r'observation|gozlem|kansoku|mushahada|-DI.*gozlem'),
+        (EVDType.RESEARCH, r'research|arastirma|kenkyu|-mis.*arastirma'),
+        (EVDType.REPORT, r'report(ed)?|rapor|houkoku|-mis.*rapor'),
+        (EVDType.INFERENCE, r'infer(red)?|cikarim|suiron|-dir'),
+        (EVDType.DEFINITION, r'definition|tanim|teigi'),
+        (EVDType.POLICY, r'policy|politika|houshin'),
+    ]
+
+    def texts(self, count=2000):
+        rng = random.Random(7)
+        for _ in range(count):
+            yield "".join(rng.choice(self.FRAGMENTS) + rng.choice(["", " ", "x"])
+                          for _ in range(rng.randrange(0, 12)))
+
+    def reference_evd_type(self, output):
+        for evd_type, pattern in self.EVD_TYPES:
+            if re.search(pattern, output, re.IGNORECASE):
+                return evd_type
+        match = re.search(r'\[ground:([\w\-:=\.]+)\]', output)
+        if match:
+            ground = match.group(1).lower()
+            for evd_type, words in ((EVDType.OBSERVATION, ("witnessed", "observed")),
+                                    (EVDType.RESEARCH, ("research",)),
+                                    (EVDType.REPORT, ("reported",)),
+                                    (EVDType.INFERENCE, ("inferred",))):
+                if any(word in ground for word in words):
+                    return evd_type
+        return None
+
+    def test_tokens_match_regex_searches(self):
+        for text in self.texts():
+            scan = _scan_output(text)
+            for slot in VCLValidator.SLOT_ORDER:
+                match = re.search(rf'\[+{slot.value}:', text, re.IGNORECASE)
+                assert scan.slot_positions.get(slot) == (match.start() if match else None), text
+            assert scan.confidences == re.findall(r'\[conf:(\d+\.?\d*)\]', text)
+            assert scan.evd_marker == bool(re.search(r'-DI<|-mis<|-dir<', text, re.IGNORECASE))
+            assert scan.asp_marker == bool(re.search(r'sov\.', text, re.IGNORECASE))
+
+    def test_word_phrases_match_regexes(self):
+        for text in self.texts():
+            scan = _scan_output(text)
+            assert scan.contains_word(_EVIDENCE_WORDS) == any(
+                re.search(p, text, re.IGNORECASE) for p in self.EVIDENCE), text
+            assert scan.contains_word(_ASPECT_WORDS) == any(
+                re.search(p, text, re.IGNORECASE) for p in self.ASPECT), text
+
+    def test_evd_type_matches_regexes(self):
+        validator = VCLValidator()
+        for text in self.texts():
+            assert validator._extract_evd_type(text) == self.reference_evd_type(text), text
+
+    def test_case_folding_matches_ignorecase(self):
+        """Dotted/dotless I and long s fold the way re.IGNORECASE matches them."""
+        scan = _scan_output("\u0130 directly observed it, \u017fov. done")
+        assert scan.contains_word(("i directly observed",))
+        assert scan.contains(("sov.",))
+        assert scan.asp_marker
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -5,9 +5,13 @@ Tests:
 - All 7 cognitive frame implementations
 - FrameRegistry registration and lookup
 - Frame scoring functions
+- Single-pass CompiledFrameScorer equivalence
 - Combined activation instructions
 """
 
+import random
+from dataclasses import dataclass
+
 import pytest
 from core.verilingua import (
     CognitiveFrame,
@@ -18,6 +22,7 @@ from core.verilingua import (
     HonorificFrame,
     ClassifierFrame,
     SpatialFrame,
+    CompiledFrameScorer,
     FrameRegistry,
     score_all_frames,
     aggregate_frame_score,
@@ -266,6 +271,97 @@ class TestScoringFunctions:
         assert score == 1.0
 
 
+VOCAB = [
+    "is", "IS", "Is a", "is  a", "is a", "isa", "refers to", "Refers To", "defined as",
+    "means", "Means.", "DataStore", "FooBarBaz", "implementation", "function",
+    "file_path", "Line", "42", "4a", "some", "Several", "...", "?!", "end.is a",
+    "[witnessed]", "[WITNESSED]", "[root:x]", "[audience:dev]", "[Path:/a]", "[type:",
+]
+
+
+@dataclass
+class MarkerOnlyFrame:
+    """Custom frame using the compiled scanning attributes."""
+    name: str = "custom"
+    MARKERS = ["[custom:", "[cust"]
+    COUNT_PATTERN = r"\bwidget\b"
+    COUNT_FLAGS = 0
+
+    def score_from_counts(self, found_markers, pattern_count):
+        return len(found_markers) * 0.1 + pattern_count * 0.01
+
+    def score_response(self, response):
+        lower = response.lower()
+        found = {m for m in self.MARKERS if m in lower}
+        return self.score_from_counts(found, response.count("widget"))
+
+
+@pytest.fixture
+def restore_registry():
+    FrameRegistry._ensure_initialized()
+    frames = dict(FrameRegistry._frames)
+    yield
+    FrameRegistry._frames = frames
+    FrameRegistry._scorer = CompiledFrameScorer(frames)
+
+
+class TestCompiledFrameScorer:
+    """Single-pass scoring must equal per-frame score_response()."""
+
+    def test_random_text_matches_per_frame_scoring(self):
+        """Scores should be identical on mixed-case, punctuation-heavy text."""
+        rng = random.Random(3)
+        frames = FrameRegistry.get_all()
+        names = list(frames)
+        for _ in range(500):
+            response = "".join(
+                rng.choice(VOCAB) + rng.choice([" ", "  ", "\n", ", ", ".", ""])
+                for _ in range(rng.randint(0, 30))
+            )
+            expected = {n: frames[n].score_response(response) for n in names}
+            assert FrameRegistry.score_response(response, names) == expected
+
+    def test_score_all_frames_uses_config_order(self):
+        """score_all_frames should return active frames in registry order."""
+        config = FrameworkConfig(evidential=True, aspectual=True, spatial=True)
+        response = "[witnessed] The file is a module. [complete] [path:/x]"
+        scores = score_all_frames(response, config)
+        assert list(scores) == [f.name for f in FrameRegistry.get_active(config)]
+        assert scores == {n: FrameRegistry.get(n).score_response(response) for n in scores}
+
+    def test_register_recompiles(self, restore_registry):
+        """Registering a frame should add its markers to the compiled scanner."""
+        before = FrameRegistry._scorer
+        FrameRegistry.register(MarkerOnlyFrame())
+        assert FrameRegistry._scorer is not before
+
+        response = "[CUSTOM:x] widget widgets widget"
+        scores = FrameRegistry.score_response(response, ["custom", "evidential"])
+        assert scores["custom"] == pytest.approx(0.22)
+        assert scores["evidential"] == FrameRegistry.get("evidential").score_response(response)
+
+    def test_protocol_only_frame_falls_back(self, restore_registry):
+        """Frames without scan attributes should use their own score_response."""
+
+        class PlainFrame:
+            name = "plain"
+
+            def score_response(self, response):
+                return 0.5
+
+        FrameRegistry.register(PlainFrame())
+        assert FrameRegistry.score_response("text", ["plain"]) == {"plain": 0.5}
+
+    def test_repeated_response_reuses_result(self):
+        """aggregate after score_all_frames should not rescan the same response."""
+        config = FrameworkConfig()
+        response = "[witnessed] Repeated response."
+        scores = score_all_frames(response, config)
+        scorer = FrameRegistry._scorer
+        assert scorer._last[0] is response
+        assert aggregate_frame_score(response, config) == sum(scores.values()) / len(scores)
+
+
 class TestCombinedActivation:
     """Tests for combined activation instructions."""
 
@@ -6,15 +6,18 @@ Tests:
 - VerixParser L1 and L0 format parsing
 - VerixValidator validation and compliance scoring
 - Format conversion (L0, L1, L2)
+- VerixStreamParser incremental parsing, running validation and early rejection
 """
 
 import pytest
+import random
 from core.verix import (
     Illocution,
     Affect,
     State,
     VerixClaim,
     VerixParser,
+    VerixStreamParser,
     VerixValidator,
     format_claim,
     create_claim,
@@ -283,3 +286,95 @@ class TestHelperFunctions:
         assert claim.affect == Affect.NEUTRAL
         assert claim.confidence == 0.5
         assert claim.state == State.PROVISIONAL
+
+
+def claim_fields(claims):
+    return [
+        (c.raw_text, c.content, c.ground, c.confidence, c.state, c.agent, c.claim_id, c.meta_level)
+        for c in claims
+    ]
+
+
+def stream(text, chunk_size, **kwargs):
+    parser = VerixStreamParser(**kwargs)
+    emitted = []
+    for i in range(0, len(text), chunk_size):
+        emitted.extend(parser.feed(text[i:i + chunk_size]))
+    return parser, emitted
+
+
+class TestVerixStreamParser:
+    """Tests for VerixStreamParser."""
+
+    TOKENS = [
+        "[assert|neutral]", "[query|uncertain]", "[meta]", "[meta:verix]", "[agent:model]",
+        "[id:a]", "[id:b]", "[ground:a]", "[ground:doc", "[conf:0.9]", "[conf:0.3]", "[conf:0.",
+        "[state:confirmed]", "[state:retracted]", "content", "x", "]", " ", "\n", "\n\n", " \n ",
+        "MA.90:hello", "A+50:bye", "U?20:q", "[bogus|neutral]",
+    ]
+
+    def test_matches_batch_parse_and_validate(self):
+        """close()/result() equal parse()/validate() for any chunking."""
+        config = PromptConfig(verix_strictness=VerixStrictness.STRICT)
+        parser = VerixParser(config)
+        validator = VerixValidator(config)
+        rng = random.Random(3)
+        for _ in range(2000):
+            text = "".join(rng.choice(self.TOKENS) + rng.choice(["", " ", "\n"])
+                           for _ in range(rng.randrange(25)))
+            streaming, _ = stream(text, rng.choice([1, 3, 16, 200]), config=config)
+            claims = streaming.close()
+            assert claim_fields(claims) == claim_fields(parser.parse(text)), repr(text)
+            assert streaming.result() == validator.validate(claims)
+
+    def test_claims_emitted_as_lines_complete(self):
+        """An L1 claim is emitted once the following line completes."""
+        parser = VerixStreamParser()
+        assert parser.feed("[assert|neutral] Sky is blue [ground:obs] [conf:0.9]\n") == []
+        emitted = parser.feed("Some prose.\n")
+        assert [c.content for c in emitted] == ["Sky is blue"]
+        assert parser.feed("[query|uncertain] Is it? [conf:0.4]") == []
+        assert [c.content for c in parser.close()] == ["Sky is blue", "Is it?"]
+
+    def test_markers_on_following_line_kept(self):
+        """Trailing markers continued on the next line still attach to the claim."""
+        parser, emitted = stream("[assert|neutral] Claim\n[ground:doc] [conf:0.8]\nDone.\n", 4)
+        assert emitted[0].ground == "doc"
+        assert emitted[0].confidence == 0.8
+
+    def test_l0_emitted_per_line(self):
+        """L0 claims complete with their line."""
+        parser = VerixStreamParser()
+        assert [c.content for c in parser.feed("A.85:First\nMA+")] == ["First"]
+        assert [c.content for c in parser.feed("90:Second\n")] == ["Second"]
+
+    def test_l1_replaces_l0(self):
+        """Like parse(), a response with any L1 claim keeps only L1 claims."""
+        text = "A.85:Old style\n[assert|neutral] New style [ground:g] [conf:0.7]\nend\n"
+        parser, _ = stream(text, 5)
+        assert [c.content for c in parser.close()] == ["New style"]
+        assert parser.result() == VerixValidator(PromptConfig()).validate(parser.claims)
+
+    def test_running_violations_and_early_rejection(self):
+        """An off-spec response is rejected as soon as the limit is passed."""
+        config = PromptConfig(require_ground=True)
+        lines = ["[assert|neutral] Grounded [ground:doc] [conf:0.8]\n",
+                 "[assert|neutral] Ungrounded [conf:0.8]\n",
+                 "more text\n",
+                 "[assert|neutral] Never parsed [ground:doc] [conf:0.8]\n",
+                 "tail\n"]
+        parser = VerixStreamParser(config, max_violations=0)
+        for i, line in enumerate(lines):
+            parser.feed(line)
+            if parser.rejected:
+                break
+        assert i == 2
+        assert len(parser.violations) == 1
+        assert parser.feed(lines[3]) == []
+        assert len(parser.close()) == 2
+
+    def test_feed_after_close_raises(self):
+        parser = VerixStreamParser()
+        parser.close()
+        with pytest.raises(ValueError):
+            parser.feed("x")
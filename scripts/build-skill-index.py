@@ -11,17 +11,27 @@ Features:
 - Backward compatible with supplementary skills in ~/.claude/skills/
 - Packaged skills take precedence over supplementary skills with same name
 - Properly extracts TRIGGER_POSITIVE patterns for auto-routing
+- Also writes skill-index.bin, the precompiled trigger index that
+  trigger_matcher.py maps instead of parsing the JSON on every prompt
+- Incremental: per-archive results are cached in skill-index.cache.json
+  keyed on (path, size, mtime, SHA-256); only changed archives are
+  reprocessed, across a process pool, and the keyword and category
+  indexes are merged from the cached per-skill fragments
 
 Usage:
-    python build-skill-index.py [--output skill-index.json] [--verbose]
+    python build-skill-index.py [--output skill-index.json] [--verbose] [--no-artifact]
+                                [--full] [--jobs N] [--cache PATH]
 """
 
+import hashlib
+import io
 import json
 import os
 import re
 import sys
 import zipfile
-from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
@@ -44,6 +54,14 @@ SKILLS_DIR = PLUGIN_DIR / "skills"
 PACKAGED_SKILLS_DIR = SKILLS_DIR / "packaged"
 SUPPLEMENTARY_SKILLS_DIR = Path("C:/Users/17175/.claude/skills")
 DEFAULT_OUTPUT = PLUGIN_DIR / "scripts" / "skill-index" / "skill-index.json"
+# trigger_matcher.py (and the artifact format) live next to this script's repo
+MATCHER_DIR = Path(__file__).resolve().parent.parent / "cognitive-architecture" / "skills"
+
+# Incremental builds cache per-archive results next to the output; bump when
+# the cache layout changes (edits to this script invalidate it on their own)
+CACHE_VERSION = 1
+# Fewer changed archives than this are processed without a process pool
+PARALLEL_MIN_ARCHIVES = 8
 
 # Stopwords to filter from extracted keywords
 STOPWORDS = {
@@ -120,56 +138,73 @@ def find_packaged_skills(packaged_dir: Path) -> List[Path]:
     return list(packaged_dir.glob("*.skill"))
 
 
-def read_skill_md_from_archive(skill_archive: Path) -> Optional[Tuple[str, str]]:
+def _find_skill_md(namelist: List[str]) -> Optional[str]:
+    """SKILL.md member of an archive - it may be at root or in a subdirectory."""
+    for name in namelist:
+        if name.endswith('SKILL.md'):
+            return name
+    return None
+
+
+def _supporting_files_in(namelist: List[str]) -> List[str]:
+    """Supporting files listed in an archive (other .md files, examples/)."""
+    files = []
+    for name in namelist:
+        # Get just the filename without path prefixes
+        basename = Path(name).name
+        if basename and basename.endswith('.md') and basename != 'SKILL.md':
+            files.append(basename)
+        elif 'examples/' in name:
+            if 'examples/' not in files:
+                files.append('examples/')
+    return files
+
+
+def read_archive(skill_archive: Path, data: Optional[bytes] = None) -> Optional[Tuple[str, str, List[str]]]:
     """
-    Read SKILL.md content from a .skill ZIP archive.
+    Read SKILL.md and the supporting file list from a .skill ZIP archive,
+    opening it once.
+
+    Args:
+        skill_archive: Archive path
+        data: Archive bytes already read (default: read skill_archive)
 
     Returns:
-        Tuple of (content, skill_name) or None if SKILL.md not found
+        Tuple of (content, skill_name, files) or None if SKILL.md not found
     """
     try:
-        with zipfile.ZipFile(skill_archive, 'r') as zf:
-            # List all files in the archive
+        with zipfile.ZipFile(io.BytesIO(data) if data is not None else skill_archive, 'r') as zf:
             namelist = zf.namelist()
-
-            # Look for SKILL.md - it may be at root or in a subdirectory
-            skill_md_path = None
-            for name in namelist:
-                if name.endswith('SKILL.md'):
-                    skill_md_path = name
-                    break
-
+            skill_md_path = _find_skill_md(namelist)
             if not skill_md_path:
                 return None
-
-            # Read the content
             content = zf.read(skill_md_path).decode('utf-8', errors='replace')
-
-            # Extract skill name from the archive filename (without .skill extension)
-            skill_name = skill_archive.stem
-
-            return (content, skill_name)
     except (zipfile.BadZipFile, KeyError, IOError) as e:
         print(f"  Error reading {skill_archive}: {e}")
         return None
 
+    # Skill name from the archive filename (without .skill extension)
+    return (content, skill_archive.stem, _supporting_files_in(namelist))
+
+
+def read_skill_md_from_archive(skill_archive: Path) -> Optional[Tuple[str, str]]:
+    """
+    Read SKILL.md content from a .skill ZIP archive.
+
+    Returns:
+        Tuple of (content, skill_name) or None if SKILL.md not found
+    """
+    result = read_archive(skill_archive)
+    return result[:2] if result else None
+
 
 def get_supporting_files_from_archive(skill_archive: Path) -> List[str]:
     """Get list of supporting files from a .skill ZIP archive."""
-    files = []
     try:
         with zipfile.ZipFile(skill_archive, 'r') as zf:
-            for name in zf.namelist():
-                # Get just the filename without path prefixes
-                basename = Path(name).name
-                if basename and basename.endswith('.md') and basename != 'SKILL.md':
-                    files.append(basename)
-                elif 'examples/' in name:
-                    if 'examples/' not in files:
-                        files.append('examples/')
+            return _supporting_files_in(zf.namelist())
     except (zipfile.BadZipFile, IOError):
-        pass
-    return files
+        return []
 
 
 def parse_yaml_frontmatter(content: str) -> Dict:
@@ -421,13 +456,13 @@ def process_skill_file(skill_path: Path, skills_dir: Path) -> Optional[SkillData
     )
 
 
-def process_packaged_skill(skill_archive: Path) -> Optional[SkillData]:
-    """Process a .skill ZIP archive and extract data."""
-    result = read_skill_md_from_archive(skill_archive)
+def process_packaged_skill(skill_archive: Path, data: Optional[bytes] = None) -> Optional[SkillData]:
+    """Process a .skill ZIP archive (or its already-read bytes) and extract data."""
+    result = read_archive(skill_archive, data)
     if not result:
         return None
 
-    content, archive_name = result
+    content, archive_name, files = result
 
     # Parse frontmatter
     frontmatter = parse_yaml_frontmatter(content)
@@ -486,9 +521,6 @@ def process_packaged_skill(skill_archive: Path) -> Optional[SkillData]:
     ]
     negative_triggers = extract_keywords(' '.join(negative_sources))
 
-    # Get supporting files from archive
-    files = get_supporting_files_from_archive(skill_archive)
-
     # Path format: skills/packaged/{name}.skill
     rel_path = f"skills/packaged/{skill_archive.name}"
 
@@ -505,6 +537,163 @@ def process_packaged_skill(skill_archive: Path) -> Optional[SkillData]:
     )
 
 
+def extractor_fingerprint() -> str:
+    """Digest of this script, so cached fragments from other extraction code are not reused."""
+    return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+
+def default_cache_path(output_path: Path) -> Path:
+    return output_path.with_name(output_path.stem + '.cache.json')
+
+
+def _skill_from_fragment(fragment: dict) -> SkillData:
+    """SkillData from a cached fragment (lists copied; main() appends tags)."""
+    return SkillData(**{k: list(v) if isinstance(v, list) else v for k, v in fragment.items()})
+
+
+class ArchiveCache:
+    """
+    Per-archive SkillData fragments from previous builds.
+
+    Entries are keyed on the archive path and validated against its size and
+    mtime; when only the mtime changed (a checkout or copy) the archive is
+    hashed and the entry kept if the SHA-256 still matches.
+    """
+
+    def __init__(self, path: Optional[Path], entries: Optional[Dict[str, dict]] = None):
+        self.path = path
+        self.entries: Dict[str, dict] = entries or {}
+        self.dirty = False
+
+    @classmethod
+    def load(cls, path: Path) -> 'ArchiveCache':
+        """Cache at path (empty if missing, unreadable or from other extraction code)."""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return cls(path)
+        if data.get('version') != CACHE_VERSION or data.get('extractor') != extractor_fingerprint():
+            return cls(path)
+        return cls(path, data.get('archives', {}))
+
+    def get(self, archive: Path) -> Tuple[bool, Optional[SkillData]]:
+        """(hit, skill) for archive; skill is None for archives without SKILL.md."""
+        entry = self.entries.get(str(archive))
+        if entry is None:
+            return False, None
+        try:
+            stat = archive.stat()
+        except OSError:
+            return False, None
+        if stat.st_size != entry['size']:
+            return False, None
+        if stat.st_mtime_ns != entry['mtime_ns']:
+            try:
+                digest = hashlib.sha256(archive.read_bytes()).hexdigest()
+            except OSError:
+                return False, None
+            if digest != entry['sha256']:
+                return False, None
+            entry['mtime_ns'] = stat.st_mtime_ns
+            self.dirty = True
+        skill = entry['skill']
+        return True, _skill_from_fragment(skill) if skill is not None else None
+
+    def put(self, archive: str, entry: dict) -> None:
+        self.entries[archive] = entry
+        self.dirty = True
+
+    def prune(self, archives: List[Path]) -> None:
+        """Drop entries for archives that no longer exist."""
+        keep = {str(a) for a in archives}
+        for archive in [a for a in self.entries if a not in keep]:
+            del self.entries[archive]
+            self.dirty = True
+
+    def save(self) -> None:
+        """Write the cache atomically (no-op when nothing changed)."""
+        if self.path is None or not self.dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': CACHE_VERSION,
+                'extractor': extractor_fingerprint(),
+                'archives': self.entries,
+            }, f)
+        os.replace(tmp_path, self.path)
+        self.dirty = False
+
+
+def process_archive_fragment(archive: str) -> Tuple[str, Optional[dict]]:
+    """
+    Process one archive into a cache entry (runs in pool workers).
+
+    Returns:
+        (archive, entry) - entry holds size, mtime_ns, sha256 and the
+        SkillData fields (None if SKILL.md is missing); entry is None if
+        the archive could not be read
+    """
+    path = Path(archive)
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+        data = path.read_bytes()
+    except OSError as e:
+        print(f"  Error reading {path}: {e}")
+        return archive, None
+    skill = process_packaged_skill(path, data)
+    return archive, {
+        'size': len(data),
+        'mtime_ns': mtime_ns,
+        'sha256': hashlib.sha256(data).hexdigest(),
+        'skill': asdict(skill) if skill else None,
+    }
+
+
+def process_archives(
+    archives: List[Path],
+    cache: ArchiveCache,
+    jobs: int = 1,
+) -> Tuple[List[Optional[SkillData]], int]:
+    """
+    SkillData for each archive, reprocessing only those the cache misses.
+
+    Args:
+        archives: Packaged .skill files
+        cache: Fragments from previous builds (updated in place)
+        jobs: Worker processes for the changed archives
+
+    Returns:
+        (skills in archive order, number of archives reprocessed)
+    """
+    results: Dict[str, Optional[SkillData]] = {}
+    misses: List[str] = []
+    for archive in archives:
+        hit, skill = cache.get(archive)
+        if hit:
+            results[str(archive)] = skill
+        else:
+            misses.append(str(archive))
+
+    if jobs > 1 and len(misses) >= PARALLEL_MIN_ARCHIVES:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            fragments = list(pool.map(process_archive_fragment, misses,
+                                      chunksize=max(1, len(misses) // (jobs * 4))))
+    else:
+        fragments = [process_archive_fragment(archive) for archive in misses]
+
+    for archive, entry in fragments:
+        if entry is None:
+            results[archive] = None
+            continue
+        cache.put(archive, entry)
+        results[archive] = _skill_from_fragment(entry['skill']) if entry['skill'] is not None else None
+
+    return [results[str(archive)] for archive in archives], len(misses)
+
+
 def build_keyword_index(skills: Dict[str, dict]) -> Dict[str, List[str]]:
     """Build inverted index: keyword -> [skill names]."""
     index: Dict[str, List[str]] = {}
@@ -537,6 +726,26 @@ def build_category_index(skills: Dict[str, dict]) -> Dict[str, dict]:
     return categories
 
 
+def write_index_artifact(json_path: Path) -> Optional[Path]:
+    """
+    Compile json_path into the mmap-loaded artifact next to it (.bin).
+
+    Returns:
+        Artifact path, or None if trigger_matcher.py could not be imported
+        (the matcher then keeps reading the JSON)
+    """
+    sys.path.insert(0, str(MATCHER_DIR))
+    try:
+        from trigger_matcher import SkillTriggerMatcher
+    except ImportError as e:
+        print(f"  Skipping skill-index.bin: cannot import trigger_matcher ({e})")
+        return None
+    finally:
+        sys.path.remove(str(MATCHER_DIR))
+
+    return SkillTriggerMatcher(str(json_path), use_artifact=False).compile_artifact()
+
+
 def main():
     """Main entry point."""
     import argparse
@@ -546,9 +755,19 @@ def main():
                         help='Output JSON file path')
     parser.add_argument('--verbose', '-v', action='store_true',
                         help='Verbose output')
+    parser.add_argument('--no-artifact', action='store_true',
+                        help='Do not write the precompiled skill-index.bin')
+    parser.add_argument('--full', action='store_true',
+                        help='Ignore the incremental cache and reprocess every archive')
+    parser.add_argument('--cache', type=str, default=None,
+                        help='Incremental cache path (default: <output>.cache.json)')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                        help='Worker processes for changed archives')
     args = parser.parse_args()
 
     output_path = Path(args.output)
+    cache_path = Path(args.cache) if args.cache else default_cache_path(output_path)
+    cache = ArchiveCache(cache_path) if args.full else ArchiveCache.load(cache_path)
 
     print(f"Building skill index...")
     print(f"Packaged skills directory: {PACKAGED_SKILLS_DIR}")
@@ -565,8 +784,12 @@ def main():
     packaged_skill_files = find_packaged_skills(PACKAGED_SKILLS_DIR)
     print(f"\nFound {len(packaged_skill_files)} packaged .skill files")
 
-    for skill_archive in packaged_skill_files:
-        skill_data = process_packaged_skill(skill_archive)
+    packaged_skills, reprocessed = process_archives(packaged_skill_files, cache, args.jobs)
+    cache.prune(packaged_skill_files)
+    cache.save()
+    print(f"Reprocessed {reprocessed} changed archives (cache: {cache_path})")
+
+    for skill_data in packaged_skills:
         if skill_data:
             skill_data.tags.append("packaged")
             packaged_count += 1
@@ -635,6 +858,11 @@ def main():
 
     print(f"\nIndex written to {output_path}")
 
+    if not args.no_artifact:
+        artifact_path = write_index_artifact(output_path)
+        if artifact_path:
+            print(f"Precompiled index written to {artifact_path}")
+
     # Print summary
     print("\n=== Summary ===")
     print(f"Total skills: {index['total_skills']} (packaged: {index['packaged_skills']}, supplementary: {index['supplementary_skills']})")
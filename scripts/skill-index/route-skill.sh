@@ -4,7 +4,9 @@
 # Usage: route-skill.sh "user request text"
 # Output: Top 5 matching skills with confidence scores
 #
-# Uses Python trigger_matcher.py with rapidfuzz for fuzzy matching.
+# Uses Python trigger_matcher.py with rapidfuzz for fuzzy matching. The
+# matcher maps skill-index.bin (written by build-skill-index.py) when it is
+# up to date with skill-index.json, and parses the JSON otherwise.
 # Falls back to Node.js if Python matcher unavailable.
 
 
@@ -7,6 +7,10 @@
 # ROUTING PRIORITY:
 #   1. COMMANDS_INDEX.yaml - Explicit trigger->skill mappings
 #   2. skill-index.json - Fuzzy keyword matching (fallback)
+#
+# Both tiers are answered by a resident router (router_service.py, started
+# in the background on first use) through router_client.py; the shell tiers
+# below run when it does not answer in time. SKILL_ROUTER_DAEMON=0 disables it.
 
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 PLUGIN_DIR="${SCRIPT_DIR%/*}"
@@ -27,6 +31,16 @@ if echo "$MESSAGE_TEXT" | grep -iqE "$TRIVIAL_PATTERNS"; then
     exit 0
 fi
 
+# === Resident router: both tiers in one request ===
+# Prints exactly what the tiers below would; exits non-zero without printing
+# when the service is unavailable. The client bounds its own wait
+# (SKILL_ROUTER_TIMEOUT), so no `timeout` command is needed (macOS has none).
+ROUTER_CLIENT="$PLUGIN_DIR/cognitive-architecture/skills/router_client.py"
+if [ -f "$ROUTER_CLIENT" ] && printf '%s' "$MESSAGE_TEXT" | python -S "$ROUTER_CLIENT" \
+        --commands-index "$COMMANDS_INDEX" --skill-index "$INDEX_FILE" 2>/dev/null; then
+    exit 0
+fi
+
 # === TIER 1: Check COMMANDS_INDEX.yaml for explicit matches ===
 if [ -f "$COMMANDS_INDEX" ]; then
     TRIGGER=""